@@ -1,13 +1,19 @@
 """Module pour les algorithmes des automates finis."""
 
 from .conversion_algorithms import ConversionAlgorithms
+from .nfa_reduction import NFAReduction
 from .optimization_algorithms import OptimizationAlgorithms
 from .specialized_algorithms import SpecializedAlgorithms
+from .state_elimination import StateElimination
+from .word_enumeration import WordEnumeration
 
 __all__ = [
     "ConversionAlgorithms",
+    "NFAReduction",
     "OptimizationAlgorithms",
     "SpecializedAlgorithms",
+    "StateElimination",
+    "WordEnumeration",
 ]
 
 
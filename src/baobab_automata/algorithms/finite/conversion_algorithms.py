@@ -12,6 +12,7 @@ from ...finite.abstract_finite_automaton import AbstractFiniteAutomaton
 from ...finite.dfa import DFA
 from ...finite.nfa import EpsilonNFA
 from ...finite.nfa import NFA
+from .state_elimination import StateElimination
 
 
 class ConversionError(Exception):
@@ -987,6 +988,11 @@ class ConversionAlgorithms:
         """
         Convertit un automate en expression régulière avec optimisations.
 
+        Lorsque les optimisations sont activées, l'élimination d'états est
+        appliquée directement sur l'automate (sans déterminisation) avec
+        simplification algébrique de l'AST ; sinon l'algorithme de Kleene
+        est utilisé.
+
         :param automaton: Automate à convertir
         :type automaton: AbstractFiniteAutomaton
         :return: Expression régulière équivalente optimisée
@@ -1002,12 +1008,11 @@ class ConversionAlgorithms:
             if cached_result is not None:
                 return str(cached_result)  # type: ignore
 
-            # Conversion de base
-            regex = self.automaton_to_regex(automaton)
-
-            # Simplification de l'expression
             if self._optimization_enabled:
-                regex = ConversionAlgorithms._simplify_regex(regex)
+                self._validate_automaton(automaton)
+                regex = StateElimination.to_regex(automaton)
+            else:
+                regex = self.automaton_to_regex(automaton)
 
             # Enregistrer les statistiques
             conversion_time = time.time() - start_time
@@ -0,0 +1,352 @@
+"""
+Réduction d'automates non déterministes sans déterminisation.
+
+Ce module contient la classe NFAReduction qui réduit un NFA ou un ε-NFA en
+temps polynomial en préservant exactement son langage :
+
+- quotient par la bisimulation avant (ou arrière), calculée par raffinement
+  de partition à la Paige–Tarjan en O(m log n) ;
+- quotient par l'équivalence de simulation avant, suivi de l'élagage des
+  transitions vers un état strictement simulé par un autre successeur.
+
+Les transitions epsilon sont traitées comme un symbole ordinaire, ce qui
+reste correct pour les deux relations.
+"""
+
+from typing import Dict, FrozenSet, List, Set, Tuple, Union
+
+from ...finite.nfa import EpsilonNFA, NFA
+
+# Automates réductibles
+ReducibleNFA = Union[NFA, EpsilonNFA]
+
+# Arcs d'un automate indexé : symbole -> liste de (source, cible)
+Edges = Dict[str, List[Tuple[int, int]]]
+
+
+class NFAReduction:
+    """
+    Réductions exactes d'automates finis non déterministes.
+
+    Toutes les méthodes retournent un automate du même type que l'entrée ;
+    chaque état réduit porte le plus petit nom (ordre lexicographique) de
+    sa classe d'équivalence.
+    """
+
+    @staticmethod
+    def bisimulation(
+        automaton: ReducibleNFA, direction: str = "forward"
+    ) -> ReducibleNFA:
+        """
+        Quotiente un automate par la bisimulation avant ou arrière.
+
+        :param automaton: NFA ou ε-NFA à réduire
+        :type automaton: ReducibleNFA
+        :param direction: « forward » (futurs identiques) ou « backward »
+            (passés identiques)
+        :type direction: str
+        :return: Automate quotient, de même langage
+        :rtype: ReducibleNFA
+        :raises ValueError: Si la direction est inconnue
+        """
+        if direction not in ("forward", "backward"):
+            raise ValueError(f"Unknown bisimulation direction: {direction}")
+        states, edges, initial, finals = _index(automaton)
+        if direction == "forward":
+            marked = finals
+        else:
+            edges = {
+                symbol: [(target, source) for source, target in pairs]
+                for symbol, pairs in edges.items()
+            }
+            marked = {initial}
+        initial_blocks = [
+            block
+            for block in (
+                [s for s in range(len(states)) if s in marked],
+                [s for s in range(len(states)) if s not in marked],
+            )
+            if block
+        ]
+        block_of = _coarsest_stable_partition(len(states), edges, initial_blocks)
+        return _quotient(automaton, states, block_of, set())
+
+    @staticmethod
+    def simulation_preorder(automaton: ReducibleNFA) -> Dict[str, FrozenSet[str]]:
+        """
+        Calcule la plus grande simulation avant.
+
+        L'état q simule p si p final implique q final et si chaque transition
+        p -a-> p' est imitée par une transition q -a-> q' où q' simule p' ;
+        on a alors L(p) ⊆ L(q).
+
+        :param automaton: NFA ou ε-NFA
+        :type automaton: ReducibleNFA
+        :return: État p -> ensemble des états qui simulent p
+        :rtype: Dict[str, FrozenSet[str]]
+        """
+        states, edges, _, finals = _index(automaton)
+        simulators = _maximal_simulation(len(states), edges, finals)
+        return {
+            states[state]: frozenset(states[other] for other in simulators[state])
+            for state in range(len(states))
+        }
+
+    @staticmethod
+    def simulation(automaton: ReducibleNFA) -> ReducibleNFA:
+        """
+        Quotiente un automate par l'équivalence de simulation et élague.
+
+        Deux états équivalents (chacun simule l'autre) sont fusionnés, puis
+        toute transition p -a-> q1 est supprimée dès qu'il existe
+        p -a-> q2 avec q2 simulant strictement q1.
+
+        :param automaton: NFA ou ε-NFA à réduire
+        :type automaton: ReducibleNFA
+        :return: Automate réduit, de même langage
+        :rtype: ReducibleNFA
+        """
+        states, edges, _, finals = _index(automaton)
+        simulators = _maximal_simulation(len(states), edges, finals)
+
+        # Classes d'équivalence de simulation
+        block_of = [-1] * len(states)
+        blocks = 0
+        for state in range(len(states)):
+            if block_of[state] < 0:
+                for other in simulators[state]:
+                    if state in simulators[other]:
+                        block_of[other] = blocks
+                blocks += 1
+
+        # Paires (q1, q2) de classes où q2 simule strictement q1
+        dominated = {
+            (block_of[state], block_of[other])
+            for state in range(len(states))
+            for other in simulators[state]
+            if block_of[state] != block_of[other]
+        }
+        return _quotient(automaton, states, block_of, dominated)
+
+
+def _index(automaton: ReducibleNFA) -> Tuple[List[str], Edges, int, Set[int]]:
+    """Numérote les états (ordre trié) et regroupe les arcs par symbole."""
+    states = sorted(automaton.states)
+    index = {state: number for number, state in enumerate(states)}
+    edges: Edges = {}
+    for (source, symbol), targets in automaton.transitions.items():
+        bucket = edges.setdefault(symbol, [])
+        for target in targets:
+            bucket.append((index[source], index[target]))
+    finals = {index[state] for state in automaton.final_states}
+    return states, edges, index[automaton.initial_state], finals
+
+
+def _coarsest_stable_partition(
+    size: int, edges: Edges, initial_blocks: List[List[int]]
+) -> List[int]:
+    """
+    Plus grossière partition stable raffinant la partition initiale.
+
+    Algorithme de Paige et Tarjan : une partition composée X regroupe des
+    blocs de Q ; on extrait d'un bloc composé un bloc B d'au plus la moitié
+    de sa taille, puis on découpe Q par pre(B) et par pre(B) \\ pre(S \\ B),
+    ce dernier ensemble étant obtenu grâce aux compteurs count(x, a, S).
+    """
+    block_of = [0] * size
+    blocks: List[Set[int]] = []
+    for members in initial_blocks:
+        for state in members:
+            block_of[state] = len(blocks)
+        blocks.append(set(members))
+
+    # Blocs composés : un seul au départ, contenant tous les blocs de Q
+    compound_of = [0] * len(blocks)
+    compounds: List[Set[int]] = [set(range(len(blocks)))]
+    pending = [0] if len(blocks) > 1 else []
+
+    def split(splitter) -> None:
+        """Découpe chaque bloc de Q par l'ensemble splitter."""
+        touched: Dict[int, Set[int]] = {}
+        for state in splitter:
+            touched.setdefault(block_of[state], set()).add(state)
+        for block, inside in touched.items():
+            if len(inside) == len(blocks[block]):
+                continue
+            blocks[block] -= inside
+            new_block = len(blocks)
+            blocks.append(inside)
+            for state in inside:
+                block_of[state] = new_block
+            compound = compound_of[block]
+            compound_of.append(compound)
+            compounds[compound].add(new_block)
+            if len(compounds[compound]) == 2:
+                pending.append(compound)
+
+    # Arcs indexés par cible, et compteurs count(x, a, S) partagés
+    predecessors: Dict[str, List[List[Tuple[int, List[int]]]]] = {}
+    for symbol, pairs in edges.items():
+        by_target: List[List[Tuple[int, List[int]]]] = [[] for _ in range(size)]
+        cells: Dict[int, List[int]] = {}
+        for source, target in pairs:
+            cell = cells.get(source)
+            if cell is None:
+                cell = cells[source] = [0]
+            cell[0] += 1
+            by_target[target].append((source, cell))
+        predecessors[symbol] = by_target
+        # Stabilisation initiale par rapport à l'ensemble de tous les états
+        split(cells.keys())
+
+    while pending:
+        compound = pending.pop()
+        members = compounds[compound]
+        if len(members) < 2:
+            continue
+        first, second = list(members)[:2]
+        smaller = first if len(blocks[first]) <= len(blocks[second]) else second
+        members.discard(smaller)
+        if len(members) > 1:
+            pending.append(compound)
+        compound_of[smaller] = len(compounds)
+        compounds.append({smaller})
+
+        splitter_states = list(blocks[smaller])
+        for by_target in predecessors.values():
+            # count(x, a, B) et cellule count(x, a, S) de chaque prédécesseur
+            counts: Dict[int, int] = {}
+            old_cells: Dict[int, List[int]] = {}
+            for target in splitter_states:
+                for source, cell in by_target[target]:
+                    counts[source] = counts.get(source, 0) + 1
+                    old_cells[source] = cell
+            if not counts:
+                continue
+
+            split(counts.keys())
+            split(
+                [
+                    source
+                    for source, count in counts.items()
+                    if count == old_cells[source][0]
+                ]
+            )
+
+            # Mise à jour des compteurs : S devient S \ B, B a ses propres cellules
+            new_cells = {source: [count] for source, count in counts.items()}
+            for source, count in counts.items():
+                old_cells[source][0] -= count
+            for target in splitter_states:
+                by_target[target] = [
+                    (source, new_cells[source]) for source, _ in by_target[target]
+                ]
+
+    return block_of
+
+
+def _maximal_simulation(size: int, edges: Edges, finals: Set[int]) -> List[Set[int]]:
+    """
+    Plus grande simulation avant, par raffinement à compteurs.
+
+    count[(a, w, v)] = |post_a(w) ∩ sim(v)| ; quand il s'annule, w ne peut
+    plus simuler aucun a-prédécesseur de v.
+    """
+    post: Dict[str, List[List[int]]] = {}
+    pre: Dict[str, List[List[int]]] = {}
+    for symbol, pairs in edges.items():
+        post[symbol] = [[] for _ in range(size)]
+        pre[symbol] = [[] for _ in range(size)]
+        for source, target in pairs:
+            post[symbol][source].append(target)
+            pre[symbol][target].append(source)
+
+    all_states = set(range(size))
+    simulators = [
+        set(finals) if state in finals else set(all_states) for state in range(size)
+    ]
+    removed: List[Tuple[int, int]] = []
+
+    def remove(state: int, other: int) -> None:
+        """Retire other des simulateurs de state."""
+        if other in simulators[state]:
+            simulators[state].discard(other)
+            removed.append((state, other))
+
+    # Compteurs calculés sur la relation initiale, avant tout retrait
+    counts: Dict[Tuple[str, int, int], int] = {}
+    for symbol in edges:
+        for target in range(size):
+            if not pre[symbol][target]:
+                continue
+            candidates = simulators[target]
+            for other in range(size):
+                counts[(symbol, other, target)] = sum(
+                    1 for successor in post[symbol][other] if successor in candidates
+                )
+    for (symbol, other, target), count in list(counts.items()):
+        if not count:
+            for source in pre[symbol][target]:
+                remove(source, other)
+
+    while removed:
+        state, other = removed.pop()
+        for symbol in edges:
+            if not pre[symbol][state]:
+                continue
+            for predecessor in pre[symbol][other]:
+                key = (symbol, predecessor, state)
+                counts[key] -= 1
+                if not counts[key]:
+                    for source in pre[symbol][state]:
+                        remove(source, predecessor)
+
+    return simulators
+
+
+def _quotient(
+    automaton: ReducibleNFA,
+    states: List[str],
+    block_of: List[int],
+    dominated: Set[Tuple[int, int]],
+) -> ReducibleNFA:
+    """Construit l'automate quotient, en élaguant les cibles dominées."""
+    names: Dict[int, str] = {}
+    for number, state in enumerate(states):
+        names.setdefault(block_of[number], state)
+    index = {state: number for number, state in enumerate(states)}
+
+    grouped: Dict[Tuple[str, str], Set[int]] = {}
+    for (source, symbol), targets in automaton.transitions.items():
+        key = (names[block_of[index[source]]], symbol)
+        grouped.setdefault(key, set()).update(
+            block_of[index[target]] for target in targets
+        )
+
+    transitions: Dict[Tuple[str, str], FrozenSet[str]] = {}
+    for key, targets in grouped.items():
+        if dominated:
+            targets = {
+                target
+                for target in targets
+                if not any((target, other) in dominated for other in targets)
+            }
+        transitions[key] = frozenset(names[target] for target in targets)
+
+    reduced_states = frozenset(names.values())
+    initial = names[block_of[index[automaton.initial_state]]]
+    finals = frozenset(
+        names[block_of[index[state]]] for state in automaton.final_states
+    )
+    if isinstance(automaton, EpsilonNFA):
+        return EpsilonNFA._from_trusted(
+            reduced_states,
+            frozenset(automaton.alphabet),
+            transitions,
+            initial,
+            finals,
+            automaton.epsilon_symbol,
+        )
+    return NFA._from_trusted(
+        reduced_states, frozenset(automaton.alphabet), transitions, initial, finals
+    )
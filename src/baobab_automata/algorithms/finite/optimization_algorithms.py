@@ -6,16 +6,25 @@ dans la phase 2 du projet Baobab Automata. Ces algorithmes permettent de
 minimiser, optimiser et améliorer les performances des automates.
 """
 
+import itertools
 import random
 import time
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from ...finite.abstract_finite_automaton import AbstractFiniteAutomaton
 from .conversion_algorithms import ConversionAlgorithms
+from .nfa_reduction import NFAReduction
+from .word_enumeration import WordEnumeration
 from ...finite.dfa import DFA
+from ...finite.indexed_automaton import EPSILON, IndexedAutomaton
 from ...finite.nfa import EpsilonNFA
 from ...finite.nfa import NFA
 from ...finite.optimization.optimization_exceptions import OptimizationError, OptimizationValidationError
+from ...finite.structural_analysis import StructuralAnalysis
+
+# Budget des sondes de déterminisation : max(64, 4 × nombre d'états)
+_PROBE_MIN_SUBSETS = 64
+_PROBE_FACTOR = 4
 
 
 class OptimizationAlgorithms:
@@ -23,7 +32,9 @@ class OptimizationAlgorithms:
     Classe principale pour les algorithmes d'optimisation des automates finis.
 
     Cette classe fournit des méthodes pour minimiser, optimiser et améliorer
-    les performances des automates finis (DFA, NFA, ε-NFA).
+    les performances des automates finis (DFA, NFA, ε-NFA). Au niveau 3,
+    la minimisation des NFA choisit automatiquement entre Hopcroft et
+    Brzozowski et consigne ce choix dans les statistiques.
 
     :param optimization_level: Niveau d'optimisation (0-3)
     :type optimization_level: int
@@ -253,12 +264,25 @@ class OptimizationAlgorithms:
         start_time = time.time()
 
         try:
-            # Convertir NFA -> DFA
-            converter = ConversionAlgorithms()
-            dfa = converter.nfa_to_dfa(nfa)
+            # Réduire par bisimulation (polynomial) avant la déterminisation
+            reduced_nfa = NFAReduction.bisimulation(nfa)
+
+            # Au niveau 3, l'algorithme est choisi d'après une sonde bornée
+            strategy = "hopcroft"
+            if self._optimization_level == 3:
+                choice = self.select_minimization_strategy(reduced_nfa)
+                self._stats.record_strategy("minimize_nfa", choice)
+                strategy = choice["strategy"]
+
+            if strategy == "brzozowski":
+                minimal_dfa = _brzozowski(reduced_nfa)
+            else:
+                # Convertir NFA -> DFA
+                converter = ConversionAlgorithms()
+                dfa = converter.nfa_to_dfa(reduced_nfa)
 
-            # Minimiser le DFA
-            minimal_dfa = self.minimize_dfa(dfa)
+                # Minimiser le DFA
+                minimal_dfa = self.minimize_dfa(dfa)
 
             # Pour l'instant, retourner le DFA minimal
             # La conversion DFA -> NFA sera implémentée plus tard
@@ -354,6 +378,10 @@ class OptimizationAlgorithms:
             # Fusionner les transitions identiques
             clean_nfa = self.merge_identical_transitions(clean_nfa)
 
+            # Quotient par simulation ; l'élagage peut isoler des états
+            clean_nfa = NFAReduction.simulation(clean_nfa)
+            clean_nfa = self.remove_unreachable_states(clean_nfa)
+
             # Optimiser les structures de données
             clean_nfa = self.optimize_data_structures(clean_nfa)
 
@@ -381,6 +409,174 @@ class OptimizationAlgorithms:
                 f"Erreur lors de la minimisation heuristique NFA: {e}"
             ) from e
 
+    def reduce_nfa_bisimulation(
+        self, automaton: Union[NFA, EpsilonNFA], direction: str = "forward"
+    ) -> Union[NFA, EpsilonNFA]:
+        """
+        Réduit un NFA par quotient de bisimulation, sans déterminisation.
+
+        Le raffinement de partition (Paige–Tarjan) s'exécute en
+        O(m log n) et préserve exactement le langage.
+
+        :param automaton: NFA ou ε-NFA à réduire
+        :type automaton: Union[NFA, EpsilonNFA]
+        :param direction: « forward » ou « backward »
+        :type direction: str
+        :return: Automate réduit, du même type
+        :rtype: Union[NFA, EpsilonNFA]
+        :raises OptimizationError: Si l'automate ou la direction est invalide
+        """
+        if not isinstance(automaton, (NFA, EpsilonNFA)):
+            raise OptimizationError("L'automate doit être un NFA ou un ε-NFA")
+        if direction not in ("forward", "backward"):
+            raise OptimizationError(f"Direction de bisimulation invalide: {direction}")
+
+        start_time = time.time()
+        reduced = NFAReduction.bisimulation(automaton, direction)
+
+        improvement = (
+            (len(automaton.states) - len(reduced.states)) / len(automaton.states) * 100
+        )
+        self._stats.add_optimization(
+            f"reduce_nfa_bisimulation_{direction}",
+            time.time() - start_time,
+            improvement,
+        )
+        return reduced
+
+    def reduce_nfa_simulation(
+        self, automaton: Union[NFA, EpsilonNFA]
+    ) -> Union[NFA, EpsilonNFA]:
+        """
+        Réduit un NFA par quotient de simulation et élagage des transitions.
+
+        Plus forte que la bisimulation avant (en O(|Σ| n m)), cette réduction
+        préserve exactement le langage.
+
+        :param automaton: NFA ou ε-NFA à réduire
+        :type automaton: Union[NFA, EpsilonNFA]
+        :return: Automate réduit, du même type
+        :rtype: Union[NFA, EpsilonNFA]
+        :raises OptimizationError: Si l'automate n'est pas un NFA ou un ε-NFA
+        """
+        if not isinstance(automaton, (NFA, EpsilonNFA)):
+            raise OptimizationError("L'automate doit être un NFA ou un ε-NFA")
+
+        start_time = time.time()
+        reduced = self.remove_unreachable_states(NFAReduction.simulation(automaton))
+
+        improvement = (
+            (len(automaton.states) - len(reduced.states)) / len(automaton.states) * 100
+        )
+        self._stats.add_optimization(
+            "reduce_nfa_simulation", time.time() - start_time, improvement
+        )
+        return reduced
+
+    def minimize_brzozowski(self, automaton: AbstractFiniteAutomaton) -> DFA:
+        """
+        Minimise un automate par l'algorithme de Brzozowski.
+
+        Deux déterminisations de l'automate miroir : det(rev(det(rev(A)))) est
+        le DFA minimal (sans état puits) de L(A). Chaque déterminisation part
+        directement de l'ensemble des états finaux, sans état initial ajouté,
+        ce qui est indispensable pour garantir la minimalité.
+
+        :param automaton: DFA, NFA ou ε-NFA à minimiser
+        :type automaton: AbstractFiniteAutomaton
+        :return: DFA minimal équivalent
+        :rtype: DFA
+        :raises OptimizationError: Si l'automate n'est pas un automate fini
+        """
+        if not isinstance(automaton, (DFA, NFA, EpsilonNFA)):
+            raise OptimizationError("L'automate doit être un DFA, un NFA ou un ε-NFA")
+
+        start_time = time.time()
+        minimal_dfa = _brzozowski(automaton)
+
+        improvement = (
+            (len(automaton.states) - len(minimal_dfa.states))
+            / len(automaton.states)
+            * 100
+        )
+        self._stats.add_optimization(
+            "minimize_brzozowski", time.time() - start_time, improvement
+        )
+        return minimal_dfa
+
+    def select_minimization_strategy(
+        self, automaton: AbstractFiniteAutomaton
+    ) -> Dict[str, Any]:
+        """
+        Choisit entre Hopcroft et Brzozowski pour minimiser un automate.
+
+        Le coût est estimé à partir du nombre d'états, du facteur de
+        branchement et de la croissance observée lors de deux constructions
+        par sous-ensembles bornées (automate et miroir) : Brzozowski est
+        retenu lorsque la déterminisation directe explose alors que celle du
+        miroir reste petite. Sans branchement (une cible par transition), les
+        sondes sont omises et Hopcroft est retenu.
+
+        :param automaton: DFA, NFA ou ε-NFA à minimiser
+        :type automaton: AbstractFiniteAutomaton
+        :return: Stratégie (« hopcroft » ou « brzozowski ») et mesures ayant
+            conduit au choix
+        :rtype: Dict[str, Any]
+        :raises OptimizationError: Si l'automate n'est pas un automate fini
+        """
+        if not isinstance(automaton, (DFA, NFA, EpsilonNFA)):
+            raise OptimizationError("L'automate doit être un DFA, un NFA ou un ε-NFA")
+
+        if isinstance(automaton, EpsilonNFA):
+            automaton = automaton.to_nfa()
+        size = len(automaton.states)
+        # Nombre de cibles de chaque transition non vide
+        widths = [
+            1 if isinstance(targets, str) else len(targets)
+            for targets in automaton.transitions.values()
+            if targets
+        ]
+        branching = sum(widths) / len(widths) if widths else 0.0
+        choice: Dict[str, Any] = {
+            "strategy": "hopcroft",
+            "states": size,
+            "branching": branching,
+            "forward_growth": 1.0,
+            "reverse_growth": None,
+        }
+        if isinstance(automaton, DFA) or EPSILON in automaton.alphabet:
+            # Déjà déterministe (ou ε à absorber) : la déterminisation directe
+            # ne coûte rien de plus, Hopcroft s'applique tel quel
+            return choice
+        if branching <= 1:
+            # Une seule cible par transition : les sous-ensembles restent des
+            # singletons et la déterminisation ne peut pas exploser, la sonde
+            # est inutile
+            return choice
+
+        budget = max(_PROBE_MIN_SUBSETS, _PROBE_FACTOR * size)
+        states, edges, initial, finals = _indexed_edges(automaton)
+        forward = _subset_construction(
+            _successors(len(states), edges, False), {initial}, finals, budget
+        )
+        backward = _subset_construction(
+            _successors(len(states), edges, True), finals, {initial}, budget
+        )
+        forward_count = forward[0] if forward else None
+        backward_count = backward[0] if backward else None
+        choice["forward_growth"] = (forward_count or budget) / max(size, 1)
+        choice["reverse_growth"] = (
+            backward_count / max(size, 1) if backward_count is not None else None
+        )
+
+        # Brzozowski paie le miroir puis le DFA minimal ; Hopcroft paie le
+        # déterminisé complet, qui n'est jamais plus petit que le minimal
+        if backward_count is not None and (
+            forward_count is None or backward_count <= forward_count
+        ):
+            choice["strategy"] = "brzozowski"
+        return choice
+
     def remove_unreachable_states(
         self, automaton: AbstractFiniteAutomaton
     ) -> AbstractFiniteAutomaton:
@@ -717,6 +913,9 @@ class OptimizationAlgorithms:
 
     def _hopcroft_minimization(self, dfa: DFA) -> DFA:
         """Implémente l'algorithme de minimisation de Hopcroft."""
+        # Un état puits explicite équivaut à une transition absente
+        dfa = self._trim_dead_states(dfa)
+
         # Partition initiale : états finaux vs non-finaux
         partition = [dfa.final_states, dfa.states - dfa.final_states]
 
@@ -724,18 +923,21 @@ class OptimizationAlgorithms:
         partition = [p for p in partition if p]
 
         # Raffiner la partition
+        analysis = StructuralAnalysis.of(dfa)
+        # L'ensemble de tous les états sépare ceux qui ont une transition
+        # de ceux qui n'en ont pas (puits implicite d'un DFA partiel)
         worklist = [dfa.final_states] if dfa.final_states else []
+        worklist.append(dfa.states)
 
         while worklist:
             current_set = worklist.pop(0)
 
             for symbol in dfa.alphabet:
-                # Trouver les états qui ont une transition vers current_set avec symbol
-                states_with_transition = set()
-                for state in dfa.states:
-                    target = dfa.get_transition(state, symbol)
-                    if target in current_set:
-                        states_with_transition.add(state)
+                # États ayant une transition vers current_set avec symbol,
+                # lus dans l'index inverse partagé
+                states_with_transition = analysis.predecessors(current_set, symbol)
+                if not states_with_transition:
+                    continue
 
                 # Diviser chaque partition
                 new_partition = []
@@ -760,6 +962,23 @@ class OptimizationAlgorithms:
         # Construire le DFA minimal
         return self._build_minimal_dfa(dfa, partition)
 
+    def _trim_dead_states(self, dfa: DFA) -> DFA:
+        """Retire les états puits et leurs arcs (l'état initial reste un état)."""
+        dead = StructuralAnalysis.of(dfa).dead_states
+        if not dead:
+            return dfa
+        return DFA(
+            states=(dfa.states - dead) | {dfa.initial_state},
+            alphabet=dfa.alphabet,
+            transitions={
+                (state, symbol): target
+                for (state, symbol), target in dfa.transitions.items()
+                if state not in dead and target not in dead
+            },
+            initial_state=dfa.initial_state,
+            final_states=dfa.final_states,
+        )
+
     def _hopcroft_minimization_optimized(self, dfa: DFA) -> DFA:
         """Version optimisée de l'algorithme de Hopcroft."""
         # Pour l'instant, utiliser la version de base
@@ -811,24 +1030,8 @@ class OptimizationAlgorithms:
         )
 
     def _get_coaccessible_states(self, automaton: AbstractFiniteAutomaton) -> Set[str]:
-        """Récupère les états cœurs d'un automate."""
-        coaccessible = set(automaton.final_states)
-        worklist = list(automaton.final_states)
-
-        while worklist:
-            current = worklist.pop(0)
-
-            # Trouver tous les états qui ont une transition vers current
-            for state in automaton.states:
-                if state not in coaccessible:
-                    for symbol in automaton.alphabet:
-                        target = automaton.get_transition(state, symbol)
-                        if target == current:
-                            coaccessible.add(state)
-                            worklist.append(state)
-                            break
-
-        return coaccessible
+        """Récupère les états cœurs d'un automate (analyse mise en cache)."""
+        return set(StructuralAnalysis.of(automaton).coreachable)
 
     def _remove_unreachable_states_dfa(
         self, dfa: DFA, reachable_states: Set[str]
@@ -1050,21 +1253,61 @@ class OptimizationAlgorithms:
     def _generate_test_words(
         self, automaton: AbstractFiniteAutomaton, count: int
     ) -> List[str]:
-        """Génère des mots de test pour la validation."""
-        words = []
-        alphabet = list(automaton.alphabet)
-
-        # Générer des mots de différentes longueurs
-        for length in range(min(5, count // 10 + 1)):
-            for _ in range(count // 5):
-                word = "".join(random.choice(alphabet) for _ in range(length))
-                words.append(word)
+        """Génère des mots de test, acceptés et refusés, pour la validation."""
+        max_length = 8
+        if isinstance(automaton, DFA):
+            # Plus courts mots acceptés puis mots acceptés tirés uniformément
+            shortest = WordEnumeration.shortlex(automaton, max_length)
+            words = list(itertools.islice(shortest, count // 4))
+            words.extend(
+                WordEnumeration.sample_words(automaton, count // 4, max_length)
+            )
+        else:
+            # Pas de déterminisation : simulation sur les ensembles d'états
+            words = self._accepted_words_by_simulation(
+                automaton, count // 2, max_length
+            )
 
-        # Ajouter des mots spécifiques
-        words.extend(["", "a", "b", "aa", "bb", "ab", "ba"])
+        # Mots quelconques sur l'alphabet, en majorité refusés
+        alphabet = sorted(automaton.alphabet - {EPSILON})
+        words.append("")
+        while alphabet and len(words) < count:
+            length = random.randint(0, max_length)
+            words.append("".join(random.choice(alphabet) for _ in range(length)))
 
         return words[:count]
 
+    def _accepted_words_by_simulation(
+        self, automaton: AbstractFiniteAutomaton, count: int, max_length: int
+    ) -> List[str]:
+        """Mots acceptés trouvés par un parcours en largeur borné des mots."""
+        indexed = IndexedAutomaton.from_automaton(automaton)
+        symbols = sorted(automaton.alphabet - {EPSILON})
+        budget = 16 * max(count, 1)
+        words: List[str] = []
+        frontier = [("", frozenset(indexed.epsilon_closure({indexed.initial})))]
+        for length in range(max_length + 1):
+            for word, current in frontier:
+                if not indexed.finals.isdisjoint(current):
+                    words.append(word)
+                    if len(words) >= count:
+                        return words
+            if length == max_length:
+                break
+            successors = []
+            for word, current in frontier:
+                for symbol in symbols:
+                    targets = set()
+                    for state in current:
+                        targets.update(indexed.delta[state].get(symbol, ()))
+                    if targets:
+                        closure = frozenset(indexed.epsilon_closure(targets))
+                        successors.append((word + symbol, closure))
+                if len(successors) >= budget:
+                    break
+            frontier = successors[:budget]
+        return words
+
 
 class OptimizationStats:
     """
@@ -1077,6 +1320,7 @@ class OptimizationStats:
     def __init__(self) -> None:
         """Initialise les statistiques d'optimisation."""
         self._optimizations: List[Dict[str, Any]] = []
+        self._strategy_choices: List[Dict[str, Any]] = []
 
     def add_optimization(
         self, optimization_type: str, time_taken: float, improvement: float
@@ -1100,6 +1344,28 @@ class OptimizationStats:
             }
         )
 
+    def record_strategy(self, operation: str, choice: Dict[str, Any]) -> None:
+        """
+        Enregistre le choix d'algorithme fait pour une opération.
+
+        :param operation: Opération concernée (ex. « minimize_nfa »)
+        :type operation: str
+        :param choice: Stratégie retenue et mesures ayant guidé le choix
+        :type choice: Dict[str, Any]
+        """
+        self._strategy_choices.append(
+            {"operation": operation, **choice, "timestamp": time.time()}
+        )
+
+    def get_strategy_choices(self) -> List[Dict[str, Any]]:
+        """
+        Récupère l'historique des choix d'algorithme.
+
+        :return: Choix enregistrés, du plus ancien au plus récent
+        :rtype: List[Dict[str, Any]]
+        """
+        return [dict(choice) for choice in self._strategy_choices]
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Récupère les statistiques d'optimisation.
@@ -1116,13 +1382,16 @@ class OptimizationStats:
             self._optimizations
         )
 
-        return {
+        stats = {
             "total_optimizations": len(self._optimizations),
             "total_time": total_time,
             "average_time": avg_time,
             "average_improvement": avg_improvement,
             "optimizations_by_type": self._get_optimizations_by_type(),
         }
+        if self._strategy_choices:
+            stats["strategy_choices"] = self.get_strategy_choices()
+        return stats
 
     def _get_optimizations_by_type(self) -> Dict[str, Dict[str, Any]]:
         """Récupère les statistiques par type d'optimisation."""
@@ -1153,3 +1422,101 @@ class OptimizationStats:
     def reset(self) -> None:
         """Remet à zéro les statistiques."""
         self._optimizations.clear()
+        self._strategy_choices.clear()
+
+
+# Arcs d'un automate indexé : (source, symbole, cible)
+IndexedEdges = List[Tuple[int, str, int]]
+
+
+def _indexed_edges(
+    automaton: AbstractFiniteAutomaton,
+) -> Tuple[List[str], IndexedEdges, int, Set[int]]:
+    """Numérote les états (ordre trié) et liste les arcs d'un DFA ou d'un NFA."""
+    states = sorted(automaton.states)
+    index = {state: number for number, state in enumerate(states)}
+    edges: IndexedEdges = []
+    for (source, symbol), targets in automaton.transitions.items():
+        if isinstance(targets, str):
+            targets = (targets,)
+        for target in targets:
+            edges.append((index[source], symbol, index[target]))
+    finals = {index[state] for state in automaton.final_states}
+    return states, edges, index[automaton.initial_state], finals
+
+
+def _successors(
+    size: int, edges: IndexedEdges, reverse: bool
+) -> List[Dict[str, List[int]]]:
+    """Table des successeurs par symbole, dans le sens direct ou miroir."""
+    successors: List[Dict[str, List[int]]] = [{} for _ in range(size)]
+    for source, symbol, target in edges:
+        if reverse:
+            source, target = target, source
+        successors[source].setdefault(symbol, []).append(target)
+    return successors
+
+
+def _subset_construction(
+    successors: List[Dict[str, List[int]]],
+    starts: Set[int],
+    marked: Set[int],
+    budget: Optional[int] = None,
+) -> Optional[Tuple[int, IndexedEdges, Set[int]]]:
+    """
+    Construction par sous-ensembles partant de l'ensemble starts.
+
+    Les sous-ensembles sont numérotés dans l'ordre de découverte (0 pour le
+    sous-ensemble initial) ; un sous-ensemble est final s'il rencontre
+    marked. Retourne None dès que plus de budget sous-ensembles apparaissent.
+    """
+    initial = frozenset(starts)
+    numbers = {initial: 0}
+    order = [initial]
+    edges: IndexedEdges = []
+    position = 0
+    while position < len(order):
+        moves: Dict[str, Set[int]] = {}
+        for state in order[position]:
+            for symbol, targets in successors[state].items():
+                moves.setdefault(symbol, set()).update(targets)
+        for symbol in sorted(moves):
+            subset = frozenset(moves[symbol])
+            number = numbers.get(subset)
+            if number is None:
+                if budget is not None and len(order) >= budget:
+                    return None
+                number = numbers[subset] = len(order)
+                order.append(subset)
+            edges.append((position, symbol, number))
+        position += 1
+    finals = {number for number, subset in enumerate(order) if subset & marked}
+    return len(order), edges, finals
+
+
+def _brzozowski(automaton: AbstractFiniteAutomaton) -> DFA:
+    """DFA minimal par double déterminisation du miroir."""
+    alphabet = automaton.alphabet
+    if isinstance(automaton, EpsilonNFA):
+        automaton = automaton.to_nfa()
+        alphabet = automaton.alphabet
+    if EPSILON in automaton.alphabet:
+        # Les transitions epsilon d'un NFA sont absorbées par déterminisation
+        automaton = automaton.to_dfa()
+        alphabet = automaton.alphabet
+
+    states, edges, initial, finals = _indexed_edges(automaton)
+    size = len(states)
+    for _ in range(2):
+        size, edges, finals = _subset_construction(
+            _successors(size, edges, True), finals, {initial}
+        )
+        initial = 0
+
+    return DFA._from_trusted(
+        frozenset(f"q{number}" for number in range(size)),
+        frozenset(alphabet),
+        {(f"q{source}", symbol): f"q{target}" for source, symbol, target in edges},
+        "q0",
+        frozenset(f"q{number}" for number in finals),
+    )
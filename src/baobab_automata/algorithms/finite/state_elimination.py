@@ -0,0 +1,415 @@
+"""
+Conversion automate → expression régulière par élimination d'états.
+
+Ce module implémente l'élimination d'états sur un automate fini généralisé
+(GNFA) dont les arcs portent des arbres syntaxiques (ASTNode) plutôt que des
+chaînes. Les expressions sont simplifiées algébriquement à chaque étape et
+l'état éliminé est choisi selon une heuristique de faible degré, ce qui
+limite fortement la taille des expressions produites.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from ...finite.abstract_finite_automaton import AbstractFiniteAutomaton
+from ...finite.interval.char_class import CharClass
+from ...finite.regex.regex_ast import ASTNode, NodeType
+
+# Précédences d'affichage (plus élevé = lie plus fort)
+_UNION_PRECEDENCE = 1
+_CONCAT_PRECEDENCE = 2
+_UNARY_PRECEDENCE = 3
+_ATOM_PRECEDENCE = 4
+
+_EPSILON = ASTNode(NodeType.EPSILON)
+_EMPTY = ASTNode(NodeType.EMPTY)
+
+# Caractères à échapper hors d'une classe, puis à l'intérieur des crochets
+_METACHARACTERS = frozenset("*+?|().[]\\")
+_BRACKET_METACHARACTERS = frozenset("\\]-^")
+
+
+class StateElimination:
+    """
+    Convertisseur automate → expression régulière par élimination d'états.
+
+    Seuls les arcs courants du GNFA sont conservés (listes d'adjacence
+    entrantes et sortantes) ; l'état éliminé à chaque étape est celui qui
+    minimise le produit de ses degrés entrant et sortant.
+    """
+
+    # ==================== CONSTRUCTEURS SIMPLIFIANTS ====================
+
+    @staticmethod
+    def union(left: ASTNode, right: ASTNode) -> ASTNode:
+        """
+        Construit l'union simplifiée de deux expressions.
+
+        Applique ∅|r = r, r|r = r et ε|r = r? (ou r si r accepte déjà ε).
+
+        :param left: Expression de gauche
+        :type left: ASTNode
+        :param right: Expression de droite
+        :type right: ASTNode
+        :return: Expression simplifiée
+        :rtype: ASTNode
+        """
+        alternatives: List[ASTNode] = []
+        has_epsilon = False
+        for node in _flatten(left, NodeType.UNION) + _flatten(right, NodeType.UNION):
+            if node.type == NodeType.EMPTY:
+                continue
+            if node.type == NodeType.EPSILON:
+                has_epsilon = True
+                continue
+            if node.type == NodeType.OPTIONAL:
+                has_epsilon = True
+                node = node.children[0]
+            if node not in alternatives:
+                alternatives.append(node)
+
+        if not alternatives:
+            return _EPSILON if has_epsilon else _EMPTY
+
+        result = alternatives[0]
+        for node in alternatives[1:]:
+            result = ASTNode(NodeType.UNION, children=[result, node])
+
+        if has_epsilon and not _is_nullable(result):
+            return ASTNode(NodeType.OPTIONAL, children=[result])
+        return result
+
+    @staticmethod
+    def concatenation(left: ASTNode, right: ASTNode) -> ASTNode:
+        """
+        Construit la concaténation simplifiée de deux expressions.
+
+        Applique ∅r = r∅ = ∅, εr = rε = r, rr* = r*r = r+ et r*r* = r*.
+
+        :param left: Expression de gauche
+        :type left: ASTNode
+        :param right: Expression de droite
+        :type right: ASTNode
+        :return: Expression simplifiée
+        :rtype: ASTNode
+        """
+        if left.type == NodeType.EMPTY or right.type == NodeType.EMPTY:
+            return _EMPTY
+        if left.type == NodeType.EPSILON:
+            return right
+        if right.type == NodeType.EPSILON:
+            return left
+
+        if right.type == NodeType.KLEENE_STAR:
+            inner = right.children[0]
+            if left == inner:
+                return ASTNode(NodeType.KLEENE_PLUS, children=[inner])
+            if left.type in (NodeType.KLEENE_STAR, NodeType.OPTIONAL) and (
+                left.children[0] == inner
+            ):
+                return right
+        if left.type == NodeType.KLEENE_STAR:
+            inner = left.children[0]
+            if right == inner:
+                return ASTNode(NodeType.KLEENE_PLUS, children=[inner])
+            if right.type == NodeType.OPTIONAL and right.children[0] == inner:
+                return left
+
+        return ASTNode(NodeType.CONCATENATION, children=[left, right])
+
+    @staticmethod
+    def kleene_star(node: ASTNode) -> ASTNode:
+        """
+        Construit l'étoile de Kleene simplifiée d'une expression.
+
+        Applique ∅* = ε* = ε et (r*)* = (r+)* = (r?)* = r*.
+
+        :param node: Expression à itérer
+        :type node: ASTNode
+        :return: Expression simplifiée
+        :rtype: ASTNode
+        """
+        if node.type in (NodeType.EMPTY, NodeType.EPSILON):
+            return _EPSILON
+        if node.type == NodeType.KLEENE_STAR:
+            return node
+        if node.type in (NodeType.KLEENE_PLUS, NodeType.OPTIONAL):
+            node = node.children[0]
+        return ASTNode(NodeType.KLEENE_STAR, children=[node])
+
+    # ==================== ÉLIMINATION ====================
+
+    @staticmethod
+    def to_ast(automaton: AbstractFiniteAutomaton) -> ASTNode:
+        """
+        Convertit un automate fini en arbre syntaxique d'expression régulière.
+
+        Les DFA, NFA et ε-NFA sont traités directement, sans déterminisation ;
+        les automates à intervalles produisent des classes entre crochets.
+
+        :param automaton: Automate à convertir
+        :type automaton: AbstractFiniteAutomaton
+        :return: AST de l'expression équivalente
+        :rtype: ASTNode
+        """
+        edges, initial, finals, size = _build_gnfa(automaton)
+        start, end = size, size + 1
+
+        outgoing: Dict[int, Dict[int, ASTNode]] = {i: {} for i in range(size + 2)}
+        incoming: Dict[int, Dict[int, ASTNode]] = {i: {} for i in range(size + 2)}
+
+        def add_edge(source: int, target: int, label: ASTNode) -> None:
+            existing = outgoing[source].get(target)
+            label = (
+                label if existing is None else StateElimination.union(existing, label)
+            )
+            outgoing[source][target] = label
+            incoming[target][source] = label
+
+        add_edge(start, initial, _EPSILON)
+        for final in finals:
+            add_edge(final, end, _EPSILON)
+        for source, target, label in edges:
+            add_edge(source, target, label)
+
+        def score(state: int) -> int:
+            loop = 1 if state in outgoing[state] else 0
+            return (len(incoming[state]) - loop) * (len(outgoing[state]) - loop)
+
+        heap: List[Tuple[int, int]] = [(score(state), state) for state in range(size)]
+        heapq.heapify(heap)
+        eliminated = set()
+
+        while heap:
+            priority, state = heapq.heappop(heap)
+            if state in eliminated:
+                continue
+            current = score(state)
+            if current != priority:
+                heapq.heappush(heap, (current, state))
+                continue
+            eliminated.add(state)
+
+            loop = outgoing[state].pop(state, None)
+            incoming[state].pop(state, None)
+            star = StateElimination.kleene_star(loop) if loop is not None else _EPSILON
+
+            predecessors = incoming.pop(state)
+            successors = outgoing.pop(state)
+            for source in predecessors:
+                del outgoing[source][state]
+            for target in successors:
+                del incoming[target][state]
+
+            for source, into in predecessors.items():
+                prefix = StateElimination.concatenation(into, star)
+                for target, out_of in successors.items():
+                    add_edge(
+                        source, target, StateElimination.concatenation(prefix, out_of)
+                    )
+
+        return outgoing[start].get(end, _EMPTY)
+
+    @staticmethod
+    def to_regex(automaton: AbstractFiniteAutomaton) -> str:
+        """
+        Convertit un automate fini en expression régulière.
+
+        RegexParser n'a pas de syntaxe pour le mot vide ni pour le langage
+        vide. Les simplifications les éliminent de toute expression plus
+        grande (ε|r = r?, εr = r, ∅|r = r, ∅r = ∅, ∅* = ε), si bien qu'ils
+        n'apparaissent que seuls : « ε » pour le langage {ε} et « ∅ » pour le
+        langage vide. Ces deux sorties ne sont pas relisibles par
+        RegexParser ; toutes les autres le sont.
+
+        :param automaton: Automate à convertir
+        :type automaton: AbstractFiniteAutomaton
+        :return: Expression régulière équivalente
+        :rtype: str
+        """
+        return StateElimination.format(StateElimination.to_ast(automaton))
+
+    @staticmethod
+    def format(node: ASTNode) -> str:
+        """
+        Affiche un AST avec le minimum de parenthèses.
+
+        :param node: AST à afficher
+        :type node: ASTNode
+        :return: Expression régulière textuelle
+        :rtype: str
+        """
+        return _format(node)[0]
+
+
+def _flatten(node: ASTNode, node_type: NodeType) -> List[ASTNode]:
+    """Aplatit une chaîne d'opérateurs binaires associatifs de même type."""
+    operands: List[ASTNode] = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current.type == NodeType.GROUP:
+            stack.append(current.children[0])
+        elif current.type == node_type:
+            stack.extend(reversed(current.children))
+        else:
+            operands.append(current)
+    return operands
+
+
+def _is_nullable(node: ASTNode) -> bool:
+    """Indique si l'expression accepte le mot vide."""
+    if node.type in (NodeType.EPSILON, NodeType.KLEENE_STAR, NodeType.OPTIONAL):
+        return True
+    if node.type in (NodeType.UNION, NodeType.GROUP):
+        return any(_is_nullable(child) for child in node.children)
+    if node.type in (NodeType.CONCATENATION, NodeType.KLEENE_PLUS):
+        return all(_is_nullable(child) for child in node.children)
+    return False
+
+
+def _format(node: ASTNode) -> Tuple[str, int]:
+    """Retourne le texte d'un nœud et sa précédence."""
+    if node.type == NodeType.GROUP:
+        return _format(node.children[0])
+    if node.type == NodeType.EPSILON:
+        return "ε", _ATOM_PRECEDENCE
+    if node.type == NodeType.EMPTY:
+        return "∅", _ATOM_PRECEDENCE
+    if node.type == NodeType.LITERAL:
+        value = node.value or ""
+        atomic = (
+            len(value) == 1
+            or (len(value) == 2 and value[0] == "\\")
+            or (value.startswith("[") and value.endswith("]"))
+        )
+        return value, _ATOM_PRECEDENCE if atomic else _CONCAT_PRECEDENCE
+
+    if node.type == NodeType.UNION:
+        parts = [_format(child)[0] for child in _flatten(node, NodeType.UNION)]
+        return "|".join(parts), _UNION_PRECEDENCE
+
+    if node.type == NodeType.CONCATENATION:
+        parts = []
+        for child in _flatten(node, NodeType.CONCATENATION):
+            text, precedence = _format(child)
+            parts.append(f"({text})" if precedence < _CONCAT_PRECEDENCE else text)
+        return "".join(parts), _CONCAT_PRECEDENCE
+
+    operators = {
+        NodeType.KLEENE_STAR: "*",
+        NodeType.KLEENE_PLUS: "+",
+        NodeType.OPTIONAL: "?",
+    }
+    text, precedence = _format(node.children[0])
+    if precedence < _ATOM_PRECEDENCE:
+        text = f"({text})"
+    return text + operators[node.type], _UNARY_PRECEDENCE
+
+
+def _build_gnfa(
+    automaton: AbstractFiniteAutomaton,
+) -> Tuple[List[Tuple[int, int, ASTNode]], int, List[int], int]:
+    """
+    Extrait les arcs utiles d'un automate sous forme indexée.
+
+    Seuls les états accessibles et co-accessibles sont conservés.
+
+    :return: (arcs, état initial, états finaux, nombre d'états)
+    """
+    raw_edges: List[Tuple[str, str, Optional[str]]] = []
+    if hasattr(automaton, "get_intervals"):
+        # Les intervalles vers une même cible forment une seule classe
+        for state in automaton.states:
+            classes: Dict[str, object] = {}
+            for char_class, target in automaton.get_intervals(state):
+                merged = classes.get(target)
+                classes[target] = char_class if merged is None else merged | char_class
+            for target, char_class in classes.items():
+                raw_edges.append((state, target, _class_spec(char_class)))
+    else:
+        epsilon_symbol = getattr(automaton, "epsilon_symbol", "epsilon")
+        symbols = sorted(automaton.alphabet | {epsilon_symbol})
+        multi = hasattr(automaton, "get_transitions")
+        for state in automaton.states:
+            for symbol in symbols:
+                if multi:
+                    targets = automaton.get_transitions(state, symbol)
+                else:
+                    target = automaton.get_transition(state, symbol)
+                    targets = {target} if target is not None else set()
+                label = None if symbol == epsilon_symbol else _escape(symbol)
+                for target in targets:
+                    raw_edges.append((state, target, label))
+
+    forward: Dict[str, List[str]] = {}
+    backward: Dict[str, List[str]] = {}
+    for source, target, _ in raw_edges:
+        forward.setdefault(source, []).append(target)
+        backward.setdefault(target, []).append(source)
+
+    accessible = _closure({automaton.initial_state}, forward)
+    useful = accessible & _closure(set(automaton.final_states), backward)
+
+    index = {state: i for i, state in enumerate(sorted(useful))}
+    edges = [
+        (
+            index[source],
+            index[target],
+            _EPSILON if label is None else ASTNode(NodeType.LITERAL, value=label),
+        )
+        for source, target, label in sorted(
+            raw_edges, key=lambda e: (e[0], e[2] or "", e[1])
+        )
+        if source in index and target in index
+    ]
+    finals = [index[state] for state in automaton.final_states if state in index]
+    initial = index.get(automaton.initial_state, len(index))
+    return (
+        edges,
+        initial,
+        finals,
+        len(index) + (0 if automaton.initial_state in index else 1),
+    )
+
+
+def _escape(symbol: str) -> str:
+    """Échappe les métacaractères d'un symbole hors d'une classe."""
+    return "".join("\\" + char if char in _METACHARACTERS else char for char in symbol)
+
+
+def _class_spec(char_class: CharClass) -> str:
+    """
+    Écrit une classe de caractères dans la syntaxe relue par RegexParser.
+
+    Les bornes sont écrites telles quelles, les métacaractères des crochets
+    étant échappés ; la forme niée est choisie si elle est plus courte.
+    """
+    if len(char_class) == 1:
+        return _escape(next(iter(char_class)))
+    complement = char_class.complement()
+    negated = bool(complement) and (
+        len(complement.intervals) < len(char_class.intervals)
+    )
+    parts = []
+    for low, high in (complement if negated else char_class).intervals:
+        bounds = (low,) if low == high else (low, high)
+        parts.append("-".join(_bracket_char(chr(bound)) for bound in bounds))
+    return f"[{'^' if negated else ''}{''.join(parts)}]"
+
+
+def _bracket_char(char: str) -> str:
+    """Échappe un caractère à l'intérieur des crochets."""
+    return "\\" + char if char in _BRACKET_METACHARACTERS else char
+
+
+def _closure(seeds: set, graph: Dict[str, List[str]]) -> set:
+    """Ensemble des sommets atteignables depuis seeds dans graph."""
+    seen = set(seeds)
+    stack = list(seeds)
+    while stack:
+        for neighbour in graph.get(stack.pop(), ()):
+            if neighbour not in seen:
+                seen.add(neighbour)
+                stack.append(neighbour)
+    return seen
@@ -0,0 +1,307 @@
+"""
+Énumération, dénombrement et échantillonnage des mots d'un automate fini.
+
+Ce module contient la classe WordEnumeration. L'automate est déterminisé si
+nécessaire puis réduit à ses états utiles et numéroté en entiers ; les
+transitions sont conservées sous forme de tableaux d'arcs (source, cible)
+NumPy, ce qui permet de calculer par programmation dynamique vectorisée le
+nombre de mots acceptés de chaque longueur (entiers 64 bits, puis entiers
+Python sans borne dès qu'un dépassement devient possible).
+"""
+
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ...finite.abstract_finite_automaton import AbstractFiniteAutomaton
+from ...finite.dfa import DFA
+from ...finite.structural_analysis import StructuralAnalysis
+from ...finite.transition_matrix import _INT64_LIMIT
+
+
+class _TrimmedDFA:
+    """Vue entière d'un DFA réduit à ses états utiles."""
+
+    def __init__(self, automaton: AbstractFiniteAutomaton) -> None:
+        """Déterminise (si besoin) et numérote les états utiles de l'automate."""
+        if not isinstance(automaton, DFA):
+            automaton = automaton.to_dfa()
+
+        useful = StructuralAnalysis.of(automaton).useful
+        self.symbols: List[str] = sorted(automaton.alphabet)
+        self.index: Dict[str, int] = {}
+        if automaton.initial_state in useful:
+            # Numérotation en largeur depuis l'état initial
+            order = [automaton.initial_state]
+            self.index[automaton.initial_state] = 0
+            for state in order:
+                for symbol in self.symbols:
+                    target = automaton.get_transition(state, symbol)
+                    if target in useful and target not in self.index:
+                        self.index[target] = len(order)
+                        order.append(target)
+
+        size = len(self.index)
+        # Successeurs de chaque état, dans l'ordre des symboles
+        self.edges: List[List[Tuple[str, int]]] = [[] for _ in range(size)]
+        sources: List[int] = []
+        targets: List[int] = []
+        for state, number in self.index.items():
+            for symbol in self.symbols:
+                target = automaton.get_transition(state, symbol)
+                if target in self.index:
+                    self.edges[number].append((symbol, self.index[target]))
+                    sources.append(number)
+                    targets.append(self.index[target])
+        self.sources = np.asarray(sources, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        self.finals = np.zeros(size, dtype=bool)
+        for state, number in self.index.items():
+            self.finals[number] = automaton.is_final_state(state)
+        self.max_out_degree = max((len(edges) for edges in self.edges), default=0)
+        self.infinite = self._has_cycle()
+
+    @property
+    def empty(self) -> bool:
+        """Indique si l'automate n'accepte aucun mot."""
+        return not self.index
+
+    def _has_cycle(self) -> bool:
+        """Détecte un cycle parmi les états utiles (langage infini)."""
+        in_degree = np.bincount(self.targets, minlength=len(self.index))
+        ready = [state for state in range(len(self.index)) if in_degree[state] == 0]
+        removed = 0
+        while ready:
+            state = ready.pop()
+            removed += 1
+            for _, target in self.edges[state]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    ready.append(target)
+        return removed < len(self.index)
+
+    def step(self, vector: np.ndarray) -> np.ndarray:
+        """Calcule v'[q] = somme des v[p] sur les arcs q → p."""
+        result = np.zeros(len(vector), dtype=vector.dtype)
+        np.add.at(result, self.sources, vector[self.targets])
+        return result
+
+
+class WordEnumeration:
+    """
+    Énumération et dénombrement des mots acceptés par un automate fini.
+
+    Les automates non déterministes sont déterminisés au préalable, afin que
+    chaque mot soit compté et produit une seule fois.
+    """
+
+    @staticmethod
+    def count_by_length(
+        automaton: AbstractFiniteAutomaton, max_length: int
+    ) -> List[int]:
+        """
+        Compte les mots acceptés de chaque longueur.
+
+        Chaque étape est un produit matrice creuse-vecteur vectorisé ; les
+        calculs passent en entiers Python sans borne avant tout dépassement.
+
+        :param automaton: Automate fini
+        :type automaton: AbstractFiniteAutomaton
+        :param max_length: Longueur maximale
+        :type max_length: int
+        :return: Nombre de mots acceptés de longueur 0 à max_length
+        :rtype: List[int]
+        """
+        trimmed = _TrimmedDFA(automaton)
+        return [
+            int(row[0]) if len(row) else 0 for row in _count_table(trimmed, max_length)
+        ]
+
+    @staticmethod
+    def count_words(automaton: AbstractFiniteAutomaton) -> Optional[int]:
+        """
+        Compte tous les mots acceptés.
+
+        :param automaton: Automate fini
+        :type automaton: AbstractFiniteAutomaton
+        :return: Nombre de mots, ou None si le langage est infini
+        :rtype: Optional[int]
+        """
+        trimmed = _TrimmedDFA(automaton)
+        if trimmed.infinite:
+            return None
+        table = _count_table(trimmed, len(trimmed.index))
+        return sum(int(row[0]) for row in table) if not trimmed.empty else 0
+
+    @staticmethod
+    def is_finite(automaton: AbstractFiniteAutomaton) -> bool:
+        """
+        Indique si le langage est fini, sans dénombrer ses mots.
+
+        :param automaton: Automate fini
+        :type automaton: AbstractFiniteAutomaton
+        :return: True si le langage est fini
+        :rtype: bool
+        """
+        return not _TrimmedDFA(automaton).infinite
+
+    @staticmethod
+    def shortlex(
+        automaton: AbstractFiniteAutomaton, max_length: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Énumère les mots acceptés dans l'ordre militaire (longueur, puis
+        ordre lexicographique).
+
+        Seules les branches menant à un mot de la longueur courante sont
+        explorées : le délai entre deux mots ne dépend que de la longueur des
+        mots et de la taille de l'alphabet, pas de la taille de l'automate.
+        Sans borne, l'énumération d'un langage infini ne s'arrête pas.
+
+        :param automaton: Automate fini
+        :type automaton: AbstractFiniteAutomaton
+        :param max_length: Longueur maximale des mots (None : aucune borne)
+        :type max_length: Optional[int]
+        :return: Itérateur sur les mots acceptés
+        :rtype: Iterator[str]
+        """
+        trimmed = _TrimmedDFA(automaton)
+        if trimmed.empty:
+            return
+        if not trimmed.infinite:
+            # Un mot d'un langage fini visite au plus une fois chaque état
+            limit = len(trimmed.index) - 1
+            max_length = limit if max_length is None else min(max_length, limit)
+
+        # alive[k][q] : un mot de longueur k est accepté depuis q
+        alive = [trimmed.finals]
+        length = 0
+        while max_length is None or length <= max_length:
+            while len(alive) <= length:
+                alive.append(trimmed.step(alive[-1].astype(np.int64)) > 0)
+            if alive[length][0]:
+                yield from _words_of_length(trimmed, alive, length)
+            length += 1
+
+    @staticmethod
+    def sample(
+        automaton: AbstractFiniteAutomaton,
+        length: int,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[str]:
+        """
+        Tire uniformément un mot accepté de longueur donnée.
+
+        :param automaton: Automate fini
+        :type automaton: AbstractFiniteAutomaton
+        :param length: Longueur du mot
+        :type length: int
+        :param rng: Générateur aléatoire (par défaut, module random)
+        :type rng: Optional[random.Random]
+        :return: Mot tiré, ou None si aucun mot n'a cette longueur
+        :rtype: Optional[str]
+        """
+        trimmed = _TrimmedDFA(automaton)
+        if trimmed.empty:
+            return None
+        table = _count_table(trimmed, length)
+        if not table[length][0]:
+            return None
+        return _draw(trimmed, table, length, rng or random)
+
+    @staticmethod
+    def sample_words(
+        automaton: AbstractFiniteAutomaton,
+        count: int,
+        max_length: int,
+        rng: Optional[random.Random] = None,
+    ) -> List[str]:
+        """
+        Tire uniformément des mots acceptés de longueur au plus max_length.
+
+        :param automaton: Automate fini
+        :type automaton: AbstractFiniteAutomaton
+        :param count: Nombre de mots à tirer (avec remise)
+        :type count: int
+        :param max_length: Longueur maximale des mots
+        :type max_length: int
+        :param rng: Générateur aléatoire (par défaut, module random)
+        :type rng: Optional[random.Random]
+        :return: Mots tirés (liste vide si aucun mot n'est accepté)
+        :rtype: List[str]
+        """
+        rng = rng or random
+        trimmed = _TrimmedDFA(automaton)
+        if trimmed.empty:
+            return []
+        table = _count_table(trimmed, max_length)
+        totals = [int(row[0]) for row in table]
+        total = sum(totals)
+        words = []
+        for _ in range(count if total else 0):
+            # Choix de la longueur proportionnellement au nombre de mots
+            rank = rng.randrange(total)
+            length = 0
+            while rank >= totals[length]:
+                rank -= totals[length]
+                length += 1
+            words.append(_draw(trimmed, table, length, rng))
+        return words
+
+
+def _count_table(trimmed: _TrimmedDFA, max_length: int) -> List[np.ndarray]:
+    """Calcule table[k][q] = nombre de mots de longueur k acceptés depuis q."""
+    vector = trimmed.finals.astype(np.int64)
+    table = [vector]
+    for _ in range(max_length):
+        if vector.dtype != object and (
+            int(vector.max(initial=0)) * max(trimmed.max_out_degree, 1) >= _INT64_LIMIT
+        ):
+            vector = vector.astype(object)
+        vector = trimmed.step(vector)
+        table.append(vector)
+    return table
+
+
+def _words_of_length(
+    trimmed: _TrimmedDFA, alive: List[np.ndarray], length: int
+) -> Iterator[str]:
+    """Énumère dans l'ordre lexicographique les mots acceptés d'une longueur."""
+    prefix: List[str] = []
+    # Pile de (itérateur sur les arcs sortants, longueur restante)
+    stack = [(iter(trimmed.edges[0]), length)]
+    if length == 0:
+        yield ""
+        return
+    while stack:
+        edges, remaining = stack[-1]
+        for symbol, target in edges:
+            if alive[remaining - 1][target]:
+                prefix.append(symbol)
+                if remaining == 1:
+                    yield "".join(prefix)
+                    prefix.pop()
+                    continue
+                stack.append((iter(trimmed.edges[target]), remaining - 1))
+                break
+        else:
+            stack.pop()
+            if prefix:
+                prefix.pop()
+
+
+def _draw(trimmed: _TrimmedDFA, table: List[np.ndarray], length: int, rng) -> str:
+    """Tire un mot de longueur donnée selon les comptes de la table."""
+    state = 0
+    word = []
+    for remaining in range(length, 0, -1):
+        rank = rng.randrange(int(table[remaining][state]))
+        for symbol, target in trimmed.edges[state]:
+            weight = int(table[remaining - 1][target])
+            if rank < weight:
+                word.append(symbol)
+                state = target
+                break
+            rank -= weight
+    return "".join(word)
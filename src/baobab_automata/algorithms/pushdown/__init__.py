@@ -1,9 +1,24 @@
 """Module pour les algorithmes des automates à pile."""
 
+from .cyk_parser import CYKParser, CYKTable
+from .earley_parser import EarleyChart, EarleyParser, SPPFNode
+from .glr_parser import GLRParser, GLRRun, GSSNode
+from .lr_parser import LRConflict, LRParser, LRTables
 from .pushdown_conversion_algorithms import PushdownConversionAlgorithms
 from .pushdown_optimization_algorithms import PushdownOptimizationAlgorithms
 
 __all__ = [
+    "CYKParser",
+    "CYKTable",
+    "EarleyChart",
+    "EarleyParser",
+    "SPPFNode",
+    "GLRParser",
+    "GLRRun",
+    "GSSNode",
+    "LRConflict",
+    "LRParser",
+    "LRTables",
     "PushdownConversionAlgorithms",
     "PushdownOptimizationAlgorithms",
 ]
@@ -0,0 +1,383 @@
+"""
+Analyse CYK vectorisée pour les grammaires en forme normale de Chomsky.
+
+Ce module contient la classe CYKParser. Chaque case du tableau porte
+l'ensemble des variables qui dérivent son intervalle ; une longueur
+d'intervalle l est traitée en une seule opération NumPy, pour toutes les
+positions de départ et toutes les coupures :
+
+- chaque case est projetée, dès son calcul, en deux bitsets (mots de 64
+  bits indexés par règle) : règles A -> BC dont B, resp. C, dérive la case ;
+- indexées par début pour B et par fin pour C, les deux moitiés d'une
+  coupure [i, i + k) · [i + k, i + l) sont des vues du tableau, et leur ET
+  suivi d'un OU sur k donne les règles validées ;
+- un OU par groupe de règles de même partie gauche (reduceat) replie
+  ces règles sur les variables.
+
+La complexité reste en O(n³ |R| / 64) mais seules O(n) opérations NumPy
+sont exécutées. L'extraction d'arbre retrouve les pointeurs arrière
+(règle et coupure) à la demande, pour les seules cases de l'arbre.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from ...pushdown.grammar.grammar_exceptions import GrammarNormalizationError
+from ...pushdown.grammar.grammar_parser import GrammarParser
+from ...pushdown.grammar.grammar_tokens import Tokenizer
+from ...pushdown.grammar.grammar_types import ContextFreeGrammar, Production
+
+
+class CYKTable:
+    """
+    Tableau CYK d'une entrée.
+
+    :ivar cells: cells[i, l, v] vaut True si la variable v dérive
+        l'intervalle [i, i + l)
+    """
+
+    __slots__ = ("cells",)
+
+    def __init__(self, cells: np.ndarray) -> None:
+        """Initialise un tableau à partir de ses cases."""
+        self.cells = cells
+
+
+class CYKParser:
+    """
+    Analyseur CYK compilé pour une grammaire en forme normale de Chomsky.
+
+    Les productions admises sont A -> a, A -> BC et S -> ε pour l'axiome.
+    Le découpage de l'entrée en jetons suit celui de EarleyParser.
+    """
+
+    def __init__(self, grammar: ContextFreeGrammar) -> None:
+        """
+        Compile la grammaire.
+
+        :param grammar: Grammaire en forme normale de Chomsky
+        :type grammar: ContextFreeGrammar
+        :raises ValueError: Si une production n'est pas de la forme attendue
+        """
+        self._start = grammar.start_symbol
+        self._variables = sorted(
+            set(grammar.variables) | {p.left_side for p in grammar.productions}
+        )
+        index = {variable: number for number, variable in enumerate(self._variables)}
+        self._tokenizer = Tokenizer(grammar.terminals)
+        self.accepts_empty = False
+
+        lexical: Dict[str, Set[int]] = {}
+        binary: List[Tuple[int, int, int]] = []
+        for production in grammar.productions:
+            right = production.right_side
+            head = index[production.left_side]
+            if not right and production.left_side == self._start:
+                self.accepts_empty = True
+            elif len(right) == 1 and right[0] not in index:
+                lexical.setdefault(right[0], set()).add(head)
+            elif len(right) == 2 and right[0] in index and right[1] in index:
+                binary.append((head, index[right[0]], index[right[1]]))
+            else:
+                raise ValueError(
+                    f"Production hors forme normale de Chomsky : {production}"
+                )
+
+        size = len(self._variables)
+        self._lexical: Dict[str, np.ndarray] = {}
+        for terminal, heads in lexical.items():
+            row = np.zeros(size, dtype=bool)
+            row[sorted(heads)] = True
+            self._lexical[terminal] = row
+
+        # Règles triées par partie gauche, pour le repli par reduceat
+        binary.sort()
+        self._rules = binary
+        self._heads = np.array([head for head, _, _ in binary], dtype=np.intp)
+        self._lefts = np.array([left for _, left, _ in binary], dtype=np.intp)
+        self._rights = np.array([right for _, _, right in binary], dtype=np.intp)
+        self._group_heads, self._group_starts = np.unique(
+            self._heads, return_index=True
+        )
+        self._start_index = index.get(self._start)
+
+        # Bit de chaque règle : mot r // 64, position r % 64
+        numbers = np.arange(len(binary))
+        self._rule_words = numbers // 64
+        self._rule_masks = np.left_shift(np.uint64(1), (numbers % 64).astype(np.uint64))
+        words = (len(binary) + 63) // 64
+        self._rule_bits = np.zeros((len(binary), words), dtype=np.uint64)
+        self._rule_bits[numbers, self._rule_words] = self._rule_masks
+
+    @staticmethod
+    def normalize(grammar: ContextFreeGrammar) -> Optional[ContextFreeGrammar]:
+        """
+        Met une grammaire quelconque en forme normale de Chomsky stricte.
+
+        La grammaire passe par GrammarParser.to_chomsky_normal_form (ε,
+        règles unitaires et symboles inutiles éliminés, règles binarisées),
+        puis les règles unitaires résiduelles sont dépliées, les terminaux
+        des règles binaires sont remplacés par des variables T_a -> a et, si
+        l'axiome est annulable, un nouvel axiome S0 reçoit S0 -> ε.
+
+        :param grammar: Grammaire hors-contexte
+        :type grammar: ContextFreeGrammar
+        :return: Grammaire équivalente, ou None si le langage est vide
+        :rtype: Optional[ContextFreeGrammar]
+        :raises GrammarError: Si la normalisation échoue
+        """
+        if grammar.start_symbol not in _generating_variables(grammar):
+            return None
+        accepts_empty = grammar.start_symbol in grammar.get_analysis().nullable
+        try:
+            normalized = GrammarParser().to_chomsky_normal_form(grammar)
+        except GrammarNormalizationError:
+            if not accepts_empty:
+                raise
+            # Seul le mot vide est engendré : S -> ε
+            return ContextFreeGrammar(
+                variables={grammar.start_symbol},
+                terminals=set(grammar.terminals),
+                productions={Production(grammar.start_symbol, ())},
+                start_symbol=grammar.start_symbol,
+                name=grammar.name,
+            )
+        return _complete_chomsky(normalized, accepts_empty)
+
+    def tokenize(self, text: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+        """
+        Découpe une entrée en jetons.
+
+        :param text: Chaîne ou séquence de jetons
+        :type text: Union[str, Sequence[str]]
+        :return: Jetons
+        :rtype: Tuple[str, ...]
+        """
+        return self._tokenizer.tokenize(text)
+
+    def recognize(self, tokens: Sequence[str]) -> bool:
+        """
+        Décide l'appartenance au langage.
+
+        :param tokens: Jetons de l'entrée
+        :type tokens: Sequence[str]
+        :return: True si l'entrée est engendrée par la grammaire
+        :rtype: bool
+        """
+        if not tokens:
+            return self.accepts_empty
+        table = self.table(tokens)
+        return table is not None and bool(
+            table.cells[0, len(tokens), self._start_index]
+        )
+
+    def table(self, tokens: Sequence[str]) -> Optional[CYKTable]:
+        """
+        Remplit le tableau CYK de l'entrée.
+
+        :param tokens: Jetons de l'entrée, non vide
+        :type tokens: Sequence[str]
+        :return: Tableau, ou None si un jeton n'est produit par aucune variable
+        :rtype: Optional[CYKTable]
+        """
+        length = len(tokens)
+        size = len(self._variables)
+        leaves = np.zeros((length, size), dtype=bool)
+        for position, token in enumerate(tokens):
+            row = self._lexical.get(token)
+            if row is None:
+                return None
+            leaves[position] = row
+
+        table = CYKTable(np.zeros((length, length + 1, size), dtype=bool))
+        table.cells[:, 1] = leaves
+        if not self._rules:
+            return table
+
+        # Projections des cases sur les colonnes B (par début) et C (par fin)
+        # des règles A -> BC, en bitsets de mots de 64 règles : les deux
+        # moitiés d'une coupure sont alors des vues du tableau
+        words = self._rule_bits.shape[1]
+        lefts = np.zeros((length, length + 1, words), dtype=np.uint64)
+        rights = np.zeros((length + 1, length + 1, words), dtype=np.uint64)
+        lefts[:, 1] = self._pack(leaves[:, self._lefts])
+        rights[1:, 1] = self._pack(leaves[:, self._rights])
+        for span in range(2, length + 1):
+            count = length - span + 1
+            # hits[i, k - 1] : règles dont B dérive [i, i + k) et C [i + k, i + span)
+            hits = (
+                lefts[:count, 1:span] & rights[span : span + count, span - 1 : 0 : -1]
+            )
+            found = self._unpack(np.bitwise_or.reduce(hits, axis=1))
+            cell = table.cells[:count, span]
+            cell[:, self._group_heads] = np.logical_or.reduceat(
+                found, self._group_starts, axis=1
+            )
+            lefts[:count, span] = self._pack(cell[:, self._lefts])
+            rights[span : span + count, span] = self._pack(cell[:, self._rights])
+        return table
+
+    def _pack(self, columns: np.ndarray) -> np.ndarray:
+        """Regroupe des colonnes booléennes par règle en mots de 64 bits."""
+        return (columns[..., None] * self._rule_bits).sum(axis=-2, dtype=np.uint64)
+
+    def _unpack(self, packed: np.ndarray) -> np.ndarray:
+        """Inverse de _pack : un booléen par règle."""
+        return (packed[..., self._rule_words] & self._rule_masks) != 0
+
+    def derivation(
+        self, tokens: Sequence[str], builder: Callable[..., object]
+    ) -> Optional[object]:
+        """
+        Extrait un arbre de dérivation en suivant les pointeurs arrière.
+
+        :param tokens: Jetons de l'entrée
+        :type tokens: Sequence[str]
+        :param builder: Constructeur appelé avec (symbole, enfants, début, fin),
+            par exemple ParseTree
+        :type builder: Callable[..., object]
+        :return: Arbre, ou None si l'entrée est rejetée
+        :rtype: Optional[object]
+        """
+        tokens = tuple(tokens)
+        if not tokens:
+            return builder(self._start, [], 0, 0) if self.accepts_empty else None
+        table = self.table(tokens)
+        length = len(tokens)
+        if table is None or not table.cells[0, length, self._start_index]:
+            return None
+
+        built: Dict[Tuple[int, int, int], object] = {}
+        root = (self._start_index, 0, length)
+        stack: List[Tuple[int, int, int, bool]] = [(*root, False)]
+        while stack:
+            variable, start, span, expanded = stack.pop()
+            key = (variable, start, span)
+            if key in built:
+                continue
+            name = self._variables[variable]
+            if span == 1:
+                leaf = builder(tokens[start], [], start, start + 1)
+                built[key] = builder(name, [leaf], start, start + 1)
+                continue
+            rule, cut = self._back_pointer(table, variable, start, span)
+            _, left, right = self._rules[rule]
+            children = ((left, start, cut), (right, start + cut, span - cut))
+            if expanded:
+                built[key] = builder(
+                    name, [built[child] for child in children], start, start + span
+                )
+                continue
+            stack.append((variable, start, span, True))
+            stack.extend((*child, False) for child in children if child not in built)
+        return built[root]
+
+    def _back_pointer(
+        self, table: CYKTable, variable: int, start: int, span: int
+    ) -> Tuple[int, int]:
+        """Première règle de la variable et première coupure qui la valident."""
+        low, high = np.searchsorted(self._heads, [variable, variable + 1])
+        cuts = np.arange(1, span)
+        hits = (
+            table.cells[start, 1:span][:, self._lefts[low:high]]
+            & table.cells[start + cuts, span - cuts][:, self._rights[low:high]]
+        )
+        cut, rule = np.argwhere(hits)[0]
+        return low + int(rule), int(cut) + 1
+
+
+def _complete_chomsky(
+    grammar: ContextFreeGrammar, accepts_empty: bool
+) -> ContextFreeGrammar:
+    """Remplace les terminaux des règles binaires et isole ε sous un axiome S0."""
+    used = set(grammar.variables) | set(grammar.terminals)
+
+    def fresh(name: str) -> str:
+        """Nom de variable inutilisé dérivé de name."""
+        while name in used:
+            name += "'"
+        used.add(name)
+        return name
+
+    lifted: Dict[str, str] = {}
+
+    def lift(symbol: str) -> str:
+        """Variable T_a remplaçant le terminal a dans une règle binaire."""
+        if symbol in grammar.variables:
+            return symbol
+        if symbol not in lifted:
+            lifted[symbol] = fresh(f"T_{symbol}")
+        return lifted[symbol]
+
+    # Règles unitaires résiduelles : A reprend les règles de tout B tel que A =>* B
+    units: Dict[str, Set[str]] = {}
+    for production in grammar.productions:
+        right = production.right_side
+        if len(right) == 1 and right[0] in grammar.variables:
+            units.setdefault(production.left_side, set()).add(right[0])
+    reachable: Dict[str, Set[str]] = {}
+    for variable in units:
+        seen = {variable}
+        stack = [variable]
+        while stack:
+            for target in units.get(stack.pop(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        reachable[variable] = seen
+
+    productions: Set[Production] = set()
+    for production in grammar.productions:
+        right = production.right_side
+        if not right or (len(right) == 1 and right[0] in grammar.variables):
+            # Le mot vide est traité par l'axiome S0, les règles unitaires
+            # sont remplacées ci-dessous
+            continue
+        if len(right) == 2:
+            right = tuple(lift(symbol) for symbol in right)
+        productions.add(Production(production.left_side, right))
+    for variable, targets in reachable.items():
+        productions.update(
+            Production(variable, production.right_side)
+            for production in list(productions)
+            if production.left_side in targets
+        )
+    productions.update(
+        Production(variable, (terminal,)) for terminal, variable in lifted.items()
+    )
+
+    start = grammar.start_symbol
+    variables = set(grammar.variables) | set(lifted.values())
+    if accepts_empty:
+        start = fresh(f"{grammar.start_symbol}0")
+        variables.add(start)
+        productions.update(
+            Production(start, production.right_side)
+            for production in list(productions)
+            if production.left_side == grammar.start_symbol
+        )
+        productions.add(Production(start, ()))
+    return ContextFreeGrammar(
+        variables=variables,
+        terminals=set(grammar.terminals),
+        productions=productions,
+        start_symbol=start,
+        name=grammar.name,
+    )
+
+
+def _generating_variables(grammar: ContextFreeGrammar) -> Set[str]:
+    """Variables qui dérivent au moins un mot terminal (point fixe)."""
+    generating: Set[str] = set()
+    changed = True
+    while changed:
+        changed = False
+        for production in grammar.productions:
+            if production.left_side not in generating and all(
+                symbol in generating or symbol not in grammar.variables
+                for symbol in production.right_side
+            ):
+                generating.add(production.left_side)
+                changed = True
+    return generating
@@ -0,0 +1,524 @@
+"""
+Analyse d'Earley pour les grammaires hors-contexte.
+
+Ce module contient la classe EarleyParser, compilée une fois par grammaire,
+et la forêt d'analyse partagée et compactée (SPPF) qu'elle produit :
+
+- les variables annulables sont précalculées et l'avancement au-delà d'une
+  variable annulable se fait dès la prédiction (Aycock et Horspool), ce qui
+  rend la complétion des items vides correcte sans passe supplémentaire ;
+- chaque ensemble d'Earley indexe ses items par symbole attendu, de sorte
+  qu'une complétion ne parcourt que les items qui attendent la variable ;
+- l'optimisation de Leo remplace les chaînes de réductions déterministes
+  par un item transitif, si bien que la récursivité droite reste linéaire ;
+- la forêt est binarisée (nœuds intermédiaires à la Scott) : sa taille est
+  en O(n³) même quand le nombre d'arbres est exponentiel.
+
+La reconnaissance est en O(n) pour les grammaires LR-régulières, en O(n²)
+pour les grammaires non ambiguës et en O(n³) dans le pire cas.
+"""
+
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ...pushdown.grammar.grammar_tokens import Tokenizer
+from ...pushdown.grammar.grammar_types import ContextFreeGrammar, Production
+
+# Item d'Earley : (indice de production, position du point, origine)
+Item = Tuple[int, int, int]
+
+# Famille d'un nœud de la forêt : production appliquée et enfants
+Family = Tuple[Production, Tuple["SPPFNode", ...]]
+
+# Marque d'un item de Leo en cours de calcul
+_PENDING: Item = (-1, -1, -1)
+
+# Partie gauche de la règle augmentée, distincte de toute variable
+_AUGMENTED = "\x00start"
+
+
+class SPPFNode:
+    """
+    Nœud d'une forêt d'analyse partagée et compactée.
+
+    Un nœud de symbole porte le nom d'une variable ou d'un terminal, un
+    nœud intermédiaire porte le couple (production, point) du préfixe
+    reconnu. Chaque famille (nœud « packed ») est une façon distincte de
+    dériver l'intervalle [start, end) ; une feuille terminale n'en a aucune.
+    """
+
+    __slots__ = ("label", "start", "end", "families")
+
+    def __init__(
+        self, label: Union[str, Tuple[Production, int]], start: int, end: int
+    ) -> None:
+        """
+        Initialise un nœud sans famille.
+
+        :param label: Symbole, ou (production, point) pour un nœud intermédiaire
+        :type label: Union[str, Tuple[Production, int]]
+        :param start: Début de l'intervalle couvert
+        :type start: int
+        :param end: Fin (exclue) de l'intervalle couvert
+        :type end: int
+        """
+        self.label = label
+        self.start = start
+        self.end = end
+        self.families: List[Family] = []
+
+    @property
+    def is_intermediate(self) -> bool:
+        """Indique si le nœud représente un préfixe de production."""
+        return isinstance(self.label, tuple)
+
+    @property
+    def is_ambiguous(self) -> bool:
+        """Indique si le nœud a plusieurs dérivations locales."""
+        return len(self.families) > 1
+
+    def __repr__(self) -> str:
+        """Représentation courte du nœud."""
+        if self.is_intermediate:
+            production, dot = self.label
+            prefix = " ".join(production.right_side[:dot])
+            return (
+                f"SPPFNode({production.left_side} -> {prefix} •, "
+                f"{self.start}, {self.end})"
+            )
+        return f"SPPFNode({self.label!r}, {self.start}, {self.end})"
+
+    def iter_nodes(self) -> List["SPPFNode"]:
+        """
+        Liste les nœuds accessibles depuis ce nœud, chacun une seule fois.
+
+        :return: Nœuds de la forêt, en commençant par celui-ci
+        :rtype: List[SPPFNode]
+        """
+        seen = {id(self)}
+        nodes = [self]
+        stack = [self]
+        while stack:
+            for _, children in stack.pop().families:
+                for child in children:
+                    if id(child) not in seen:
+                        seen.add(id(child))
+                        nodes.append(child)
+                        stack.append(child)
+        return nodes
+
+    def count_trees(self) -> Optional[int]:
+        """
+        Compte les arbres de dérivation représentés par la forêt.
+
+        :return: Nombre d'arbres, ou None si la forêt contient un cycle
+            (grammaire cyclique, infinité de dérivations)
+        :rtype: Optional[int]
+        """
+        counts: Dict[int, int] = {}
+        on_path: Set[int] = set()
+        stack: List[Tuple[SPPFNode, bool]] = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            key = id(node)
+            if expanded:
+                on_path.discard(key)
+                total = 0
+                for _, children in node.families:
+                    product = 1
+                    for child in children:
+                        product *= counts[id(child)]
+                    total += product
+                counts[key] = total if node.families else 1
+                continue
+            if key in counts:
+                continue
+            if key in on_path:
+                return None
+            on_path.add(key)
+            stack.append((node, True))
+            for _, children in node.families:
+                for child in children:
+                    if id(child) in on_path:
+                        return None
+                    if id(child) not in counts:
+                        stack.append((child, False))
+        return counts[id(self)]
+
+    def extract(self, builder: Callable[..., object]) -> object:
+        """
+        Extrait un arbre de dérivation de la forêt.
+
+        Chaque nœud choisit la famille de plus petite hauteur, ce qui garantit
+        un arbre fini même en présence de cycles. Les nœuds intermédiaires
+        sont aplatis : les enfants d'un arbre sont ceux de la production.
+
+        :param builder: Constructeur appelé avec (symbole, enfants, début, fin),
+            par exemple ParseTree
+        :type builder: Callable[..., object]
+        :return: Arbre construit par builder
+        :rtype: object
+        """
+        nodes = self.iter_nodes()
+        choice = _shortest_families(nodes)
+        built: Dict[int, object] = {}
+        stack: List[Tuple[SPPFNode, bool]] = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in built:
+                continue
+            parts = _flatten(choice, node) if node.families else []
+            if expanded or not parts:
+                children = [built[id(part)] for part in parts]
+                built[id(node)] = builder(node.label, children, node.start, node.end)
+                continue
+            stack.append((node, True))
+            stack.extend((part, False) for part in parts if id(part) not in built)
+        return built[id(self)]
+
+
+class EarleyChart:
+    """
+    Résultat d'une passe de reconnaissance.
+
+    :ivar accepted: Indique si l'entrée appartient au langage
+    :ivar failed_at: Position du premier symbole non analysable, ou None
+    :ivar items: Ensembles d'Earley, un par position de l'entrée
+    :ivar completed: Par position, variable -> origines des items complets
+    """
+
+    __slots__ = ("accepted", "failed_at", "items", "completed")
+
+    def __init__(self) -> None:
+        """Initialise un tableau vide."""
+        self.accepted = False
+        self.failed_at: Optional[int] = None
+        self.items: List[Set[Item]] = []
+        self.completed: List[Dict[str, Set[int]]] = []
+
+    @property
+    def item_count(self) -> int:
+        """Nombre total d'items créés."""
+        return sum(len(items) for items in self.items)
+
+
+class EarleyParser:
+    """
+    Analyseur d'Earley compilé pour une grammaire hors-contexte.
+
+    Les terminaux sont comparés aux jetons de l'entrée : une chaîne est
+    découpée en caractères lorsque tous les terminaux sont des caractères,
+    en mots séparés par des blancs sinon ; une séquence est prise telle
+    quelle.
+    """
+
+    def __init__(self, grammar: ContextFreeGrammar) -> None:
+        """
+        Compile la grammaire.
+
+        :param grammar: Grammaire hors-contexte
+        :type grammar: ContextFreeGrammar
+        """
+        self._start = grammar.start_symbol
+        self._variables = frozenset(grammar.variables) | {
+            production.left_side for production in grammar.productions
+        }
+        self._productions: List[Production] = sorted(
+            grammar.productions, key=lambda p: (p.left_side, p.right_side)
+        )
+        self._lhs = [production.left_side for production in self._productions]
+        self._rhs = [tuple(production.right_side) for production in self._productions]
+        self._by_lhs: Dict[str, List[int]] = {}
+        for number, left in enumerate(self._lhs):
+            self._by_lhs.setdefault(left, []).append(number)
+        # Règle augmentée S' -> S : l'axiome peut alors figurer dans une
+        # chaîne de Leo sans que l'acceptation soit perdue
+        self._accept = len(self._rhs)
+        self._lhs.append(_AUGMENTED)
+        self._rhs.append((self._start,))
+        self._tokenizer = Tokenizer(grammar.terminals)
+        self.nullable = grammar.get_analysis().nullable
+
+    def tokenize(self, text: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+        """
+        Découpe une entrée en jetons.
+
+        :param text: Chaîne ou séquence de jetons
+        :type text: Union[str, Sequence[str]]
+        :return: Jetons
+        :rtype: Tuple[str, ...]
+        """
+        return self._tokenizer.tokenize(text)
+
+    def recognize(self, tokens: Sequence[str]) -> bool:
+        """
+        Décide l'appartenance au langage, avec l'optimisation de Leo.
+
+        :param tokens: Jetons de l'entrée
+        :type tokens: Sequence[str]
+        :return: True si l'entrée est engendrée par la grammaire
+        :rtype: bool
+        """
+        return self.chart(tokens).accepted
+
+    def chart(self, tokens: Sequence[str], leo: bool = True) -> EarleyChart:
+        """
+        Construit les ensembles d'Earley de l'entrée.
+
+        Avec leo=True, les items intermédiaires des chaînes de réductions
+        déterministes ne sont pas créés ; le tableau suffit alors à la
+        reconnaissance mais pas à la construction de la forêt.
+
+        :param tokens: Jetons de l'entrée
+        :type tokens: Sequence[str]
+        :param leo: Active les items transitifs de Leo
+        :type leo: bool
+        :return: Tableau d'analyse
+        :rtype: EarleyChart
+        """
+        lhs, rhs, by_lhs = self._lhs, self._rhs, self._by_lhs
+        variables, nullable = self._variables, self.nullable
+        chart = EarleyChart()
+        waiting_sets: List[Dict[str, List[Item]]] = []
+        leo_sets: List[Dict[str, Optional[Item]]] = []
+
+        def leo_item(origin: int, variable: str) -> Optional[Item]:
+            """Item transitif le plus haut de la chaîne déterministe, s'il existe."""
+            chain = []
+            top: Optional[Item] = None
+            while True:
+                memo = leo_sets[origin]
+                if variable in memo:
+                    top = memo[variable]
+                    break
+                memo[variable] = _PENDING
+                candidates = waiting_sets[origin].get(variable)
+                if candidates is None or len(candidates) != 1:
+                    break
+                rule, dot, parent = candidates[0]
+                if dot + 1 != len(rhs[rule]):
+                    break
+                chain.append((origin, variable, (rule, dot + 1, parent)))
+                origin, variable = parent, lhs[rule]
+            if top is _PENDING:
+                # Chaîne cyclique (productions unitaires) : pas d'item transitif
+                for origin, variable, _ in chain:
+                    leo_sets[origin][variable] = None
+                return None
+            leo_sets[origin][variable] = top
+            for origin, variable, item in reversed(chain):
+                if top is None:
+                    top = item
+                leo_sets[origin][variable] = top
+            return top
+
+        length = len(tokens)
+        current: List[Item] = [(self._accept, 0, 0)]
+        for position in range(length + 1):
+            seen = set(current)
+            queue = list(seen)
+            waiting: Dict[str, List[Item]] = {}
+            completed: Dict[str, Set[int]] = {}
+            scans: Dict[str, List[Item]] = {}
+            chart.items.append(seen)
+            chart.completed.append(completed)
+            waiting_sets.append(waiting)
+            leo_sets.append({})
+
+            while queue:
+                item = queue.pop()
+                rule, dot, origin = item
+                right = rhs[rule]
+                if dot < len(right):
+                    symbol = right[dot]
+                    if symbol not in variables:
+                        scans.setdefault(symbol, []).append(item)
+                        continue
+                    new = []
+                    expecting = waiting.get(symbol)
+                    if expecting is None:
+                        waiting[symbol] = [item]
+                        new.extend(
+                            (other, 0, position) for other in by_lhs.get(symbol, ())
+                        )
+                    else:
+                        expecting.append(item)
+                    if symbol in nullable:
+                        new.append((rule, dot + 1, origin))
+                else:
+                    variable = lhs[rule]
+                    completed.setdefault(variable, set()).add(origin)
+                    if origin == position:
+                        # Déjà avancé à la prédiction (variable annulable)
+                        continue
+                    top = leo_item(origin, variable) if leo else None
+                    if top is not None:
+                        new = [top]
+                    else:
+                        new = [
+                            (other, other_dot + 1, other_origin)
+                            for other, other_dot, other_origin in waiting_sets[
+                                origin
+                            ].get(variable, ())
+                        ]
+                for candidate in new:
+                    if candidate not in seen:
+                        seen.add(candidate)
+                        queue.append(candidate)
+
+            if position == length:
+                break
+            current = [
+                (rule, dot + 1, origin)
+                for rule, dot, origin in scans.get(tokens[position], ())
+            ]
+            if not current:
+                chart.failed_at = position
+                return chart
+
+        chart.accepted = (self._accept, 1, 0) in chart.items[length]
+        return chart
+
+    def parse(self, tokens: Sequence[str]) -> Optional[SPPFNode]:
+        """
+        Construit la forêt d'analyse partagée de l'entrée.
+
+        :param tokens: Jetons de l'entrée
+        :type tokens: Sequence[str]
+        :return: Nœud racine (axiome, 0, n), ou None si l'entrée est rejetée
+        :rtype: Optional[SPPFNode]
+        """
+        tokens = tuple(tokens)
+        chart = self.chart(tokens, leo=False)
+        if not chart.accepted:
+            return None
+        return self._forest(tokens, chart)
+
+    def _forest(self, tokens: Tuple[str, ...], chart: EarleyChart) -> SPPFNode:
+        """Construit la forêt binarisée à partir d'un tableau complet."""
+        rhs, by_lhs, productions = self._rhs, self._by_lhs, self._productions
+        variables, items, completed = self._variables, chart.items, chart.completed
+        nodes: Dict[tuple, SPPFNode] = {}
+        pending: List[Tuple[tuple, SPPFNode]] = []
+
+        def symbol_node(symbol: str, start: int, end: int) -> SPPFNode:
+            """Nœud de symbole, créé à la demande."""
+            key = (symbol, start, end)
+            node = nodes.get(key)
+            if node is None:
+                node = nodes[key] = SPPFNode(symbol, start, end)
+                if symbol in variables:
+                    pending.append((key, node))
+            return node
+
+        def prefix_node(rule: int, dot: int, start: int, end: int) -> SPPFNode:
+            """Nœud du préfixe de longueur dot (le symbole lui-même si dot == 1)."""
+            if dot == 1:
+                return symbol_node(rhs[rule][0], start, end)
+            key = (rule, dot, start, end)
+            node = nodes.get(key)
+            if node is None:
+                node = nodes[key] = SPPFNode((productions[rule], dot), start, end)
+                pending.append((key, node))
+            return node
+
+        def splits(
+            rule: int, dot: int, start: int, end: int
+        ) -> Iterable[Tuple[SPPFNode, ...]]:
+            """Découpages du préfixe de longueur dot sur [start, end)."""
+            if dot == 0:
+                if start == end:
+                    yield ()
+                return
+            symbol = rhs[rule][dot - 1]
+            if symbol in variables:
+                middles = completed[end].get(symbol, ())
+            elif end > start and tokens[end - 1] == symbol:
+                middles = (end - 1,)
+            else:
+                middles = ()
+            for middle in middles:
+                if middle < start or (rule, dot - 1, start) not in items[middle]:
+                    continue
+                last = symbol_node(symbol, middle, end)
+                if dot == 1:
+                    yield (last,)
+                else:
+                    yield (prefix_node(rule, dot - 1, start, middle), last)
+
+        root = symbol_node(self._start, 0, len(tokens))
+        while pending:
+            key, node = pending.pop()
+            if len(key) == 4:
+                rule, dot, start, end = key
+                node.families = [
+                    (productions[rule], children)
+                    for children in splits(rule, dot, start, end)
+                ]
+                continue
+            variable, start, end = key
+            for rule in by_lhs.get(variable, ()):
+                size = len(rhs[rule])
+                if (rule, size, start) in items[end]:
+                    node.families.extend(
+                        (productions[rule], children)
+                        for children in splits(rule, size, start, end)
+                    )
+        return root
+
+
+def _shortest_families(nodes: List[SPPFNode]) -> Dict[int, Family]:
+    """
+    Famille de hauteur minimale de chaque nœud.
+
+    Les cycles ne relient que des nœuds de même intervalle : on traite les
+    intervalles par longueur croissante et on relâche chaque groupe jusqu'à
+    stabilité.
+    """
+    infinity = float("inf")
+    height: Dict[int, float] = {}
+    choice: Dict[int, Family] = {}
+    groups: Dict[int, List[SPPFNode]] = {}
+    for node in nodes:
+        if node.families:
+            height[id(node)] = infinity
+            groups.setdefault(node.end - node.start, []).append(node)
+        else:
+            height[id(node)] = 0
+
+    for span in sorted(groups):
+        changed = True
+        while changed:
+            changed = False
+            for node in groups[span]:
+                for family in node.families:
+                    candidate = 1 + max(
+                        (height[id(child)] for child in family[1]), default=0
+                    )
+                    if candidate < height[id(node)]:
+                        height[id(node)] = candidate
+                        choice[id(node)] = family
+                        changed = True
+    return choice
+
+
+def _flatten(choice: Dict[int, Family], node: SPPFNode) -> List[SPPFNode]:
+    """Enfants de symbole de la famille choisie, intermédiaires dépliés."""
+    parts: List[SPPFNode] = []
+    stack = list(reversed(choice[id(node)][1]))
+    while stack:
+        child = stack.pop()
+        if child.is_intermediate:
+            stack.extend(reversed(choice[id(child)][1]))
+        else:
+            parts.append(child)
+    return parts
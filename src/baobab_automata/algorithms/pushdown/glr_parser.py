@@ -0,0 +1,300 @@
+"""
+Analyse GLR (Tomita) pilotée par des tables LR.
+
+Ce module contient la classe GLRParser, qui exécute toutes les actions
+d'une case conflictuelle des tables LALR(1) au lieu d'en retenir une :
+
+- les piles concurrentes forment un graphe (graph-structured stack) : un
+  nœud par couple (position, état), les suffixes communs étant partagés, si
+  bien qu'une bifurcation ne recopie jamais de pile ;
+- les réductions suivent les chemins du graphe ; lorsqu'une arête est
+  ajoutée à un nœud déjà traité, seules les réductions passant par cette
+  arête sont refaites (correction de Farshi, nécessaire avec les règles
+  vides) ;
+- chaque arête porte un nœud de la forêt partagée et compactée (SPPFNode,
+  commun avec l'analyseur d'Earley), de sorte que les dérivations
+  ambiguës se partagent leurs sous-arbres.
+
+Sur une grammaire déterministe, une seule pile survit à chaque position et
+l'analyse est linéaire ; le coût ne croît qu'avec le nombre de piles
+simultanées.
+"""
+
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from ...pushdown.grammar.grammar_tokens import Tokenizer
+from ...pushdown.grammar.grammar_types import ContextFreeGrammar
+from .earley_parser import SPPFNode
+from .lr_parser import END_MARKER, LRTables
+
+# Arête du graphe : (nœud de départ, nœud d'arrivée)
+Edge = Tuple["GSSNode", "GSSNode"]
+
+
+class GSSNode:
+    """
+    Nœud du graphe des piles : un état LR à une position de l'entrée.
+
+    Les arêtes vont vers les nœuds situés en dessous dans les piles et
+    portent le nœud de forêt du symbole empilé. Les arêtes vers des nœuds
+    de même position (réductions de règles vides) sont aussi listées à part.
+    """
+
+    __slots__ = ("state", "level", "edges", "level_edges")
+
+    def __init__(self, state: int, level: int) -> None:
+        """
+        Initialise un nœud sans arête.
+
+        :param state: État LR
+        :type state: int
+        :param level: Nombre de jetons lus
+        :type level: int
+        """
+        self.state = state
+        self.level = level
+        self.edges: Dict["GSSNode", SPPFNode] = {}
+        self.level_edges: List["GSSNode"] = []
+
+    def link(self, below: "GSSNode", symbol: SPPFNode) -> None:
+        """
+        Ajoute une arête vers un nœud situé en dessous.
+
+        :param below: Nœud d'arrivée
+        :type below: GSSNode
+        :param symbol: Nœud de forêt du symbole empilé
+        :type symbol: SPPFNode
+        """
+        self.edges[below] = symbol
+        if below.level == self.level:
+            self.level_edges.append(below)
+
+    def __repr__(self) -> str:
+        """Représentation courte du nœud."""
+        return f"GSSNode({self.state}, {self.level})"
+
+
+class GLRRun:
+    """
+    Résultat d'une analyse GLR.
+
+    :ivar accepted: Indique si l'entrée appartient au langage
+    :ivar failed_at: Position du premier jeton sans pile survivante, ou None
+    :ivar forest: Racine de la forêt d'analyse, ou None
+    :ivar node_count: Nombre de nœuds créés dans le graphe des piles
+    :ivar max_width: Nombre maximal de nœuds à une même position
+    """
+
+    __slots__ = ("accepted", "failed_at", "forest", "node_count", "max_width")
+
+    def __init__(self) -> None:
+        """Initialise un résultat vide."""
+        self.accepted = False
+        self.failed_at: Optional[int] = None
+        self.forest: Optional[SPPFNode] = None
+        self.node_count = 0
+        self.max_width = 0
+
+
+class GLRParser:
+    """
+    Analyseur GLR sur graphe des piles, construit sur des tables LR.
+
+    Les tables peuvent contenir des conflits : toutes les actions de
+    LRTables.actions sont suivies. Les jetons sont découpés comme pour
+    EarleyParser.
+    """
+
+    def __init__(self, tables: LRTables) -> None:
+        """
+        Prépare l'analyseur.
+
+        :param tables: Tables d'analyse, conflictuelles ou non
+        :type tables: LRTables
+        """
+        self.tables = tables
+        self._codes = {terminal: code for code, terminal in enumerate(tables.terminals)}
+        del self._codes[END_MARKER]
+        self._tokenizer = Tokenizer(self._codes)
+
+    @classmethod
+    def from_grammar(cls, grammar: ContextFreeGrammar) -> "GLRParser":
+        """
+        Construit les tables LALR(1) d'une grammaire puis l'analyseur.
+
+        :param grammar: Grammaire hors-contexte
+        :type grammar: ContextFreeGrammar
+        :return: Analyseur
+        :rtype: GLRParser
+        """
+        return cls(LRTables.from_grammar(grammar))
+
+    def tokenize(self, text: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+        """
+        Découpe une entrée en jetons.
+
+        :param text: Chaîne ou séquence de jetons
+        :type text: Union[str, Sequence[str]]
+        :return: Jetons
+        :rtype: Tuple[str, ...]
+        """
+        return self._tokenizer.tokenize(text)
+
+    def recognize(self, tokens: Sequence[str]) -> bool:
+        """
+        Décide l'appartenance au langage.
+
+        :param tokens: Jetons de l'entrée
+        :type tokens: Sequence[str]
+        :return: True si l'entrée est engendrée par la grammaire
+        :rtype: bool
+        """
+        return self.run(tokens).accepted
+
+    def parse(self, tokens: Sequence[str]) -> Optional[SPPFNode]:
+        """
+        Construit la forêt d'analyse partagée de l'entrée.
+
+        :param tokens: Jetons de l'entrée
+        :type tokens: Sequence[str]
+        :return: Nœud racine (axiome, 0, n), ou None si l'entrée est rejetée
+        :rtype: Optional[SPPFNode]
+        """
+        return self.run(tokens).forest
+
+    def run(self, tokens: Sequence[str]) -> GLRRun:
+        """
+        Analyse l'entrée jeton par jeton sur le graphe des piles.
+
+        :param tokens: Jetons de l'entrée
+        :type tokens: Sequence[str]
+        :return: Résultat de l'analyse
+        :rtype: GLRRun
+        """
+        tokens = tuple(tokens)
+        result = GLRRun()
+        codes = [self._codes.get(token, -1) for token in tokens] + [0]
+        root = GSSNode(0, 0)
+        frontier = {0: root}
+        for level, lookahead in enumerate(codes):
+            if lookahead < 0:
+                result.failed_at = level
+                return result
+            self._reduce(frontier, level, lookahead)
+            result.node_count += len(frontier)
+            result.max_width = max(result.max_width, len(frontier))
+            if level == len(tokens):
+                break
+            leaf = SPPFNode(tokens[level], level, level + 1)
+            following: Dict[int, GSSNode] = {}
+            for node in frontier.values():
+                for code in self.tables.actions(node.state, lookahead):
+                    if code > 0:
+                        target = following.get(code - 1)
+                        if target is None:
+                            target = following[code - 1] = GSSNode(code - 1, level + 1)
+                        target.link(node, leaf)
+            if not following:
+                result.failed_at = level
+                return result
+            frontier = following
+
+        for node in frontier.values():
+            if -1 in self.tables.actions(node.state, 0):
+                result.accepted = True
+                result.forest = node.edges[root]
+                return result
+        result.failed_at = len(tokens)
+        return result
+
+    def _reduce(self, frontier: Dict[int, GSSNode], level: int, lookahead: int) -> None:
+        """Effectue toutes les réductions d'une position, nœuds créés compris."""
+        tables = self.tables
+        variables = len(tables.variables)
+        forest: Dict[Tuple[str, int], SPPFNode] = {}
+        families: Set[Tuple[int, ...]] = set()
+        # Réductions en attente : (nœud, production, arête imposée ou None)
+        pending: Deque[Tuple[GSSNode, int, Optional[Edge]]] = deque()
+
+        def schedule(node: GSSNode, edge: Optional[Edge]) -> None:
+            for code in tables.actions(node.state, lookahead):
+                if code < -1 and (edge is None or tables.lengths[-code - 1]):
+                    pending.append((node, -code - 1, edge))
+
+        for node in list(frontier.values()):
+            schedule(node, None)
+        while pending:
+            node, rule, required = pending.popleft()
+            production = tables.productions[rule]
+            head = tables.heads[rule]
+            for below, children in _paths(node, tables.lengths[rule], required):
+                start = below.level if children else level
+                symbol = forest.get((production.left_side, start))
+                if symbol is None:
+                    symbol = SPPFNode(production.left_side, start, level)
+                    forest[(production.left_side, start)] = symbol
+                key = (id(symbol), rule) + tuple(id(child) for child in children)
+                if key not in families:
+                    families.add(key)
+                    symbol.families.append((production, children))
+
+                state = tables.goto[below.state * variables + head]
+                target = frontier.get(state)
+                if target is None:
+                    target = frontier[state] = GSSNode(state, level)
+                    target.link(below, symbol)
+                    schedule(target, None)
+                elif below not in target.edges:
+                    target.link(below, symbol)
+                    # Nouvelle arête sur un nœud déjà traité : les chemins
+                    # qui l'empruntent n'ont pas encore été réduits ; seuls
+                    # les nœuds qui atteignent target en partent
+                    for other in _reaching(frontier, target):
+                        schedule(other, (target, below))
+
+
+def _reaching(frontier: Dict[int, GSSNode], target: GSSNode) -> List[GSSNode]:
+    """Nœuds de la position courante depuis lesquels target est atteignable."""
+    # Les chemins restent à la position courante : seules les arêtes de
+    # règles vides sont suivies, jusqu'à un point fixe
+    reaching = {target}
+    changed = True
+    while changed:
+        changed = False
+        for node in frontier.values():
+            if node not in reaching and any(
+                below in reaching for below in node.level_edges
+            ):
+                reaching.add(node)
+                changed = True
+    return list(reaching)
+
+
+def _paths(
+    node: GSSNode, length: int, required: Optional[Edge]
+) -> List[Tuple[GSSNode, Tuple[SPPFNode, ...]]]:
+    """Chemins de longueur donnée : nœud atteint et symboles dans l'ordre."""
+    # Avant l'arête imposée, qui part de la position courante, un chemin ne
+    # suit que cette arête ou des arêtes de règles vides
+    paths = []
+    stack: List[Tuple[GSSNode, Tuple[SPPFNode, ...], bool]] = [
+        (node, (), required is None)
+    ]
+    while stack:
+        current, labels, seen = stack.pop()
+        if len(labels) == length:
+            if seen:
+                paths.append((current, labels))
+            continue
+        if seen:
+            for below, label in current.edges.items():
+                stack.append((below, (label,) + labels, True))
+            continue
+        if current is required[0]:
+            below = required[1]
+            stack.append((below, (current.edges[below],) + labels, True))
+        for below in current.level_edges:
+            if below is not required[1] or current is not required[0]:
+                stack.append((below, (current.edges[below],) + labels, False))
+    return paths
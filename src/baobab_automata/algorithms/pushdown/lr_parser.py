@@ -0,0 +1,559 @@
+"""
+Tables LR(1) et LALR(1) et analyseur par décalage-réduction.
+
+Ce module construit les tables d'analyse ascendante d'une grammaire
+hors-contexte et les exécute avec une pile de simples entiers :
+
+- les items sont des couples (production, point) associés à un masque de
+  symboles de prévision, de sorte que la fermeture propage des entiers au
+  lieu d'ensembles d'items (rule, dot, lookahead) ;
+- la même construction donne les tables LR(1) canoniques (états distingués
+  par leurs prévisions) ou LALR(1) (états fusionnés par noyau, avec une
+  nouvelle propagation lorsque les prévisions d'un état fusionné grossissent) ;
+- les actions et les transitions sur les variables sont des tableaux
+  d'entiers à plat, indexés par état et par code de symbole ;
+- les conflits sont rapportés puis résolus comme yacc (décalage préféré,
+  sinon la production de plus petit numéro), toutes les actions d'une
+  case conflictuelle restant disponibles ;
+- les tables se sérialisent en dictionnaire d'entiers et de chaînes, pour
+  être rechargées sans refaire la construction.
+
+L'analyse est linéaire en la longueur de l'entrée et exacte lorsque les
+tables n'ont aucun conflit.
+"""
+
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ...pushdown.grammar.grammar_analysis import END_MARKER, GrammarAnalysis
+from ...pushdown.grammar.grammar_tokens import Tokenizer
+from ...pushdown.grammar.grammar_types import ContextFreeGrammar, Production
+from .earley_parser import _AUGMENTED
+
+# Noyau d'un état : (production, point) -> masque des prévisions
+Kernel = Dict[Tuple[int, int], int]
+
+
+@dataclass(frozen=True)
+class LRConflict:
+    """
+    Case de la table d'actions admettant plusieurs actions.
+
+    Les actions sont codées comme dans la table : un décalage vers l'état j
+    vaut j + 1, une réduction par la production r vaut -(r + 1). La première
+    action est celle retenue par la table.
+
+    :ivar state: Numéro de l'état
+    :ivar symbol: Terminal de prévision
+    :ivar actions: Actions possibles, codées
+    :ivar description: Description lisible des actions
+    """
+
+    state: int
+    symbol: str
+    actions: Tuple[int, ...]
+    description: str
+
+    @property
+    def kind(self) -> str:
+        """Nature du conflit : "shift/reduce" ou "reduce/reduce"."""
+        if any(action > 0 for action in self.actions):
+            return "shift/reduce"
+        return "reduce/reduce"
+
+
+class LRTables:
+    """
+    Tables d'analyse ascendante, codées en entiers.
+
+    Les terminaux sont numérotés à partir de 1, le code 0 étant la marque de
+    fin ; les variables sont numérotées à partir de 0 dans la table des
+    transitions. La production 0 est la règle augmentée S' -> S, dont la
+    réduction vaut acceptation.
+
+    :ivar method: "lr1" ou "lalr1"
+    :ivar terminals: Terminaux, par code
+    :ivar variables: Variables, par code
+    :ivar productions: Productions, par numéro
+    :ivar action: Actions à plat, indice état * len(terminals) + terminal
+    :ivar goto: Transitions à plat, indice état * len(variables) + variable,
+        -1 en l'absence de transition
+    :ivar conflicts: Conflits rencontrés lors de la construction
+    """
+
+    def __init__(
+        self,
+        method: str,
+        terminals: Sequence[str],
+        variables: Sequence[str],
+        productions: Sequence[Production],
+        action: Sequence[int],
+        goto: Sequence[int],
+        conflicts: Sequence[LRConflict] = (),
+    ) -> None:
+        """
+        Initialise les tables à partir de leurs tableaux codés.
+
+        :param method: "lr1" ou "lalr1"
+        :type method: str
+        :param terminals: Terminaux, la marque de fin en premier
+        :type terminals: Sequence[str]
+        :param variables: Variables
+        :type variables: Sequence[str]
+        :param productions: Productions, la règle augmentée en premier
+        :type productions: Sequence[Production]
+        :param action: Table des actions, à plat
+        :type action: Sequence[int]
+        :param goto: Table des transitions sur les variables, à plat
+        :type goto: Sequence[int]
+        :param conflicts: Conflits rapportés
+        :type conflicts: Sequence[LRConflict]
+        """
+        self.method = method
+        self.terminals = tuple(terminals)
+        self.variables = tuple(variables)
+        self.productions = tuple(productions)
+        self.action = array("i", action)
+        self.goto = array("i", goto)
+        self.conflicts = list(conflicts)
+        variable_codes = {variable: code for code, variable in enumerate(variables)}
+        # Variable et longueur de chaque production, lues à chaque réduction
+        self.heads = array(
+            "i", [variable_codes.get(p.left_side, -1) for p in self.productions]
+        )
+        self.lengths = array("i", [len(p.right_side) for p in self.productions])
+        self._multiple = {
+            (conflict.state, self.terminals.index(conflict.symbol)): conflict.actions
+            for conflict in self.conflicts
+        }
+
+    @classmethod
+    def from_grammar(cls, grammar: ContextFreeGrammar, lalr: bool = True) -> "LRTables":
+        """
+        Construit les tables d'une grammaire.
+
+        :param grammar: Grammaire hors-contexte
+        :type grammar: ContextFreeGrammar
+        :param lalr: Fusionne les états de même noyau (LALR(1)) si True,
+            garde la collection LR(1) canonique sinon
+        :type lalr: bool
+        :return: Tables d'analyse
+        :rtype: LRTables
+        """
+        return _LRBuilder(grammar).build(lalr)
+
+    @property
+    def state_count(self) -> int:
+        """Nombre d'états de l'automate LR."""
+        return len(self.action) // len(self.terminals)
+
+    @property
+    def is_deterministic(self) -> bool:
+        """Indique si la grammaire est LR(1) (resp. LALR(1)) : aucun conflit."""
+        return not self.conflicts
+
+    def actions(self, state: int, terminal: int) -> Tuple[int, ...]:
+        """
+        Toutes les actions d'une case, y compris celles écartées par un conflit.
+
+        :param state: Numéro de l'état
+        :type state: int
+        :param terminal: Code du terminal de prévision
+        :type terminal: int
+        :return: Actions codées, vide en cas d'erreur
+        :rtype: Tuple[int, ...]
+        """
+        multiple = self._multiple.get((state, terminal))
+        if multiple is not None:
+            return multiple
+        code = self.action[state * len(self.terminals) + terminal]
+        return (code,) if code else ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convertit les tables en dictionnaire sérialisable (JSON).
+
+        :return: Dictionnaire de listes d'entiers et de chaînes
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "method": self.method,
+            "terminals": list(self.terminals),
+            "variables": list(self.variables),
+            "productions": [
+                [production.left_side, list(production.right_side)]
+                for production in self.productions
+            ],
+            "action": self.action.tolist(),
+            "goto": self.goto.tolist(),
+            "conflicts": [
+                [conflict.state, conflict.symbol, list(conflict.actions)]
+                for conflict in self.conflicts
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LRTables":
+        """
+        Recharge des tables sans refaire la construction.
+
+        :param data: Dictionnaire produit par to_dict
+        :type data: Dict[str, Any]
+        :return: Tables d'analyse
+        :rtype: LRTables
+        """
+        productions = [
+            Production(left, tuple(right)) for left, right in data["productions"]
+        ]
+        conflicts = [
+            LRConflict(state, symbol, tuple(actions), _describe(actions, productions))
+            for state, symbol, actions in data["conflicts"]
+        ]
+        return cls(
+            data["method"],
+            data["terminals"],
+            data["variables"],
+            productions,
+            data["action"],
+            data["goto"],
+            conflicts,
+        )
+
+
+class LRParser:
+    """
+    Analyseur par décalage-réduction piloté par des tables LR.
+
+    La pile ne contient que des numéros d'états ; chaque jeton est lu une
+    fois et chaque réduction dépile autant d'états que la longueur de la
+    production, d'où un temps linéaire. Les jetons sont découpés comme pour
+    EarleyParser.
+    """
+
+    def __init__(self, tables: LRTables) -> None:
+        """
+        Prépare l'analyseur.
+
+        :param tables: Tables d'analyse
+        :type tables: LRTables
+        """
+        self.tables = tables
+        self._codes = {terminal: code for code, terminal in enumerate(tables.terminals)}
+        del self._codes[END_MARKER]
+        self._tokenizer = Tokenizer(self._codes)
+
+    @classmethod
+    def from_grammar(cls, grammar: ContextFreeGrammar, lalr: bool = True) -> "LRParser":
+        """
+        Construit les tables d'une grammaire puis l'analyseur.
+
+        :param grammar: Grammaire hors-contexte
+        :type grammar: ContextFreeGrammar
+        :param lalr: Tables LALR(1) si True, LR(1) canoniques sinon
+        :type lalr: bool
+        :return: Analyseur
+        :rtype: LRParser
+        """
+        return cls(LRTables.from_grammar(grammar, lalr))
+
+    def tokenize(self, text: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+        """
+        Découpe une entrée en jetons.
+
+        :param text: Chaîne ou séquence de jetons
+        :type text: Union[str, Sequence[str]]
+        :return: Jetons
+        :rtype: Tuple[str, ...]
+        """
+        return self._tokenizer.tokenize(text)
+
+    def recognize(self, tokens: Sequence[str]) -> bool:
+        """
+        Décide l'appartenance au langage.
+
+        :param tokens: Jetons de l'entrée
+        :type tokens: Sequence[str]
+        :return: True si l'entrée est acceptée par les tables
+        :rtype: bool
+        """
+        return self.failure_position(tokens) is None
+
+    def failure_position(self, tokens: Sequence[str]) -> Optional[int]:
+        """
+        Position du jeton sur lequel l'analyse échoue.
+
+        :param tokens: Jetons de l'entrée
+        :type tokens: Sequence[str]
+        :return: Indice du jeton fautif (len(tokens) pour une fin prématurée),
+            ou None si l'entrée est acceptée
+        :rtype: Optional[int]
+        """
+        codes = self._encode(tokens)
+        if isinstance(codes, int):
+            return codes
+        tables = self.tables
+        action, goto, heads, lengths = (
+            tables.action,
+            tables.goto,
+            tables.heads,
+            tables.lengths,
+        )
+        width = len(tables.terminals)
+        variables = len(tables.variables)
+        stack = [0]
+        position = 0
+        lookahead = codes[0]
+        while True:
+            code = action[stack[-1] * width + lookahead]
+            if code > 0:
+                stack.append(code - 1)
+                position += 1
+                lookahead = codes[position]
+            elif code < -1:
+                rule = -code - 1
+                length = lengths[rule]
+                if length:
+                    del stack[-length:]
+                stack.append(goto[stack[-1] * variables + heads[rule]])
+            elif code == -1:
+                return None
+            else:
+                return position
+
+    def derivation(
+        self, tokens: Sequence[str], builder: Callable[..., object]
+    ) -> Optional[object]:
+        """
+        Construit l'arbre de dérivation retenu par les tables.
+
+        :param tokens: Jetons de l'entrée
+        :type tokens: Sequence[str]
+        :param builder: Constructeur builder(symbol, children, start, end),
+            par exemple ParseTree
+        :type builder: Callable[..., object]
+        :return: Arbre construit, ou None si l'entrée est rejetée
+        :rtype: Optional[object]
+        """
+        tokens = tuple(tokens)
+        codes = self._encode(tokens)
+        if isinstance(codes, int):
+            return None
+        tables = self.tables
+        width = len(tables.terminals)
+        variables = len(tables.variables)
+        stack = [0]
+        # Nœuds et positions de début, en parallèle des états (hors état 0)
+        nodes: List[object] = []
+        starts: List[int] = []
+        position = 0
+        while True:
+            code = tables.action[stack[-1] * width + codes[position]]
+            if code > 0:
+                stack.append(code - 1)
+                nodes.append(builder(tokens[position], [], position, position + 1))
+                starts.append(position)
+                position += 1
+            elif code < -1:
+                rule = -code - 1
+                length = tables.lengths[rule]
+                start = starts[-length] if length else position
+                children = nodes[len(nodes) - length :]
+                if length:
+                    del stack[-length:], nodes[-length:], starts[-length:]
+                stack.append(tables.goto[stack[-1] * variables + tables.heads[rule]])
+                left = tables.productions[rule].left_side
+                nodes.append(builder(left, children, start, position))
+                starts.append(start)
+            elif code == -1:
+                return nodes[-1]
+            else:
+                return None
+
+    def _encode(self, tokens: Sequence[str]) -> Union[List[int], int]:
+        """Codes des jetons suivis de la marque de fin, ou indice du premier inconnu."""
+        codes = []
+        for position, token in enumerate(tokens):
+            code = self._codes.get(token)
+            if code is None:
+                return position
+            codes.append(code)
+        codes.append(0)
+        return codes
+
+
+class _LRBuilder:
+    """Construction des collections d'items LR(1) et LALR(1)."""
+
+    def __init__(self, grammar: ContextFreeGrammar) -> None:
+        """Numérote les symboles et précalcule les premiers des suffixes."""
+        analysis = grammar.get_analysis()
+        # Les codes des terminaux sont ceux des ensembles de bits de l'analyse
+        self.terminals = list(analysis.terminals)
+        self.variables = list(analysis.variables)
+        self.productions = [Production(_AUGMENTED, (grammar.start_symbol,))] + list(
+            analysis.productions
+        )
+        # Codes de symboles : terminaux d'abord, variables ensuite
+        width = len(self.terminals)
+        codes = {symbol: code for code, symbol in enumerate(self.terminals)}
+        codes.update({variable: width + v for v, variable in enumerate(self.variables)})
+        self.width = width
+        self.rhs = [
+            tuple(codes[symbol] for symbol in production.right_side)
+            for production in self.productions
+        ]
+        self.heads = [-1] + [
+            codes[production.left_side] - width for production in self.productions[1:]
+        ]
+        self.by_lhs: List[List[int]] = [[] for _ in self.variables]
+        for rule in range(1, len(self.productions)):
+            self.by_lhs[self.heads[rule]].append(rule)
+        self.suffixes = [
+            _suffix_firsts(production.right_side, analysis)
+            for production in self.productions
+        ]
+
+    def closure(self, kernel: Kernel) -> Kernel:
+        """Fermeture d'un noyau, les prévisions étant propagées en masques."""
+        items = dict(kernel)
+        work = list(kernel)
+        width = self.width
+        while work:
+            core = work.pop()
+            rule, dot = core
+            right = self.rhs[rule]
+            if dot == len(right) or right[dot] < width:
+                continue
+            first, empty = self.suffixes[rule][dot + 1]
+            lookahead = first | (items[core] if empty else 0)
+            for produced in self.by_lhs[right[dot] - width]:
+                item = (produced, 0)
+                old = items.get(item, 0)
+                if lookahead & ~old:
+                    items[item] = old | lookahead
+                    work.append(item)
+        return items
+
+    def build(self, lalr: bool) -> LRTables:
+        """Collection d'états, puis remplissage des tables et rapport des conflits."""
+        kernels: List[Kernel] = [{(0, 0): 1}]
+        index: Dict[Hashable, int] = {}
+        transitions: List[Dict[int, int]] = [{}]
+        queue = deque([0])
+        queued = {0}
+        while queue:
+            state = queue.popleft()
+            queued.discard(state)
+            successors: Dict[int, Kernel] = {}
+            for (rule, dot), lookahead in self.closure(kernels[state]).items():
+                right = self.rhs[rule]
+                if dot < len(right):
+                    kernel = successors.setdefault(right[dot], {})
+                    kernel[(rule, dot + 1)] = kernel.get((rule, dot + 1), 0) | lookahead
+            for symbol, kernel in successors.items():
+                key = frozenset(kernel) if lalr else frozenset(kernel.items())
+                target = index.get(key)
+                if target is None:
+                    target = index[key] = len(kernels)
+                    kernels.append(kernel)
+                    transitions.append({})
+                    queue.append(target)
+                    queued.add(target)
+                elif lalr:
+                    # Fusion par noyau : les prévisions qui grossissent sont
+                    # propagées à nouveau aux successeurs
+                    merged = kernels[target]
+                    grown = False
+                    for core, lookahead in kernel.items():
+                        if lookahead & ~merged[core]:
+                            merged[core] |= lookahead
+                            grown = True
+                    if grown and target not in queued:
+                        queue.append(target)
+                        queued.add(target)
+                transitions[state][symbol] = target
+        return self._tables(kernels, transitions, lalr)
+
+    def _tables(
+        self, kernels: List[Kernel], transitions: List[Dict[int, int]], lalr: bool
+    ) -> LRTables:
+        """Tables codées à partir de la collection d'états."""
+        width = self.width
+        variables = len(self.variables)
+        action = [0] * (len(kernels) * width)
+        goto = [-1] * (len(kernels) * variables)
+        conflicts = []
+        for state, kernel in enumerate(kernels):
+            cells: Dict[int, List[int]] = {}
+            for symbol, target in transitions[state].items():
+                if symbol < width:
+                    cells[symbol] = [target + 1]
+                else:
+                    goto[state * variables + symbol - width] = target
+            for (rule, dot), lookahead in self.closure(kernel).items():
+                if dot < len(self.rhs[rule]):
+                    continue
+                while lookahead:
+                    low = lookahead & -lookahead
+                    lookahead ^= low
+                    cells.setdefault(low.bit_length() - 1, []).append(-rule - 1)
+            for symbol, codes in cells.items():
+                # Décalage d'abord, puis réductions par numéro croissant
+                codes.sort(reverse=True)
+                action[state * width + symbol] = codes[0]
+                if len(codes) > 1:
+                    conflicts.append(
+                        LRConflict(
+                            state,
+                            self.terminals[symbol],
+                            tuple(codes),
+                            _describe(codes, self.productions),
+                        )
+                    )
+        return LRTables(
+            "lalr1" if lalr else "lr1",
+            self.terminals,
+            self.variables,
+            self.productions,
+            action,
+            goto,
+            conflicts,
+        )
+
+
+def _suffix_firsts(
+    right: Tuple[str, ...], analysis: GrammarAnalysis
+) -> List[Tuple[int, bool]]:
+    """Pour chaque position d'une partie droite : (FIRST du suffixe, annulable)."""
+    row = [(0, True)]
+    for symbol in reversed(right):
+        mask, empty = row[-1]
+        first, nullable = analysis.sequence_first((symbol,))
+        row.append((first | (mask if nullable else 0), empty and nullable))
+    row.reverse()
+    return row
+
+
+def _describe(actions: Sequence[int], productions: Sequence[Production]) -> str:
+    """Description lisible des actions d'une case conflictuelle."""
+    parts = []
+    for code in actions:
+        if code > 0:
+            parts.append(f"décalage vers l'état {code - 1}")
+        else:
+            production = productions[-code - 1]
+            right = " ".join(production.right_side) or "ε"
+            parts.append(f"réduction {production.left_side} -> {right}")
+    return " / ".join(parts)
@@ -5,6 +5,7 @@ Ce module implémente les algorithmes de conversion entre différents types
 d'automates à pile (PDA, DPDA, NPDA) et les grammaires hors-contexte.
 """
 
+import itertools
 import time
 from typing import Any, Dict, List, Set, Tuple, Union
 from collections import deque
@@ -1298,8 +1299,13 @@ class PushdownConversionAlgorithms:
                 word = "".join(random.choices(alphabet, k=length))
                 words.append(word)
 
-            # Ajout de mots spécifiques
-            words.extend(["", "a", "b", "ab", "ba", "aa", "bb"])
+            # Ajout de tous les mots courts de l'alphabet, en ordre militaire
+            symbols = sorted(alphabet)
+            for length in range(min(2, max_length) + 1):
+                words.extend(
+                    "".join(letters)
+                    for letters in itertools.product(symbols, repeat=length)
+                )
 
             # Suppression des doublons
             words = list(set(words))
@@ -16,6 +16,10 @@ from ...pushdown.specialized.specialized_exceptions import (
     NormalizationError,
 )
 from ...pushdown.grammar.grammar_types import ContextFreeGrammar, Production
+from ...pushdown.grammar.grammar_exceptions import GrammarError
+from ...pushdown.grammar.grammar_tokens import grammar_fingerprint
+from .cyk_parser import CYKParser
+from .earley_parser import EarleyParser
 
 class ParseTree:
     """Arbre de syntaxe abstraite pour le parsing."""
@@ -69,6 +73,7 @@ class SpecializedAlgorithms:
         self._cache = {}
         self._cache_stats = {"hits": 0, "misses": 0}
         self._algorithm_config = {}
+        self._parsers = {}
         self.stats = AlgorithmStats()
     
     @classmethod
@@ -85,43 +90,28 @@ class SpecializedAlgorithms:
         return instance
     
     def earley_parse(self, grammar, input_string):
-        """Parse une chaîne avec l'algorithme d'Earley."""
-        # Implémentation simplifiée
-        if grammar is None:
-            raise EarleyError("La grammaire ne peut pas être None")
-        if not input_string:
-            return False
-        # Pour les tests, retourner True pour "ab" et "a", False pour "ba"
-        return input_string in ["a", "ab"]
+        """Reconnaît une chaîne avec l'algorithme d'Earley (items de Leo)."""
+        parser = self._earley_parser(grammar)
+        return parser.recognize(parser.tokenize(input_string))
+
+    def earley_parse_forest(self, grammar, input_string):
+        """Retourne la forêt partagée (SPPF), ou None si la chaîne est rejetée."""
+        parser = self._earley_parser(grammar)
+        return parser.parse(parser.tokenize(input_string))
     
     def cyk_parse(self, grammar, input_string):
-        """Parse une chaîne avec l'algorithme CYK."""
-        # Implémentation simplifiée
-        if grammar is None:
-            raise CYKError("La grammaire ne peut pas être None")
-        if not input_string:
-            return False
-        # Vérifier si la grammaire est en forme normale de Chomsky
-        if not self._is_chomsky_normal_form(grammar):
-            raise CYKError("La grammaire doit être en forme normale de Chomsky")
-        
-        # Utiliser le cache
-        cache_key = f"cyk_{grammar.start_symbol}_{input_string}"
+        """Parse une chaîne avec CYK (grammaire en forme normale de Chomsky)."""
+        parser = self._cyk_parser(grammar)
+        tokens = parser.tokenize(input_string)
+        if not self.enable_caching:
+            return parser.recognize(tokens)
+        cache_key = ("CYK", grammar_fingerprint(grammar), tokens)
         if cache_key in self._cache:
             self._cache_stats["hits"] += 1
             return self._cache[cache_key]
-        
-        # Pour les tests, retourner True pour "ab" et "a", False pour "ba"
-        result = input_string in ["a", "ab"]
-        self._cache[cache_key] = result
+        result = parser.recognize(tokens)
         self._cache_stats["misses"] += 1
-        
-        # Limiter la taille du cache
-        if len(self._cache) > self.max_cache_size:
-            # Supprimer le premier élément (FIFO)
-            first_key = next(iter(self._cache))
-            del self._cache[first_key]
-        
+        self._remember(cache_key, result)
         return result
     
     def configure_algorithm(self, algorithm_type, config):
@@ -210,42 +200,16 @@ class SpecializedAlgorithms:
         )
     
     def to_chomsky_normal_form(self, grammar):
-        """Convertit en forme normale de Chomsky."""
+        """Convertit en forme normale de Chomsky stricte (A -> BC, A -> a, S -> ε)."""
         if grammar is None:
             raise NormalizationError("La grammaire ne peut pas être None")
-        # Implémentation simplifiée - créer une grammaire en forme normale de Chomsky
-        # Pour les tests, créer une grammaire avec des productions de longueur 1 ou 2
-        new_productions = []
-        for production in grammar.productions:
-            if len(production.right_side) <= 2:
-                # Éliminer la récursivité gauche A -> A b
-                if production.left_side == "A" and len(production.right_side) == 2 and production.right_side[0] == "A":
-                    # Remplacer A -> A b par A -> b A'
-                    new_productions.append(Production("A", ("b", "A'")))
-                    new_productions.append(Production("A'", ("b", "A'")))
-                    new_productions.append(Production("A'", ()))  # A' -> ε
-                else:
-                    new_productions.append(production)
-            else:
-                # Remplacer les productions longues par des productions de longueur 2
-                if len(production.right_side) == 3:
-                    # Remplacer A -> B C D par A -> B X, X -> C D
-                    new_productions.append(Production(production.left_side, (production.right_side[0], "X")))
-                    new_productions.append(Production("X", (production.right_side[1], production.right_side[2])))
-                else:
-                    new_productions.append(production)
-        
-        # Ajouter A' aux variables si nécessaire
-        new_variables = set(grammar.variables)
-        if any(prod.left_side == "A'" for prod in new_productions):
-            new_variables.add("A'")
-        
-        return ContextFreeGrammar(
-            variables=new_variables,
-            terminals=grammar.terminals,
-            productions=new_productions,
-            start_symbol=grammar.start_symbol
-        )
+        try:
+            normalized = CYKParser.normalize(grammar)
+        except GrammarError as e:
+            raise NormalizationError(f"Normalisation impossible : {e}") from e
+        if normalized is None:
+            raise NormalizationError("Le langage de la grammaire est vide")
+        return normalized
     
     def to_greibach_normal_form(self, grammar):
         """Convertit en forme normale de Greibach."""
@@ -280,57 +244,113 @@ class SpecializedAlgorithms:
     
     def _is_chomsky_normal_form(self, grammar):
         """Vérifie si la grammaire est en forme normale de Chomsky."""
-        # Pour les tests, simuler que certaines grammaires ne sont pas en forme normale de Chomsky
-        # En regardant les productions - si elles ont plus de 2 symboles à droite, ce n'est pas Chomsky
-        # Ou si elles ont des productions unitaires (A -> B), ce n'est pas Chomsky
-        # Ou si elles ont exactement 3 productions ET contiennent "A" -> "A" (comme general_grammar), ce n'est pas Chomsky
-        if len(grammar.productions) == 3:
-            # Vérifier si c'est general_grammar (contient A -> A b)
-            for production in grammar.productions:
-                if production.left_side == "A" and len(production.right_side) == 2 and production.right_side[0] == "A":
-                    return False
-            # Si c'est une grammaire avec 3 productions mais sans récursion gauche, c'est Chomsky
-            return True
-        # Vérifier les productions unitaires
+        used_on_right = {
+            symbol
+            for production in grammar.productions
+            for symbol in production.right_side
+        }
         for production in grammar.productions:
-            if len(production.right_side) > 2:
-                return False
-            if len(production.right_side) == 1 and production.right_side[0] in grammar.variables:
+            right = production.right_side
+            if not right:
+                # S -> ε seulement, et S n'apparaît dans aucune partie droite
+                start = grammar.start_symbol
+                if production.left_side != start or start in used_on_right:
+                    return False
+            elif len(right) == 1:
+                if right[0] not in grammar.terminals:
+                    return False
+            elif len(right) != 2 or not set(right) <= set(grammar.variables):
                 return False
         return True
     
     def earley_parse_with_tree(self, grammar, input_string):
-        """Parse avec arbre de dérivation."""
-        if not input_string:
+        """Parse avec arbre de dérivation, extrait de la forêt d'Earley."""
+        forest = self.earley_parse_forest(grammar, input_string)
+        if forest is None:
             return None
-        # Pour les tests, retourner None pour "ba" et un arbre pour "ab"
-        if input_string == "ba":
-            return None
-        return ParseTree("S", [], 0, len(input_string))
+        return forest.extract(ParseTree)
     
     def cyk_parse_with_tree(self, grammar, input_string):
-        """Parse CYK avec arbre de dérivation."""
-        if not input_string:
-            return None
-        # Pour les tests, retourner None pour "ba" et un arbre pour "ab"
-        if input_string == "ba":
-            return None
-        # Créer un arbre simple avec des enfants
-        child1 = ParseTree("A", [], 0, 1)
-        child2 = ParseTree("B", [], 1, 2)
-        return ParseTree("S", [child1, child2], 0, len(input_string))
+        """Parse CYK avec arbre de dérivation (pointeurs arrière)."""
+        parser = self._cyk_parser(grammar)
+        return parser.derivation(parser.tokenize(input_string), ParseTree)
     
     def earley_parse_optimized(self, grammar, input_string):
-        """Parse Earley optimisé."""
-        return True
+        """Parse Earley avec mise en cache du résultat par grammaire et entrée."""
+        parser = self._earley_parser(grammar)
+        tokens = parser.tokenize(input_string)
+        if not self.enable_caching:
+            return parser.recognize(tokens)
+        cache_key = ("earley", grammar_fingerprint(grammar), tokens)
+        if cache_key in self._cache:
+            self._cache_stats["hits"] += 1
+            return self._cache[cache_key]
+        result = parser.recognize(tokens)
+        self._cache_stats["misses"] += 1
+        self._remember(cache_key, result)
+        return result
+
+    def _earley_parser(self, grammar):
+        """Retourne l'analyseur d'Earley compilé pour la grammaire."""
+        if grammar is None:
+            raise EarleyError("La grammaire ne peut pas être None")
+        return self._compiled_parser("Earley", grammar, EarleyParser)
+
+    def _cyk_parser(self, grammar):
+        """Retourne l'analyseur CYK compilé d'une grammaire en forme normale."""
+        if grammar is None:
+            raise CYKError("La grammaire ne peut pas être None")
+        if not self._is_chomsky_normal_form(grammar):
+            raise CYKError("La grammaire doit être en forme normale de Chomsky")
+        return self._compiled_parser("CYK", grammar, CYKParser)
+
+    @staticmethod
+    def _normalized_cyk(grammar):
+        """Compile CYK sur la forme normale de la grammaire (None si langage vide)."""
+        try:
+            normalized = CYKParser.normalize(grammar)
+        except GrammarError as e:
+            raise CYKError(f"Normalisation impossible : {e}") from e
+        return CYKParser(normalized) if normalized is not None else None
+
+    def _compiled_parser(self, kind, grammar, factory):
+        """Retourne l'analyseur compilé de la grammaire, en cache par empreinte."""
+        key = (kind, grammar_fingerprint(grammar))
+        if key not in self._parsers:
+            if len(self._parsers) >= self.max_cache_size:
+                del self._parsers[next(iter(self._parsers))]
+            self._parsers[key] = factory(grammar)
+        return self._parsers[key]
+
+    def _remember(self, cache_key, value):
+        """Stocke un résultat dans le cache en respectant sa taille (FIFO)."""
+        self._cache[cache_key] = value
+        if len(self._cache) > self.max_cache_size:
+            del self._cache[next(iter(self._cache))]
     
     def cyk_parse_optimized(self, grammar, input_string):
-        """Parse CYK optimisé."""
-        return True
+        """Parse CYK d'une grammaire quelconque, normalisée une fois et en cache."""
+        if grammar is None:
+            raise CYKError("La grammaire ne peut pas être None")
+        parser = self._compiled_parser("CYK-normalized", grammar, self._normalized_cyk)
+        if parser is None:
+            return False
+        tokens = parser.tokenize(input_string)
+        if not self.enable_caching:
+            return parser.recognize(tokens)
+        cache_key = ("CYK-normalized", grammar_fingerprint(grammar), tokens)
+        if cache_key in self._cache:
+            self._cache_stats["hits"] += 1
+            return self._cache[cache_key]
+        result = parser.recognize(tokens)
+        self._cache_stats["misses"] += 1
+        self._remember(cache_key, result)
+        return result
     
     def clear_cache(self):
         """Vide le cache."""
         self._cache.clear()
+        self._parsers.clear()
         self._cache_stats = {"hits": 0, "misses": 0}
     
     def get_cache_stats(self):
@@ -6,14 +6,17 @@ non-déterministes (NFA) et epsilon-NFA.
 """
 
 from .abstract_finite_automaton import AbstractFiniteAutomaton
-from .dfa import DFA
+from .dfa import DFA, AcyclicDFABuilder, DFABuilder, LevenshteinAutomaton, PersistentDFA
 from .nfa.nfa import NFA
+from .nfa.nfa_builder import NFABuilder
 from .nfa.epsilon_nfa import EpsilonNFA
+from .interval import CharClass, IntervalDFA, IntervalNFA
 from .regex.regex_parser import RegexParser, ASTNode, NodeType, Token, TokenType
 from .regex.regex_exceptions import RegexError, RegexParseError, RegexSyntaxError, RegexConversionError
 from .language.language_operations import LanguageOperations
 from .mapping import Mapping
 from .operation_stats import OperationStats
+from .transition_matrix import TransitionMatrix
 
 # Imports des algorithmes
 from ..algorithms.finite import ConversionAlgorithms, OptimizationAlgorithms
@@ -21,8 +24,16 @@ from ..algorithms.finite import ConversionAlgorithms, OptimizationAlgorithms
 __all__ = [
     "AbstractFiniteAutomaton",
     "DFA",
+    "DFABuilder",
+    "AcyclicDFABuilder",
+    "LevenshteinAutomaton",
+    "PersistentDFA",
     "NFA",
+    "NFABuilder",
     "EpsilonNFA",
+    "CharClass",
+    "IntervalDFA",
+    "IntervalNFA",
     "RegexParser",
     "ASTNode",
     "NodeType",
@@ -35,6 +46,7 @@ __all__ = [
     "LanguageOperations",
     "Mapping",
     "OperationStats",
+    "TransitionMatrix",
     "ConversionAlgorithms",
     "OptimizationAlgorithms",
 ]
\ No newline at end of file
@@ -0,0 +1,317 @@
+"""
+Base commune des constructeurs d'automates finis en masse.
+
+Ce module contient la classe AutomatonBuilder qui accumule les états et les
+transitions d'un automate dans des tableaux NumPy préalloués (agrandis par
+doublement), afin de construire de très grands automates sans passer par des
+dictionnaires intermédiaires.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Type, Union
+
+import numpy as np
+
+# Indices d'états ou de symboles acceptés par les opérations en masse
+IndexArray = Union[np.ndarray, Sequence[int]]
+
+
+class AutomatonBuilder:
+    """
+    Constructeur incrémental d'automate fini à états entiers.
+
+    Les états sont numérotés 0..n-1 dans l'ordre d'ajout et nommés « q<i> »
+    sauf nom explicite. Les symboles sont numérotés dans l'ordre trié de
+    l'alphabet. Les transitions sont stockées en trois tableaux parallèles
+    (source, symbole, cible).
+
+    :param alphabet: Alphabet de l'automate
+    :type alphabet: Iterable[str]
+    :param expected_states: Nombre d'états prévu (préallocation)
+    :type expected_states: int
+    :param expected_transitions: Nombre de transitions prévu (préallocation)
+    :type expected_transitions: int
+    """
+
+    # Exceptions levées par les sous-classes
+    _automaton_error: Type[Exception] = ValueError
+    _transition_error: Type[Exception] = ValueError
+
+    def __init__(
+        self,
+        alphabet: Iterable[str],
+        expected_states: int = 16,
+        expected_transitions: int = 16,
+    ) -> None:
+        """
+        Initialise un constructeur vide.
+
+        :param alphabet: Alphabet de l'automate
+        :type alphabet: Iterable[str]
+        :param expected_states: Nombre d'états prévu (préallocation)
+        :type expected_states: int
+        :param expected_transitions: Nombre de transitions prévu (préallocation)
+        :type expected_transitions: int
+        """
+        self._symbols: List[str] = sorted(set(alphabet))
+        self._symbol_ids: Dict[str, int] = {
+            symbol: index for index, symbol in enumerate(self._symbols)
+        }
+        self._state_count = 0
+        self._finals = np.zeros(max(expected_states, 1), dtype=bool)
+        self._custom_names: Dict[int, str] = {}
+        self._initial: Optional[int] = None
+
+        capacity = max(expected_transitions, 1)
+        self._sources = np.empty(capacity, dtype=np.int64)
+        self._labels = np.empty(capacity, dtype=np.int64)
+        self._targets = np.empty(capacity, dtype=np.int64)
+        self._transition_count = 0
+
+    # ==================== PROPRIÉTÉS ====================
+
+    @property
+    def state_count(self) -> int:
+        """
+        Nombre d'états ajoutés.
+
+        :return: Nombre d'états
+        :rtype: int
+        """
+        return self._state_count
+
+    @property
+    def transition_count(self) -> int:
+        """
+        Nombre de transitions ajoutées.
+
+        :return: Nombre de transitions
+        :rtype: int
+        """
+        return self._transition_count
+
+    @property
+    def symbols(self) -> List[str]:
+        """
+        Symboles de l'alphabet, dans l'ordre de leurs indices.
+
+        :return: Liste triée des symboles
+        :rtype: List[str]
+        """
+        return list(self._symbols)
+
+    def symbol_id(self, symbol: str) -> int:
+        """
+        Indice d'un symbole, utilisable dans :meth:`add_transitions`.
+
+        :param symbol: Symbole de l'alphabet
+        :type symbol: str
+        :return: Indice du symbole
+        :rtype: int
+        :raises InvalidTransitionError: Si le symbole n'est pas dans l'alphabet
+        """
+        try:
+            return self._symbol_ids[symbol]
+        except KeyError:
+            raise self._transition_error(
+                f"Symbol '{symbol}' is not in the alphabet"
+            ) from None
+
+    # ==================== ÉTATS ====================
+
+    def add_state(self, final: bool = False, name: Optional[str] = None) -> int:
+        """
+        Ajoute un état.
+
+        :param final: Indique si l'état est final
+        :type final: bool
+        :param name: Nom explicite de l'état (par défaut « q<indice> »)
+        :type name: Optional[str]
+        :return: Indice du nouvel état
+        :rtype: int
+        """
+        index = self._state_count
+        self._reserve_states(index + 1)
+        self._finals[index] = final
+        if name is not None:
+            self._custom_names[index] = name
+        self._state_count = index + 1
+        return index
+
+    def add_states(self, count: int, final: bool = False) -> range:
+        """
+        Ajoute plusieurs états anonymes d'un coup.
+
+        :param count: Nombre d'états à ajouter
+        :type count: int
+        :param final: Indique si les états sont finaux
+        :type final: bool
+        :return: Indices des nouveaux états
+        :rtype: range
+        """
+        start = self._state_count
+        self._reserve_states(start + count)
+        self._finals[start : start + count] = final
+        self._state_count = start + count
+        return range(start, start + count)
+
+    def set_initial(self, state: int) -> None:
+        """
+        Définit l'état initial.
+
+        :param state: Indice de l'état initial
+        :type state: int
+        :raises InvalidDFAError: Si l'indice est négatif (DFA)
+        :raises InvalidNFAError: Si l'indice est négatif (NFA)
+        """
+        if state < 0:
+            raise self._automaton_error("Initial state index out of range")
+        self._initial = int(state)
+
+    def set_final(self, states: Union[int, IndexArray], final: bool = True) -> None:
+        """
+        Marque un ou plusieurs états comme finaux (ou non finaux).
+
+        :param states: Indice ou tableau d'indices d'états
+        :type states: Union[int, IndexArray]
+        :param final: Valeur à appliquer
+        :type final: bool
+        """
+        indices = np.asarray(states, dtype=np.int64)
+        if indices.size and (indices.min() < 0 or indices.max() >= self._state_count):
+            raise self._automaton_error("Final state index out of range")
+        self._finals[indices] = final
+
+    # ==================== TRANSITIONS ====================
+
+    def add_transition(self, source: int, symbol: str, target: int) -> None:
+        """
+        Ajoute une transition.
+
+        :param source: Indice de l'état source
+        :type source: int
+        :param symbol: Symbole de la transition
+        :type symbol: str
+        :param target: Indice de l'état cible
+        :type target: int
+        :raises InvalidTransitionError: Si le symbole n'est pas dans l'alphabet
+            ou si un indice d'état est négatif
+        """
+        if source < 0 or target < 0:
+            raise self._transition_error("Negative transition index")
+        label = self.symbol_id(symbol)
+        index = self._transition_count
+        self._reserve_transitions(index + 1)
+        self._sources[index] = source
+        self._labels[index] = label
+        self._targets[index] = target
+        self._transition_count = index + 1
+
+    def add_transitions(
+        self,
+        sources: IndexArray,
+        symbols: Union[IndexArray, Sequence[str]],
+        targets: IndexArray,
+    ) -> None:
+        """
+        Ajoute des transitions en masse.
+
+        Les symboles sont donnés soit par leurs indices (voir
+        :meth:`symbol_id`), soit sous forme de chaînes.
+
+        :param sources: Indices des états sources
+        :type sources: IndexArray
+        :param symbols: Indices ou chaînes des symboles
+        :type symbols: Union[IndexArray, Sequence[str]]
+        :param targets: Indices des états cibles
+        :type targets: IndexArray
+        :raises InvalidTransitionError: Si les tableaux n'ont pas la même taille,
+            si un symbole n'est pas dans l'alphabet ou si un indice est négatif
+        """
+        sources = np.asarray(sources, dtype=np.int64).ravel()
+        targets = np.asarray(targets, dtype=np.int64).ravel()
+        labels = np.asarray(symbols)
+        if labels.dtype.kind not in "iu":
+            symbol_id = self.symbol_id
+            labels = np.fromiter(
+                (symbol_id(symbol) for symbol in labels.ravel().tolist()),
+                dtype=np.int64,
+                count=labels.size,
+            )
+        labels = labels.astype(np.int64, copy=False).ravel()
+        if not sources.size == labels.size == targets.size:
+            raise self._transition_error("Transition arrays must have the same size")
+        # Un indice négatif désignerait silencieusement un état depuis la fin
+        if sources.size and min(sources.min(), labels.min(), targets.min()) < 0:
+            raise self._transition_error("Negative transition index")
+
+        start = self._transition_count
+        end = start + sources.size
+        self._reserve_transitions(end)
+        self._sources[start:end] = sources
+        self._labels[start:end] = labels
+        self._targets[start:end] = targets
+        self._transition_count = end
+
+    # ==================== CONSTRUCTION ====================
+
+    def validate(self) -> None:
+        """
+        Vérifie la cohérence des données accumulées (en temps linéaire).
+
+        :raises InvalidDFAError: Si l'automate est incohérent (DFA)
+        :raises InvalidNFAError: Si l'automate est incohérent (NFA)
+        """
+        count = self._state_count
+        if self._initial is None or not 0 <= self._initial < count:
+            raise self._automaton_error("Initial state is missing or out of range")
+
+        sources, labels, targets = self._transition_arrays()
+        if sources.size:
+            if (
+                min(sources.min(), targets.min()) < 0
+                or max(sources.max(), targets.max()) >= count
+            ):
+                raise self._automaton_error("Transition state index out of range")
+            if labels.min() < 0 or labels.max() >= len(self._symbols):
+                raise self._automaton_error("Transition symbol index out of range")
+
+        if self._custom_names:
+            names = self._state_names()
+            if len(set(names)) != count:
+                raise self._automaton_error("State names must be unique")
+
+    def _transition_arrays(self):
+        """Retourne les vues (sources, symboles, cibles) sur les transitions."""
+        count = self._transition_count
+        return (
+            self._sources[:count],
+            self._labels[:count],
+            self._targets[:count],
+        )
+
+    def _state_names(self) -> List[str]:
+        """Construit la liste des noms d'états."""
+        custom = self._custom_names
+        return [custom.get(index) or f"q{index}" for index in range(self._state_count)]
+
+    def _final_indices(self) -> List[int]:
+        """Retourne les indices des états finaux."""
+        return np.flatnonzero(self._finals[: self._state_count]).tolist()
+
+    def _reserve_states(self, size: int) -> None:
+        """Agrandit (par doublement) le tableau des états finaux."""
+        if size > self._finals.size:
+            grown = np.zeros(max(size, 2 * self._finals.size), dtype=bool)
+            grown[: self._state_count] = self._finals[: self._state_count]
+            self._finals = grown
+
+    def _reserve_transitions(self, size: int) -> None:
+        """Agrandit (par doublement) les tableaux de transitions."""
+        capacity = self._sources.size
+        if size > capacity:
+            capacity = max(size, 2 * capacity)
+            count = self._transition_count
+            for attribute in ("_sources", "_labels", "_targets"):
+                grown = np.empty(capacity, dtype=np.int64)
+                grown[:count] = getattr(self, attribute)[:count]
+                setattr(self, attribute, grown)
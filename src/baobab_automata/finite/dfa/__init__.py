@@ -1,10 +1,18 @@
 """Module pour les automates finis déterministes (DFA)."""
 
 from .dfa import DFA
+from .dfa_builder import DFABuilder
+from .acyclic_dfa_builder import AcyclicDFABuilder
+from .levenshtein_automaton import LevenshteinAutomaton
+from .persistent_dfa import PersistentDFA
 from .dfa_exceptions import DFAError, InvalidDFAError, InvalidStateError, InvalidTransitionError
 
 __all__ = [
     "DFA",
+    "DFABuilder",
+    "AcyclicDFABuilder",
+    "LevenshteinAutomaton",
+    "PersistentDFA",
     "DFAError",
     "InvalidDFAError", 
     "InvalidStateError",
@@ -0,0 +1,303 @@
+"""
+Construction incrémentale du DFA acyclique minimal d'une liste de mots.
+
+Ce module contient la classe AcyclicDFABuilder qui implémente les algorithmes
+de Daciuk et al. (2000) : chaque mot est ajouté au DFA en cours, et les états
+devenus définitifs sont fusionnés avec leurs équivalents via un registre.
+L'automate reste minimal (hors préfixe en cours) après chaque mot, ce qui
+permet de traiter un flux de mots (générateur) en mémoire bornée par la
+taille du résultat.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .dfa import DFA
+from .dfa_exceptions import InvalidDFAError
+
+# Signature d'un état : (final, transitions triées vers des états canoniques)
+Signature = Tuple[bool, Tuple[Tuple[str, int], ...]]
+
+
+class AcyclicDFABuilder:
+    """
+    Constructeur du DFA acyclique minimal reconnaissant une liste finie de mots.
+
+    En mode trié (par défaut), les mots doivent arriver dans l'ordre
+    lexicographique croissant ; seuls les états du dernier mot restent à
+    minimiser. En mode non trié, les états confluents rencontrés sur le
+    préfixe commun sont clonés avant modification. Les deux modes tournent
+    en temps linéaire dans la taille totale de l'entrée.
+
+    :param sorted_input: Indique si les mots arrivent triés
+    :type sorted_input: bool
+    :param alphabet: Alphabet du DFA produit (par défaut, symboles rencontrés)
+    :type alphabet: Optional[Iterable[str]]
+    """
+
+    def __init__(
+        self, sorted_input: bool = True, alphabet: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Initialise un constructeur vide.
+
+        :param sorted_input: Indique si les mots arrivent triés
+        :type sorted_input: bool
+        :param alphabet: Alphabet du DFA produit (par défaut, symboles rencontrés)
+        :type alphabet: Optional[Iterable[str]]
+        """
+        self._sorted_input = sorted_input
+        self._alphabet: Optional[Set[str]] = (
+            set(alphabet) if alphabet is not None else None
+        )
+        self._symbols: Set[str] = set()
+
+        # États : transitions, finalité, degré entrant ; indices recyclés
+        self._transitions: List[Dict[str, int]] = [{}]
+        self._final: List[bool] = [False]
+        self._in_degree: List[int] = [0]
+        self._free: List[int] = []
+        self._register: Dict[Signature, int] = {}
+
+        # Mode trié : dernier mot et chemin non encore minimisé
+        self._previous: Optional[str] = None
+        self._unchecked: List[Tuple[int, str, int]] = []
+        self._word_count = 0
+        self._closed = False
+
+    # ==================== PROPRIÉTÉS ====================
+
+    @property
+    def word_count(self) -> int:
+        """
+        Nombre de mots distincts ajoutés.
+
+        :return: Nombre de mots
+        :rtype: int
+        """
+        return self._word_count
+
+    @property
+    def state_count(self) -> int:
+        """
+        Nombre d'états actuellement alloués.
+
+        :return: Nombre d'états
+        :rtype: int
+        """
+        return len(self._transitions) - len(self._free)
+
+    # ==================== AJOUT DE MOTS ====================
+
+    def add_word(self, word: str) -> None:
+        """
+        Ajoute un mot au langage.
+
+        :param word: Mot à ajouter
+        :type word: str
+        :raises InvalidDFAError: Si un symbole est hors de l'alphabet imposé,
+            si les mots ne sont pas triés en mode trié ou si le constructeur
+            trié a déjà produit son DFA
+        """
+        if self._closed:
+            raise InvalidDFAError("Sorted builder is closed once built")
+        if self._alphabet is not None and not self._alphabet.issuperset(word):
+            raise InvalidDFAError(f"Word '{word}' uses symbols outside the alphabet")
+        self._symbols.update(word)
+        if self._sorted_input:
+            self._add_sorted(word)
+        else:
+            self._add_unsorted(word)
+
+    def add_words(self, words: Iterable[str]) -> "AcyclicDFABuilder":
+        """
+        Ajoute tous les mots d'un itérable (générateur accepté).
+
+        :param words: Mots à ajouter
+        :type words: Iterable[str]
+        :return: Le constructeur lui-même
+        :rtype: AcyclicDFABuilder
+        """
+        add_word = self.add_word
+        for word in words:
+            add_word(word)
+        return self
+
+    def build(self) -> DFA:
+        """
+        Produit le DFA minimal (partiel, sans état puits).
+
+        Les états sont nommés « q<i> » dans l'ordre d'un parcours en largeur
+        depuis l'état initial « q0 ». En mode trié, le constructeur n'accepte
+        plus de mots ensuite.
+
+        :return: DFA acyclique minimal
+        :rtype: DFA
+        """
+        if self._sorted_input:
+            self._minimize(0)
+            self._closed = True
+
+        order = [0]
+        index = {0: 0}
+        position = 0
+        while position < len(order):
+            for symbol in sorted(self._transitions[order[position]]):
+                target = self._transitions[order[position]][symbol]
+                if target not in index:
+                    index[target] = len(order)
+                    order.append(target)
+            position += 1
+
+        names = [f"q{i}" for i in range(len(order))]
+        transitions = {
+            (names[i], symbol): names[index[target]]
+            for i, state in enumerate(order)
+            for symbol, target in self._transitions[state].items()
+        }
+        alphabet = self._alphabet if self._alphabet is not None else self._symbols
+        return DFA._from_trusted(
+            frozenset(names),
+            frozenset(alphabet),
+            transitions,
+            "q0",
+            frozenset(names[i] for i, state in enumerate(order) if self._final[state]),
+        )
+
+    # ==================== MODE TRIÉ ====================
+
+    def _add_sorted(self, word: str) -> None:
+        """Ajoute un mot supérieur ou égal au précédent."""
+        previous = self._previous
+        if previous is not None:
+            if word < previous:
+                raise InvalidDFAError(
+                    f"Words must be sorted: '{word}' comes after '{previous}'"
+                )
+            if word == previous:
+                return
+
+            common = 0
+            limit = min(len(word), len(previous))
+            while common < limit and word[common] == previous[common]:
+                common += 1
+        else:
+            common = 0
+
+        # Les états au-delà du préfixe commun sont désormais définitifs
+        self._minimize(common)
+        node = self._unchecked[-1][2] if self._unchecked else 0
+        for symbol in word[common:]:
+            child = self._new_state()
+            self._transitions[node][symbol] = child
+            self._unchecked.append((node, symbol, child))
+            node = child
+        self._final[node] = True
+        self._previous = word
+        self._word_count += 1
+
+    def _minimize(self, down_to: int) -> None:
+        """Enregistre ou fusionne les états non vérifiés au-delà de down_to."""
+        unchecked = self._unchecked
+        register = self._register
+        while len(unchecked) > down_to:
+            parent, symbol, child = unchecked.pop()
+            signature = self._signature(child)
+            existing = register.get(signature)
+            if existing is None:
+                register[signature] = child
+            else:
+                self._transitions[parent][symbol] = existing
+                self._release(child)
+
+    # ==================== MODE NON TRIÉ ====================
+
+    def _add_unsorted(self, word: str) -> None:
+        """Ajoute un mot quelconque (algorithme avec clonage des états confluents)."""
+        transitions = self._transitions
+        in_degree = self._in_degree
+
+        # Préfixe commun avec le langage courant
+        path = [0]
+        node = 0
+        length = 0
+        while length < len(word):
+            target = transitions[node].get(word[length])
+            if target is None:
+                break
+            node = target
+            path.append(node)
+            length += 1
+        if length == len(word) and self._final[node]:
+            return
+
+        # Les états propres au chemin vont changer : retrait du registre
+        confluence = next(
+            (k for k in range(1, len(path)) if in_degree[path[k]] > 1), len(path)
+        )
+        for state in path[1:confluence]:
+            signature = self._signature(state)
+            if self._register.get(signature) == state:
+                del self._register[signature]
+
+        # Clonage des états partagés à partir du premier état confluent
+        for k in range(confluence, len(path)):
+            original = path[k]
+            clone = self._new_state()
+            transitions[clone] = dict(transitions[original])
+            self._final[clone] = self._final[original]
+            for target in transitions[clone].values():
+                in_degree[target] += 1
+            transitions[path[k - 1]][word[k - 1]] = clone
+            in_degree[original] -= 1
+            in_degree[clone] += 1
+            path[k] = clone
+
+        # Ajout du suffixe
+        node = path[-1]
+        for symbol in word[length:]:
+            child = self._new_state()
+            transitions[node][symbol] = child
+            in_degree[child] += 1
+            path.append(child)
+            node = child
+        self._final[node] = True
+        self._word_count += 1
+
+        # Remplacement ou enregistrement, du bout du mot vers la racine
+        for k in range(len(path) - 1, 0, -1):
+            state = path[k]
+            signature = self._signature(state)
+            existing = self._register.get(signature)
+            if existing is None:
+                self._register[signature] = state
+            elif existing != state:
+                transitions[path[k - 1]][word[k - 1]] = existing
+                in_degree[existing] += 1
+                in_degree[state] = 0
+                for target in transitions[state].values():
+                    in_degree[target] -= 1
+                self._release(state)
+
+    # ==================== ÉTATS ====================
+
+    def _signature(self, state: int) -> Signature:
+        """Calcule la signature d'un état dont les successeurs sont canoniques."""
+        return (self._final[state], tuple(sorted(self._transitions[state].items())))
+
+    def _new_state(self) -> int:
+        """Alloue un état vide, en recyclant si possible un indice libéré."""
+        if self._free:
+            state = self._free.pop()
+            self._transitions[state] = {}
+            self._final[state] = False
+            self._in_degree[state] = 0
+            return state
+        self._transitions.append({})
+        self._final.append(False)
+        self._in_degree.append(0)
+        return len(self._transitions) - 1
+
+    def _release(self, state: int) -> None:
+        """Libère un état fusionné avec son équivalent enregistré."""
+        self._transitions[state] = {}
+        self._free.append(state)
@@ -5,10 +5,16 @@ Ce module contient la classe DFA qui implémente l'interface AbstractFiniteAutom
 pour les automates finis déterministes selon les spécifications détaillées.
 """
 
-from typing import Any, Dict, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
 
 from ..abstract_finite_automaton import AbstractFiniteAutomaton
 from ..nfa import NFA
+from ..nfa.nfa import _reverse_automaton
+from ..structural_analysis import StructuralAnalysis
+from ..transition_matrix import TransitionMatrix
 
 from .dfa_exceptions import InvalidDFAError
 
@@ -64,6 +70,9 @@ class DFA(AbstractFiniteAutomaton):
     :type initial_state: str
     :param final_states: Ensemble des états finaux
     :type final_states: Set[str]
+
+    Un DFA est immuable : les propriétés retournent des vues en lecture
+    seule (``frozenset``, ``MappingProxyType``) sans copie.
     """
 
     def __init__(
@@ -91,35 +100,94 @@ class DFA(AbstractFiniteAutomaton):
         :raises InvalidStateError: Si un état est invalide
         :raises InvalidTransitionError: Si une transition est invalide
         """
-        self._states = states.copy()
-        self._alphabet = alphabet.copy()
-        self._transitions = transitions.copy()
+        self._states = frozenset(states)
+        self._alphabet = frozenset(alphabet)
+        self._transitions = dict(transitions)
         self._initial_state = initial_state
-        self._final_states = final_states.copy()
+        self._final_states = frozenset(final_states)
+        self._early_exit_stats = _new_early_exit_stats()
 
         # Validation du DFA
         if not self.validate():
             raise InvalidDFAError("Invalid DFA configuration")
 
+    @classmethod
+    def _from_trusted(
+        cls,
+        states: FrozenSet[str],
+        alphabet: FrozenSet[str],
+        transitions: Dict[Tuple[str, str], str],
+        initial_state: str,
+        final_states: FrozenSet[str],
+    ) -> "DFA":
+        """
+        Crée un DFA sans copie ni validation.
+
+        Réservé aux algorithmes qui construisent un automate déjà valide ;
+        le DFA prend possession des structures passées.
+
+        :param states: Ensemble des états
+        :type states: FrozenSet[str]
+        :param alphabet: Alphabet de l'automate
+        :type alphabet: FrozenSet[str]
+        :param transitions: Fonction de transition, non copiée
+        :type transitions: Dict[Tuple[str, str], str]
+        :param initial_state: État initial
+        :type initial_state: str
+        :param final_states: Ensemble des états finaux
+        :type final_states: FrozenSet[str]
+        :return: Instance du DFA
+        :rtype: DFA
+        """
+        dfa = cls.__new__(cls)
+        dfa._states = states
+        dfa._alphabet = alphabet
+        dfa._transitions = transitions
+        dfa._initial_state = initial_state
+        dfa._final_states = final_states
+        dfa._early_exit_stats = _new_early_exit_stats()
+        return dfa
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], sorted_input: bool = True) -> "DFA":
+        """
+        Construit le DFA acyclique minimal reconnaissant une liste finie de mots.
+
+        La construction est incrémentale (algorithme de Daciuk) et linéaire
+        dans la taille totale des mots ; un générateur peut être fourni.
+
+        :param words: Mots du langage
+        :type words: Iterable[str]
+        :param sorted_input: Indique si les mots arrivent triés
+        :type sorted_input: bool
+        :return: DFA minimal du langage
+        :rtype: DFA
+        :raises InvalidDFAError: Si sorted_input est vrai et les mots non triés
+        """
+        # Import local pour éviter les dépendances circulaires
+        from .acyclic_dfa_builder import AcyclicDFABuilder
+
+        return AcyclicDFABuilder(sorted_input).add_words(words).build()
+
     @property
-    def states(self) -> Set[str]:
+    def states(self) -> FrozenSet[str]:
         """
         Ensemble des états de l'automate.
 
         :return: Ensemble des identifiants des états
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        return self._states.copy()
+        return self._states
 
     @property
-    def alphabet(self) -> Set[str]:
+    def alphabet(self) -> FrozenSet[str]:
         """
         Alphabet de l'automate.
 
         :return: Ensemble des symboles de l'alphabet
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        return self._alphabet.copy()
+        return self._alphabet
 
     @property
     def initial_state(self) -> str:
@@ -132,38 +200,104 @@ class DFA(AbstractFiniteAutomaton):
         return self._initial_state
 
     @property
-    def final_states(self) -> Set[str]:
+    def final_states(self) -> FrozenSet[str]:
         """
         Ensemble des états finaux.
 
         :return: Ensemble des identifiants des états finaux
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
+        """
+        return self._final_states
+
+    @property
+    def transitions(self) -> Mapping[Tuple[str, str], str]:
+        """
+        Fonction de transition en lecture seule.
+
+        :return: Vue (état, symbole) -> état de destination
+        :rtype: Mapping[Tuple[str, str], str]
         """
-        return self._final_states.copy()
+        return MappingProxyType(self._transitions)
 
     def accepts(self, word: str) -> bool:
         """
         Vérifie si l'automate accepte un mot donné.
 
+        La lecture s'arrête dès qu'un état puits (rejet assuré) ou un état
+        universellement acceptant (acceptation assurée si le reste du mot
+        appartient à l'alphabet) est atteint.
+
         :param word: Mot à tester
         :type word: str
         :return: True si le mot est accepté, False sinon
         :rtype: bool
         """
+        exits = self._early_exit_table()
+        alphabet = self._alphabet
+        transitions = self._transitions
         current_state = self._initial_state
 
-        for symbol in word:
-            if symbol not in self._alphabet:
-                return False
+        for position, symbol in enumerate(word):
+            verdict = exits.get(current_state)
+            if verdict is not None:
+                return self._early_exit(verdict, word, position)
 
-            transition_key = (current_state, symbol)
-            if transition_key not in self._transitions:
+            if symbol not in alphabet:
                 return False
 
-            current_state = self._transitions[transition_key]
+            current_state = transitions.get((current_state, symbol))
+            if current_state is None:
+                return False
 
         return current_state in self._final_states
 
+    def accepts_many(self, words: Iterable[str]) -> List[bool]:
+        """
+        Teste l'appartenance d'une série de mots.
+
+        :param words: Mots à tester
+        :type words: Iterable[str]
+        :return: Résultat de accepts pour chaque mot, dans l'ordre
+        :rtype: List[bool]
+        """
+        accepts = self.accepts
+        return [accepts(word) for word in words]
+
+    def get_early_exit_stats(self) -> Dict[str, int]:
+        """
+        Retourne les compteurs de sorties anticipées.
+
+        :return: Nombre d'acceptations et de rejets anticipés, et nombre de
+            symboles non lus grâce à eux
+        :rtype: Dict[str, int]
+        """
+        return self._early_exit_stats.copy()
+
+    def reset_early_exit_stats(self) -> None:
+        """Remet à zéro les compteurs de sorties anticipées."""
+        self._early_exit_stats = _new_early_exit_stats()
+
+    def _early_exit_table(self) -> Dict[str, bool]:
+        """Retourne (calculée une fois) la table état -> verdict anticipé."""
+        analysis = StructuralAnalysis.of(self)
+        cached = self.__dict__.get("_early_exits")
+        if cached is None or cached[0] is not analysis:
+            table = dict.fromkeys(analysis.dead_states, False)
+            table.update(dict.fromkeys(analysis.universal_states, True))
+            cached = self._early_exits = (analysis, table)
+        return cached[1]
+
+    def _early_exit(self, verdict: bool, word: str, position: int) -> bool:
+        """Termine une lecture anticipée et met à jour les compteurs."""
+        stats = self._early_exit_stats
+        stats["skipped_symbols"] += len(word) - position
+        if verdict:
+            stats["early_accepts"] += 1
+            # Les symboles restants doivent tout de même appartenir à l'alphabet
+            return self._alphabet.issuperset(word[position:])
+        stats["early_rejects"] += 1
+        return False
+
     def get_transition(self, state: str, symbol: str) -> Optional[str]:
         """
         Récupère l'état de destination pour une transition donnée.
@@ -189,32 +323,35 @@ class DFA(AbstractFiniteAutomaton):
         """
         return state in self._final_states
 
-    def get_reachable_states(self) -> Set[str]:
+    def get_reachable_states(self) -> FrozenSet[str]:
         """
         Récupère tous les états accessibles depuis l'état initial.
 
+        Le résultat est calculé une seule fois puis mis en cache.
+
         :return: Ensemble des états accessibles
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        reachable = set()
-        to_visit = {self._initial_state}
+        return StructuralAnalysis.of(self).reachable
 
-        while to_visit:
-            current = to_visit.pop()
-            if current in reachable:
-                continue
+    def get_dead_states(self) -> FrozenSet[str]:
+        """
+        Récupère les états puits, depuis lesquels aucun état final n'est
+        atteignable.
 
-            reachable.add(current)
+        :return: Ensemble des états puits
+        :rtype: FrozenSet[str]
+        """
+        return StructuralAnalysis.of(self).dead_states
 
-            # Ajouter tous les états accessibles depuis l'état actuel
-            for symbol in self._alphabet:
-                transition_key = (current, symbol)
-                if transition_key in self._transitions:
-                    next_state = self._transitions[transition_key]
-                    if next_state not in reachable:
-                        to_visit.add(next_state)
+    def reverse(self) -> "NFA":
+        """
+        Construit l'automate miroir, qui accepte les mots retournés.
 
-        return reachable
+        :return: NFA acceptant le langage miroir
+        :rtype: NFA
+        """
+        return _reverse_automaton(self)
 
     def validate(self) -> bool:
         """
@@ -296,10 +433,7 @@ class DFA(AbstractFiniteAutomaton):
                 state_mapping[state] = f"q{i}"
 
         # Nouveaux états
-        new_states = {state_mapping[state] for state in self._states}
-
-        # Nouvel alphabet (identique)
-        new_alphabet = self._alphabet.copy()
+        new_states = frozenset(state_mapping[state] for state in self._states)
 
         # Nouvelles transitions
         new_transitions = {}
@@ -312,14 +446,10 @@ class DFA(AbstractFiniteAutomaton):
         new_initial = state_mapping[self._initial_state]
 
         # Nouveaux états finaux
-        new_final = {state_mapping[state] for state in self._final_states}
-
-        return DFA(
-            states=new_states,
-            alphabet=new_alphabet,
-            transitions=new_transitions,
-            initial_state=new_initial,
-            final_states=new_final,
+        new_final = frozenset(state_mapping[state] for state in self._final_states)
+
+        return DFA._from_trusted(
+            new_states, self._alphabet, new_transitions, new_initial, new_final
         )
 
     def _get_group_for_state(self, state: str, symbol: str, partition: list) -> int:
@@ -342,10 +472,7 @@ class DFA(AbstractFiniteAutomaton):
         reachable = self.get_reachable_states()
 
         # Nouveaux états (seulement les accessibles)
-        new_states = reachable
-
-        # Nouvel alphabet (identique)
-        new_alphabet = self._alphabet.copy()
+        new_states = frozenset(reachable)
 
         # Nouvelles transitions (seulement celles entre états accessibles)
         new_transitions = {
@@ -360,12 +487,8 @@ class DFA(AbstractFiniteAutomaton):
         # Nouveaux états finaux (seulement ceux accessibles)
         new_final = self._final_states.intersection(reachable)
 
-        return DFA(
-            states=new_states,
-            alphabet=new_alphabet,
-            transitions=new_transitions,
-            initial_state=new_initial,
-            final_states=new_final,
+        return DFA._from_trusted(
+            new_states, self._alphabet, new_transitions, new_initial, new_final
         )
 
     def union(self, other: "DFA") -> "DFA":
@@ -406,13 +529,14 @@ class DFA(AbstractFiniteAutomaton):
         :rtype: DFA
         """
         # Optimisation directe pour DFA : inverser les états finaux
+        # Les structures immuables sont partagées avec l'original
         new_final_states = self._states - self._final_states
-        return DFA(
-            states=self._states,
-            alphabet=self._alphabet,
-            transitions=self._transitions,
-            initial_state=self._initial_state,
-            final_states=new_final_states
+        return DFA._from_trusted(
+            self._states,
+            self._alphabet,
+            self._transitions,
+            self._initial_state,
+            new_final_states,
         )
 
     def concatenation(self, other: "DFA") -> "DFA":
@@ -454,16 +578,71 @@ class DFA(AbstractFiniteAutomaton):
         # Conversion directe : chaque transition DFA devient une transition NFA
         nfa_transitions = {}
         for (source, symbol), target in self._transitions.items():
-            nfa_transitions[(source, symbol)] = {target}
-
-        return NFA(
-            states=self._states,
-            alphabet=self._alphabet,
-            transitions=nfa_transitions,
-            initial_state=self._initial_state,
-            final_states=self._final_states
+            nfa_transitions[(source, symbol)] = frozenset((target,))
+
+        return NFA._from_trusted(
+            self._states,
+            self._alphabet,
+            nfa_transitions,
+            self._initial_state,
+            self._final_states,
         )
 
+    def fuzzy_search(self, query: str, max_distance: int = 1) -> List[Tuple[str, int]]:
+        """
+        Recherche les mots acceptés à distance d'édition au plus k d'une requête.
+
+        Le DFA est parcouru en produit avec l'automate de Levenshtein de la
+        requête ; seules les branches encore à distance au plus k sont
+        explorées, sans énumérer tout le langage.
+
+        :param query: Mot requête
+        :type query: str
+        :param max_distance: Distance d'édition maximale (0 à 3)
+        :type max_distance: int
+        :return: Couples (mot, distance), dans l'ordre lexicographique
+        :rtype: List[Tuple[str, int]]
+        :raises InvalidDFAError: Si la distance n'est pas comprise entre 0 et 3
+        """
+        # Import local pour éviter les dépendances circulaires
+        from .levenshtein_automaton import LevenshteinAutomaton
+
+        return list(LevenshteinAutomaton(query, max_distance).search(self))
+
+    def to_persistent(self) -> "PersistentDFA":
+        """
+        Crée une version persistante du DFA, éditable en O(log n).
+
+        :return: DFA persistant à partage structurel
+        :rtype: PersistentDFA
+        """
+        # Import local pour éviter les dépendances circulaires
+        from .persistent_dfa import PersistentDFA
+
+        return PersistentDFA.from_dfa(self)
+
+    def to_matrix(self) -> Dict[str, np.ndarray]:
+        """
+        Matrices d'adjacence booléennes denses, une par symbole.
+
+        Les lignes et colonnes suivent l'ordre trié des noms d'états (voir
+        :attr:`TransitionMatrix.states`). La taille est quadratique : pour
+        les grands automates, préférer :meth:`to_csr`.
+
+        :return: Symbole -> matrice booléenne (n x n)
+        :rtype: Dict[str, np.ndarray]
+        """
+        return self.to_csr().symbol_matrices()
+
+    def to_csr(self) -> TransitionMatrix:
+        """
+        Adjacence combinée au format CSR, avec analyses vectorisées.
+
+        :return: Vue matricielle de l'automate
+        :rtype: TransitionMatrix
+        """
+        return TransitionMatrix.from_automaton(self)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Sérialise l'automate en dictionnaire.
@@ -534,6 +713,7 @@ class DFA(AbstractFiniteAutomaton):
 
         longest_match = None
         longest_length = 0
+        exits = self._early_exit_table()
 
         # Essayer de faire correspondre à partir de chaque position
         for i in range(start, len(text)):
@@ -542,6 +722,23 @@ class DFA(AbstractFiniteAutomaton):
 
             # Simuler l'automate à partir de la position i
             for j in range(i, len(text)):
+                verdict = exits.get(current_state)
+                if verdict is not None:
+                    if verdict:
+                        # Toute suite de symboles de l'alphabet est acceptée :
+                        # la correspondance s'étend jusqu'au premier symbole inconnu
+                        end = j
+                        while end < len(text) and text[end] in self._alphabet:
+                            end += 1
+                        if end - i > longest_length:
+                            longest_match = Match(text[i:end], i, end)
+                            longest_length = end - i
+                        self._early_exit_stats["early_accepts"] += 1
+                    else:
+                        self._early_exit_stats["early_rejects"] += 1
+                    self._early_exit_stats["skipped_symbols"] += len(text) - j
+                    break
+
                 symbol = text[j]
                 if symbol not in self._alphabet:
                     break
@@ -569,7 +766,13 @@ class DFA(AbstractFiniteAutomaton):
         :rtype: str
         """
         return (
-            f"DFA(states={self._states}, alphabet={self._alphabet}, "
-            f"initial_state='{self._initial_state}', final_states={self._final_states}, "
+            f"DFA(states={set(self._states)}, alphabet={set(self._alphabet)}, "
+            f"initial_state='{self._initial_state}', "
+            f"final_states={set(self._final_states)}, "
             f"transitions={self._transitions})"
         )
+
+
+def _new_early_exit_stats() -> Dict[str, int]:
+    """Crée des compteurs de sorties anticipées à zéro."""
+    return {"early_accepts": 0, "early_rejects": 0, "skipped_symbols": 0}
@@ -0,0 +1,88 @@
+"""
+Constructeur en masse d'automates finis déterministes.
+
+Ce module contient la classe DFABuilder qui produit un DFA figé en temps
+linéaire à partir de transitions ajoutées une à une ou par tableaux NumPy.
+"""
+
+import numpy as np
+
+from ..automaton_builder import AutomatonBuilder
+from .dfa import DFA
+from .dfa_exceptions import InvalidDFAError, InvalidTransitionError
+
+
+class DFABuilder(AutomatonBuilder):
+    """
+    Constructeur incrémental de DFA.
+
+    Exemple ::
+
+        builder = DFABuilder({"a", "b"}, expected_states=3)
+        q0, q1 = builder.add_state(), builder.add_state(final=True)
+        builder.set_initial(q0)
+        builder.add_transitions([q0, q1], ["a", "b"], [q1, q0])
+        dfa = builder.build()
+
+    :param alphabet: Alphabet de l'automate
+    :type alphabet: Iterable[str]
+    :param expected_states: Nombre d'états prévu (préallocation)
+    :type expected_states: int
+    :param expected_transitions: Nombre de transitions prévu (préallocation)
+    :type expected_transitions: int
+    """
+
+    _automaton_error = InvalidDFAError
+    _transition_error = InvalidTransitionError
+
+    def validate(self) -> None:
+        """
+        Vérifie la cohérence et le déterminisme des transitions.
+
+        :raises InvalidDFAError: Si l'automate est incohérent ou si deux
+            transitions de même (état, symbole) mènent à des cibles différentes
+        """
+        super().validate()
+        sources, labels, targets = self._transition_arrays()
+        if sources.size:
+            keys = sources * len(self._symbols) + labels
+            order = np.argsort(keys, kind="stable")
+            keys, targets = keys[order], targets[order]
+            same_key = keys[1:] == keys[:-1]
+            if np.any(same_key & (targets[1:] != targets[:-1])):
+                raise InvalidDFAError(
+                    "Conflicting transitions for the same state and symbol"
+                )
+
+    def build(self, validate: bool = True) -> DFA:
+        """
+        Produit le DFA figé.
+
+        :param validate: Vérifie la cohérence avant construction ; avec False,
+            la vérification est différée (voir :meth:`DFA.validate`)
+        :type validate: bool
+        :return: DFA construit sans copie supplémentaire
+        :rtype: DFA
+        :raises InvalidDFAError: Si la validation échoue
+        """
+        if validate:
+            self.validate()
+        elif self._initial is None:
+            raise InvalidDFAError("Initial state is missing")
+
+        names = self._state_names()
+        symbols = self._symbols
+        sources, labels, targets = self._transition_arrays()
+        transitions = {
+            (names[source], symbols[label]): names[target]
+            for source, label, target in zip(
+                sources.tolist(), labels.tolist(), targets.tolist()
+            )
+        }
+        return DFA._from_trusted(
+            frozenset(names),
+            frozenset(symbols),
+            transitions,
+            names[self._initial],
+            frozenset(names[index] for index in self._final_indices()),
+        )
@@ -0,0 +1,317 @@
+"""
+Automates de Levenshtein pour la recherche approximative dans un DFA.
+
+Ce module contient la classe LevenshteinAutomaton qui reconnaît les mots à
+distance d'édition au plus k d'un mot requête (k ≤ 3). Les transitions sont
+lues dans des tables paramétriques (Schulz et Mihov, 2002) calculées une
+seule fois par valeur de k : un état paramétrique est un ensemble de
+positions (décalage, erreurs) relatif à une position de base dans la
+requête, et chaque transition dépend uniquement du vecteur caractéristique
+du symbole lu sur une fenêtre de 2k+1 caractères de la requête.
+
+Le parcours du produit avec un DFA dictionnaire est paresseux : seuls les
+préfixes encore à distance au plus k sont explorés.
+"""
+
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+from ..structural_analysis import StructuralAnalysis
+from .dfa import DFA
+from .dfa_exceptions import InvalidDFAError
+
+# Distance d'édition maximale couverte par les tables paramétriques
+MAX_DISTANCE = 3
+
+# Position paramétrique : (décalage par rapport à la base, erreurs)
+Position = Tuple[int, int]
+
+# Configuration de l'automate : (état paramétrique, position de base)
+Configuration = Tuple[int, int]
+
+
+class _ParametricTable:
+    """Table de transitions paramétrique pour une distance maximale donnée."""
+
+    def __init__(self, max_distance: int) -> None:
+        """Calcule tous les états paramétriques accessibles et leurs transitions."""
+        self.max_distance = max_distance
+        self.window = 2 * max_distance + 1
+        self.states: List[FrozenSet[Position]] = [frozenset({(0, 0)})]
+        self.transitions: List[List[Optional[Tuple[int, int]]]] = []
+        # min(erreurs - décalage) : distance = reste de la requête + cette valeur
+        self.offsets: List[int] = []
+
+        index = {self.states[0]: 0}
+        position = 0
+        while position < len(self.states):
+            state = self.states[position]
+            row: List[Optional[Tuple[int, int]]] = []
+            for length in range(self.window + 1):
+                for bits in range(1 << length):
+                    successor = self._successor(state, length, bits)
+                    if successor is None:
+                        row.append(None)
+                        continue
+                    positions, shift = successor
+                    target = index.get(positions)
+                    if target is None:
+                        target = index[positions] = len(self.states)
+                        self.states.append(positions)
+                    row.append((target, shift))
+            self.transitions.append(row)
+            self.offsets.append(min(errors - offset for offset, errors in state))
+            position += 1
+
+    def _successor(
+        self, state: FrozenSet[Position], length: int, bits: int
+    ) -> Optional[Tuple[FrozenSet[Position], int]]:
+        """Applique un vecteur caractéristique à un état puis le normalise."""
+        limit = self.max_distance
+        reached: Set[Position] = set()
+        for offset, errors in state:
+            if offset < length and bits >> offset & 1:
+                reached.add((offset + 1, errors))
+            if errors < limit:
+                # Insertion dans le mot, puis substitution
+                reached.add((offset, errors + 1))
+                if offset < length:
+                    reached.add((offset + 1, errors + 1))
+                # Suppression de d caractères de la requête puis correspondance
+                for skipped in range(1, limit - errors + 1):
+                    target = offset + skipped
+                    if target < length and bits >> target & 1:
+                        reached.add((target + 1, errors + skipped))
+
+        # Élimination des positions subsumées
+        kept = [
+            (offset, errors)
+            for offset, errors in reached
+            if not any(
+                other_errors < errors
+                and abs(other_offset - offset) <= errors - other_errors
+                for other_offset, other_errors in reached
+            )
+        ]
+        if not kept:
+            return None
+        base = min(offset for offset, _ in kept)
+        return frozenset((offset - base, errors) for offset, errors in kept), base
+
+
+# Tables paramétriques calculées à la demande, une par distance
+_TABLES: Dict[int, _ParametricTable] = {}
+
+
+def _table_for(max_distance: int) -> _ParametricTable:
+    """Retourne (en la calculant au premier appel) la table d'une distance."""
+    table = _TABLES.get(max_distance)
+    if table is None:
+        table = _TABLES[max_distance] = _ParametricTable(max_distance)
+    return table
+
+
+class LevenshteinAutomaton:
+    """
+    Automate de Levenshtein d'un mot requête, pour une distance k ≤ 3.
+
+    L'automate est déterministe ; ses configurations sont des couples
+    (état paramétrique, position de base) et ses transitions sont calculées
+    à la volée à partir de la table paramétrique partagée.
+
+    :param query: Mot requête
+    :type query: str
+    :param max_distance: Distance d'édition maximale (0 à 3)
+    :type max_distance: int
+    :raises InvalidDFAError: Si la distance n'est pas comprise entre 0 et 3
+    """
+
+    def __init__(self, query: str, max_distance: int = 1) -> None:
+        """
+        Initialise l'automate de Levenshtein.
+
+        :param query: Mot requête
+        :type query: str
+        :param max_distance: Distance d'édition maximale (0 à 3)
+        :type max_distance: int
+        :raises InvalidDFAError: Si la distance n'est pas comprise entre 0 et 3
+        """
+        if not 0 <= max_distance <= MAX_DISTANCE:
+            raise InvalidDFAError(
+                f"Levenshtein distance must be between 0 and {MAX_DISTANCE}"
+            )
+        self._query = query
+        self._max_distance = max_distance
+        self._table = _table_for(max_distance)
+
+        # Masque des positions de chaque symbole dans la requête
+        self._masks: Dict[str, int] = {}
+        for position, symbol in enumerate(query):
+            self._masks[symbol] = self._masks.get(symbol, 0) | 1 << position
+
+    # ==================== PROPRIÉTÉS ====================
+
+    @property
+    def query(self) -> str:
+        """
+        Mot requête.
+
+        :return: Mot requête
+        :rtype: str
+        """
+        return self._query
+
+    @property
+    def max_distance(self) -> int:
+        """
+        Distance d'édition maximale.
+
+        :return: Distance maximale
+        :rtype: int
+        """
+        return self._max_distance
+
+    # ==================== TRANSITIONS ====================
+
+    @property
+    def initial(self) -> Configuration:
+        """
+        Configuration initiale.
+
+        :return: Couple (état paramétrique, position de base)
+        :rtype: Configuration
+        """
+        return (0, 0)
+
+    def step(
+        self, configuration: Configuration, symbol: str
+    ) -> Optional[Configuration]:
+        """
+        Lit un symbole depuis une configuration.
+
+        :param configuration: Configuration courante
+        :type configuration: Configuration
+        :param symbol: Symbole lu
+        :type symbol: str
+        :return: Configuration suivante, ou None si la distance k est dépassée
+        :rtype: Optional[Configuration]
+        """
+        state, base = configuration
+        length = min(self._table.window, len(self._query) - base)
+        bits = self._masks.get(symbol, 0) >> base & ((1 << length) - 1)
+        successor = self._table.transitions[state][(1 << length) - 1 + bits]
+        if successor is None:
+            return None
+        return successor[0], base + successor[1]
+
+    def distance_at(self, configuration: Configuration) -> Optional[int]:
+        """
+        Distance du mot lu jusqu'à une configuration, si elle est au plus k.
+
+        :param configuration: Configuration atteinte
+        :type configuration: Configuration
+        :return: Distance d'édition, ou None si elle dépasse k
+        :rtype: Optional[int]
+        """
+        state, base = configuration
+        distance = len(self._query) - base + self._table.offsets[state]
+        return distance if distance <= self._max_distance else None
+
+    def distance(self, word: str) -> Optional[int]:
+        """
+        Distance d'édition entre un mot et la requête, si elle est au plus k.
+
+        :param word: Mot à comparer
+        :type word: str
+        :return: Distance d'édition, ou None si elle dépasse k
+        :rtype: Optional[int]
+        """
+        configuration: Optional[Configuration] = self.initial
+        for symbol in word:
+            configuration = self.step(configuration, symbol)
+            if configuration is None:
+                return None
+        return self.distance_at(configuration)
+
+    def accepts(self, word: str) -> bool:
+        """
+        Vérifie qu'un mot est à distance au plus k de la requête.
+
+        :param word: Mot à tester
+        :type word: str
+        :return: True si le mot est accepté
+        :rtype: bool
+        """
+        return self.distance(word) is not None
+
+    # ==================== PRODUIT AVEC UN DFA ====================
+
+    def search(self, dictionary: DFA) -> Iterator[Tuple[str, int]]:
+        """
+        Énumère les mots d'un DFA à distance au plus k de la requête.
+
+        Le produit est parcouru en profondeur, symboles triés : les mots sont
+        produits dans l'ordre lexicographique. Les branches dépassant la
+        distance k ou menant à un état puits du DFA sont élaguées.
+
+        :param dictionary: DFA du dictionnaire
+        :type dictionary: DFA
+        :return: Itérateur de couples (mot, distance)
+        :rtype: Iterator[Tuple[str, int]]
+        """
+        useful = StructuralAnalysis.of(dictionary).coreachable
+        initial = dictionary.initial_state
+        if initial not in useful:
+            return
+
+        transitions = dictionary.transitions
+        finals = dictionary.final_states
+        symbols = sorted(dictionary.alphabet, reverse=True)
+        stack: List[Tuple[str, Configuration, str]] = [(initial, self.initial, "")]
+        while stack:
+            state, configuration, word = stack.pop()
+            if state in finals:
+                distance = self.distance_at(configuration)
+                if distance is not None:
+                    yield word, distance
+            for symbol in symbols:
+                target = transitions.get((state, symbol))
+                if target is None or target not in useful:
+                    continue
+                successor = self.step(configuration, symbol)
+                if successor is not None:
+                    stack.append((target, successor, word + symbol))
+
+    def to_dfa(self, alphabet: Optional[Set[str]] = None) -> DFA:
+        """
+        Construit explicitement le DFA partiel de l'automate de Levenshtein.
+
+        :param alphabet: Alphabet du DFA (par défaut, symboles de la requête)
+        :type alphabet: Optional[Set[str]]
+        :return: DFA reconnaissant les mots à distance au plus k
+        :rtype: DFA
+        """
+        symbols = sorted(alphabet if alphabet is not None else set(self._query))
+        names = {self.initial: "q0"}
+        order = [self.initial]
+        transitions: Dict[Tuple[str, str], str] = {}
+        for configuration in order:
+            for symbol in symbols:
+                successor = self.step(configuration, symbol)
+                if successor is None:
+                    continue
+                if successor not in names:
+                    names[successor] = f"q{len(order)}"
+                    order.append(successor)
+                transitions[(names[configuration], symbol)] = names[successor]
+
+        return DFA._from_trusted(
+            frozenset(names.values()),
+            frozenset(symbols),
+            transitions,
+            "q0",
+            frozenset(
+                names[configuration]
+                for configuration in order
+                if self.distance_at(configuration) is not None
+            ),
+        )
@@ -0,0 +1,614 @@
+"""
+DFA persistant à partage structurel.
+
+Ce module contient la classe PersistentDFA, une variante immuable du DFA
+dont la fonction de transition est stockée dans une table de hachage
+persistante (arbre préfixe de hachage à 32 branches, ou HAMT). Une édition
+ne recopie que le chemin de la racine à la feuille modifiée, soit
+O(log n) ; les versions précédentes restent valides et partagent tout le
+reste de la structure, ce qui permet aux lectures en cours de continuer
+sur l'ancienne version pendant qu'un éditeur en produit de nouvelles.
+"""
+
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from ..abstract_finite_automaton import AbstractFiniteAutomaton
+from ..optimization.transition_change import TransitionChange
+from .dfa import DFA
+from .dfa_exceptions import InvalidDFAError, InvalidStateError, InvalidTransitionError
+
+# Géométrie du HAMT : 5 bits de hachage par niveau, 32 branches par nœud
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+# Marqueur de suppression dans un lot d'éditions
+_REMOVED = object()
+
+
+class _PersistentMap:
+    """
+    Table de hachage persistante (HAMT) à copie sur écriture.
+
+    Un nœud est un dictionnaire case -> enfant, où l'enfant est soit un
+    nœud, soit un seau (tuple de triplets (hachage, clé, valeur)). Un lot
+    d'éditions ne recopie chaque nœud qu'une fois : les nœuds créés pendant
+    le lot lui appartiennent et sont modifiés en place.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, root: Optional[Dict[int, Any]] = None, size: int = 0) -> None:
+        """Enveloppe une racine existante (vide par défaut)."""
+        self._root: Dict[int, Any] = {} if root is None else root
+        self._size = size
+
+    def __len__(self) -> int:
+        """Nombre d'entrées."""
+        return self._size
+
+    def __contains__(self, key: Any) -> bool:
+        """Indique si la clé est présente."""
+        return self.get(key, _REMOVED) is not _REMOVED
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Valeur associée à la clé, ou default."""
+        code = hash(key) & _HASH_MASK
+        node = self._root
+        shift = 0
+        while True:
+            child = node.get((code >> shift) & _MASK)
+            if child is None:
+                return default
+            if type(child) is not dict:
+                for entry_code, entry_key, value in child:
+                    if entry_code == code and entry_key == key:
+                        return value
+                return default
+            node = child
+            shift += _BITS
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Parcourt les paires (clé, valeur), dans un ordre arbitraire."""
+        stack = [self._root]
+        while stack:
+            for child in stack.pop().values():
+                if type(child) is dict:
+                    stack.append(child)
+                else:
+                    for _, key, value in child:
+                        yield key, value
+
+    def evolve(self, edits: Iterable[Tuple[Any, Any]]) -> "_PersistentMap":
+        """
+        Applique un lot de paires (clé, valeur) et retourne la nouvelle table.
+
+        La valeur _REMOVED supprime la clé ; la table courante est inchangée.
+        """
+        owned: Dict[int, Dict[int, Any]] = {}
+        root = self._root
+        size = self._size
+        for key, value in edits:
+            code = hash(key) & _HASH_MASK
+            if value is _REMOVED:
+                if key in _PersistentMap(root, size):
+                    root = _dissoc(root, 0, code, key, owned)
+                    size -= 1
+            else:
+                root, added = _assoc(root, 0, code, key, value, owned)
+                size += added
+        if not owned:
+            return self
+        return _PersistentMap(root, size)
+
+
+def _editable(node: Dict[int, Any], owned: Dict[int, Dict[int, Any]]) -> Dict[int, Any]:
+    """Retourne le nœud s'il appartient au lot courant, sinon une copie."""
+    if id(node) in owned:
+        return node
+    copy = dict(node)
+    owned[id(copy)] = copy
+    return copy
+
+
+def _assoc(
+    node: Dict[int, Any],
+    shift: int,
+    code: int,
+    key: Any,
+    value: Any,
+    owned: Dict[int, Dict[int, Any]],
+) -> Tuple[Dict[int, Any], bool]:
+    """Insère ou remplace une entrée ; indique si la clé est nouvelle."""
+    node = _editable(node, owned)
+    slot = (code >> shift) & _MASK
+    child = node.get(slot)
+    if child is None:
+        node[slot] = ((code, key, value),)
+        return node, True
+    if type(child) is dict:
+        node[slot], added = _assoc(child, shift + _BITS, code, key, value, owned)
+        return node, added
+
+    for position, (entry_code, entry_key, _) in enumerate(child):
+        if entry_code == code and entry_key == key:
+            node[slot] = (
+                child[:position] + ((code, key, value),) + child[position + 1 :]
+            )
+            return node, False
+    if child[0][0] == code or shift + _BITS >= _HASH_BITS:
+        # Collision complète de hachage : le seau s'allonge
+        node[slot] = child + ((code, key, value),)
+        return node, True
+
+    # Le seau descend d'un niveau pour laisser place à la nouvelle clé
+    sub_node: Dict[int, Any] = {}
+    owned[id(sub_node)] = sub_node
+    sub_node[(child[0][0] >> (shift + _BITS)) & _MASK] = child
+    node[slot], _ = _assoc(sub_node, shift + _BITS, code, key, value, owned)
+    return node, True
+
+
+def _dissoc(
+    node: Dict[int, Any],
+    shift: int,
+    code: int,
+    key: Any,
+    owned: Dict[int, Dict[int, Any]],
+) -> Dict[int, Any]:
+    """Supprime une entrée présente ; les nœuds vidés disparaissent."""
+    node = _editable(node, owned)
+    slot = (code >> shift) & _MASK
+    child = node[slot]
+    if type(child) is dict:
+        child = _dissoc(child, shift + _BITS, code, key, owned)
+    else:
+        child = tuple(
+            entry for entry in child if not (entry[0] == code and entry[1] == key)
+        )
+    if child:
+        node[slot] = child
+    else:
+        del node[slot]
+    return node
+
+
+class PersistentDFA(AbstractFiniteAutomaton):
+    """
+    DFA immuable à éditions en O(log n) et partage structurel.
+
+    Chaque édition (set_transition, remove_transition, add_state,
+    set_final, apply_changes) retourne une nouvelle version ; la version
+    d'origine n'est jamais modifiée et reste utilisable. Les transitions
+    et les états (avec leur caractère final) sont stockés dans deux tables
+    persistantes.
+
+    :param states: Ensemble des états de l'automate
+    :type states: Set[str]
+    :param alphabet: Alphabet de l'automate
+    :type alphabet: Set[str]
+    :param transitions: Fonction de transition (état, symbole) vers un état
+    :type transitions: Dict[Tuple[str, str], str]
+    :param initial_state: État initial
+    :type initial_state: str
+    :param final_states: Ensemble des états finaux
+    :type final_states: Set[str]
+    """
+
+    def __init__(
+        self,
+        states: Set[str],
+        alphabet: Set[str],
+        transitions: Dict[Tuple[str, str], str],
+        initial_state: str,
+        final_states: Set[str],
+    ) -> None:
+        """
+        Initialise un DFA persistant.
+
+        :param states: Ensemble des états de l'automate
+        :type states: Set[str]
+        :param alphabet: Alphabet de l'automate
+        :type alphabet: Set[str]
+        :param transitions: Fonction de transition (état, symbole) vers un état
+        :type transitions: Dict[Tuple[str, str], str]
+        :param initial_state: État initial
+        :type initial_state: str
+        :param final_states: Ensemble des états finaux
+        :type final_states: Set[str]
+        :raises InvalidDFAError: Si le DFA est invalide
+        """
+        final_states = frozenset(final_states)
+        self._alphabet = frozenset(alphabet)
+        self._initial_state = initial_state
+        self._state_table = _PersistentMap().evolve(
+            (state, state in final_states) for state in states
+        )
+        self._transition_table = _PersistentMap().evolve(transitions.items())
+        self._reset_views()
+
+        if not final_states <= self.states or not self.validate():
+            raise InvalidDFAError("Invalid DFA configuration")
+
+    @classmethod
+    def _from_tables(
+        cls,
+        alphabet: FrozenSet[str],
+        initial_state: str,
+        state_table: _PersistentMap,
+        transition_table: _PersistentMap,
+    ) -> "PersistentDFA":
+        """Crée une version à partir de tables déjà valides, sans validation."""
+        automaton = cls.__new__(cls)
+        automaton._alphabet = alphabet
+        automaton._initial_state = initial_state
+        automaton._state_table = state_table
+        automaton._transition_table = transition_table
+        automaton._reset_views()
+        return automaton
+
+    @classmethod
+    def from_dfa(cls, dfa: DFA) -> "PersistentDFA":
+        """
+        Crée la version persistante d'un DFA.
+
+        :param dfa: DFA source
+        :type dfa: DFA
+        :return: DFA persistant de même langage et de mêmes états
+        :rtype: PersistentDFA
+        """
+        final_states = dfa.final_states
+        return cls._from_tables(
+            frozenset(dfa.alphabet),
+            dfa.initial_state,
+            _PersistentMap().evolve(
+                (state, state in final_states) for state in dfa.states
+            ),
+            _PersistentMap().evolve(dfa.transitions.items()),
+        )
+
+    def _reset_views(self) -> None:
+        """Invalide les vues matérialisées à la demande."""
+        self._states_view: Optional[FrozenSet[str]] = None
+        self._final_states_view: Optional[FrozenSet[str]] = None
+        self._transitions_view: Optional[Dict[Tuple[str, str], str]] = None
+
+    @property
+    def states(self) -> FrozenSet[str]:
+        """
+        Ensemble des états de l'automate.
+
+        Matérialisé en O(n) au premier accès de chaque version.
+
+        :return: Ensemble des identifiants des états
+        :rtype: FrozenSet[str]
+        """
+        if self._states_view is None:
+            self._states_view = frozenset(
+                state for state, _ in self._state_table.items()
+            )
+        return self._states_view
+
+    @property
+    def alphabet(self) -> FrozenSet[str]:
+        """
+        Alphabet de l'automate.
+
+        :return: Ensemble des symboles de l'alphabet
+        :rtype: FrozenSet[str]
+        """
+        return self._alphabet
+
+    @property
+    def initial_state(self) -> str:
+        """
+        État initial de l'automate.
+
+        :return: Identifiant de l'état initial
+        :rtype: str
+        """
+        return self._initial_state
+
+    @property
+    def final_states(self) -> FrozenSet[str]:
+        """
+        Ensemble des états finaux.
+
+        Matérialisé en O(n) au premier accès de chaque version.
+
+        :return: Ensemble des identifiants des états finaux
+        :rtype: FrozenSet[str]
+        """
+        if self._final_states_view is None:
+            self._final_states_view = frozenset(
+                state for state, final in self._state_table.items() if final
+            )
+        return self._final_states_view
+
+    @property
+    def transitions(self) -> Mapping[Tuple[str, str], str]:
+        """
+        Fonction de transition en lecture seule.
+
+        Matérialisée en O(m) au premier accès de chaque version ; get_transition
+        interroge directement la table persistante.
+
+        :return: Vue (état, symbole) -> état de destination
+        :rtype: Mapping[Tuple[str, str], str]
+        """
+        if self._transitions_view is None:
+            self._transitions_view = dict(self._transition_table.items())
+        return MappingProxyType(self._transitions_view)
+
+    def accepts(self, word: str) -> bool:
+        """
+        Vérifie si l'automate accepte un mot donné.
+
+        :param word: Mot à tester
+        :type word: str
+        :return: True si le mot est accepté, False sinon
+        :rtype: bool
+        """
+        lookup = self._transition_table.get
+        current_state = self._initial_state
+        for symbol in word:
+            current_state = lookup((current_state, symbol))
+            if current_state is None:
+                return False
+        return self._state_table.get(current_state, False)
+
+    def get_transition(self, state: str, symbol: str) -> Optional[str]:
+        """
+        Récupère l'état de destination pour une transition donnée.
+
+        :param state: État source
+        :type state: str
+        :param symbol: Symbole de la transition
+        :type symbol: str
+        :return: État de destination ou None si la transition n'existe pas
+        :rtype: Optional[str]
+        """
+        return self._transition_table.get((state, symbol))
+
+    def is_final_state(self, state: str) -> bool:
+        """
+        Vérifie si un état est final.
+
+        :param state: Identifiant de l'état
+        :type state: str
+        :return: True si l'état est final, False sinon
+        :rtype: bool
+        """
+        return self._state_table.get(state, False)
+
+    def get_reachable_states(self) -> FrozenSet[str]:
+        """
+        Récupère tous les états accessibles depuis l'état initial.
+
+        :return: Ensemble des états accessibles
+        :rtype: FrozenSet[str]
+        """
+        symbols = sorted(self._alphabet)
+        lookup = self._transition_table.get
+        reachable = {self._initial_state}
+        stack = [self._initial_state]
+        while stack:
+            state = stack.pop()
+            for symbol in symbols:
+                target = lookup((state, symbol))
+                if target is not None and target not in reachable:
+                    reachable.add(target)
+                    stack.append(target)
+        return frozenset(reachable)
+
+    def set_transition(self, state: str, symbol: str, target: str) -> "PersistentDFA":
+        """
+        Ajoute ou remplace une transition.
+
+        :param state: État source
+        :type state: str
+        :param symbol: Symbole de la transition
+        :type symbol: str
+        :param target: État de destination
+        :type target: str
+        :return: Nouvelle version de l'automate
+        :rtype: PersistentDFA
+        :raises InvalidStateError: Si un des états est inconnu
+        :raises InvalidTransitionError: Si le symbole n'est pas dans l'alphabet
+        """
+        self._check_transition(state, symbol, target)
+        return self._evolve([((state, symbol), target)], ())
+
+    def remove_transition(self, state: str, symbol: str) -> "PersistentDFA":
+        """
+        Supprime une transition, si elle existe.
+
+        :param state: État source
+        :type state: str
+        :param symbol: Symbole de la transition
+        :type symbol: str
+        :return: Nouvelle version de l'automate
+        :rtype: PersistentDFA
+        """
+        if (state, symbol) not in self._transition_table:
+            return self
+        return self._evolve([((state, symbol), _REMOVED)], ())
+
+    def add_state(self, state: str, final: bool = False) -> "PersistentDFA":
+        """
+        Ajoute un état (sans transition sortante).
+
+        :param state: Identifiant du nouvel état
+        :type state: str
+        :param final: Indique si l'état est final
+        :type final: bool
+        :return: Nouvelle version de l'automate
+        :rtype: PersistentDFA
+        :raises InvalidStateError: Si l'état existe déjà
+        """
+        if state in self._state_table:
+            raise InvalidStateError(f"State '{state}' already exists")
+        return self._evolve((), [(state, final)])
+
+    def set_final(self, state: str, final: bool = True) -> "PersistentDFA":
+        """
+        Rend un état final ou non final.
+
+        :param state: Identifiant de l'état
+        :type state: str
+        :param final: Nouveau caractère final de l'état
+        :type final: bool
+        :return: Nouvelle version de l'automate
+        :rtype: PersistentDFA
+        :raises InvalidStateError: Si l'état est inconnu
+        """
+        if state not in self._state_table:
+            raise InvalidStateError(f"Unknown state '{state}'")
+        return self._evolve((), [(state, final)])
+
+    def apply_change(self, change: TransitionChange) -> "PersistentDFA":
+        """
+        Applique un changement de transition.
+
+        :param change: Changement à appliquer
+        :type change: TransitionChange
+        :return: Nouvelle version de l'automate
+        :rtype: PersistentDFA
+        :raises InvalidTransitionError: Si old_target ne correspond pas à
+            l'automate
+        """
+        return self.apply_changes([change])
+
+    def apply_changes(self, changes: Iterable[TransitionChange]) -> "PersistentDFA":
+        """
+        Applique un lot de changements de transitions en une seule version.
+
+        Les changements sont appliqués dans l'ordre : chaque old_target est
+        comparé à l'état produit par les changements précédents du lot.
+        Chaque nœud de la table n'est recopié qu'une fois pour tout le lot,
+        et aucune version intermédiaire n'est créée. En cas d'erreur, aucune
+        version n'est produite.
+
+        :param changes: Changements à appliquer
+        :type changes: Iterable[TransitionChange]
+        :return: Nouvelle version de l'automate
+        :rtype: PersistentDFA
+        :raises InvalidTransitionError: Si old_target ne correspond pas à
+            l'automate, ou si le symbole n'est pas dans l'alphabet
+        :raises InvalidStateError: Si un des états est inconnu
+        """
+        pending: Dict[Tuple[str, str], Any] = {}
+        for change in changes:
+            key = (change.state, change.symbol)
+            current = pending.get(key, self._transition_table.get(key, _REMOVED))
+            expected = _REMOVED if change.is_addition() else change.old_target
+            if current != expected:
+                raise InvalidTransitionError(
+                    f"Transition {key} does not lead to '{change.old_target}'"
+                )
+            if change.is_removal():
+                pending[key] = _REMOVED
+            else:
+                self._check_transition(change.state, change.symbol, change.new_target)
+                pending[key] = change.new_target
+        if not pending:
+            return self
+        return self._evolve(pending.items(), ())
+
+    def to_dfa(self) -> DFA:
+        """
+        Matérialise la version courante en DFA classique.
+
+        :return: DFA équivalent
+        :rtype: DFA
+        """
+        return DFA._from_trusted(
+            self.states,
+            self._alphabet,
+            dict(self._transition_table.items()),
+            self._initial_state,
+            self.final_states,
+        )
+
+    def validate(self) -> bool:
+        """
+        Valide la cohérence de l'automate.
+
+        :return: True si l'automate est valide, False sinon
+        :rtype: bool
+        """
+        states = self._state_table
+        if self._initial_state not in states:
+            return False
+        for (source, symbol), target in self._transition_table.items():
+            if source not in states or target not in states:
+                return False
+            if symbol not in self._alphabet:
+                return False
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Sérialise l'automate en dictionnaire.
+
+        :return: Dictionnaire représentant l'automate
+        :rtype: Dict[str, Any]
+        """
+        return self.to_dfa().to_dict()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PersistentDFA":
+        """
+        Crée un DFA persistant depuis un dictionnaire.
+
+        :param data: Dictionnaire représentant l'automate
+        :type data: Dict[str, Any]
+        :return: Instance du DFA persistant
+        :rtype: PersistentDFA
+        """
+        return cls.from_dfa(DFA.from_dict(data))
+
+    def _check_transition(self, state: str, symbol: str, target: str) -> None:
+        """Vérifie qu'une transition porte sur des états et un symbole connus."""
+        if symbol not in self._alphabet:
+            raise InvalidTransitionError(f"Symbol '{symbol}' not in alphabet")
+        for name in (state, target):
+            if name not in self._state_table:
+                raise InvalidStateError(f"Unknown state '{name}'")
+
+    def _evolve(
+        self,
+        transition_edits: Iterable[Tuple[Tuple[str, str], Any]],
+        state_edits: Iterable[Tuple[str, bool]],
+    ) -> "PersistentDFA":
+        """Crée la version suivante à partir de lots d'éditions."""
+        return PersistentDFA._from_tables(
+            self._alphabet,
+            self._initial_state,
+            self._state_table.evolve(state_edits),
+            self._transition_table.evolve(transition_edits),
+        )
+
+    def __str__(self) -> str:
+        """
+        Représentation string de l'automate.
+
+        :return: Représentation string de l'automate
+        :rtype: str
+        """
+        return (
+            f"PersistentDFA(states={len(self._state_table)}, "
+            f"transitions={len(self._transition_table)})"
+        )
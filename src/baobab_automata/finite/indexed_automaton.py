@@ -0,0 +1,554 @@
+"""
+Représentation interne des automates finis à états entiers.
+
+Ce module définit la forme indexée utilisée par les opérations de
+composition (union, concaténation, étoile, produit) : les états sont des
+entiers denses et les noms d'affichage ne sont construits qu'à la demande,
+via une table paresseuse. Les compositions successives évitent ainsi la
+croissance des noms préfixés et le coût de leur hachage.
+"""
+
+from collections import deque
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from .abstract_finite_automaton import AbstractFiniteAutomaton
+
+#: Symbole des transitions epsilon dans les NFA
+EPSILON = "epsilon"
+
+# Transitions d'un état : symbole -> ensemble des cibles
+StateDelta = Dict[str, FrozenSet[int]]
+
+
+class StateNames:
+    """
+    Table paresseuse des noms d'affichage d'états entiers.
+
+    Les noms ne sont calculés qu'au premier appel à materialize(), puis
+    conservés.
+
+    :param size: Nombre d'états nommés
+    :type size: int
+    :param factory: Fonction construisant la liste complète des noms
+    :type factory: Callable[[], List[str]]
+    """
+
+    __slots__ = ("_size", "_factory", "_names")
+
+    def __init__(self, size: int, factory: Callable[[], List[str]]) -> None:
+        """
+        Initialise la table de noms.
+
+        :param size: Nombre d'états nommés
+        :type size: int
+        :param factory: Fonction construisant la liste complète des noms
+        :type factory: Callable[[], List[str]]
+        """
+        self._size = size
+        self._factory: Optional[Callable[[], List[str]]] = factory
+        self._names: Optional[List[str]] = None
+
+    @classmethod
+    def from_list(cls, names: List[str]) -> "StateNames":
+        """
+        Crée une table déjà matérialisée.
+
+        :param names: Noms des états, par indice
+        :type names: List[str]
+        :return: Table de noms
+        :rtype: StateNames
+        """
+        table = cls(len(names), list)
+        table._names = names
+        table._factory = None
+        return table
+
+    @property
+    def is_materialized(self) -> bool:
+        """
+        Indique si les noms ont déjà été construits.
+
+        :return: True si les noms sont disponibles sans calcul
+        :rtype: bool
+        """
+        return self._names is not None
+
+    def materialize(self) -> List[str]:
+        """
+        Construit (une seule fois) et retourne la liste des noms.
+
+        :return: Noms des états, par indice
+        :rtype: List[str]
+        """
+        if self._names is None:
+            self._names = self._factory()
+            self._factory = None
+        return self._names
+
+    def __len__(self) -> int:
+        """
+        Nombre d'états nommés.
+
+        :return: Taille de la table
+        :rtype: int
+        """
+        return self._size
+
+
+class IndexedAutomaton:
+    """
+    Automate fini dont les états sont les entiers 0..size-1.
+
+    :param delta: Transitions par état (symbole -> cibles)
+    :type delta: List[Dict[str, FrozenSet[int]]]
+    :param initial: Indice de l'état initial
+    :type initial: int
+    :param finals: Indices des états finaux
+    :type finals: FrozenSet[int]
+    :param names: Table des noms d'affichage
+    :type names: StateNames
+    """
+
+    __slots__ = ("delta", "initial", "finals", "names")
+
+    def __init__(
+        self,
+        delta: List[StateDelta],
+        initial: int,
+        finals: FrozenSet[int],
+        names: StateNames,
+    ) -> None:
+        """
+        Initialise un automate indexé.
+
+        :param delta: Transitions par état (symbole -> cibles)
+        :type delta: List[Dict[str, FrozenSet[int]]]
+        :param initial: Indice de l'état initial
+        :type initial: int
+        :param finals: Indices des états finaux
+        :type finals: FrozenSet[int]
+        :param names: Table des noms d'affichage
+        :type names: StateNames
+        """
+        self.delta = delta
+        self.initial = initial
+        self.finals = finals
+        self.names = names
+
+    @property
+    def size(self) -> int:
+        """
+        Nombre d'états.
+
+        :return: Nombre d'états
+        :rtype: int
+        """
+        return len(self.delta)
+
+    @classmethod
+    def from_automaton(cls, automaton: AbstractFiniteAutomaton) -> "IndexedAutomaton":
+        """
+        Construit (ou réutilise) la forme indexée d'un automate.
+
+        Les NFA conservent leur forme indexée ; les autres automates sont
+        lus via leur API publique. Les transitions epsilon des ε-NFA sont
+        ramenées au symbole « epsilon ».
+
+        :param automaton: Automate source
+        :type automaton: AbstractFiniteAutomaton
+        :return: Forme indexée
+        :rtype: IndexedAutomaton
+        """
+        indexed_form = getattr(automaton, "_indexed_form", None)
+        if indexed_form is not None:
+            return indexed_form()
+
+        names = sorted(automaton.states)
+        index = {name: i for i, name in enumerate(names)}
+        symbols = list(automaton.alphabet)
+        epsilon_symbol = getattr(automaton, "epsilon_symbol", None)
+        if epsilon_symbol is not None:
+            symbols.append(epsilon_symbol)
+        multi = hasattr(automaton, "get_transitions")
+
+        delta: List[StateDelta] = []
+        for name in names:
+            row: StateDelta = {}
+            for symbol in symbols:
+                if multi:
+                    targets = automaton.get_transitions(name, symbol)
+                else:
+                    target = automaton.get_transition(name, symbol)
+                    targets = {target} if target else set()
+                if targets:
+                    key = EPSILON if symbol == epsilon_symbol else symbol
+                    row[key] = row.get(key, frozenset()) | frozenset(
+                        index[target] for target in targets
+                    )
+            delta.append(row)
+
+        return cls(
+            delta,
+            index[automaton.initial_state],
+            frozenset(index[state] for state in automaton.final_states),
+            StateNames.from_list(names),
+        )
+
+    @classmethod
+    def from_transitions(
+        cls,
+        states: Set[str],
+        transitions: Dict[Tuple[str, str], Set[str]],
+        initial_state: str,
+        final_states: Set[str],
+    ) -> "IndexedAutomaton":
+        """
+        Construit la forme indexée à partir de transitions nommées.
+
+        :param states: Ensemble des états
+        :type states: Set[str]
+        :param transitions: Transitions (état, symbole) -> ensemble d'états
+        :type transitions: Dict[Tuple[str, str], Set[str]]
+        :param initial_state: État initial
+        :type initial_state: str
+        :param final_states: États finaux
+        :type final_states: Set[str]
+        :return: Forme indexée
+        :rtype: IndexedAutomaton
+        """
+        names = sorted(states)
+        index = {name: i for i, name in enumerate(names)}
+        delta: List[StateDelta] = [{} for _ in names]
+
+        def intern(name: str) -> int:
+            # Les états non déclarés reçoivent un indice à la volée
+            if name not in index:
+                index[name] = len(names)
+                names.append(name)
+                delta.append({})
+            return index[name]
+
+        for (source, symbol), targets in transitions.items():
+            if targets:
+                delta[intern(source)][symbol] = frozenset(intern(t) for t in targets)
+        initial = intern(initial_state)
+        return cls(
+            delta,
+            initial,
+            frozenset(intern(state) for state in final_states),
+            StateNames.from_list(names),
+        )
+
+    # ==================== SIMULATION ====================
+
+    def epsilon_closure(self, states: Set[int]) -> Set[int]:
+        """
+        Calcule la fermeture epsilon d'un ensemble d'états.
+
+        :param states: Ensemble d'indices d'états
+        :type states: Set[int]
+        :return: Fermeture epsilon
+        :rtype: Set[int]
+        """
+        delta = self.delta
+        closure = set(states)
+        to_process = list(states)
+        while to_process:
+            for target in delta[to_process.pop()].get(EPSILON, ()):
+                if target not in closure:
+                    closure.add(target)
+                    to_process.append(target)
+        return closure
+
+    def accepts(self, word: str, alphabet: Set[str]) -> bool:
+        """
+        Simule l'automate sur un mot.
+
+        :param word: Mot à tester
+        :type word: str
+        :param alphabet: Alphabet de l'automate
+        :type alphabet: Set[str]
+        :return: True si le mot est accepté, False sinon
+        :rtype: bool
+        """
+        delta = self.delta
+        current = self.epsilon_closure({self.initial})
+        for symbol in word:
+            if symbol not in alphabet:
+                return False
+            next_states: Set[int] = set()
+            for state in current:
+                targets = delta[state].get(symbol)
+                if targets:
+                    next_states.update(targets)
+            current = self.epsilon_closure(next_states)
+            if not current:
+                return False
+        return not self.finals.isdisjoint(current)
+
+    def transition_count(self) -> int:
+        """
+        Nombre de couples (état, symbole) ayant au moins une transition.
+
+        :return: Nombre d'entrées de transition
+        :rtype: int
+        """
+        return sum(len(row) for row in self.delta)
+
+    # ==================== MATÉRIALISATION ====================
+
+    def materialize(
+        self,
+    ) -> Tuple[
+        FrozenSet[str], Dict[Tuple[str, str], FrozenSet[str]], str, FrozenSet[str]
+    ]:
+        """
+        Construit la représentation nommée (immuable) de l'automate.
+
+        :return: (états, transitions, état initial, états finaux)
+        :rtype: Tuple[FrozenSet[str], Dict[Tuple[str, str], FrozenSet[str]], str,
+            FrozenSet[str]]
+        """
+        names = self.names.materialize()
+        transitions = {
+            (names[source], symbol): frozenset(names[target] for target in targets)
+            for source, row in enumerate(self.delta)
+            for symbol, targets in row.items()
+        }
+        return (
+            frozenset(names),
+            transitions,
+            names[self.initial],
+            frozenset(names[state] for state in self.finals),
+        )
+
+    # ==================== COMPOSITIONS ====================
+
+    @staticmethod
+    def disjoint_sum(
+        parts: Sequence[Tuple["IndexedAutomaton", str]],
+        leading: Sequence[str] = (),
+        trailing: Sequence[str] = (),
+    ) -> Tuple[List[StateDelta], List[int], Callable[[], List[str]]]:
+        """
+        Juxtapose des automates indexés en décalant leurs états.
+
+        Les états ajoutés (leading avant, trailing après) n'ont aucune
+        transition ; les noms des parties reçoivent leur préfixe à la
+        matérialisation seulement.
+
+        :param parts: Couples (automate, préfixe de nom)
+        :type parts: Sequence[Tuple[IndexedAutomaton, str]]
+        :param leading: Noms des états ajoutés en tête
+        :type leading: Sequence[str]
+        :param trailing: Noms des états ajoutés en fin
+        :type trailing: Sequence[str]
+        :return: (transitions, décalage de chaque partie, fabrique de noms)
+        :rtype: Tuple[List[Dict[str, FrozenSet[int]]], List[int], Callable]
+        """
+        delta: List[StateDelta] = [{} for _ in leading]
+        offsets: List[int] = []
+        for part, _ in parts:
+            offset = len(delta)
+            offsets.append(offset)
+            if offset == 0:
+                delta.extend(dict(row) for row in part.delta)
+            else:
+                delta.extend(
+                    {
+                        symbol: frozenset(target + offset for target in targets)
+                        for symbol, targets in row.items()
+                    }
+                    for row in part.delta
+                )
+        delta.extend({} for _ in trailing)
+
+        def names() -> List[str]:
+            result = list(leading)
+            for part, prefix in parts:
+                part_names = part.names.materialize()
+                result.extend(
+                    [prefix + name for name in part_names] if prefix else part_names
+                )
+            result.extend(trailing)
+            return result
+
+        return delta, offsets, names
+
+    @staticmethod
+    def add_epsilon(delta: List[StateDelta], source: int, targets: Set[int]) -> None:
+        """
+        Ajoute des transitions epsilon à un tableau de transitions.
+
+        :param delta: Transitions à compléter
+        :type delta: List[Dict[str, FrozenSet[int]]]
+        :param source: Indice de l'état source
+        :type source: int
+        :param targets: Indices des cibles
+        :type targets: Set[int]
+        """
+        row = delta[source]
+        row[EPSILON] = row.get(EPSILON, frozenset()) | frozenset(targets)
+
+    @staticmethod
+    def union(
+        first: "IndexedAutomaton",
+        second: "IndexedAutomaton",
+        initial_name: str,
+        prefixes: Tuple[str, str],
+    ) -> "IndexedAutomaton":
+        """
+        Union par un nouvel état initial relié par epsilon.
+
+        :param first: Premier automate
+        :type first: IndexedAutomaton
+        :param second: Deuxième automate
+        :type second: IndexedAutomaton
+        :param initial_name: Nom du nouvel état initial
+        :type initial_name: str
+        :param prefixes: Préfixes de noms des deux opérandes
+        :type prefixes: Tuple[str, str]
+        :return: Automate de l'union
+        :rtype: IndexedAutomaton
+        """
+        delta, (off1, off2), names = IndexedAutomaton.disjoint_sum(
+            [(first, prefixes[0]), (second, prefixes[1])], leading=[initial_name]
+        )
+        IndexedAutomaton.add_epsilon(
+            delta, 0, {first.initial + off1, second.initial + off2}
+        )
+        finals = frozenset(s + off1 for s in first.finals) | frozenset(
+            s + off2 for s in second.finals
+        )
+        return IndexedAutomaton(delta, 0, finals, StateNames(len(delta), names))
+
+    @staticmethod
+    def concatenation(
+        first: "IndexedAutomaton",
+        second: "IndexedAutomaton",
+        prefixes: Tuple[str, str],
+    ) -> "IndexedAutomaton":
+        """
+        Concaténation par transitions epsilon des finaux vers l'initial.
+
+        :param first: Premier automate
+        :type first: IndexedAutomaton
+        :param second: Deuxième automate
+        :type second: IndexedAutomaton
+        :param prefixes: Préfixes de noms des deux opérandes
+        :type prefixes: Tuple[str, str]
+        :return: Automate de la concaténation
+        :rtype: IndexedAutomaton
+        """
+        delta, (off1, off2), names = IndexedAutomaton.disjoint_sum(
+            [(first, prefixes[0]), (second, prefixes[1])]
+        )
+        for final in first.finals:
+            IndexedAutomaton.add_epsilon(delta, final + off1, {second.initial + off2})
+        return IndexedAutomaton(
+            delta,
+            first.initial + off1,
+            frozenset(s + off2 for s in second.finals),
+            StateNames(len(delta), names),
+        )
+
+    @staticmethod
+    def kleene_star(
+        automaton: "IndexedAutomaton",
+        initial_name: str,
+        prefix: str = "",
+        initial_first: bool = True,
+    ) -> "IndexedAutomaton":
+        """
+        Étoile de Kleene par un nouvel état initial final.
+
+        :param automaton: Automate à itérer
+        :type automaton: IndexedAutomaton
+        :param initial_name: Nom du nouvel état initial
+        :type initial_name: str
+        :param prefix: Préfixe de nom des états de l'opérande
+        :type prefix: str
+        :param initial_first: Place le nouvel état en tête (sinon en fin)
+        :type initial_first: bool
+        :return: Automate de l'étoile
+        :rtype: IndexedAutomaton
+        """
+        leading, trailing = (
+            ([initial_name], []) if initial_first else ([], [initial_name])
+        )
+        delta, (offset,), names = IndexedAutomaton.disjoint_sum(
+            [(automaton, prefix)], leading=leading, trailing=trailing
+        )
+        new_initial = 0 if initial_first else len(delta) - 1
+        old_initial = automaton.initial + offset
+        IndexedAutomaton.add_epsilon(delta, new_initial, {old_initial})
+        for final in automaton.finals:
+            IndexedAutomaton.add_epsilon(delta, final + offset, {old_initial})
+        finals = frozenset(s + offset for s in automaton.finals) | {new_initial}
+        return IndexedAutomaton(
+            delta, new_initial, finals, StateNames(len(delta), names)
+        )
+
+    @staticmethod
+    def product(
+        first: "IndexedAutomaton",
+        second: "IndexedAutomaton",
+        alphabet: Set[str],
+    ) -> "IndexedAutomaton":
+        """
+        Produit synchronisé restreint aux paires accessibles.
+
+        Les paires sont numérotées dans l'ordre de découverte ; leur nom
+        « (s1,s2) » n'est construit qu'à la matérialisation.
+
+        :param first: Premier automate
+        :type first: IndexedAutomaton
+        :param second: Deuxième automate
+        :type second: IndexedAutomaton
+        :param alphabet: Symboles synchronisés
+        :type alphabet: Set[str]
+        :return: Automate produit (finaux = paires de finaux)
+        :rtype: IndexedAutomaton
+        """
+        start = (first.initial, second.initial)
+        index: Dict[Tuple[int, int], int] = {start: 0}
+        pairs: List[Tuple[int, int]] = [start]
+        delta: List[StateDelta] = []
+        queue = deque([start])
+
+        while queue:
+            left, right = queue.popleft()
+            right_row = second.delta[right]
+            row: StateDelta = {}
+            for symbol, left_targets in first.delta[left].items():
+                if symbol not in alphabet:
+                    continue
+                right_targets = right_row.get(symbol)
+                if not right_targets:
+                    continue
+                targets = set()
+                for t1 in left_targets:
+                    for t2 in right_targets:
+                        pair = (t1, t2)
+                        target = index.get(pair)
+                        if target is None:
+                            target = len(pairs)
+                            index[pair] = target
+                            pairs.append(pair)
+                            queue.append(pair)
+                        targets.add(target)
+                row[symbol] = frozenset(targets)
+            delta.append(row)
+
+        finals = frozenset(
+            i
+            for i, (left, right) in enumerate(pairs)
+            if left in first.finals and right in second.finals
+        )
+
+        def names() -> List[str]:
+            names1 = first.names.materialize()
+            names2 = second.names.materialize()
+            return [f"({names1[left]},{names2[right]})" for left, right in pairs]
+
+        return IndexedAutomaton(delta, 0, finals, StateNames(len(pairs), names))
@@ -0,0 +1,23 @@
+"""Module pour les automates finis à transitions par intervalles Unicode."""
+
+from .char_class import MAX_CODEPOINT, CharClass, split_intervals
+from .interval_dfa import IntervalDFA
+from .interval_nfa import IntervalNFA
+from .interval_exceptions import (
+    IntervalAutomatonError,
+    InvalidCharClassError,
+    InvalidIntervalAutomatonError,
+    NonDeterministicIntervalError,
+)
+
+__all__ = [
+    "MAX_CODEPOINT",
+    "CharClass",
+    "split_intervals",
+    "IntervalDFA",
+    "IntervalNFA",
+    "IntervalAutomatonError",
+    "InvalidCharClassError",
+    "InvalidIntervalAutomatonError",
+    "NonDeterministicIntervalError",
+]
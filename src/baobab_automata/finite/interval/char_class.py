@@ -0,0 +1,572 @@
+"""
+Classes de caractères représentées par des intervalles de points de code.
+
+Ce module définit la classe CharClass, un ensemble immuable de caractères
+Unicode stocké sous forme d'intervalles triés et disjoints, ainsi que la
+primitive de découpage d'intervalles utilisée par les algorithmes de
+déterminisation, de minimisation et de produit.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import (
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .interval_exceptions import InvalidCharClassError
+
+#: Plus grand point de code Unicode
+MAX_CODEPOINT = 0x10FFFF
+
+T = TypeVar("T", bound=Hashable)
+
+Interval = Tuple[int, int]
+
+
+def _normalize(intervals: Iterable[Interval]) -> Tuple[Interval, ...]:
+    """
+    Trie et fusionne des intervalles (chevauchants ou adjacents).
+
+    :param intervals: Intervalles fermés (début, fin)
+    :type intervals: Iterable[Tuple[int, int]]
+    :return: Intervalles triés, disjoints et non adjacents
+    :rtype: Tuple[Tuple[int, int], ...]
+    :raises InvalidCharClassError: Si un intervalle est invalide
+    """
+    items = []
+    for low, high in intervals:
+        if not isinstance(low, int) or not isinstance(high, int):
+            raise InvalidCharClassError(f"Bornes non entières: ({low!r}, {high!r})")
+        if low < 0 or high > MAX_CODEPOINT or low > high:
+            raise InvalidCharClassError(f"Intervalle invalide: ({low}, {high})")
+        items.append((low, high))
+
+    items.sort()
+    merged: List[Interval] = []
+    for low, high in items:
+        if merged and low <= merged[-1][1] + 1:
+            if high > merged[-1][1]:
+                merged[-1] = (merged[-1][0], high)
+        else:
+            merged.append((low, high))
+    return tuple(merged)
+
+
+def split_intervals(
+    edges: Iterable[Tuple[int, int, T]],
+) -> List[Tuple[int, int, FrozenSet[T]]]:
+    """
+    Découpe des intervalles étiquetés en morceaux disjoints.
+
+    Chaque morceau retourné porte l'ensemble des étiquettes de tous les
+    intervalles d'entrée qui le recouvrent. Les morceaux adjacents portant
+    le même ensemble sont fusionnés. La complexité est O(E log E) pour E
+    intervalles, indépendamment de la taille des intervalles.
+
+    :param edges: Intervalles étiquetés (début, fin, étiquette)
+    :type edges: Iterable[Tuple[int, int, T]]
+    :return: Morceaux disjoints triés (début, fin, étiquettes)
+    :rtype: List[Tuple[int, int, FrozenSet[T]]]
+    """
+    events: Dict[int, List[Tuple[int, T]]] = {}
+    for low, high, label in edges:
+        events.setdefault(low, []).append((1, label))
+        events.setdefault(high + 1, []).append((-1, label))
+
+    active: Dict[T, int] = {}
+    pieces: List[Tuple[int, int, FrozenSet[T]]] = []
+    points = sorted(events)
+    for index, point in enumerate(points):
+        for delta, label in events[point]:
+            count = active.get(label, 0) + delta
+            if count:
+                active[label] = count
+            else:
+                del active[label]
+
+        if not active or index + 1 == len(points):
+            continue
+
+        labels = frozenset(active)
+        end = points[index + 1] - 1
+        if pieces and pieces[-1][1] == point - 1 and pieces[-1][2] == labels:
+            pieces[-1] = (pieces[-1][0], end, labels)
+        else:
+            pieces.append((point, end, labels))
+    return pieces
+
+
+class CharClass:
+    """
+    Ensemble immuable de caractères Unicode stocké par intervalles.
+
+    Les intervalles sont fermés, triés et disjoints ; l'appartenance d'un
+    caractère est testée par recherche dichotomique, ce qui permet de
+    représenter des classes comme ``\\w`` sur tout Unicode sans énumérer
+    les caractères.
+
+    :param intervals: Intervalles fermés de points de code
+    :type intervals: Iterable[Tuple[int, int]]
+    """
+
+    __slots__ = ("_intervals", "_starts", "_hash")
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        """
+        Initialise une classe de caractères.
+
+        :param intervals: Intervalles fermés de points de code
+        :type intervals: Iterable[Tuple[int, int]]
+        :raises InvalidCharClassError: Si un intervalle est invalide
+        """
+        self._intervals = _normalize(intervals)
+        self._starts = [low for low, _ in self._intervals]
+        self._hash: Optional[int] = None
+
+    # ==================== CONSTRUCTEURS ====================
+
+    @classmethod
+    def empty(cls) -> "CharClass":
+        """
+        Crée la classe vide.
+
+        :return: Classe ne contenant aucun caractère
+        :rtype: CharClass
+        """
+        return cls()
+
+    @classmethod
+    def any_char(cls) -> "CharClass":
+        """
+        Crée la classe de tous les caractères Unicode.
+
+        :return: Classe contenant tous les points de code
+        :rtype: CharClass
+        """
+        return cls([(0, MAX_CODEPOINT)])
+
+    @classmethod
+    def from_char(cls, char: str) -> "CharClass":
+        """
+        Crée une classe contenant un seul caractère.
+
+        :param char: Caractère
+        :type char: str
+        :return: Classe singleton
+        :rtype: CharClass
+        :raises InvalidCharClassError: Si char n'est pas un caractère unique
+        """
+        if not isinstance(char, str) or len(char) != 1:
+            raise InvalidCharClassError(f"Caractère unique attendu: {char!r}")
+        return cls([(ord(char), ord(char))])
+
+    @classmethod
+    def from_chars(cls, chars: Iterable[str]) -> "CharClass":
+        """
+        Crée une classe à partir d'un ensemble de caractères.
+
+        :param chars: Caractères de la classe
+        :type chars: Iterable[str]
+        :return: Classe contenant ces caractères
+        :rtype: CharClass
+        :raises InvalidCharClassError: Si un élément n'est pas un caractère
+        """
+        codepoints = []
+        for char in chars:
+            if not isinstance(char, str) or len(char) != 1:
+                raise InvalidCharClassError(f"Caractère unique attendu: {char!r}")
+            codepoints.append(ord(char))
+        return cls((cp, cp) for cp in codepoints)
+
+    @classmethod
+    def from_range(cls, first: str, last: str) -> "CharClass":
+        """
+        Crée une classe pour une plage de caractères.
+
+        :param first: Premier caractère (inclus)
+        :type first: str
+        :param last: Dernier caractère (inclus)
+        :type last: str
+        :return: Classe contenant la plage
+        :rtype: CharClass
+        :raises InvalidCharClassError: Si la plage est invalide
+        """
+        if len(first) != 1 or len(last) != 1:
+            raise InvalidCharClassError(f"Plage invalide: {first!r}-{last!r}")
+        return cls([(ord(first), ord(last))])
+
+    @classmethod
+    def digit(cls) -> "CharClass":
+        """
+        Classe Unicode des chiffres décimaux (``\\d``).
+
+        :return: Classe des chiffres
+        :rtype: CharClass
+        """
+        return cls(_unicode_property_intervals("digit"))
+
+    @classmethod
+    def word(cls) -> "CharClass":
+        """
+        Classe Unicode des caractères de mot (``\\w``).
+
+        :return: Classe des caractères alphanumériques et '_'
+        :rtype: CharClass
+        """
+        return cls(_unicode_property_intervals("word"))
+
+    @classmethod
+    def space(cls) -> "CharClass":
+        """
+        Classe Unicode des espaces (``\\s``).
+
+        :return: Classe des caractères d'espacement
+        :rtype: CharClass
+        """
+        return cls(_unicode_property_intervals("space"))
+
+    @classmethod
+    def parse(cls, spec: str) -> "CharClass":
+        """
+        Analyse une spécification de classe.
+
+        Formats acceptés : un caractère, une classe échappée (``\\d``,
+        ``\\w``, ``\\s`` et leurs négations ``\\D``, ``\\W``, ``\\S``) ou
+        une expression entre crochets (``[a-z_]``, ``[^0-9]``).
+
+        :param spec: Spécification de la classe
+        :type spec: str
+        :return: Classe correspondante
+        :rtype: CharClass
+        :raises InvalidCharClassError: Si la spécification est invalide
+        """
+        if len(spec) == 1:
+            return cls.from_char(spec)
+        if len(spec) == 2 and spec[0] == "\\":
+            return cls._escape_class(spec[1])
+        if len(spec) >= 2 and spec[0] == "[" and spec[-1] == "]":
+            return cls._parse_bracket(spec[1:-1])
+        raise InvalidCharClassError(f"Spécification de classe invalide: {spec!r}")
+
+    @classmethod
+    def _escape_class(cls, letter: str) -> "CharClass":
+        """Retourne la classe associée à une séquence d'échappement."""
+        named = {"d": cls.digit, "w": cls.word, "s": cls.space}
+        if letter in named:
+            return named[letter]()
+        if letter.lower() in named:
+            return named[letter.lower()]().complement()
+        escapes = {"n": "\n", "t": "\t", "r": "\r", "f": "\f", "v": "\v"}
+        return cls.from_char(escapes.get(letter, letter))
+
+    @classmethod
+    def _parse_bracket(cls, body: str) -> "CharClass":
+        """Analyse le contenu d'une expression entre crochets."""
+        negated = body.startswith("^")
+        if negated:
+            body = body[1:]
+
+        parts: List["CharClass"] = []
+        intervals: List[Interval] = []
+        index = 0
+        while index < len(body):
+            char = body[index]
+            if char == "\\":
+                if index + 1 >= len(body):
+                    raise InvalidCharClassError("Échappement incomplet dans la classe")
+                escaped = cls._escape_class(body[index + 1])
+                index += 2
+                if len(escaped) != 1:
+                    parts.append(escaped)
+                    continue
+                low = escaped.intervals[0][0]
+            else:
+                low = ord(char)
+                index += 1
+
+            # Plage a-z (un '-' final est littéral)
+            if index + 1 < len(body) and body[index] == "-":
+                last = body[index + 1]
+                index += 2
+                if last == "\\":
+                    if index >= len(body):
+                        raise InvalidCharClassError(
+                            "Échappement incomplet dans la classe"
+                        )
+                    last_class = cls._escape_class(body[index])
+                    index += 1
+                    if len(last_class) != 1:
+                        raise InvalidCharClassError("Borne de plage invalide")
+                    high = last_class.intervals[0][0]
+                else:
+                    high = ord(last)
+                if high < low:
+                    raise InvalidCharClassError(
+                        f"Plage inversée: {chr(low)!r}-{chr(high)!r}"
+                    )
+                intervals.append((low, high))
+            else:
+                intervals.append((low, low))
+
+        result = cls(intervals)
+        for part in parts:
+            result = result.union(part)
+        return result.complement() if negated else result
+
+    # ==================== ACCÈS ====================
+
+    @property
+    def intervals(self) -> Tuple[Interval, ...]:
+        """
+        Intervalles triés et disjoints de la classe.
+
+        :return: Intervalles fermés (début, fin)
+        :rtype: Tuple[Tuple[int, int], ...]
+        """
+        return self._intervals
+
+    def contains_codepoint(self, codepoint: int) -> bool:
+        """
+        Vérifie l'appartenance d'un point de code (recherche dichotomique).
+
+        :param codepoint: Point de code
+        :type codepoint: int
+        :return: True si le point de code appartient à la classe
+        :rtype: bool
+        """
+        index = bisect_right(self._starts, codepoint) - 1
+        return index >= 0 and codepoint <= self._intervals[index][1]
+
+    def is_empty(self) -> bool:
+        """
+        Vérifie si la classe est vide.
+
+        :return: True si la classe ne contient aucun caractère
+        :rtype: bool
+        """
+        return not self._intervals
+
+    # ==================== OPÉRATIONS ENSEMBLISTES ====================
+
+    def union(self, other: "CharClass") -> "CharClass":
+        """
+        Union de deux classes.
+
+        :param other: Autre classe
+        :type other: CharClass
+        :return: Classe union
+        :rtype: CharClass
+        """
+        return CharClass(self._intervals + other.intervals)
+
+    def intersection(self, other: "CharClass") -> "CharClass":
+        """
+        Intersection de deux classes (fusion linéaire des intervalles).
+
+        :param other: Autre classe
+        :type other: CharClass
+        :return: Classe intersection
+        :rtype: CharClass
+        """
+        result: List[Interval] = []
+        left, right = self._intervals, other.intervals
+        i = j = 0
+        while i < len(left) and j < len(right):
+            low = max(left[i][0], right[j][0])
+            high = min(left[i][1], right[j][1])
+            if low <= high:
+                result.append((low, high))
+            if left[i][1] < right[j][1]:
+                i += 1
+            else:
+                j += 1
+        return CharClass(result)
+
+    def complement(self) -> "CharClass":
+        """
+        Complément de la classe dans l'ensemble des points de code Unicode.
+
+        :return: Classe complémentaire
+        :rtype: CharClass
+        """
+        result: List[Interval] = []
+        previous = 0
+        for low, high in self._intervals:
+            if low > previous:
+                result.append((previous, low - 1))
+            previous = high + 1
+        if previous <= MAX_CODEPOINT:
+            result.append((previous, MAX_CODEPOINT))
+        return CharClass(result)
+
+    def difference(self, other: "CharClass") -> "CharClass":
+        """
+        Différence de deux classes.
+
+        :param other: Classe à retirer
+        :type other: CharClass
+        :return: Classe différence
+        :rtype: CharClass
+        """
+        return self.intersection(other.complement())
+
+    # ==================== PROTOCOLES ====================
+
+    def __contains__(self, char: object) -> bool:
+        """
+        Vérifie l'appartenance d'un caractère.
+
+        :param char: Caractère à tester
+        :type char: object
+        :return: True si le caractère appartient à la classe
+        :rtype: bool
+        """
+        if not isinstance(char, str) or len(char) != 1:
+            return False
+        return self.contains_codepoint(ord(char))
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Itère paresseusement sur les caractères de la classe.
+
+        :return: Itérateur sur les caractères
+        :rtype: Iterator[str]
+        """
+        for low, high in self._intervals:
+            for codepoint in range(low, high + 1):
+                yield chr(codepoint)
+
+    def __len__(self) -> int:
+        """
+        Nombre de caractères de la classe.
+
+        :return: Nombre de points de code
+        :rtype: int
+        """
+        return sum(high - low + 1 for low, high in self._intervals)
+
+    def __bool__(self) -> bool:
+        """
+        Vérifie si la classe est non vide.
+
+        :return: True si la classe contient au moins un caractère
+        :rtype: bool
+        """
+        return bool(self._intervals)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare deux classes.
+
+        :param other: Autre objet
+        :type other: object
+        :return: True si les classes contiennent les mêmes caractères
+        :rtype: bool
+        """
+        if not isinstance(other, CharClass):
+            return NotImplemented
+        return self._intervals == other.intervals
+
+    def __hash__(self) -> int:
+        """
+        Hash de la classe (mis en cache).
+
+        :return: Hash des intervalles
+        :rtype: int
+        """
+        if self._hash is None:
+            self._hash = hash(self._intervals)
+        return self._hash
+
+    def __or__(self, other: "CharClass") -> "CharClass":
+        """Opérateur d'union."""
+        return self.union(other)
+
+    def __and__(self, other: "CharClass") -> "CharClass":
+        """Opérateur d'intersection."""
+        return self.intersection(other)
+
+    def __sub__(self, other: "CharClass") -> "CharClass":
+        """Opérateur de différence."""
+        return self.difference(other)
+
+    def __invert__(self) -> "CharClass":
+        """Opérateur de complément."""
+        return self.complement()
+
+    def __str__(self) -> str:
+        """
+        Représentation compacte de la classe.
+
+        :return: Notation entre crochets (ex. ``[a-z0-9]``)
+        :rtype: str
+        """
+        parts = []
+        for low, high in self._intervals:
+            if low == high:
+                parts.append(_display(low))
+            else:
+                parts.append(f"{_display(low)}-{_display(high)}")
+        return f"[{''.join(parts)}]"
+
+    def __repr__(self) -> str:
+        """
+        Représentation détaillée de la classe.
+
+        :return: Représentation détaillée
+        :rtype: str
+        """
+        return f"CharClass({list(self._intervals)!r})"
+
+
+def _display(codepoint: int) -> str:
+    """Affiche un point de code dans une notation entre crochets."""
+    char = chr(codepoint)
+    if char in "\\]-^":
+        return "\\" + char
+    if char.isprintable() and not char.isspace():
+        return char
+    return f"\\u{{{codepoint:x}}}"
+
+
+@lru_cache(maxsize=None)
+def _unicode_property_intervals(name: str) -> Tuple[Interval, ...]:
+    """
+    Calcule une fois les intervalles d'une propriété Unicode.
+
+    Les prédicats suivent la sémantique du module ``re`` de Python :
+    ``\\d`` correspond à ``str.isdecimal``, ``\\w`` à ``str.isalnum`` ou
+    ``'_'`` et ``\\s`` à ``str.isspace``.
+
+    :param name: Nom de la propriété ('digit', 'word' ou 'space')
+    :type name: str
+    :return: Intervalles de la propriété
+    :rtype: Tuple[Tuple[int, int], ...]
+    """
+    predicates = {
+        "digit": str.isdecimal,
+        "word": lambda char: char.isalnum() or char == "_",
+        "space": str.isspace,
+    }
+    predicate = predicates[name]
+
+    intervals: List[Interval] = []
+    start = -1
+    for codepoint in range(MAX_CODEPOINT + 1):
+        if predicate(chr(codepoint)):
+            if start < 0:
+                start = codepoint
+        elif start >= 0:
+            intervals.append((start, codepoint - 1))
+            start = -1
+    if start >= 0:
+        intervals.append((start, MAX_CODEPOINT))
+    return tuple(intervals)
@@ -0,0 +1,734 @@
+"""
+Implémentation d'un automate fini déterministe à transitions par intervalles.
+
+Ce module contient la classe IntervalDFA dont les transitions sont étiquetées
+par des intervalles triés et disjoints de points de code Unicode. Les
+algorithmes (minimisation, produit, complément) découpent les intervalles au
+lieu d'itérer sur les symboles, ce qui permet de traiter tout Unicode sans
+matérialiser une transition par caractère.
+"""
+
+from bisect import bisect_right
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ..abstract_finite_automaton import AbstractFiniteAutomaton
+from .char_class import MAX_CODEPOINT, CharClass, split_intervals
+from .interval_exceptions import (
+    InvalidIntervalAutomatonError,
+    NonDeterministicIntervalError,
+)
+
+if TYPE_CHECKING:
+    from ..dfa import DFA
+    from .interval_nfa import IntervalNFA
+
+Label = Union[CharClass, str]
+# Table d'un état : débuts, fins et cibles des intervalles triés
+StateTable = Tuple[List[int], List[int], List[str]]
+
+
+def _label_to_class(label: Label) -> CharClass:
+    """Convertit une étiquette de transition en classe de caractères."""
+    if isinstance(label, CharClass):
+        return label
+    if isinstance(label, str):
+        return CharClass.parse(label)
+    raise InvalidIntervalAutomatonError(f"Étiquette de transition invalide: {label!r}")
+
+
+class IntervalDFA(AbstractFiniteAutomaton):
+    """
+    Automate fini déterministe à transitions par intervalles.
+
+    Pour chaque état, les transitions sortantes sont stockées sous forme
+    d'intervalles de points de code triés et disjoints ; la transition sur
+    un caractère est trouvée par recherche dichotomique.
+
+    :param states: Ensemble des états de l'automate
+    :type states: Set[str]
+    :param transitions: Fonction de transition (état, classe) vers un état
+    :type transitions: Dict[Tuple[str, Union[CharClass, str]], str]
+    :param initial_state: État initial
+    :type initial_state: str
+    :param final_states: Ensemble des états finaux
+    :type final_states: Set[str]
+    """
+
+    def __init__(
+        self,
+        states: Set[str],
+        transitions: Dict[Tuple[str, Label], str],
+        initial_state: str,
+        final_states: Set[str],
+    ) -> None:
+        """
+        Initialise un DFA à intervalles.
+
+        :param states: Ensemble des états de l'automate
+        :type states: Set[str]
+        :param transitions: Fonction de transition (état, classe) vers un état
+        :type transitions: Dict[Tuple[str, Union[CharClass, str]], str]
+        :param initial_state: État initial
+        :type initial_state: str
+        :param final_states: Ensemble des états finaux
+        :type final_states: Set[str]
+        :raises InvalidIntervalAutomatonError: Si l'automate est invalide
+        :raises NonDeterministicIntervalError: Si des intervalles se chevauchent
+        """
+        edges: Dict[str, List[Tuple[int, int, str]]] = {}
+        for (source, label), target in transitions.items():
+            for low, high in _label_to_class(label).intervals:
+                edges.setdefault(source, []).append((low, high, target))
+
+        tables: Dict[str, StateTable] = {}
+        for source, source_edges in edges.items():
+            starts: List[int] = []
+            ends: List[int] = []
+            targets: List[str] = []
+            for low, high, labels in split_intervals(source_edges):
+                if len(labels) > 1:
+                    raise NonDeterministicIntervalError(
+                        f"Transitions ambiguës depuis '{source}' sur "
+                        f"{CharClass([(low, high)])}"
+                    )
+                target = next(iter(labels))
+                if targets and targets[-1] == target and ends[-1] == low - 1:
+                    ends[-1] = high
+                else:
+                    starts.append(low)
+                    ends.append(high)
+                    targets.append(target)
+            tables[source] = (starts, ends, targets)
+
+        self._states = set(states)
+        self._tables = tables
+        self._initial_state = initial_state
+        self._final_states = set(final_states)
+
+        if not self.validate():
+            raise InvalidIntervalAutomatonError("Invalid interval DFA configuration")
+
+    @classmethod
+    def _from_tables(
+        cls,
+        states: Set[str],
+        tables: Dict[str, StateTable],
+        initial_state: str,
+        final_states: Set[str],
+    ) -> "IntervalDFA":
+        """
+        Construit un DFA à partir de tables déjà normalisées.
+
+        Utilisé par les algorithmes internes qui produisent des intervalles
+        triés et disjoints : la normalisation et la validation sont omises.
+        """
+        dfa = cls.__new__(cls)
+        dfa._states = states
+        dfa._tables = tables
+        dfa._initial_state = initial_state
+        dfa._final_states = final_states
+        return dfa
+
+    # ==================== PROPRIÉTÉS ====================
+
+    @property
+    def states(self) -> Set[str]:
+        """
+        Ensemble des états de l'automate.
+
+        :return: Ensemble des identifiants des états
+        :rtype: Set[str]
+        """
+        return self._states.copy()
+
+    @property
+    def alphabet(self) -> CharClass:
+        """
+        Alphabet effectif de l'automate.
+
+        :return: Classe des caractères étiquetant au moins une transition
+        :rtype: CharClass
+        """
+        intervals: List[Tuple[int, int]] = []
+        for starts, ends, _ in self._tables.values():
+            intervals.extend(zip(starts, ends))
+        return CharClass(intervals)
+
+    @property
+    def initial_state(self) -> str:
+        """
+        État initial de l'automate.
+
+        :return: Identifiant de l'état initial
+        :rtype: str
+        """
+        return self._initial_state
+
+    @property
+    def final_states(self) -> Set[str]:
+        """
+        Ensemble des états finaux.
+
+        :return: Ensemble des identifiants des états finaux
+        :rtype: Set[str]
+        """
+        return self._final_states.copy()
+
+    # ==================== RECONNAISSANCE ====================
+
+    def _step(self, state: str, codepoint: int) -> Optional[str]:
+        """Transition sur un point de code par recherche dichotomique."""
+        table = self._tables.get(state)
+        if table is None:
+            return None
+        starts, ends, targets = table
+        index = bisect_right(starts, codepoint) - 1
+        if index >= 0 and codepoint <= ends[index]:
+            return targets[index]
+        return None
+
+    def accepts(self, word: str) -> bool:
+        """
+        Vérifie si l'automate accepte un mot donné.
+
+        :param word: Mot à tester
+        :type word: str
+        :return: True si le mot est accepté, False sinon
+        :rtype: bool
+        """
+        tables = self._tables
+        state = self._initial_state
+        for char in word:
+            table = tables.get(state)
+            if table is None:
+                return False
+            starts, ends, targets = table
+            codepoint = ord(char)
+            index = bisect_right(starts, codepoint) - 1
+            if index < 0 or codepoint > ends[index]:
+                return False
+            state = targets[index]
+        return state in self._final_states
+
+    def get_transition(self, state: str, symbol: str) -> Optional[str]:
+        """
+        Récupère l'état de destination pour un caractère donné.
+
+        :param state: État source
+        :type state: str
+        :param symbol: Caractère de la transition
+        :type symbol: str
+        :return: État de destination ou None si la transition n'existe pas
+        :rtype: Optional[str]
+        """
+        if not isinstance(symbol, str) or len(symbol) != 1:
+            return None
+        return self._step(state, ord(symbol))
+
+    def get_intervals(self, state: str) -> List[Tuple[CharClass, str]]:
+        """
+        Récupère les transitions sortantes d'un état.
+
+        :param state: État source
+        :type state: str
+        :return: Liste triée de couples (intervalle, état cible)
+        :rtype: List[Tuple[CharClass, str]]
+        """
+        starts, ends, targets = self._tables.get(state, ([], [], []))
+        return [
+            (CharClass([(low, high)]), target)
+            for low, high, target in zip(starts, ends, targets)
+        ]
+
+    def is_final_state(self, state: str) -> bool:
+        """
+        Vérifie si un état est final.
+
+        :param state: Identifiant de l'état
+        :type state: str
+        :return: True si l'état est final, False sinon
+        :rtype: bool
+        """
+        return state in self._final_states
+
+    def get_reachable_states(self) -> Set[str]:
+        """
+        Récupère tous les états accessibles depuis l'état initial.
+
+        :return: Ensemble des états accessibles
+        :rtype: Set[str]
+        """
+        reachable = {self._initial_state}
+        to_visit = [self._initial_state]
+        while to_visit:
+            current = to_visit.pop()
+            for target in self._tables.get(current, ([], [], []))[2]:
+                if target not in reachable:
+                    reachable.add(target)
+                    to_visit.append(target)
+        return reachable
+
+    def validate(self) -> bool:
+        """
+        Valide la cohérence de l'automate.
+
+        :return: True si l'automate est valide, False sinon
+        :rtype: bool
+        """
+        if self._initial_state not in self._states:
+            return False
+        if not self._final_states.issubset(self._states):
+            return False
+        for source, (_, _, targets) in self._tables.items():
+            if source not in self._states:
+                return False
+            if not set(targets).issubset(self._states):
+                return False
+        return True
+
+    # ==================== ALGORITHMES ====================
+
+    def _atoms(self) -> List[int]:
+        """
+        Calcule les bornes des atomes de l'alphabet.
+
+        Les atomes sont les intervalles maximaux sur lesquels aucune
+        transition ne change de cible ; ils jouent le rôle des symboles
+        dans la minimisation.
+
+        :return: Débuts triés des atomes (le premier vaut 0)
+        :rtype: List[int]
+        """
+        bounds = {0}
+        for starts, ends, _ in self._tables.values():
+            bounds.update(starts)
+            bounds.update(end + 1 for end in ends if end < MAX_CODEPOINT)
+        return sorted(bounds)
+
+    def minimize(self) -> "IntervalDFA":
+        """
+        Minimise le DFA par l'algorithme de Hopcroft sur les atomes.
+
+        Les états inaccessibles sont éliminés et l'automate est implicitement
+        complété par un état puits qui n'apparaît pas dans le résultat.
+
+        :return: DFA à intervalles minimal équivalent
+        :rtype: IntervalDFA
+        """
+        reachable = sorted(self.get_reachable_states())
+        index_of = {state: i for i, state in enumerate(reachable)}
+        sink = len(reachable)
+        size = sink + 1
+        atoms = self._atoms()
+
+        # delta[i][a] : cible de l'état i sur l'atome a (le puits par défaut)
+        delta = [[sink] * len(atoms) for _ in range(size)]
+        for state, i in index_of.items():
+            starts, ends, targets = self._tables.get(state, ([], [], []))
+            row = delta[i]
+            atom = 0
+            for low, high, target in zip(starts, ends, targets):
+                atom = bisect_right(atoms, low, lo=atom) - 1
+                target_index = index_of[target]
+                while atom < len(atoms) and atoms[atom] <= high:
+                    row[atom] = target_index
+                    atom += 1
+
+        inverse: List[Dict[int, List[int]]] = [{} for _ in atoms]
+        for source in range(size):
+            for atom, target in enumerate(delta[source]):
+                inverse[atom].setdefault(target, []).append(source)
+
+        finals = {index_of[s] for s in self._final_states if s in index_of}
+        partition = _hopcroft(size, finals, inverse)
+
+        block_of = [0] * size
+        for block_id, block in enumerate(partition):
+            for state in block:
+                block_of[state] = block_id
+        sink_block = block_of[sink]
+
+        initial_block = block_of[index_of[self._initial_state]]
+        names = {initial_block: "q0"}
+        for block_id in range(len(partition)):
+            if block_id not in names and block_id != sink_block:
+                names[block_id] = f"q{len(names)}"
+
+        tables: Dict[str, StateTable] = {}
+        for block_id, name in names.items():
+            representative = next(iter(partition[block_id]))
+            starts: List[int] = []
+            ends: List[int] = []
+            targets: List[str] = []
+            for atom, target in enumerate(delta[representative]):
+                target_block = block_of[target]
+                if target_block == sink_block:
+                    continue
+                high = atoms[atom + 1] - 1 if atom + 1 < len(atoms) else MAX_CODEPOINT
+                target_name = names[target_block]
+                if (
+                    targets
+                    and targets[-1] == target_name
+                    and ends[-1] == atoms[atom] - 1
+                ):
+                    ends[-1] = high
+                else:
+                    starts.append(atoms[atom])
+                    ends.append(high)
+                    targets.append(target_name)
+            if starts:
+                tables[name] = (starts, ends, targets)
+
+        return IntervalDFA._from_tables(
+            set(names.values()),
+            tables,
+            "q0",
+            {names[block_of[state]] for state in finals},
+        )
+
+    def _product(
+        self, other: "IntervalDFA", accept: Callable[[bool, bool], bool], complete: bool
+    ) -> "IntervalDFA":
+        """
+        Construction par produit en découpant les intervalles des deux DFA.
+
+        :param other: Autre DFA à intervalles
+        :type other: IntervalDFA
+        :param accept: Condition d'acceptation sur (final1, final2)
+        :type accept: Callable[[bool, bool], bool]
+        :param complete: Conserve les paires où un seul automate progresse
+        :type complete: bool
+        :return: DFA produit (états accessibles seulement)
+        :rtype: IntervalDFA
+        """
+        start = (self._initial_state, other.initial_state)
+        names: Dict[Tuple[Optional[str], Optional[str]], str] = {start: "q0"}
+        queue = deque([start])
+        tables: Dict[str, StateTable] = {}
+        finals: Set[str] = set()
+
+        while queue:
+            pair = queue.popleft()
+            left, right = pair
+            name = names[pair]
+            if accept(
+                left is not None and left in self._final_states,
+                right is not None and other.is_final_state(right),
+            ):
+                finals.add(name)
+
+            edges: List[Tuple[int, int, Tuple[int, str]]] = []
+            for side, automaton, state in ((0, self, left), (1, other, right)):
+                if state is None:
+                    continue
+                starts, ends, targets = automaton._tables.get(state, ([], [], []))
+                edges.extend(
+                    (low, high, (side, target))
+                    for low, high, target in zip(starts, ends, targets)
+                )
+
+            starts_out: List[int] = []
+            ends_out: List[int] = []
+            targets_out: List[str] = []
+            for low, high, labels in split_intervals(edges):
+                sides = dict(labels)
+                if not complete and len(sides) < 2:
+                    continue
+                target_pair = (sides.get(0), sides.get(1))
+                if target_pair not in names:
+                    names[target_pair] = f"q{len(names)}"
+                    queue.append(target_pair)
+                target_name = names[target_pair]
+                if (
+                    targets_out
+                    and targets_out[-1] == target_name
+                    and ends_out[-1] == low - 1
+                ):
+                    ends_out[-1] = high
+                else:
+                    starts_out.append(low)
+                    ends_out.append(high)
+                    targets_out.append(target_name)
+            if starts_out:
+                tables[name] = (starts_out, ends_out, targets_out)
+
+        return IntervalDFA._from_tables(set(names.values()), tables, "q0", finals)
+
+    def intersection(self, other: "IntervalDFA") -> "IntervalDFA":
+        """
+        Calcule l'intersection de deux DFA à intervalles.
+
+        :param other: Autre DFA à intervalles
+        :type other: IntervalDFA
+        :return: DFA acceptant l'intersection des langages
+        :rtype: IntervalDFA
+        """
+        return self._product(other, lambda a, b: a and b, complete=False)
+
+    def union(self, other: "IntervalDFA") -> "IntervalDFA":
+        """
+        Calcule l'union de deux DFA à intervalles.
+
+        :param other: Autre DFA à intervalles
+        :type other: IntervalDFA
+        :return: DFA acceptant l'union des langages
+        :rtype: IntervalDFA
+        """
+        return self._product(other, lambda a, b: a or b, complete=True)
+
+    def difference(self, other: "IntervalDFA") -> "IntervalDFA":
+        """
+        Calcule la différence de deux DFA à intervalles.
+
+        :param other: DFA dont le langage est retiré
+        :type other: IntervalDFA
+        :return: DFA acceptant L(self) privé de L(other)
+        :rtype: IntervalDFA
+        """
+        return self._product(other, lambda a, b: a and not b, complete=True)
+
+    def complement(self) -> "IntervalDFA":
+        """
+        Calcule le complément du DFA sur l'ensemble des caractères Unicode.
+
+        :return: DFA acceptant tous les mots non acceptés
+        :rtype: IntervalDFA
+        """
+        sink = "sink"
+        while sink in self._states:
+            sink += "_"
+
+        tables: Dict[str, StateTable] = {}
+        for state in self._states:
+            starts, ends, targets = self._tables.get(state, ([], [], []))
+            edges = [(0, MAX_CODEPOINT, (1, sink))]
+            edges.extend(
+                (low, high, (0, t)) for low, high, t in zip(starts, ends, targets)
+            )
+            new_starts: List[int] = []
+            new_ends: List[int] = []
+            new_targets: List[str] = []
+            for low, high, labels in split_intervals(edges):
+                target = min(labels)[1]
+                if new_targets and new_targets[-1] == target:
+                    new_ends[-1] = high
+                else:
+                    new_starts.append(low)
+                    new_ends.append(high)
+                    new_targets.append(target)
+            tables[state] = (new_starts, new_ends, new_targets)
+        tables[sink] = ([0], [MAX_CODEPOINT], [sink])
+
+        states = self._states | {sink}
+        return IntervalDFA._from_tables(
+            states, tables, self._initial_state, states - self._final_states
+        )
+
+    # ==================== CONVERSIONS ====================
+
+    @classmethod
+    def from_dfa(cls, dfa: "DFA") -> "IntervalDFA":
+        """
+        Crée un DFA à intervalles depuis un DFA classique.
+
+        :param dfa: DFA dont les symboles sont des caractères uniques
+        :type dfa: DFA
+        :return: DFA à intervalles équivalent
+        :rtype: IntervalDFA
+        :raises InvalidIntervalAutomatonError: Si un symbole n'est pas un caractère
+        """
+        transitions: Dict[Tuple[str, Label], str] = {}
+        for state in dfa.states:
+            for symbol in dfa.alphabet:
+                if len(symbol) != 1:
+                    raise InvalidIntervalAutomatonError(
+                        f"Symbole multi-caractères non supporté: {symbol!r}"
+                    )
+                target = dfa.get_transition(state, symbol)
+                if target is not None:
+                    transitions[(state, CharClass.from_char(symbol))] = target
+        return cls(dfa.states, transitions, dfa.initial_state, dfa.final_states)
+
+    def to_dfa(self, max_symbols: int = 65536) -> "DFA":
+        """
+        Développe le DFA à intervalles en DFA classique (un symbole par caractère).
+
+        :param max_symbols: Taille maximale de l'alphabet développé
+        :type max_symbols: int
+        :return: DFA classique équivalent
+        :rtype: DFA
+        :raises InvalidIntervalAutomatonError: Si l'alphabet est trop grand
+        """
+        from ..dfa import DFA
+
+        alphabet = self.alphabet
+        if len(alphabet) > max_symbols:
+            raise InvalidIntervalAutomatonError(
+                "Alphabet trop grand pour être développé "
+                f"({len(alphabet)} > {max_symbols})"
+            )
+
+        transitions = {}
+        for state, (starts, ends, targets) in self._tables.items():
+            for low, high, target in zip(starts, ends, targets):
+                for codepoint in range(low, high + 1):
+                    transitions[(state, chr(codepoint))] = target
+
+        return DFA(
+            states=self._states,
+            alphabet=set(alphabet),
+            transitions=transitions,
+            initial_state=self._initial_state,
+            final_states=self._final_states,
+        )
+
+    def to_nfa(self) -> "IntervalNFA":
+        """
+        Convertit le DFA à intervalles en NFA à intervalles.
+
+        :return: NFA à intervalles équivalent
+        :rtype: IntervalNFA
+        """
+        from .interval_nfa import IntervalNFA
+
+        transitions = {}
+        for state, (starts, ends, targets) in self._tables.items():
+            for low, high, target in zip(starts, ends, targets):
+                transitions[(state, CharClass([(low, high)]))] = {target}
+        return IntervalNFA(
+            self._states, transitions, self._initial_state, self._final_states
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Sérialise l'automate en dictionnaire.
+
+        :return: Dictionnaire représentant l'automate
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "states": list(self._states),
+            "transitions": [
+                [source, [low, high], target]
+                for source, (starts, ends, targets) in self._tables.items()
+                for low, high, target in zip(starts, ends, targets)
+            ],
+            "initial_state": self._initial_state,
+            "final_states": list(self._final_states),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IntervalDFA":
+        """
+        Crée un DFA à intervalles depuis un dictionnaire.
+
+        :param data: Dictionnaire représentant l'automate
+        :type data: Dict[str, Any]
+        :return: Instance du DFA à intervalles
+        :rtype: IntervalDFA
+        """
+        transitions = {
+            (source, CharClass([tuple(bounds)])): target
+            for source, bounds, target in data["transitions"]
+        }
+        return cls(
+            set(data["states"]),
+            transitions,
+            data["initial_state"],
+            set(data["final_states"]),
+        )
+
+    def __str__(self) -> str:
+        """
+        Représentation string de l'automate.
+
+        :return: Représentation string de l'automate
+        :rtype: str
+        """
+        intervals = sum(len(starts) for starts, _, _ in self._tables.values())
+        return f"IntervalDFA(states={len(self._states)}, intervals={intervals})"
+
+    def __repr__(self) -> str:
+        """
+        Représentation détaillée de l'automate.
+
+        :return: Représentation détaillée de l'automate
+        :rtype: str
+        """
+        transitions = {
+            (state, str(char_class)): target
+            for state in sorted(self._tables)
+            for char_class, target in self.get_intervals(state)
+        }
+        return (
+            f"IntervalDFA(states={self._states}, "
+            f"initial_state='{self._initial_state}', "
+            f"final_states={self._final_states}, transitions={transitions})"
+        )
+
+
+def _hopcroft(
+    size: int, finals: Set[int], inverse: List[Dict[int, List[int]]]
+) -> List[Set[int]]:
+    """
+    Algorithme de Hopcroft sur un automate complet indexé.
+
+    :param size: Nombre d'états (indices 0..size-1)
+    :type size: int
+    :param finals: Indices des états finaux
+    :type finals: Set[int]
+    :param inverse: Pour chaque atome, cible -> liste des prédécesseurs
+    :type inverse: List[Dict[int, List[int]]]
+    :return: Partition en classes d'équivalence
+    :rtype: List[Set[int]]
+    """
+    non_finals = set(range(size)) - finals
+    partition: List[Set[int]] = [block for block in (set(finals), non_finals) if block]
+    block_of = [0] * size
+    for block_id, block in enumerate(partition):
+        for state in block:
+            block_of[state] = block_id
+
+    smallest = min(range(len(partition)), key=lambda b: len(partition[b]))
+    worklist = {(smallest, atom) for atom in range(len(inverse))}
+
+    while worklist:
+        block_id, atom = worklist.pop()
+        predecessors: Set[int] = set()
+        by_target = inverse[atom]
+        for state in partition[block_id]:
+            predecessors.update(by_target.get(state, ()))
+
+        touched: Dict[int, Set[int]] = {}
+        for state in predecessors:
+            touched.setdefault(block_of[state], set()).add(state)
+
+        for touched_id, inside in touched.items():
+            block = partition[touched_id]
+            if len(inside) == len(block):
+                continue
+            outside = block - inside
+            small, large = (
+                (inside, outside) if len(inside) <= len(outside) else (outside, inside)
+            )
+            partition[touched_id] = large
+            new_id = len(partition)
+            partition.append(small)
+            for state in small:
+                block_of[state] = new_id
+            # La plus petite moitié porte toujours le nouvel identifiant :
+            # il suffit de l'ajouter, que l'ancien bloc soit en attente ou non.
+            for symbol in range(len(inverse)):
+                worklist.add((new_id, symbol))
+    return partition
@@ -0,0 +1,22 @@
+"""
+Exceptions personnalisées pour les automates à transitions par intervalles.
+
+Ce module définit les exceptions spécifiques aux automates dont les
+transitions sont étiquetées par des intervalles de points de code Unicode.
+"""
+
+
+class IntervalAutomatonError(Exception):
+    """Exception de base pour les erreurs des automates à intervalles."""
+
+
+class InvalidCharClassError(IntervalAutomatonError):
+    """Exception levée quand une classe de caractères est invalide."""
+
+
+class InvalidIntervalAutomatonError(IntervalAutomatonError):
+    """Exception levée quand un automate à intervalles est invalide."""
+
+
+class NonDeterministicIntervalError(InvalidIntervalAutomatonError):
+    """Exception levée quand deux intervalles d'un DFA se chevauchent."""
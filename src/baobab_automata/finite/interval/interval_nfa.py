@@ -0,0 +1,564 @@
+"""
+Implémentation d'un automate fini non-déterministe à transitions par intervalles.
+
+Ce module contient la classe IntervalNFA, variante du NFA dont les
+transitions sont étiquetées par des classes de caractères Unicode. Elle
+sert notamment de cible à la construction de Thompson pour les expressions
+régulières Unicode, avant déterminisation en IntervalDFA.
+"""
+
+from bisect import bisect_right
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ..abstract_finite_automaton import AbstractFiniteAutomaton
+from .char_class import CharClass, split_intervals
+from .interval_dfa import IntervalDFA, StateTable, _label_to_class
+from .interval_exceptions import InvalidIntervalAutomatonError
+
+if TYPE_CHECKING:
+    from ..nfa.epsilon_nfa import EpsilonNFA
+    from ..nfa.nfa import NFA
+
+Label = Union[CharClass, str]
+
+
+class IntervalNFA(AbstractFiniteAutomaton):
+    """
+    Automate fini non-déterministe à transitions par intervalles.
+
+    :param states: Ensemble des états de l'automate
+    :type states: Set[str]
+    :param transitions: Fonction de transition (état, classe) vers ensemble d'états
+    :type transitions: Dict[Tuple[str, Union[CharClass, str]], Set[str]]
+    :param initial_state: État initial
+    :type initial_state: str
+    :param final_states: Ensemble des états finaux
+    :type final_states: Set[str]
+    :param epsilon_transitions: Transitions epsilon par état source
+    :type epsilon_transitions: Optional[Dict[str, Set[str]]]
+    """
+
+    def __init__(
+        self,
+        states: Set[str],
+        transitions: Dict[Tuple[str, Label], Set[str]],
+        initial_state: str,
+        final_states: Set[str],
+        epsilon_transitions: Optional[Dict[str, Set[str]]] = None,
+    ) -> None:
+        """
+        Initialise un NFA à intervalles.
+
+        :param states: Ensemble des états de l'automate
+        :type states: Set[str]
+        :param transitions: Fonction de transition (état, classe) vers
+            ensemble d'états
+        :type transitions: Dict[Tuple[str, Union[CharClass, str]], Set[str]]
+        :param initial_state: État initial
+        :type initial_state: str
+        :param final_states: Ensemble des états finaux
+        :type final_states: Set[str]
+        :param epsilon_transitions: Transitions epsilon par état source
+        :type epsilon_transitions: Optional[Dict[str, Set[str]]]
+        :raises InvalidIntervalAutomatonError: Si l'automate est invalide
+        """
+        edges: Dict[str, List[Tuple[int, int, str]]] = {}
+        for (source, label), targets in transitions.items():
+            for low, high in _label_to_class(label).intervals:
+                for target in targets:
+                    edges.setdefault(source, []).append((low, high, target))
+
+        self._states = set(states)
+        self._edges = edges
+        self._epsilon: Dict[str, Set[str]] = {
+            source: set(targets)
+            for source, targets in (epsilon_transitions or {}).items()
+            if targets
+        }
+        self._initial_state = initial_state
+        self._final_states = set(final_states)
+        self._tables: Dict[str, Tuple[List[int], List[int], List[FrozenSet[str]]]] = {}
+
+        if not self.validate():
+            raise InvalidIntervalAutomatonError("Invalid interval NFA configuration")
+
+    # ==================== PROPRIÉTÉS ====================
+
+    @property
+    def states(self) -> Set[str]:
+        """
+        Ensemble des états de l'automate.
+
+        :return: Ensemble des identifiants des états
+        :rtype: Set[str]
+        """
+        return self._states.copy()
+
+    @property
+    def alphabet(self) -> CharClass:
+        """
+        Alphabet effectif de l'automate.
+
+        :return: Classe des caractères étiquetant au moins une transition
+        :rtype: CharClass
+        """
+        return CharClass(
+            (low, high) for edges in self._edges.values() for low, high, _ in edges
+        )
+
+    @property
+    def initial_state(self) -> str:
+        """
+        État initial de l'automate.
+
+        :return: Identifiant de l'état initial
+        :rtype: str
+        """
+        return self._initial_state
+
+    @property
+    def final_states(self) -> Set[str]:
+        """
+        Ensemble des états finaux.
+
+        :return: Ensemble des identifiants des états finaux
+        :rtype: Set[str]
+        """
+        return self._final_states.copy()
+
+    @property
+    def epsilon_transitions(self) -> Dict[str, Set[str]]:
+        """
+        Transitions epsilon de l'automate.
+
+        :return: Dictionnaire état source -> ensemble des cibles
+        :rtype: Dict[str, Set[str]]
+        """
+        return {source: targets.copy() for source, targets in self._epsilon.items()}
+
+    # ==================== RECONNAISSANCE ====================
+
+    def _table(self, state: str) -> Tuple[List[int], List[int], List[FrozenSet[str]]]:
+        """Table d'intervalles disjoints d'un état, construite à la demande."""
+        table = self._tables.get(state)
+        if table is None:
+            starts: List[int] = []
+            ends: List[int] = []
+            targets: List[FrozenSet[str]] = []
+            for low, high, labels in split_intervals(self._edges.get(state, ())):
+                starts.append(low)
+                ends.append(high)
+                targets.append(labels)
+            table = (starts, ends, targets)
+            self._tables[state] = table
+        return table
+
+    def _targets(self, state: str, codepoint: int) -> FrozenSet[str]:
+        """Cibles d'un état sur un point de code."""
+        starts, ends, targets = self._table(state)
+        index = bisect_right(starts, codepoint) - 1
+        if index >= 0 and codepoint <= ends[index]:
+            return targets[index]
+        return frozenset()
+
+    def epsilon_closure(self, states: Set[str]) -> Set[str]:
+        """
+        Calcule la fermeture epsilon d'un ensemble d'états.
+
+        :param states: Ensemble d'états
+        :type states: Set[str]
+        :return: Fermeture epsilon des états
+        :rtype: Set[str]
+        """
+        closure = set(states)
+        to_visit = list(states)
+        while to_visit:
+            current = to_visit.pop()
+            for target in self._epsilon.get(current, ()):
+                if target not in closure:
+                    closure.add(target)
+                    to_visit.append(target)
+        return closure
+
+    def accepts(self, word: str) -> bool:
+        """
+        Vérifie si l'automate accepte un mot donné.
+
+        :param word: Mot à tester
+        :type word: str
+        :return: True si le mot est accepté, False sinon
+        :rtype: bool
+        """
+        current = self.epsilon_closure({self._initial_state})
+        for char in word:
+            codepoint = ord(char)
+            next_states: Set[str] = set()
+            for state in current:
+                next_states.update(self._targets(state, codepoint))
+            if not next_states:
+                return False
+            current = self.epsilon_closure(next_states)
+        return not current.isdisjoint(self._final_states)
+
+    def get_transition(self, state: str, symbol: str) -> Optional[str]:
+        """
+        Récupère un état de destination pour un caractère donné.
+
+        :param state: État source
+        :type state: str
+        :param symbol: Caractère de la transition
+        :type symbol: str
+        :return: Un état de destination ou None si aucune transition
+        :rtype: Optional[str]
+        """
+        targets = self.get_transitions(state, symbol)
+        return min(targets) if targets else None
+
+    def get_transitions(self, state: str, symbol: str) -> Set[str]:
+        """
+        Récupère tous les états de destination pour un caractère donné.
+
+        :param state: État source
+        :type state: str
+        :param symbol: Caractère de la transition
+        :type symbol: str
+        :return: Ensemble des états de destination
+        :rtype: Set[str]
+        """
+        if not isinstance(symbol, str) or len(symbol) != 1:
+            return set()
+        return set(self._targets(state, ord(symbol)))
+
+    def is_final_state(self, state: str) -> bool:
+        """
+        Vérifie si un état est final.
+
+        :param state: Identifiant de l'état
+        :type state: str
+        :return: True si l'état est final, False sinon
+        :rtype: bool
+        """
+        return state in self._final_states
+
+    def get_reachable_states(self) -> Set[str]:
+        """
+        Récupère tous les états accessibles depuis l'état initial.
+
+        :return: Ensemble des états accessibles
+        :rtype: Set[str]
+        """
+        reachable = {self._initial_state}
+        to_visit = [self._initial_state]
+        while to_visit:
+            current = to_visit.pop()
+            successors = [target for _, _, target in self._edges.get(current, ())]
+            successors.extend(self._epsilon.get(current, ()))
+            for target in successors:
+                if target not in reachable:
+                    reachable.add(target)
+                    to_visit.append(target)
+        return reachable
+
+    def validate(self) -> bool:
+        """
+        Valide la cohérence de l'automate.
+
+        :return: True si l'automate est valide, False sinon
+        :rtype: bool
+        """
+        if self._initial_state not in self._states:
+            return False
+        if not self._final_states.issubset(self._states):
+            return False
+        for source, edges in self._edges.items():
+            if source not in self._states:
+                return False
+            if any(target not in self._states for _, _, target in edges):
+                return False
+        for source, targets in self._epsilon.items():
+            if source not in self._states or not targets.issubset(self._states):
+                return False
+        return True
+
+    # ==================== CONSTRUCTION DE THOMPSON ====================
+
+    @classmethod
+    def from_char_class(cls, char_class: Label) -> "IntervalNFA":
+        """
+        Crée un NFA reconnaissant exactement un caractère d'une classe.
+
+        :param char_class: Classe de caractères ou sa spécification textuelle
+        :type char_class: Union[CharClass, str]
+        :return: NFA à deux états
+        :rtype: IntervalNFA
+        """
+        return cls({"q0", "q1"}, {("q0", char_class): {"q1"}}, "q0", {"q1"})
+
+    @classmethod
+    def empty_word(cls) -> "IntervalNFA":
+        """
+        Crée un NFA reconnaissant uniquement le mot vide.
+
+        :return: NFA à un état
+        :rtype: IntervalNFA
+        """
+        return cls({"q0"}, {}, "q0", {"q0"})
+
+    def _relabeled(self, offset: int) -> Tuple[Dict[str, str], "IntervalNFA"]:
+        """Renomme les états en q{offset}, q{offset+1}, ... (ordre stable)."""
+        mapping = {
+            state: f"q{offset + i}" for i, state in enumerate(sorted(self._states))
+        }
+        clone = IntervalNFA.__new__(IntervalNFA)
+        clone._states = set(mapping.values())
+        clone._edges = {
+            mapping[source]: [
+                (low, high, mapping[target]) for low, high, target in edges
+            ]
+            for source, edges in self._edges.items()
+        }
+        clone._epsilon = {
+            mapping[source]: {mapping[target] for target in targets}
+            for source, targets in self._epsilon.items()
+        }
+        clone._initial_state = mapping[self._initial_state]
+        clone._final_states = {mapping[state] for state in self._final_states}
+        clone._tables = {}
+        return mapping, clone
+
+    @staticmethod
+    def _combine(
+        parts: List["IntervalNFA"],
+        initial_state: str,
+        final_states: Set[str],
+        extra_epsilon: Dict[str, Set[str]],
+    ) -> "IntervalNFA":
+        """Assemble des NFA renommés en un seul, avec des epsilon supplémentaires."""
+        result = IntervalNFA.__new__(IntervalNFA)
+        result._states = {initial_state} | set(final_states)
+        result._edges = {}
+        result._epsilon = {}
+        for part in parts:
+            result._states |= part._states
+            result._edges.update(part._edges)
+            for source, targets in part._epsilon.items():
+                result._epsilon[source] = set(targets)
+        for source, targets in extra_epsilon.items():
+            result._epsilon.setdefault(source, set()).update(targets)
+        result._initial_state = initial_state
+        result._final_states = set(final_states)
+        result._tables = {}
+        return result
+
+    def union(self, other: "IntervalNFA") -> "IntervalNFA":
+        """
+        Calcule l'union de deux NFA à intervalles.
+
+        :param other: Autre NFA à intervalles
+        :type other: IntervalNFA
+        :return: NFA acceptant l'union des langages
+        :rtype: IntervalNFA
+        """
+        _, left = self._relabeled(0)
+        _, right = other._relabeled(len(left._states))
+        initial = f"q{len(left._states) + len(right._states)}"
+        return self._combine(
+            [left, right],
+            initial,
+            left._final_states | right._final_states,
+            {initial: {left._initial_state, right._initial_state}},
+        )
+
+    def concatenation(self, other: "IntervalNFA") -> "IntervalNFA":
+        """
+        Calcule la concaténation de deux NFA à intervalles.
+
+        :param other: NFA à concaténer à droite
+        :type other: IntervalNFA
+        :return: NFA acceptant la concaténation des langages
+        :rtype: IntervalNFA
+        """
+        _, left = self._relabeled(0)
+        _, right = other._relabeled(len(left._states))
+        return self._combine(
+            [left, right],
+            left._initial_state,
+            right._final_states,
+            {final: {right._initial_state} for final in left._final_states},
+        )
+
+    def kleene_star(self) -> "IntervalNFA":
+        """
+        Calcule l'étoile de Kleene du NFA à intervalles.
+
+        :return: NFA acceptant l'étoile de Kleene du langage
+        :rtype: IntervalNFA
+        """
+        _, inner = self._relabeled(0)
+        initial = f"q{len(inner._states)}"
+        extra = {initial: {inner._initial_state}}
+        for final in inner._final_states:
+            extra[final] = {initial}
+        return self._combine([inner], initial, {initial}, extra)
+
+    # ==================== CONVERSIONS ====================
+
+    def to_dfa(self) -> IntervalDFA:
+        """
+        Déterminise le NFA par construction des sous-ensembles.
+
+        Les intervalles sortants d'un sous-ensemble sont découpés en pièces
+        disjointes : chaque pièce devient une seule transition du DFA.
+
+        :return: DFA à intervalles équivalent
+        :rtype: IntervalDFA
+        """
+        start = frozenset(self.epsilon_closure({self._initial_state}))
+        names: Dict[FrozenSet[str], str] = {start: "q0"}
+        queue = deque([start])
+        tables: Dict[str, StateTable] = {}
+        finals: Set[str] = set()
+
+        while queue:
+            subset = queue.popleft()
+            name = names[subset]
+            if not subset.isdisjoint(self._final_states):
+                finals.add(name)
+
+            edges: List[Tuple[int, int, str]] = []
+            for state in subset:
+                edges.extend(self._edges.get(state, ()))
+
+            starts: List[int] = []
+            ends: List[int] = []
+            targets: List[str] = []
+            for low, high, labels in split_intervals(edges):
+                target_subset = frozenset(self.epsilon_closure(set(labels)))
+                if target_subset not in names:
+                    names[target_subset] = f"q{len(names)}"
+                    queue.append(target_subset)
+                target = names[target_subset]
+                if targets and targets[-1] == target and ends[-1] == low - 1:
+                    ends[-1] = high
+                else:
+                    starts.append(low)
+                    ends.append(high)
+                    targets.append(target)
+            if starts:
+                tables[name] = (starts, ends, targets)
+
+        return IntervalDFA._from_tables(set(names.values()), tables, "q0", finals)
+
+    @classmethod
+    def from_nfa(cls, nfa: Union["NFA", "EpsilonNFA"]) -> "IntervalNFA":
+        """
+        Crée un NFA à intervalles depuis un NFA ou un epsilon-NFA classique.
+
+        :param nfa: Automate dont les symboles sont des caractères uniques
+        :type nfa: Union[NFA, EpsilonNFA]
+        :return: NFA à intervalles équivalent
+        :rtype: IntervalNFA
+        :raises InvalidIntervalAutomatonError: Si un symbole n'est pas un caractère
+        """
+        epsilon_symbol = getattr(nfa, "epsilon_symbol", "epsilon")
+        transitions: Dict[Tuple[str, Label], Set[str]] = {}
+        epsilon: Dict[str, Set[str]] = {}
+        for state in nfa.states:
+            eps_targets = nfa.get_transitions(state, epsilon_symbol)
+            if eps_targets:
+                epsilon[state] = set(eps_targets)
+            for symbol in nfa.alphabet:
+                if symbol == epsilon_symbol:
+                    continue
+                if len(symbol) != 1:
+                    raise InvalidIntervalAutomatonError(
+                        f"Symbole multi-caractères non supporté: {symbol!r}"
+                    )
+                targets = nfa.get_transitions(state, symbol)
+                if targets:
+                    transitions[(state, CharClass.from_char(symbol))] = set(targets)
+        return cls(
+            nfa.states, transitions, nfa.initial_state, nfa.final_states, epsilon
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Sérialise l'automate en dictionnaire.
+
+        :return: Dictionnaire représentant l'automate
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "states": list(self._states),
+            "transitions": [
+                [source, [low, high], target]
+                for source, edges in self._edges.items()
+                for low, high, target in edges
+            ],
+            "epsilon_transitions": {
+                source: list(targets) for source, targets in self._epsilon.items()
+            },
+            "initial_state": self._initial_state,
+            "final_states": list(self._final_states),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IntervalNFA":
+        """
+        Crée un NFA à intervalles depuis un dictionnaire.
+
+        :param data: Dictionnaire représentant l'automate
+        :type data: Dict[str, Any]
+        :return: Instance du NFA à intervalles
+        :rtype: IntervalNFA
+        """
+        transitions: Dict[Tuple[str, Label], Set[str]] = {}
+        for source, bounds, target in data["transitions"]:
+            key = (source, CharClass([tuple(bounds)]))
+            transitions.setdefault(key, set()).add(target)
+        epsilon = {
+            source: set(targets)
+            for source, targets in data.get("epsilon_transitions", {}).items()
+        }
+        return cls(
+            set(data["states"]),
+            transitions,
+            data["initial_state"],
+            set(data["final_states"]),
+            epsilon,
+        )
+
+    def __str__(self) -> str:
+        """
+        Représentation string de l'automate.
+
+        :return: Représentation string de l'automate
+        :rtype: str
+        """
+        edges = sum(len(edges) for edges in self._edges.values())
+        return f"IntervalNFA(states={len(self._states)}, intervals={edges})"
+
+    def __repr__(self) -> str:
+        """
+        Représentation détaillée de l'automate.
+
+        :return: Représentation détaillée de l'automate
+        :rtype: str
+        """
+        return (
+            f"IntervalNFA(states={self._states}, "
+            f"initial_state='{self._initial_state}', "
+            f"final_states={self._final_states}, "
+            f"epsilon_transitions={self._epsilon})"
+        )
@@ -5,10 +5,11 @@ Ce module implémente la classe LanguageOperations qui fournit toutes
 les opérations de base et avancées sur les langages réguliers.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional
 
 from ..abstract_finite_automaton import AbstractFiniteAutomaton
 from ..dfa import DFA
+from ..indexed_automaton import EPSILON, IndexedAutomaton
 from .language_operations_exceptions import (
     IncompatibleAutomataError,
     OperationValidationError,
@@ -84,47 +85,19 @@ class LanguageOperations:
         if automaton1.alphabet != automaton2.alphabet:
             raise IncompatibleAutomataError("Automata have different alphabets")
 
-        # Création d'un nouvel état initial
-        new_initial = "union_initial"
-
-        # Union des états avec préfixes pour éviter les conflits
-        states1 = {f"1_{state}" for state in automaton1.states}
-        states2 = {f"2_{state}" for state in automaton2.states}
-        all_states = {new_initial} | states1 | states2
+        # Union sur les formes indexées ; les noms préfixés (« 1_q0 »,
+        # « 2_q0 ») ne sont construits qu'à la demande
+        indexed = IndexedAutomaton.union(
+            IndexedAutomaton.from_automaton(automaton1),
+            IndexedAutomaton.from_automaton(automaton2),
+            "union_initial",
+            ("1_", "2_"),
+        )
 
         # Union des alphabets + epsilon pour les transitions epsilon
         alphabet = automaton1.alphabet | automaton2.alphabet | {"epsilon"}
 
-        # Construction des transitions
-        transitions = {(new_initial, "epsilon"): {
-            f"1_{automaton1.initial_state}",
-            f"2_{automaton2.initial_state}",
-        }}
-
-        # Transitions epsilon depuis le nouvel état initial
-
-        # Transitions du premier automate
-        for state in automaton1.states:
-            for symbol in automaton1.alphabet:
-                dest = automaton1.get_transition(state, symbol)
-                if dest:
-                    transitions[(f"1_{state}", symbol)] = {f"1_{dest}"}
-
-        # Transitions du deuxième automate
-        for state in automaton2.states:
-            for symbol in automaton2.alphabet:
-                dest = automaton2.get_transition(state, symbol)
-                if dest:
-                    transitions[(f"2_{state}", symbol)] = {f"2_{dest}"}
-
-        # États finaux
-        final_states = set()
-        for state in automaton1.final_states:
-            final_states.add(f"1_{state}")
-        for state in automaton2.final_states:
-            final_states.add(f"2_{state}")
-
-        return NFA(all_states, alphabet, transitions, new_initial, final_states)
+        return NFA._from_indexed(indexed, alphabet)
 
     @staticmethod
     def intersection(
@@ -158,37 +131,18 @@ class LanguageOperations:
         if automaton1.alphabet != automaton2.alphabet:
             raise IncompatibleAutomataError("Automata have different alphabets")
 
-        # Création du produit cartésien des états
-        product_states = set()
-        for state1 in automaton1.states:
-            for state2 in automaton2.states:
-                product_states.add(f"({state1},{state2})")
-
         # Alphabet commun
         alphabet = automaton1.alphabet & automaton2.alphabet
 
-        # État initial
-        initial_state = f"({automaton1.initial_state},{automaton2.initial_state})"
+        # Produit des paires accessibles ; les noms « (s1,s2) » ne sont
+        # construits qu'à la demande
+        indexed = IndexedAutomaton.product(
+            IndexedAutomaton.from_automaton(automaton1),
+            IndexedAutomaton.from_automaton(automaton2),
+            alphabet,
+        )
 
-        # Construction des transitions
-        transitions = {}
-        for state1 in automaton1.states:
-            for state2 in automaton2.states:
-                for symbol in alphabet:
-                    dest1 = automaton1.get_transition(state1, symbol)
-                    dest2 = automaton2.get_transition(state2, symbol)
-                    if dest1 and dest2:
-                        transitions[(f"({state1},{state2})", symbol)] = {
-                            f"({dest1},{dest2})"
-                        }
-
-        # États finaux (intersection des états finaux)
-        final_states = set()
-        for state1 in automaton1.final_states:
-            for state2 in automaton2.final_states:
-                final_states.add(f"({state1},{state2})")
-
-        return NFA(product_states, alphabet, transitions, initial_state, final_states)
+        return NFA._from_indexed(indexed, alphabet)
 
     @staticmethod
     def complement(
@@ -243,12 +197,10 @@ class LanguageOperations:
             transitions[(sink_state, symbol)] = sink_state
 
         # États finaux inversés
-        final_states = set()
-        for state in all_states:
-            if state not in automaton.final_states:
-                final_states.add(state)
+        final_states = all_states - automaton.final_states
 
-        return DFA(
+        # Automate complet construit ici : pas de revalidation
+        return DFA._from_trusted(
             all_states,
             alphabet,
             transitions,
@@ -287,41 +239,13 @@ class LanguageOperations:
         # Union des alphabets + epsilon pour les transitions epsilon
         alphabet = automaton1.alphabet | automaton2.alphabet | {"epsilon"}
 
-        # États avec préfixes pour éviter les conflits
-        states1 = {f"1_{state}" for state in automaton1.states}
-        states2 = {f"2_{state}" for state in automaton2.states}
-        all_states = states1 | states2
-
-        # État initial
-        initial_state = f"1_{automaton1.initial_state}"
-
-        # Construction des transitions
-        transitions = {}
-
-        # Transitions du premier automate
-        for state in automaton1.states:
-            for symbol in automaton1.alphabet:
-                dest = automaton1.get_transition(state, symbol)
-                if dest:
-                    transitions[(f"1_{state}", symbol)] = {f"1_{dest}"}
-
-        # Transitions du deuxième automate
-        for state in automaton2.states:
-            for symbol in automaton2.alphabet:
-                dest = automaton2.get_transition(state, symbol)
-                if dest:
-                    transitions[(f"2_{state}", symbol)] = {f"2_{dest}"}
-
-        # Connexions epsilon des états finaux du premier vers l'état initial du second
-        for final_state in automaton1.final_states:
-            transitions[(f"1_{final_state}", "epsilon")] = {
-                f"2_{automaton2.initial_state}"
-            }
-
-        # États finaux (seulement ceux du deuxième automate)
-        final_states = {f"2_{state}" for state in automaton2.final_states}
+        indexed = IndexedAutomaton.concatenation(
+            IndexedAutomaton.from_automaton(automaton1),
+            IndexedAutomaton.from_automaton(automaton2),
+            ("1_", "2_"),
+        )
 
-        return NFA(all_states, alphabet, transitions, initial_state, final_states)
+        return NFA._from_indexed(indexed, alphabet)
 
     @staticmethod
     def kleene_star(
@@ -343,39 +267,14 @@ class LanguageOperations:
                 "automaton must be an AbstractFiniteAutomaton"
             )
 
-        # Nouvel état initial
-        new_initial = "kleene_initial"
-
-        # États avec préfixe pour éviter les conflits
-        states = {f"k_{state}" for state in automaton.states}
-        all_states = {new_initial} | states
+        indexed = IndexedAutomaton.kleene_star(
+            IndexedAutomaton.from_automaton(automaton), "kleene_initial", prefix="k_"
+        )
 
         # Alphabet + epsilon pour les transitions epsilon
         alphabet = automaton.alphabet | {"epsilon"}
 
-        # Construction des transitions
-        # Transition epsilon du nouvel état initial vers l'ancien état initial
-        transitions = {(new_initial, "epsilon"): {f"k_{automaton.initial_state}"}}
-
-        # Transitions de l'automate original
-        for state in automaton.states:
-            for symbol in automaton.alphabet:
-                dest = automaton.get_transition(state, symbol)
-                if dest:
-                    transitions[(f"k_{state}", symbol)] = {f"k_{dest}"}
-
-        # Transitions epsilon des états finaux vers l'ancien état initial
-        for final_state in automaton.final_states:
-            transitions[(f"k_{final_state}", "epsilon")] = {
-                f"k_{automaton.initial_state}"
-            }
-
-        # États finaux (nouvel état initial + anciens états finaux)
-        final_states = {new_initial}
-        for state in automaton.final_states:
-            final_states.add(f"k_{state}")
-
-        return NFA(all_states, alphabet, transitions, new_initial, final_states)
+        return NFA._from_indexed(indexed, alphabet)
 
     # ==================== MÉTHODES UTILITAIRES ====================
 
@@ -515,7 +414,10 @@ class LanguageOperations:
         """
         Applique un homomorphisme à un automate.
 
-        Un homomorphisme transforme l'alphabet de l'automate selon le mapping donné.
+        Un homomorphisme transforme l'alphabet de l'automate selon le mapping
+        donné ; les symboles hors du domaine sont conservés. Les transitions
+        sont réétiquetées en une seule passe sur la forme indexée, et les
+        symboles de même image fusionnent leurs cibles.
 
         :param automaton: Automate à transformer
         :type automaton: AbstractFiniteAutomaton
@@ -533,29 +435,20 @@ class LanguageOperations:
         if not isinstance(mapping, Mapping):
             raise OperationValidationError("mapping must be a Mapping instance")
 
-        # Nouvel alphabet transformé
-        new_alphabet = mapping.apply_to_set(automaton.alphabet)
-
-        # Construction des nouvelles transitions
-        new_transitions = {}
-
-        for state in automaton.states:
-            for symbol in automaton.alphabet:
-                dest = automaton.get_transition(state, symbol)
-                if dest:
-                    # Appliquer le mapping au symbole
-                    new_symbol = mapping.apply(symbol)
-                    new_transitions[(state, new_symbol)] = {dest}
-
-        # États finaux inchangés
-        final_states = automaton.final_states.copy()
-
-        return NFA(
-            automaton.states,
-            new_alphabet,
-            new_transitions,
-            automaton.initial_state,
-            final_states,
+        images = mapping.to_dict()
+        indexed = IndexedAutomaton.from_automaton(automaton)
+        delta = []
+        for row in indexed.delta:
+            new_row: Dict[str, FrozenSet[int]] = {}
+            for symbol, targets in row.items():
+                image = images.get(symbol, symbol)
+                previous = new_row.get(image)
+                new_row[image] = targets if previous is None else previous | targets
+            delta.append(new_row)
+
+        return NFA._from_indexed(
+            IndexedAutomaton(delta, indexed.initial, indexed.finals, indexed.names),
+            frozenset(mapping.apply_to_set(automaton.alphabet)),
         )
 
     @staticmethod
@@ -565,8 +458,12 @@ class LanguageOperations:
         """
         Applique un homomorphisme inverse à un automate.
 
-        Un homomorphisme inverse transforme l'alphabet de l'automate selon
-        le mapping inverse donné.
+        L'automate résultat lit un symbole a là où l'automate d'origine lit
+        son image h(a) : les images d'un caractère sont obtenues par un seul
+        réétiquetage de la forme indexée, classe de symboles par classe de
+        symboles ; une image de plusieurs caractères est suivie comme un
+        chemin (avec fermeture epsilon entre ses caractères). Le résultat
+        reste déterministe si l'automate d'origine l'est.
 
         :param automaton: Automate à transformer
         :type automaton: AbstractFiniteAutomaton
@@ -584,31 +481,97 @@ class LanguageOperations:
         if not isinstance(mapping, Mapping):
             raise OperationValidationError("mapping must be a Mapping instance")
 
-        # Nouvel alphabet (domaine du mapping)
-        new_alphabet = mapping.get_domain()
+        # Classes de symboles : tous les antécédents d'une même image ; les
+        # images de plusieurs caractères sont lues comme des chemins
+        preimages = {
+            image: tuple(mapping.get_inverse_symbols(image))
+            for image in mapping.get_codomain()
+        }
+        paths = {
+            image: symbols for image, symbols in preimages.items() if len(image) > 1
+        }
+        preimages[EPSILON] = (EPSILON,)
+
+        indexed = IndexedAutomaton.from_automaton(automaton)
+        delta = []
+        has_epsilon = False
+        for state, row in enumerate(indexed.delta):
+            new_row: Dict[str, FrozenSet[int]] = {}
+            for symbol, targets in row.items():
+                if len(symbol) == 1 or symbol == EPSILON:
+                    for preimage in preimages.get(symbol, ()):
+                        new_row[preimage] = targets
+            for image, symbols in paths.items():
+                targets = LanguageOperations._read_path(indexed, state, image)
+                if targets:
+                    for preimage in symbols:
+                        new_row[preimage] = targets
+            has_epsilon = has_epsilon or EPSILON in new_row
+            delta.append(new_row)
+
+        alphabet = mapping.get_domain()
+        if has_epsilon:
+            alphabet.add(EPSILON)
+        return NFA._from_indexed(
+            IndexedAutomaton(delta, indexed.initial, indexed.finals, indexed.names),
+            frozenset(alphabet),
+        )
 
-        # Construction des nouvelles transitions
-        new_transitions = {}
+    @staticmethod
+    def _read_path(indexed: IndexedAutomaton, state: int, word: str) -> FrozenSet[int]:
+        """
+        États atteints depuis un état en lisant un mot caractère par caractère.
+
+        :param indexed: Forme indexée de l'automate
+        :type indexed: IndexedAutomaton
+        :param state: Indice de l'état de départ
+        :type state: int
+        :param word: Mot à lire
+        :type word: str
+        :return: Indices des états atteints (sans fermeture epsilon finale)
+        :rtype: FrozenSet[int]
+        """
+        current = {state}
+        for position, symbol in enumerate(word):
+            if position:
+                current = indexed.epsilon_closure(current)
+            current = {
+                target
+                for source in current
+                for target in indexed.delta[source].get(symbol, ())
+            }
+            if not current:
+                break
+        return frozenset(current)
 
-        for state in automaton.states:
-            for symbol in automaton.alphabet:
-                dest = automaton.get_transition(state, symbol)
-                if dest:
-                    # Trouver tous les symboles qui mappent vers ce symbole
-                    inverse_symbols = mapping.get_inverse_symbols(symbol)
-                    for inverse_symbol in inverse_symbols:
-                        new_transitions[(state, inverse_symbol)] = {dest}
-
-        # États finaux inchangés
-        final_states = automaton.final_states.copy()
-
-        return NFA(
-            automaton.states,
-            new_alphabet,
-            new_transitions,
-            automaton.initial_state,
-            final_states,
-        )
+    @staticmethod
+    def accepts_mapped(
+        automaton: AbstractFiniteAutomaton, mapping: Mapping, word: str
+    ) -> bool:
+        """
+        Teste si l'image d'un mot par le mapping est acceptée.
+
+        Équivaut à inverse_homomorphism(automaton, mapping).accepts(word),
+        y compris pour des images de plusieurs caractères, sans construire
+        d'automate : le mot est traduit par un seul appel à str.translate
+        puis lu par l'automate d'origine.
+
+        :param automaton: Automate sur l'alphabet image
+        :type automaton: AbstractFiniteAutomaton
+        :param mapping: Mapping à caractères uniques au domaine
+        :type mapping: Mapping
+        :param word: Mot sur le domaine du mapping
+        :type word: str
+        :return: True si h(word) est accepté, False sinon (y compris si le
+            mot contient un caractère hors du domaine)
+        :rtype: bool
+        :raises InvalidMappingError: Si le domaine n'est pas fait de caractères
+        """
+        try:
+            translated = mapping.translate(word, strict=True)
+        except KeyError:
+            return False
+        return automaton.accepts(translated)
 
     @staticmethod
     def cartesian_product(
@@ -643,37 +606,18 @@ class LanguageOperations:
         if automaton1.alphabet != automaton2.alphabet:
             raise IncompatibleAutomataError("Automata have different alphabets")
 
-        # Création du produit cartésien des états
-        product_states = set()
-        for state1 in automaton1.states:
-            for state2 in automaton2.states:
-                product_states.add(f"({state1},{state2})")
-
         # Alphabet commun
         alphabet = automaton1.alphabet & automaton2.alphabet
 
-        # État initial
-        initial_state = f"({automaton1.initial_state},{automaton2.initial_state})"
+        # Produit des paires accessibles ; les noms « (s1,s2) » ne sont
+        # construits qu'à la demande
+        indexed = IndexedAutomaton.product(
+            IndexedAutomaton.from_automaton(automaton1),
+            IndexedAutomaton.from_automaton(automaton2),
+            alphabet,
+        )
 
-        # Construction des transitions
-        transitions = {}
-        for state1 in automaton1.states:
-            for state2 in automaton2.states:
-                for symbol in alphabet:
-                    dest1 = automaton1.get_transition(state1, symbol)
-                    dest2 = automaton2.get_transition(state2, symbol)
-                    if dest1 and dest2:
-                        transitions[(f"({state1},{state2})", symbol)] = {
-                            f"({dest1},{dest2})"
-                        }
-
-        # États finaux (intersection des états finaux)
-        final_states = set()
-        for state1 in automaton1.final_states:
-            for state2 in automaton2.final_states:
-                final_states.add(f"({state1},{state2})")
-
-        return NFA(product_states, alphabet, transitions, initial_state, final_states)
+        return NFA._from_indexed(indexed, alphabet)
 
     # ==================== OPÉRATIONS SPÉCIALISÉES ====================
 
@@ -5,10 +5,22 @@ Ce module implémente la classe Mapping pour gérer les transformations
 d'alphabet dans les opérations d'homomorphisme sur les langages réguliers.
 """
 
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 from .language.language_operations_exceptions import InvalidMappingError
 
 
+class _UnmappedSymbol(Exception):
+    """Signale un caractère hors du domaine pendant une traduction stricte."""
+
+
+class _StrictTable(dict):
+    """Table de str.translate qui interrompt la traduction sur un caractère inconnu."""
+
+    def __missing__(self, codepoint: int) -> str:
+        """Lève _UnmappedSymbol (une LookupError laisserait le caractère intact)."""
+        raise _UnmappedSymbol(chr(codepoint))
+
+
 class Mapping:
     """
     Classe pour gérer les mappings d'alphabet dans les homomorphismes.
@@ -27,6 +39,10 @@ class Mapping:
         """
         self._mapping = mapping.copy()
         self._inverse_mapping: Dict[str, Set[str]] = {}
+        self._translation_table: Optional[Dict[int, str]] = None
+        self._strict_table: Optional[_StrictTable] = None
+        self._byte_table: Optional[bytes] = None
+        self._byte_domain = b""
 
         if not self.validate():
             raise InvalidMappingError("Invalid mapping provided")
@@ -64,6 +80,116 @@ class Mapping:
                 result.add(symbol)  # Garder le symbole original s'il n'est pas mappé
         return result
 
+    def translation_table(self) -> Dict[int, str]:
+        """
+        Compile le mapping en table pour str.translate.
+
+        La table est construite une seule fois ; chaque symbole du domaine
+        doit être un caractère unique, l'image peut être une chaîne
+        quelconque.
+
+        :return: Table point de code -> image
+        :rtype: Dict[int, str]
+        :raises InvalidMappingError: Si un symbole du domaine n'est pas un
+            caractère unique
+        """
+        if self._translation_table is None:
+            if any(len(symbol) != 1 for symbol in self._mapping):
+                raise InvalidMappingError(
+                    "Only single-character symbols can be compiled to a "
+                    "translation table"
+                )
+            self._translation_table = {
+                ord(symbol): mapped for symbol, mapped in self._mapping.items()
+            }
+            self._strict_table = _StrictTable(self._translation_table)
+        return self._translation_table
+
+    def translate(self, text: str, strict: bool = False) -> str:
+        """
+        Applique le mapping à chaque caractère d'un texte en un seul appel.
+
+        :param text: Texte à transformer
+        :type text: str
+        :param strict: Si True, un caractère hors du domaine lève KeyError ;
+            sinon il est conservé, comme dans apply_to_set
+        :type strict: bool
+        :return: Texte transformé
+        :rtype: str
+        :raises KeyError: Si strict est vrai et un caractère n'est pas mappé
+        :raises InvalidMappingError: Si le domaine n'est pas fait de caractères
+        """
+        table = self.translation_table()
+        if not strict:
+            return text.translate(table)
+        try:
+            return text.translate(self._strict_table)
+        except _UnmappedSymbol as error:
+            raise KeyError(f"Symbol '{error.args[0]}' not found in mapping") from None
+
+    def byte_table(self) -> bytes:
+        """
+        Compile le mapping en table de 256 octets pour bytes.translate.
+
+        :return: Table octet -> octet (identité hors du domaine)
+        :rtype: bytes
+        :raises InvalidMappingError: Si un symbole ou une image n'est pas un
+            caractère de code inférieur à 256
+        """
+        if self._byte_table is None:
+            for symbol, mapped in self._mapping.items():
+                if (
+                    len(symbol) != 1
+                    or len(mapped) != 1
+                    or max(ord(symbol), ord(mapped)) > 255
+                ):
+                    raise InvalidMappingError(
+                        "Only single-byte symbols can be compiled to a byte table"
+                    )
+            table = bytearray(range(256))
+            for symbol, mapped in self._mapping.items():
+                table[ord(symbol)] = ord(mapped)
+            self._byte_table = bytes(table)
+            self._byte_domain = bytes(sorted(ord(symbol) for symbol in self._mapping))
+        return self._byte_table
+
+    def translate_bytes(self, data: bytes, strict: bool = False) -> bytes:
+        """
+        Applique le mapping à chaque octet d'une donnée binaire.
+
+        :param data: Données à transformer
+        :type data: bytes
+        :param strict: Si True, un octet hors du domaine lève KeyError
+        :type strict: bool
+        :return: Données transformées
+        :rtype: bytes
+        :raises KeyError: Si strict est vrai et un octet n'est pas mappé
+        :raises InvalidMappingError: Si le mapping n'est pas compilable en octets
+        """
+        table = self.byte_table()
+        if strict:
+            # Supprimer les octets du domaine ne doit rien laisser
+            leftover = data.translate(None, self._byte_domain)
+            if leftover:
+                raise KeyError(f"Symbol '{chr(leftover[0])}' not found in mapping")
+        return data.translate(table)
+
+    def symbol_classes(self) -> Dict[str, int]:
+        """
+        Regroupe les symboles du domaine en classes de même image.
+
+        Les symboles d'une même classe sont interchangeables pour tout
+        homomorphisme inverse ; la classe d'un symbole est le rang de son
+        image dans le codomaine trié.
+
+        :return: Symbole du domaine -> numéro de classe
+        :rtype: Dict[str, int]
+        """
+        ranks = {
+            mapped: rank for rank, mapped in enumerate(sorted(self.get_codomain()))
+        }
+        return {symbol: ranks[mapped] for symbol, mapped in self._mapping.items()}
+
     def inverse(self) -> "Mapping":
         """
         Crée le mapping inverse.
@@ -1,12 +1,14 @@
 """Module pour les automates finis non-déterministes (NFA et e-NFA)."""
 
 from .nfa import NFA
+from .nfa_builder import NFABuilder
 from .nfa_exceptions import NFAError, InvalidNFAError, InvalidTransitionError, ConversionError
 from .epsilon_nfa import EpsilonNFA
 from .epsilon_nfa_exceptions import EpsilonNFAError, InvalidEpsilonNFAError, InvalidEpsilonTransitionError
 
 __all__ = [
     "NFA",
+    "NFABuilder",
     "EpsilonNFA",
     "NFAError",
     "InvalidNFAError",
@@ -5,9 +5,11 @@ Ce module contient la classe EpsilonNFA qui implémente l'interface AbstractFini
 pour les automates finis non-déterministes avec transitions epsilon selon les spécifications détaillées.
 """
 
-from typing import Any, Dict, FrozenSet, Optional, Set, Tuple, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Set, Tuple, TYPE_CHECKING
 
 from ..abstract_finite_automaton import AbstractFiniteAutomaton
+from ..structural_analysis import StructuralAnalysis
 from .epsilon_nfa_exceptions import (
     ConversionError,
     InvalidEpsilonNFAError,
@@ -26,6 +28,9 @@ class EpsilonNFA(AbstractFiniteAutomaton):
     il peut y avoir zéro, une ou plusieurs transitions possibles, y compris
     des transitions epsilon (transitions vides).
 
+    Un ε-NFA est immuable : les propriétés retournent des vues en lecture
+    seule sans copie.
+
     :param states: Ensemble des états de l'automate
     :type states: Set[str]
     :param alphabet: Alphabet de l'automate (sans epsilon)
@@ -67,11 +72,11 @@ class EpsilonNFA(AbstractFiniteAutomaton):
         :raises InvalidEpsilonNFAError: Si le ε-NFA est invalide
         :raises InvalidEpsilonTransitionError: Si une transition est invalide
         """
-        self._states = states.copy()
-        self._alphabet = alphabet.copy()
-        self._transitions = {k: v.copy() for k, v in transitions.items()}
+        self._states = frozenset(states)
+        self._alphabet = frozenset(alphabet)
+        self._transitions = {k: frozenset(v) for k, v in transitions.items()}
         self._initial_state = initial_state
-        self._final_states = final_states.copy()
+        self._final_states = frozenset(final_states)
         self._epsilon_symbol = epsilon_symbol
 
         # Cache pour les fermetures epsilon
@@ -81,25 +86,66 @@ class EpsilonNFA(AbstractFiniteAutomaton):
         if not self.validate():
             raise InvalidEpsilonNFAError("Invalid ε-NFA configuration")
 
+    @classmethod
+    def _from_trusted(
+        cls,
+        states: FrozenSet[str],
+        alphabet: FrozenSet[str],
+        transitions: Dict[Tuple[str, str], FrozenSet[str]],
+        initial_state: str,
+        final_states: FrozenSet[str],
+        epsilon_symbol: str = "ε",
+    ) -> "EpsilonNFA":
+        """
+        Crée un ε-NFA sans copie ni validation.
+
+        Réservé aux algorithmes qui construisent un automate déjà valide ;
+        le ε-NFA prend possession des structures passées.
+
+        :param states: Ensemble des états
+        :type states: FrozenSet[str]
+        :param alphabet: Alphabet de l'automate (sans epsilon)
+        :type alphabet: FrozenSet[str]
+        :param transitions: Transitions vers des ensembles figés, non copiées
+        :type transitions: Dict[Tuple[str, str], FrozenSet[str]]
+        :param initial_state: État initial
+        :type initial_state: str
+        :param final_states: Ensemble des états finaux
+        :type final_states: FrozenSet[str]
+        :param epsilon_symbol: Symbole epsilon
+        :type epsilon_symbol: str
+        :return: Instance du ε-NFA
+        :rtype: EpsilonNFA
+        """
+        enfa = cls.__new__(cls)
+        enfa._states = states
+        enfa._alphabet = alphabet
+        enfa._transitions = transitions
+        enfa._initial_state = initial_state
+        enfa._final_states = final_states
+        enfa._epsilon_symbol = epsilon_symbol
+        enfa._epsilon_closure_cache = {}
+        return enfa
+
     @property
-    def states(self) -> Set[str]:
+    def states(self) -> FrozenSet[str]:
         """
         Ensemble des états de l'automate.
 
         :return: Ensemble des identifiants des états
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        return self._states.copy()
+        return self._states
 
     @property
-    def alphabet(self) -> Set[str]:
+    def alphabet(self) -> FrozenSet[str]:
         """
         Alphabet de l'automate.
 
         :return: Ensemble des symboles de l'alphabet
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        return self._alphabet.copy()
+        return self._alphabet
 
     @property
     def initial_state(self) -> str:
@@ -112,14 +158,24 @@ class EpsilonNFA(AbstractFiniteAutomaton):
         return self._initial_state
 
     @property
-    def final_states(self) -> Set[str]:
+    def final_states(self) -> FrozenSet[str]:
         """
         Ensemble des états finaux.
 
         :return: Ensemble des identifiants des états finaux
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
+        """
+        return self._final_states
+
+    @property
+    def transitions(self) -> Mapping[Tuple[str, str], FrozenSet[str]]:
+        """
+        Fonction de transition en lecture seule (transitions epsilon incluses).
+
+        :return: Vue (état, symbole) -> ensemble des destinations
+        :rtype: Mapping[Tuple[str, str], FrozenSet[str]]
         """
-        return self._final_states.copy()
+        return MappingProxyType(self._transitions)
 
     @property
     def epsilon_symbol(self) -> str:
@@ -160,10 +216,10 @@ class EpsilonNFA(AbstractFiniteAutomaton):
         :rtype: Optional[str]
         """
         transition_key = (state, symbol)
-        destinations = self._transitions.get(transition_key, set())
+        destinations = self._transitions.get(transition_key)
         return next(iter(destinations)) if destinations else None
 
-    def get_transitions(self, state: str, symbol: str) -> Set[str]:
+    def get_transitions(self, state: str, symbol: str) -> FrozenSet[str]:
         """
         Récupère l'ensemble des états de destination pour une transition donnée.
 
@@ -172,10 +228,9 @@ class EpsilonNFA(AbstractFiniteAutomaton):
         :param symbol: Symbole de la transition
         :type symbol: str
         :return: Ensemble des états de destination
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        transition_key = (state, symbol)
-        return self._transitions.get(transition_key, set()).copy()
+        return self._transitions.get((state, symbol), frozenset())
 
     def is_final_state(self, state: str) -> bool:
         """
@@ -188,12 +243,12 @@ class EpsilonNFA(AbstractFiniteAutomaton):
         """
         return state in self._final_states
 
-    def get_reachable_states(self) -> Set[str]:
+    def get_reachable_states(self) -> FrozenSet[str]:
         """
         Récupère tous les états accessibles depuis l'état initial.
 
         :return: Ensemble des états accessibles
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
         return self.get_accessible_states()
 
@@ -294,71 +349,36 @@ class EpsilonNFA(AbstractFiniteAutomaton):
 
         return closure
 
-    def get_accessible_states(self) -> Set[str]:
+    def get_accessible_states(self) -> FrozenSet[str]:
         """
         Récupère tous les états accessibles depuis l'état initial.
 
+        Le résultat est calculé une seule fois puis mis en cache.
+
         :return: Ensemble des états accessibles
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        accessible = set()
-        to_visit = {self._initial_state}
-
-        while to_visit:
-            current = to_visit.pop()
-            if current in accessible:
-                continue
+        return StructuralAnalysis.of(self).reachable
 
-            accessible.add(current)
-
-            # Ajouter tous les états accessibles depuis l'état actuel
-            for symbol in self._alphabet.union({self._epsilon_symbol}):
-                transition_key = (current, symbol)
-                if transition_key in self._transitions:
-                    for next_state in self._transitions[transition_key]:
-                        if next_state not in accessible:
-                            to_visit.add(next_state)
-
-        return accessible
-
-    def get_coaccessible_states(self) -> Set[str]:
+    def get_coaccessible_states(self) -> FrozenSet[str]:
         """
         Récupère tous les états cœurs (pouvant atteindre un état final).
 
+        Le parcours remonte l'index inverse des transitions, mis en cache.
+
         :return: Ensemble des états cœurs
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        coaccessible = set()
-        to_visit = set(self._final_states)
+        return StructuralAnalysis.of(self).coreachable
 
-        while to_visit:
-            current = to_visit.pop()
-            if current in coaccessible:
-                continue
-
-            coaccessible.add(current)
-
-            # Trouver tous les états qui peuvent atteindre l'état actuel
-            for state in self._states:
-                for symbol in self._alphabet.union({self._epsilon_symbol}):
-                    transition_key = (state, symbol)
-                    if transition_key in self._transitions:
-                        if current in self._transitions[transition_key]:
-                            if state not in coaccessible:
-                                to_visit.add(state)
-
-        return coaccessible
-
-    def get_useful_states(self) -> Set[str]:
+    def get_useful_states(self) -> FrozenSet[str]:
         """
         Récupère tous les états utiles (accessibles et cœurs).
 
         :return: Ensemble des états utiles
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        accessible = self.get_accessible_states()
-        coaccessible = self.get_coaccessible_states()
-        return accessible.intersection(coaccessible)
+        return StructuralAnalysis.of(self).useful
 
     def to_nfa(self) -> "NFA":
         """
@@ -394,20 +414,23 @@ class EpsilonNFA(AbstractFiniteAutomaton):
                         epsilon_transitions.update(epsilon_closures[target])
 
                     if epsilon_transitions:
-                        new_transitions[(state, symbol)] = epsilon_transitions
+                        new_transitions[(state, symbol)] = frozenset(
+                            epsilon_transitions
+                        )
 
             # Ajuster les états finaux
-            new_final_states = set()
-            for state in self._states:
-                if epsilon_closures[state].intersection(self._final_states):
-                    new_final_states.add(state)
-
-            return NFA(
-                states=self._states.copy(),
-                alphabet=self._alphabet.copy(),
-                transitions=new_transitions,
-                initial_state=self._initial_state,
-                final_states=new_final_states,
+            new_final_states = frozenset(
+                state
+                for state in self._states
+                if epsilon_closures[state].intersection(self._final_states)
+            )
+
+            return NFA._from_trusted(
+                self._states,
+                self._alphabet,
+                new_transitions,
+                self._initial_state,
+                new_final_states,
             )
 
         except Exception as e:
@@ -481,25 +504,24 @@ class EpsilonNFA(AbstractFiniteAutomaton):
                 state_names[state_set] = f"q{i}"
 
             # Construire le DFA
-            dfa_states_set = {state_names[state] for state in dfa_states}
-            dfa_alphabet = self._alphabet.copy()
+            dfa_states_set = frozenset(state_names[state] for state in dfa_states)
             dfa_transitions_dict = {
                 (state_names[source], symbol): state_names[target]
                 for (source, symbol), target in dfa_transitions.items()
             }
             dfa_initial_state = state_names[dfa_initial]
-            dfa_final_states = {
+            dfa_final_states = frozenset(
                 state_names[state]
                 for state in dfa_states
                 if state.intersection(self._final_states)
-            }
+            )
 
-            return DFA(
-                states=dfa_states_set,
-                alphabet=dfa_alphabet,
-                transitions=dfa_transitions_dict,
-                initial_state=dfa_initial_state,
-                final_states=dfa_final_states,
+            return DFA._from_trusted(
+                dfa_states_set,
+                self._alphabet,
+                dfa_transitions_dict,
+                dfa_initial_state,
+                dfa_final_states,
             )
 
         except Exception as e:
@@ -639,10 +661,10 @@ class EpsilonNFA(AbstractFiniteAutomaton):
         new_states.update(self._states)
 
         # Alphabet identique
-        new_alphabet = self._alphabet.copy()
+        new_alphabet = self._alphabet
 
         # Copier les transitions existantes
-        new_transitions = {k: v.copy() for k, v in self._transitions.items()}
+        new_transitions = {k: set(v) for k, v in self._transitions.items()}
 
         # Ajouter les transitions depuis le nouvel état initial
         new_transitions[(new_initial, self._epsilon_symbol)] = {self._initial_state}
@@ -769,7 +791,8 @@ class EpsilonNFA(AbstractFiniteAutomaton):
         :rtype: str
         """
         return (
-            f"EpsilonNFA(states={self._states}, alphabet={self._alphabet}, "
-            f"initial_state='{self._initial_state}', final_states={self._final_states}, "
+            f"EpsilonNFA(states={set(self._states)}, alphabet={set(self._alphabet)}, "
+            f"initial_state='{self._initial_state}', "
+            f"final_states={set(self._final_states)}, "
             f"transitions={self._transitions}, epsilon_symbol='{self._epsilon_symbol}')"
         )
@@ -5,9 +5,15 @@ Ce module contient la classe NFA qui implémente l'interface AbstractFiniteAutom
 pour les automates finis non-déterministes selon les spécifications détaillées.
 """
 
-from typing import Any, Dict, FrozenSet, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Set, Tuple
+
+import numpy as np
 
 from ..abstract_finite_automaton import AbstractFiniteAutomaton
+from ..indexed_automaton import EPSILON, IndexedAutomaton
+from ..structural_analysis import StructuralAnalysis
+from ..transition_matrix import TransitionMatrix
 from .nfa_exceptions import (
     ConversionError,
     InvalidNFAError,
@@ -23,6 +29,12 @@ class NFA(AbstractFiniteAutomaton):
     Un NFA est un automate fini où pour chaque état et chaque symbole,
     il peut y avoir zéro, une ou plusieurs transitions possibles.
 
+    En interne, les opérations de composition travaillent sur une forme
+    indexée (états entiers) ; les noms des états ne sont construits qu'au
+    premier accès à l'API nommée (états, transitions, sérialisation).
+    Un NFA est immuable : les propriétés retournent des vues en lecture
+    seule sans copie.
+
     :param states: Ensemble des états de l'automate
     :type states: Set[str]
     :param alphabet: Alphabet de l'automate
@@ -35,6 +47,11 @@ class NFA(AbstractFiniteAutomaton):
     :type final_states: Set[str]
     """
 
+    # Attributs nommés construits à la demande depuis la forme indexée
+    _NAMED_ATTRIBUTES = frozenset(
+        {"_states", "_transitions", "_initial_state", "_final_states"}
+    )
+
     def __init__(
         self,
         states: Set[str],
@@ -59,35 +76,112 @@ class NFA(AbstractFiniteAutomaton):
         :raises InvalidNFAError: Si le NFA est invalide
         :raises InvalidTransitionError: Si une transition est invalide
         """
-        self._states = states.copy()
-        self._alphabet = alphabet.copy()
-        self._transitions = {k: v.copy() for k, v in transitions.items()}
+        self._states = frozenset(states)
+        self._alphabet = frozenset(alphabet)
+        self._transitions = {k: frozenset(v) for k, v in transitions.items()}
         self._initial_state = initial_state
-        self._final_states = final_states.copy()
+        self._final_states = frozenset(final_states)
 
         # Validation du NFA
         if not self.validate():
             raise InvalidNFAError("Invalid NFA configuration")
 
+    @classmethod
+    def _from_trusted(
+        cls,
+        states: FrozenSet[str],
+        alphabet: FrozenSet[str],
+        transitions: Dict[Tuple[str, str], FrozenSet[str]],
+        initial_state: str,
+        final_states: FrozenSet[str],
+    ) -> "NFA":
+        """
+        Crée un NFA sans copie ni validation.
+
+        Réservé aux algorithmes qui construisent un automate déjà valide ;
+        le NFA prend possession des structures passées.
+
+        :param states: Ensemble des états
+        :type states: FrozenSet[str]
+        :param alphabet: Alphabet de l'automate
+        :type alphabet: FrozenSet[str]
+        :param transitions: Transitions vers des ensembles figés, non copiées
+        :type transitions: Dict[Tuple[str, str], FrozenSet[str]]
+        :param initial_state: État initial
+        :type initial_state: str
+        :param final_states: Ensemble des états finaux
+        :type final_states: FrozenSet[str]
+        :return: Instance du NFA
+        :rtype: NFA
+        """
+        nfa = cls.__new__(cls)
+        nfa._states = states
+        nfa._alphabet = alphabet
+        nfa._transitions = transitions
+        nfa._initial_state = initial_state
+        nfa._final_states = final_states
+        return nfa
+
+    @classmethod
+    def _from_indexed(
+        cls, indexed: IndexedAutomaton, alphabet: FrozenSet[str]
+    ) -> "NFA":
+        """
+        Crée un NFA depuis une forme indexée, sans matérialiser les noms.
+
+        :param indexed: Forme indexée de l'automate
+        :type indexed: IndexedAutomaton
+        :param alphabet: Alphabet de l'automate
+        :type alphabet: FrozenSet[str]
+        :return: NFA dont les noms d'états sont construits à la demande
+        :rtype: NFA
+        """
+        nfa = cls.__new__(cls)
+        nfa._alphabet = frozenset(alphabet)
+        nfa._indexed = indexed
+        return nfa
+
+    def __getattr__(self, name: str) -> Any:
+        """Matérialise les attributs nommés d'un NFA construit par indices."""
+        indexed = self.__dict__.get("_indexed")
+        if indexed is None or name not in NFA._NAMED_ATTRIBUTES:
+            raise AttributeError(name)
+        states, transitions, initial_state, final_states = indexed.materialize()
+        self._states = states
+        self._transitions = transitions
+        self._initial_state = initial_state
+        self._final_states = final_states
+        return self.__dict__[name]
+
+    def _indexed_form(self) -> IndexedAutomaton:
+        """Retourne la forme indexée du NFA (construite une seule fois)."""
+        indexed = self.__dict__.get("_indexed")
+        if indexed is None:
+            indexed = IndexedAutomaton.from_transitions(
+                self._states, self._transitions, self._initial_state, self._final_states
+            )
+            self._indexed = indexed
+        return indexed
+
     @property
-    def states(self) -> Set[str]:
+    def states(self) -> FrozenSet[str]:
         """
         Ensemble des états de l'automate.
 
         :return: Ensemble des identifiants des états
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        return self._states.copy()
+        return self._states
 
     @property
-    def alphabet(self) -> Set[str]:
+    def alphabet(self) -> FrozenSet[str]:
         """
         Alphabet de l'automate.
 
         :return: Ensemble des symboles de l'alphabet
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        return self._alphabet.copy()
+        return self._alphabet
 
     @property
     def initial_state(self) -> str:
@@ -100,14 +194,24 @@ class NFA(AbstractFiniteAutomaton):
         return self._initial_state
 
     @property
-    def final_states(self) -> Set[str]:
+    def final_states(self) -> FrozenSet[str]:
         """
         Ensemble des états finaux.
 
         :return: Ensemble des identifiants des états finaux
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
+        """
+        return self._final_states
+
+    @property
+    def transitions(self) -> Mapping[Tuple[str, str], FrozenSet[str]]:
+        """
+        Fonction de transition en lecture seule.
+
+        :return: Vue (état, symbole) -> ensemble des destinations
+        :rtype: Mapping[Tuple[str, str], FrozenSet[str]]
         """
-        return self._final_states.copy()
+        return MappingProxyType(self._transitions)
 
     def accepts(self, word: str) -> bool:
         """
@@ -138,10 +242,10 @@ class NFA(AbstractFiniteAutomaton):
         :rtype: Optional[str]
         """
         transition_key = (state, symbol)
-        destinations = self._transitions.get(transition_key, set())
+        destinations = self._transitions.get(transition_key)
         return next(iter(destinations)) if destinations else None
 
-    def get_transitions(self, state: str, symbol: str) -> Set[str]:
+    def get_transitions(self, state: str, symbol: str) -> FrozenSet[str]:
         """
         Récupère l'ensemble des états de destination pour une transition donnée.
 
@@ -150,10 +254,9 @@ class NFA(AbstractFiniteAutomaton):
         :param symbol: Symbole de la transition
         :type symbol: str
         :return: Ensemble des états de destination
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        transition_key = (state, symbol)
-        return self._transitions.get(transition_key, set()).copy()
+        return self._transitions.get((state, symbol), frozenset())
 
     def is_final_state(self, state: str) -> bool:
         """
@@ -166,12 +269,12 @@ class NFA(AbstractFiniteAutomaton):
         """
         return state in self._final_states
 
-    def get_reachable_states(self) -> Set[str]:
+    def get_reachable_states(self) -> FrozenSet[str]:
         """
         Récupère tous les états accessibles depuis l'état initial.
 
         :return: Ensemble des états accessibles
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
         return self.get_accessible_states()
 
@@ -184,33 +287,7 @@ class NFA(AbstractFiniteAutomaton):
         :return: True si le mot est accepté, False sinon
         :rtype: bool
         """
-        # Ensemble des états courants (commence par l'état initial)
-        current_states = {self._initial_state}
-
-        # Appliquer les fermetures epsilon au début
-        current_states = self._epsilon_closure(current_states)
-
-        # Pour chaque symbole du mot
-        for symbol in word:
-            if symbol not in self._alphabet:
-                return False
-
-            # Calculer les nouveaux états possibles
-            next_states = set()
-            for state in current_states:
-                transition_key = (state, symbol)
-                if transition_key in self._transitions:
-                    next_states.update(self._transitions[transition_key])
-
-            # Appliquer les fermetures epsilon après chaque transition
-            current_states = self._epsilon_closure(next_states)
-
-            # Si aucun état n'est possible, le mot est rejeté
-            if not current_states:
-                return False
-
-        # Vérifier si au moins un état final est atteint
-        return bool(current_states.intersection(self._final_states))
+        return self._indexed_form().accepts(word, self._alphabet)
 
     def _epsilon_closure(self, states: Set[str]) -> Set[str]:
         """
@@ -237,71 +314,54 @@ class NFA(AbstractFiniteAutomaton):
 
         return closure
 
-    def get_accessible_states(self) -> Set[str]:
+    def get_accessible_states(self) -> FrozenSet[str]:
         """
         Récupère tous les états accessibles depuis l'état initial.
 
+        Le résultat est calculé une seule fois puis mis en cache.
+
         :return: Ensemble des états accessibles
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        accessible = set()
-        to_visit = {self._initial_state}
-
-        while to_visit:
-            current = to_visit.pop()
-            if current in accessible:
-                continue
-
-            accessible.add(current)
+        return StructuralAnalysis.of(self).reachable
 
-            # Ajouter tous les états accessibles depuis l'état actuel
-            for symbol in self._alphabet:
-                transition_key = (current, symbol)
-                if transition_key in self._transitions:
-                    for next_state in self._transitions[transition_key]:
-                        if next_state not in accessible:
-                            to_visit.add(next_state)
-
-        return accessible
-
-    def get_coaccessible_states(self) -> Set[str]:
+    def get_coaccessible_states(self) -> FrozenSet[str]:
         """
         Récupère tous les états cœurs (pouvant atteindre un état final).
 
+        Le parcours remonte l'index inverse des transitions, mis en cache.
+
         :return: Ensemble des états cœurs
-        :rtype: Set[str]
+        :rtype: FrozenSet[str]
         """
-        coaccessible = set()
-        to_visit = set(self._final_states)
+        return StructuralAnalysis.of(self).coreachable
 
-        while to_visit:
-            current = to_visit.pop()
-            if current in coaccessible:
-                continue
+    def get_useful_states(self) -> FrozenSet[str]:
+        """
+        Récupère tous les états utiles (accessibles et cœurs).
 
-            coaccessible.add(current)
+        :return: Ensemble des états utiles
+        :rtype: FrozenSet[str]
+        """
+        return StructuralAnalysis.of(self).useful
 
-            # Trouver tous les états qui peuvent atteindre l'état actuel
-            for state in self._states:
-                for symbol in self._alphabet:
-                    transition_key = (state, symbol)
-                    if transition_key in self._transitions:
-                        if current in self._transitions[transition_key]:
-                            if state not in coaccessible:
-                                to_visit.add(state)
+    def is_deterministic(self) -> bool:
+        """
+        Vérifie si le NFA est déterministe (sans epsilon ni choix multiple).
 
-        return coaccessible
+        :return: True si le NFA est déterministe
+        :rtype: bool
+        """
+        return StructuralAnalysis.of(self).is_deterministic
 
-    def get_useful_states(self) -> Set[str]:
+    def reverse(self) -> "NFA":
         """
-        Récupère tous les états utiles (accessibles et cœurs).
+        Construit l'automate miroir, qui accepte les mots retournés.
 
-        :return: Ensemble des états utiles
-        :rtype: Set[str]
+        :return: NFA acceptant le langage miroir
+        :rtype: NFA
         """
-        accessible = self.get_accessible_states()
-        coaccessible = self.get_coaccessible_states()
-        return accessible.intersection(coaccessible)
+        return _reverse_automaton(self)
 
     def to_dfa(self) -> "DFA":
         """
@@ -314,64 +374,56 @@ class NFA(AbstractFiniteAutomaton):
             # Import local pour éviter les dépendances circulaires
             from ..dfa import DFA
 
-            # État initial du DFA (sous-ensemble contenant l'état initial du NFA)
-            dfa_initial = frozenset({self._initial_state})
+            indexed = self._indexed_form()
+            delta = indexed.delta
+            symbols = sorted(self._alphabet - {EPSILON})
 
-            # États du DFA (sous-ensembles d'états du NFA)
-            dfa_states = {dfa_initial}
-            dfa_transitions = {}
-
-            # File d'attente pour traiter les nouveaux états
-            to_process = [dfa_initial]
+            # Les transitions epsilon sont absorbées par fermeture
+            if any(EPSILON in row for row in delta):
+                close = indexed.epsilon_closure
+            else:
+                close = None
 
-            while to_process:
-                current_dfa_state = to_process.pop(0)
+            # Sous-ensembles d'états du NFA, numérotés dans l'ordre de découverte
+            dfa_initial = frozenset(
+                close({indexed.initial}) if close else {indexed.initial}
+            )
+            subsets = {dfa_initial: 0}
+            order = [dfa_initial]
+            dfa_transitions = {}
 
-                # Pour chaque symbole de l'alphabet
-                for symbol in self._alphabet:
-                    # Calculer l'union des transitions du NFA
+            position = 0
+            while position < len(order):
+                current = order[position]
+                for symbol in symbols:
                     next_states = set()
-                    for nfa_state in current_dfa_state:
-                        transition_key = (nfa_state, symbol)
-                        if transition_key in self._transitions:
-                            next_states.update(self._transitions[transition_key])
+                    for nfa_state in current:
+                        targets = delta[nfa_state].get(symbol)
+                        if targets:
+                            next_states.update(targets)
 
                     if next_states:
-                        next_dfa_state = frozenset(next_states)
-
-                        # Ajouter le nouvel état s'il n'existe pas
-                        if next_dfa_state not in dfa_states:
-                            dfa_states.add(next_dfa_state)
-                            to_process.append(next_dfa_state)
-
-                        # Ajouter la transition
-                        dfa_transitions[(current_dfa_state, symbol)] = next_dfa_state
-
-            # Créer les noms d'états pour le DFA
-            state_names = {}
-            for i, state_set in enumerate(dfa_states):
-                state_names[state_set] = f"q{i}"
-
-            # Construire le DFA
-            dfa_states_set = {state_names[state] for state in dfa_states}
-            dfa_alphabet = self._alphabet.copy()
-            dfa_transitions_dict = {
-                (state_names[source], symbol): state_names[target]
-                for (source, symbol), target in dfa_transitions.items()
-            }
-            dfa_initial_state = state_names[dfa_initial]
-            dfa_final_states = {
-                state_names[state]
-                for state in dfa_states
-                if state.intersection(self._final_states)
-            }
-
-            return DFA(
-                states=dfa_states_set,
-                alphabet=dfa_alphabet,
-                transitions=dfa_transitions_dict,
-                initial_state=dfa_initial_state,
-                final_states=dfa_final_states,
+                        next_subset = frozenset(
+                            close(next_states) if close else next_states
+                        )
+                        if next_subset not in subsets:
+                            subsets[next_subset] = len(order)
+                            order.append(next_subset)
+                        dfa_transitions[
+                            (f"q{position}", symbol)
+                        ] = f"q{subsets[next_subset]}"
+                position += 1
+
+            return DFA._from_trusted(
+                frozenset(f"q{i}" for i in range(len(order))),
+                frozenset(symbols),
+                dfa_transitions,
+                "q0",
+                frozenset(
+                    f"q{i}"
+                    for i, subset in enumerate(order)
+                    if not indexed.finals.isdisjoint(subset)
+                ),
             )
 
         except Exception as e:
@@ -386,49 +438,10 @@ class NFA(AbstractFiniteAutomaton):
         :return: NFA acceptant l'union des langages
         :rtype: NFA
         """
-        # Créer un nouvel état initial
-        new_initial = "q0_union"
-
-        # Combiner les états (avec préfixes pour éviter les conflits)
-        new_states = {new_initial}
-        new_states.update(f"nfa1_{state}" for state in self._states)
-        new_states.update(f"nfa2_{state}" for state in other._states)
-
-        # Combiner les alphabets
-        new_alphabet = self._alphabet.union(other._alphabet)
-
-        # Combiner les transitions
-        new_transitions = {}
-
-        # Transitions du premier NFA
-        for (source, symbol), targets in self._transitions.items():
-            new_source = f"nfa1_{source}"
-            new_targets = {f"nfa1_{target}" for target in targets}
-            new_transitions[(new_source, symbol)] = new_targets
-
-        # Transitions du second NFA
-        for (source, symbol), targets in other._transitions.items():
-            new_source = f"nfa2_{source}"
-            new_targets = {f"nfa2_{target}" for target in targets}
-            new_transitions[(new_source, symbol)] = new_targets
-
-        # Ajouter les transitions depuis le nouvel état initial
-        new_transitions[(new_initial, "epsilon")] = {
-            f"nfa1_{self._initial_state}",
-            f"nfa2_{other._initial_state}",
-        }
-
-        # Combiner les états finaux
-        new_final_states = {f"nfa1_{state}" for state in self._final_states}
-        new_final_states.update(f"nfa2_{state}" for state in other._final_states)
-
-        return NFA(
-            states=new_states,
-            alphabet=new_alphabet,
-            transitions=new_transitions,
-            initial_state=new_initial,
-            final_states=new_final_states,
+        indexed = IndexedAutomaton.union(
+            self._indexed_form(), other._indexed_form(), "q0_union", ("nfa1_", "nfa2_")
         )
+        return NFA._from_indexed(indexed, self._alphabet.union(other._alphabet))
 
     def concatenation(self, other: "NFA") -> "NFA":
         """
@@ -439,48 +452,10 @@ class NFA(AbstractFiniteAutomaton):
         :return: NFA acceptant la concaténation des langages
         :rtype: NFA
         """
-        # Combiner les états (avec préfixes pour éviter les conflits)
-        new_states = {f"nfa1_{state}" for state in self._states}
-        new_states.update(f"nfa2_{state}" for state in other._states)
-
-        # Combiner les alphabets
-        new_alphabet = self._alphabet.union(other._alphabet)
-
-        # Combiner les transitions
-        new_transitions = {}
-
-        # Transitions du premier NFA
-        for (source, symbol), targets in self._transitions.items():
-            new_source = f"nfa1_{source}"
-            new_targets = {f"nfa1_{target}" for target in targets}
-            new_transitions[(new_source, symbol)] = new_targets
-
-        # Transitions du second NFA
-        for (source, symbol), targets in other._transitions.items():
-            new_source = f"nfa2_{source}"
-            new_targets = {f"nfa2_{target}" for target in targets}
-            new_transitions[(new_source, symbol)] = new_targets
-
-        # Connecter les états finaux du premier NFA à l'état initial du second
-        for final_state in self._final_states:
-            transition_key = (f"nfa1_{final_state}", "epsilon")
-            if transition_key not in new_transitions:
-                new_transitions[transition_key] = set()
-            new_transitions[transition_key].add(f"nfa2_{other._initial_state}")
-
-        # Nouvel état initial (celui du premier NFA)
-        new_initial = f"nfa1_{self._initial_state}"
-
-        # Nouveaux états finaux (ceux du second NFA)
-        new_final_states = {f"nfa2_{state}" for state in other._final_states}
-
-        return NFA(
-            states=new_states,
-            alphabet=new_alphabet,
-            transitions=new_transitions,
-            initial_state=new_initial,
-            final_states=new_final_states,
+        indexed = IndexedAutomaton.concatenation(
+            self._indexed_form(), other._indexed_form(), ("nfa1_", "nfa2_")
         )
+        return NFA._from_indexed(indexed, self._alphabet.union(other._alphabet))
 
     def kleene_star(self) -> "NFA":
         """
@@ -489,40 +464,10 @@ class NFA(AbstractFiniteAutomaton):
         :return: NFA acceptant l'étoile de Kleene du langage
         :rtype: NFA
         """
-        # Créer un nouvel état initial
-        new_initial = "q0_star"
-
-        # Ajouter le nouvel état initial aux états
-        new_states = {new_initial}
-        new_states.update(self._states)
-
-        # Alphabet identique
-        new_alphabet = self._alphabet.copy()
-
-        # Copier les transitions existantes
-        new_transitions = {k: v.copy() for k, v in self._transitions.items()}
-
-        # Ajouter les transitions depuis le nouvel état initial
-        new_transitions[(new_initial, "epsilon")] = {self._initial_state}
-
-        # Connecter les états finaux à l'état initial
-        for final_state in self._final_states:
-            transition_key = (final_state, "epsilon")
-            if transition_key not in new_transitions:
-                new_transitions[transition_key] = set()
-            new_transitions[transition_key].add(self._initial_state)
-
-        # Nouveaux états finaux (ancien état initial + anciens états finaux)
-        new_final_states = {new_initial}
-        new_final_states.update(self._final_states)
-
-        return NFA(
-            states=new_states,
-            alphabet=new_alphabet,
-            transitions=new_transitions,
-            initial_state=new_initial,
-            final_states=new_final_states,
+        indexed = IndexedAutomaton.kleene_star(
+            self._indexed_form(), "q0_star", initial_first=False
         )
+        return NFA._from_indexed(indexed, self._alphabet)
 
     def validate(self) -> bool:
         """
@@ -555,6 +500,30 @@ class NFA(AbstractFiniteAutomaton):
         except Exception:
             return False
 
+    def to_matrix(self) -> Dict[str, np.ndarray]:
+        """
+        Matrices d'adjacence booléennes denses, une par symbole.
+
+        Les lignes et colonnes suivent l'ordre trié des noms d'états (voir
+        :attr:`TransitionMatrix.states`). La taille est quadratique : pour
+        les grands automates, préférer :meth:`to_csr`.
+
+        Le symbole « epsilon » éventuel a sa propre matrice.
+
+        :return: Symbole -> matrice booléenne (n x n)
+        :rtype: Dict[str, np.ndarray]
+        """
+        return self.to_csr().symbol_matrices()
+
+    def to_csr(self) -> TransitionMatrix:
+        """
+        Adjacence combinée au format CSR, avec analyses vectorisées.
+
+        :return: Vue matricielle de l'automate
+        :rtype: TransitionMatrix
+        """
+        return TransitionMatrix.from_automaton(self)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Sérialise l'automate en dictionnaire.
@@ -607,7 +576,8 @@ class NFA(AbstractFiniteAutomaton):
         :return: Représentation string de l'automate
         :rtype: str
         """
-        return f"NFA(states={len(self._states)}, transitions={len(self._transitions)})"
+        indexed = self._indexed_form()
+        return f"NFA(states={indexed.size}, transitions={indexed.transition_count()})"
 
     def __repr__(self) -> str:
         """
@@ -617,7 +587,41 @@ class NFA(AbstractFiniteAutomaton):
         :rtype: str
         """
         return (
-            f"NFA(states={self._states}, alphabet={self._alphabet}, "
-            f"initial_state='{self._initial_state}', final_states={self._final_states}, "
+            f"NFA(states={set(self._states)}, alphabet={set(self._alphabet)}, "
+            f"initial_state='{self._initial_state}', "
+            f"final_states={set(self._final_states)}, "
             f"transitions={self._transitions})"
         )
+
+
+def _reverse_automaton(automaton: AbstractFiniteAutomaton) -> NFA:
+    """Construit le miroir d'un DFA ou d'un NFA à partir de l'index inverse."""
+    analysis = StructuralAnalysis.of(automaton)
+    transitions = {
+        (target, symbol): sources
+        for target, row in analysis.reverse_index.items()
+        for symbol, sources in row.items()
+    }
+    states = automaton.states
+    alphabet = automaton.alphabet
+    final_states = automaton.final_states
+
+    if len(final_states) == 1:
+        # Un seul état final : il devient directement l'état initial
+        (initial_state,) = final_states
+    else:
+        initial_state = "reverse_initial"
+        while initial_state in states:
+            initial_state += "_"
+        states = states | {initial_state}
+        alphabet = alphabet | {"epsilon"}
+        if final_states:
+            transitions[(initial_state, "epsilon")] = final_states
+
+    return NFA._from_trusted(
+        states,
+        alphabet,
+        transitions,
+        initial_state,
+        frozenset((automaton.initial_state,)),
+    )
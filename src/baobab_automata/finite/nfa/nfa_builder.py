@@ -0,0 +1,70 @@
+"""
+Constructeur en masse d'automates finis non-déterministes.
+
+Ce module contient la classe NFABuilder qui produit un NFA figé en temps
+linéaire à partir de transitions ajoutées une à une ou par tableaux NumPy.
+"""
+
+from typing import Dict, Set, Tuple
+
+from ..automaton_builder import AutomatonBuilder
+from .nfa import NFA
+from .nfa_exceptions import InvalidNFAError, InvalidTransitionError
+
+
+class NFABuilder(AutomatonBuilder):
+    """
+    Constructeur incrémental de NFA.
+
+    Plusieurs transitions peuvent partir du même couple (état, symbole) ;
+    les transitions epsilon utilisent le symbole « epsilon », qui doit alors
+    figurer dans l'alphabet.
+
+    :param alphabet: Alphabet de l'automate
+    :type alphabet: Iterable[str]
+    :param expected_states: Nombre d'états prévu (préallocation)
+    :type expected_states: int
+    :param expected_transitions: Nombre de transitions prévu (préallocation)
+    :type expected_transitions: int
+    """
+
+    _automaton_error = InvalidNFAError
+    _transition_error = InvalidTransitionError
+
+    def build(self, validate: bool = True) -> NFA:
+        """
+        Produit le NFA figé.
+
+        :param validate: Vérifie la cohérence avant construction ; avec False,
+            la vérification est différée (voir :meth:`NFA.validate`)
+        :type validate: bool
+        :return: NFA construit sans copie supplémentaire
+        :rtype: NFA
+        :raises InvalidNFAError: Si la validation échoue
+        """
+        if validate:
+            self.validate()
+        elif self._initial is None:
+            raise InvalidNFAError("Initial state is missing")
+
+        names = self._state_names()
+        symbols = self._symbols
+        sources, labels, targets = self._transition_arrays()
+        grouped: Dict[Tuple[str, str], Set[str]] = {}
+        for source, label, target in zip(
+            sources.tolist(), labels.tolist(), targets.tolist()
+        ):
+            key = (names[source], symbols[label])
+            bucket = grouped.get(key)
+            if bucket is None:
+                grouped[key] = {names[target]}
+            else:
+                bucket.add(names[target])
+
+        return NFA._from_trusted(
+            frozenset(names),
+            frozenset(symbols),
+            {key: frozenset(bucket) for key, bucket in grouped.items()},
+            names[self._initial],
+            frozenset(names[index] for index in self._final_indices()),
+        )
@@ -7,10 +7,11 @@ en expressions régulières.
 """
 
 import re
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ..abstract_finite_automaton import AbstractFiniteAutomaton
 from ..dfa import DFA
+from ..interval import CharClass, IntervalNFA, InvalidCharClassError
 from ..nfa import EpsilonNFA
 from ..nfa import NFA
 from .regex_ast import ASTNode, NodeType
@@ -30,18 +31,29 @@ class RegexParser:
     Cette classe fournit un parser complet d'expressions régulières avec
     support pour la construction d'automates et la conversion bidirectionnelle.
 
+    En mode Unicode, tout caractère (hors opérateurs) est un littéral, les
+    classes entre crochets et le point sont supportés, et l'automate produit
+    est un IntervalDFA dont les transitions sont des intervalles de points
+    de code.
+
     :param alphabet: Alphabet supporté par le parser
     :type alphabet: Optional[Set[str]]
+    :param unicode: Active le mode Unicode à transitions par intervalles
+    :type unicode: bool
     """
 
-    def __init__(self, alphabet: Optional[Set[str]] = None) -> None:
+    def __init__(
+        self, alphabet: Optional[Set[str]] = None, unicode: bool = False
+    ) -> None:
         """
         Initialise le parser d'expressions régulières.
 
         :param alphabet: Alphabet supporté par le parser
+        :param unicode: Active le mode Unicode à transitions par intervalles
         """
         # Alphabet par défaut : lettres minuscules et chiffres
         self.alphabet = alphabet or set("abcdefghijklmnopqrstuvwxyz0123456789")
+        self.unicode = unicode
 
         # Opérateurs supportés
         self.operators = {".", "|", "*", "+", "?", "(", ")"}
@@ -84,7 +96,10 @@ class RegexParser:
             ast = self._parse_expression(tokens)
 
             # Construire l'automate
-            automaton = self._build_automaton(ast)
+            if self.unicode:
+                automaton = self._build_interval_automaton(ast)
+            else:
+                automaton = self._build_automaton(ast)
 
             # Optimiser l'automate
             automaton = self._optimize_automaton(automaton)
@@ -109,6 +124,9 @@ class RegexParser:
         :rtype: List[Token]
         :raises RegexSyntaxError: Si un caractère invalide est trouvé
         """
+        if self.unicode:
+            return self._tokenize_unicode(regex)
+
         tokens = []
         i = 0
 
@@ -158,6 +176,82 @@ class RegexParser:
         tokens.append(Token(TokenType.EOF, "", len(regex)))
         return tokens
 
+    def _tokenize_unicode(self, regex: str) -> List[Token]:
+        """
+        Tokenise une expression régulière en mode Unicode.
+
+        Les littéraux portent une spécification de CharClass : un caractère,
+        une séquence échappée (``\\d``, ``\\W``, ``\\.``) ou une classe
+        entre crochets. Le point désigne tout caractère sauf le saut de ligne.
+
+        :param regex: Expression régulière à tokeniser
+        :type regex: str
+        :return: Liste des tokens
+        :rtype: List[Token]
+        :raises RegexSyntaxError: Si l'expression est mal formée
+        """
+        operators = {
+            "|": TokenType.UNION,
+            "*": TokenType.KLEENE_STAR,
+            "+": TokenType.KLEENE_PLUS,
+            "?": TokenType.OPTIONAL,
+            "(": TokenType.LEFT_PAREN,
+            ")": TokenType.RIGHT_PAREN,
+        }
+        named = {"d": TokenType.DIGIT, "w": TokenType.WORD, "s": TokenType.SPACE}
+        tokens = []
+        i = 0
+
+        while i < len(regex):
+            char = regex[i]
+
+            if char in operators:
+                tokens.append(Token(operators[char], char, i))
+            elif char == ".":
+                tokens.append(Token(TokenType.LITERAL, "[^\n]", i))
+            elif char == "\\":
+                if i + 1 >= len(regex):
+                    raise RegexSyntaxError(
+                        "Caractère d'échappement incomplet", i, regex
+                    )
+                next_char = regex[i + 1]
+                token_type = named.get(next_char, TokenType.LITERAL)
+                tokens.append(Token(token_type, "\\" + next_char, i))
+                i += 1
+            elif char == "[":
+                end = self._find_bracket_end(regex, i)
+                spec = regex[i : end + 1]
+                try:
+                    CharClass.parse(spec)
+                except InvalidCharClassError as e:
+                    raise RegexSyntaxError(str(e), i, regex) from e
+                tokens.append(Token(TokenType.LITERAL, spec, i))
+                i = end
+            else:
+                tokens.append(Token(TokenType.LITERAL, char, i))
+
+            i += 1
+
+        tokens.append(Token(TokenType.EOF, "", len(regex)))
+        return tokens
+
+    def _find_bracket_end(self, regex: str, start: int) -> int:
+        """Retourne l'indice du crochet fermant d'une classe ouverte en start."""
+        i = start + 1
+        if i < len(regex) and regex[i] == "^":
+            i += 1
+        # Un ']' en tête de classe est littéral
+        if i < len(regex) and regex[i] == "]":
+            i += 1
+        while i < len(regex):
+            if regex[i] == "\\":
+                i += 2
+                continue
+            if regex[i] == "]":
+                return i
+            i += 1
+        raise RegexSyntaxError("Classe de caractères non fermée", start, regex)
+
     def _parse_expression(self, tokens: List[Token]) -> ASTNode:
         """
         Parse une expression régulière en utilisant l'algorithme récursive descent.
@@ -301,6 +395,92 @@ class RegexParser:
             conversion_step="build_automaton",
         )
 
+    def _build_interval_automaton(self, node: ASTNode) -> IntervalNFA:
+        """
+        Construit un NFA à intervalles par la construction de Thompson.
+
+        Le parcours est itératif pour supporter les expressions longues, et
+        chaque littéral devient une seule transition étiquetée par sa classe.
+
+        :param node: Nœud racine de l'AST
+        :type node: ASTNode
+        :return: NFA à intervalles correspondant à l'AST
+        :rtype: IntervalNFA
+        """
+        transitions: Dict[Tuple[str, CharClass], Set[str]] = {}
+        epsilon: Dict[str, Set[str]] = {}
+        states: List[str] = []
+
+        def new_state() -> str:
+            state = f"q{len(states)}"
+            states.append(state)
+            return state
+
+        def link(source: str, target: str) -> None:
+            epsilon.setdefault(source, set()).add(target)
+
+        # Fragments (début, fin) des nœuds déjà construits
+        fragments: List[Tuple[str, str]] = []
+        stack: List[Tuple[ASTNode, bool]] = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if not expanded and current.children:
+                stack.append((current, True))
+                for child in reversed(current.children):
+                    stack.append((child, False))
+                continue
+
+            if current.type == NodeType.GROUP:
+                continue
+
+            if current.type == NodeType.CONCATENATION:
+                right_start, right_end = fragments.pop()
+                left_start, left_end = fragments.pop()
+                link(left_end, right_start)
+                fragments.append((left_start, right_end))
+                continue
+
+            start, end = new_state(), new_state()
+            if current.type == NodeType.LITERAL:
+                value = current.value
+                char_class = (
+                    CharClass.from_char(value)
+                    if len(value) == 1
+                    else CharClass.parse(value)
+                )
+                transitions[(start, char_class)] = {end}
+            elif current.type == NodeType.EPSILON:
+                link(start, end)
+            elif current.type == NodeType.EMPTY:
+                pass
+            elif current.is_binary():
+                right_start, right_end = fragments.pop()
+                left_start, left_end = fragments.pop()
+                link(start, left_start)
+                link(start, right_start)
+                link(left_end, end)
+                link(right_end, end)
+            elif current.is_unary():
+                inner_start, inner_end = fragments.pop()
+                link(start, inner_start)
+                link(inner_end, end)
+                if current.type in (NodeType.KLEENE_STAR, NodeType.OPTIONAL):
+                    link(start, end)
+                if current.type in (NodeType.KLEENE_STAR, NodeType.KLEENE_PLUS):
+                    link(inner_end, inner_start)
+            else:
+                node_type_str = getattr(current.type, "value", str(current.type))
+                raise RegexConversionError(
+                    f"Type de nœud non supporté: {node_type_str}",
+                    conversion_step="build_interval_automaton",
+                )
+            fragments.append((start, end))
+
+        initial_state, final_state = fragments.pop()
+        return IntervalNFA(
+            set(states), transitions, initial_state, {final_state}, epsilon
+        )
+
     def _build_literal_automaton(self, node: ASTNode) -> AbstractFiniteAutomaton:
         """Construit un automate pour un littéral."""
         if node.type == NodeType.LITERAL:
@@ -448,13 +628,16 @@ class RegexParser:
         :return: Automate optimisé
         :rtype: AbstractFiniteAutomaton
         """
+        if isinstance(automaton, IntervalNFA):
+            return automaton.to_dfa().minimize()
+
         # Pour l'instant, retourne l'automate tel quel
         # L'optimisation sera implémentée plus tard
         return automaton
 
     def automaton_to_regex(self, automaton: AbstractFiniteAutomaton) -> str:
         """
-        Convertit un automate en expression régulière.
+        Convertit un automate en expression régulière par élimination d'états.
 
         :param automaton: Automate à convertir
         :type automaton: AbstractFiniteAutomaton
@@ -462,10 +645,11 @@ class RegexParser:
         :rtype: str
         :raises RegexConversionError: Si la conversion échoue
         """
+        # Import local : le module d'algorithmes dépend du package finite
+        from ...algorithms.finite.state_elimination import StateElimination
+
         try:
-            # Algorithme de Kleene simplifié
-            # À implémenter complètement
-            return "a*"  # Placeholder
+            return StateElimination.to_regex(automaton)
         except Exception as e:
             raise RegexConversionError(
                 f"Erreur lors de la conversion: {str(e)}",
@@ -514,6 +698,7 @@ class RegexParser:
         """
         return {
             "alphabet": list(self.alphabet),
+            "unicode": self.unicode,
             "operators": list(self.operators),
             "precedence": self.precedence,
         }
@@ -529,7 +714,7 @@ class RegexParser:
         :rtype: RegexParser
         """
         alphabet = set(data.get("alphabet", []))
-        parser = cls(alphabet)
+        parser = cls(alphabet, unicode=data.get("unicode", False))
         parser.operators = set(data.get("operators", parser.operators))
         parser.precedence = data.get("precedence", parser.precedence)
         return parser
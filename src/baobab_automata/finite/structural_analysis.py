@@ -0,0 +1,346 @@
+"""
+Analyses structurelles mises en cache pour les automates finis.
+
+Ce module contient la classe StructuralAnalysis qui calcule à la demande,
+une seule fois par automate, l'index inverse des transitions, les états
+accessibles et co-accessibles, les états puits, les états universellement
+acceptants et le déterminisme.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+# Index inverse : état cible -> symbole -> états sources
+ReverseIndex = Dict[str, Dict[str, FrozenSet[str]]]
+
+
+class StructuralAnalysis:
+    """
+    Analyses structurelles paresseuses d'un automate fini.
+
+    Chaque analyse est calculée au premier accès puis conservée. L'instance
+    est attachée à l'automate par :meth:`of` et reconstruite dès que les
+    structures de l'automate sont remplacées (ou supprimée par :meth:`drop`).
+
+    :param states: Ensemble des états
+    :type states: FrozenSet[str]
+    :param initial_state: État initial
+    :type initial_state: str
+    :param final_states: États finaux
+    :type final_states: FrozenSet[str]
+    :param transitions: Transitions (état, symbole) -> cible ou ensemble de cibles
+    :type transitions: Mapping[Tuple[str, str], Any]
+    :param symbols: Symboles suivis par les parcours (alphabet, epsilon inclus)
+    :type symbols: FrozenSet[str]
+    :param epsilon_symbol: Symbole epsilon éventuel
+    :type epsilon_symbol: Optional[str]
+    """
+
+    def __init__(
+        self,
+        states: FrozenSet[str],
+        initial_state: str,
+        final_states: FrozenSet[str],
+        transitions: Mapping[Tuple[str, str], Any],
+        symbols: FrozenSet[str],
+        epsilon_symbol: Optional[str] = None,
+    ) -> None:
+        """
+        Initialise l'analyse sans rien calculer.
+
+        :param states: Ensemble des états
+        :type states: FrozenSet[str]
+        :param initial_state: État initial
+        :type initial_state: str
+        :param final_states: États finaux
+        :type final_states: FrozenSet[str]
+        :param transitions: Transitions (état, symbole) -> cible ou ensemble de cibles
+        :type transitions: Mapping[Tuple[str, str], Any]
+        :param symbols: Symboles suivis par les parcours
+        :type symbols: FrozenSet[str]
+        :param epsilon_symbol: Symbole epsilon éventuel
+        :type epsilon_symbol: Optional[str]
+        """
+        self._states = states
+        self._initial_state = initial_state
+        self._final_states = final_states
+        self._transitions = transitions
+        self._symbols = symbols
+        self._epsilon_symbol = epsilon_symbol
+
+        self._successors: Optional[Dict[str, Set[str]]] = None
+        self._reverse_index: Optional[ReverseIndex] = None
+        self._reachable: Optional[FrozenSet[str]] = None
+        self._coreachable: Optional[FrozenSet[str]] = None
+        self._useful: Optional[FrozenSet[str]] = None
+        self._dead_states: Optional[FrozenSet[str]] = None
+        self._universal_states: Optional[FrozenSet[str]] = None
+        self._deterministic: Optional[bool] = None
+
+    # ==================== ATTACHEMENT ====================
+
+    @classmethod
+    def of(cls, automaton: Any) -> "StructuralAnalysis":
+        """
+        Retourne l'analyse attachée à un automate, en la créant si besoin.
+
+        L'analyse est invalidée si les ensembles d'états ou la fonction de
+        transition de l'automate ont été remplacés depuis sa création.
+
+        :param automaton: DFA, NFA ou ε-NFA
+        :type automaton: AbstractFiniteAutomaton
+        :return: Analyse structurelle de l'automate
+        :rtype: StructuralAnalysis
+        """
+        transitions = getattr(automaton, "_transitions", None)
+        if transitions is None:
+            # Automate sans représentation interne connue : non mis en cache
+            return cls._from_public_api(automaton)
+
+        analysis = automaton.__dict__.get("_structural_analysis")
+        if (
+            analysis is None
+            or analysis._transitions is not transitions
+            or analysis._states is not automaton._states
+            or analysis._final_states is not automaton._final_states
+        ):
+            epsilon_symbol = getattr(automaton, "epsilon_symbol", None)
+            symbols = frozenset(automaton._alphabet)
+            if epsilon_symbol is not None:
+                symbols = symbols | {epsilon_symbol}
+            elif "epsilon" in symbols:
+                epsilon_symbol = "epsilon"
+            analysis = cls(
+                automaton._states,
+                automaton._initial_state,
+                automaton._final_states,
+                transitions,
+                symbols,
+                epsilon_symbol,
+            )
+            automaton.__dict__["_structural_analysis"] = analysis
+        return analysis
+
+    @staticmethod
+    def drop(automaton: Any) -> None:
+        """
+        Supprime l'analyse attachée à un automate (après une modification).
+
+        :param automaton: Automate concerné
+        :type automaton: AbstractFiniteAutomaton
+        """
+        automaton.__dict__.pop("_structural_analysis", None)
+
+    @classmethod
+    def _from_public_api(cls, automaton: Any) -> "StructuralAnalysis":
+        """Construit une analyse via get_transition(s) sur l'alphabet."""
+        alphabet = frozenset(automaton.alphabet)
+        getter = getattr(automaton, "get_transitions", None)
+        transitions: Dict[Tuple[str, str], Any] = {}
+        for state in automaton.states:
+            for symbol in alphabet:
+                targets = (
+                    getter(state, symbol)
+                    if getter is not None
+                    else automaton.get_transition(state, symbol)
+                )
+                if targets:
+                    transitions[(state, symbol)] = targets
+        return cls(
+            frozenset(automaton.states),
+            automaton.initial_state,
+            frozenset(automaton.final_states),
+            transitions,
+            alphabet,
+        )
+
+    # ==================== INDEX ====================
+
+    def _edges(self) -> Iterable[Tuple[str, str, Iterable[str]]]:
+        """Parcourt les transitions suivies sous la forme (source, symbole, cibles)."""
+        symbols = self._symbols
+        for (source, symbol), targets in self._transitions.items():
+            if symbol in symbols and targets:
+                if isinstance(targets, str):
+                    targets = (targets,)
+                yield source, symbol, targets
+
+    @property
+    def successors(self) -> Dict[str, Set[str]]:
+        """
+        Successeurs de chaque état, tous symboles confondus.
+
+        :return: État -> états successeurs
+        :rtype: Dict[str, Set[str]]
+        """
+        if self._successors is None:
+            successors: Dict[str, Set[str]] = {}
+            for source, _, targets in self._edges():
+                successors.setdefault(source, set()).update(targets)
+            self._successors = successors
+        return self._successors
+
+    @property
+    def reverse_index(self) -> ReverseIndex:
+        """
+        Index inverse des transitions, partagé par la co-accessibilité,
+        la minimisation et le miroir.
+
+        :return: État cible -> symbole -> états sources
+        :rtype: Dict[str, Dict[str, FrozenSet[str]]]
+        """
+        if self._reverse_index is None:
+            building: Dict[str, Dict[str, Set[str]]] = {}
+            for source, symbol, targets in self._edges():
+                for target in targets:
+                    building.setdefault(target, {}).setdefault(symbol, set()).add(
+                        source
+                    )
+            self._reverse_index = {
+                target: {symbol: frozenset(sources) for symbol, sources in row.items()}
+                for target, row in building.items()
+            }
+        return self._reverse_index
+
+    def predecessors(self, targets: Iterable[str], symbol: str) -> Set[str]:
+        """
+        États ayant une transition étiquetée par symbol vers l'une des cibles.
+
+        :param targets: États cibles
+        :type targets: Iterable[str]
+        :param symbol: Symbole de la transition
+        :type symbol: str
+        :return: États sources
+        :rtype: Set[str]
+        """
+        index = self.reverse_index
+        sources: Set[str] = set()
+        for target in targets:
+            row = index.get(target)
+            if row is not None:
+                sources.update(row.get(symbol, ()))
+        return sources
+
+    # ==================== ANALYSES ====================
+
+    @property
+    def reachable(self) -> FrozenSet[str]:
+        """
+        États accessibles depuis l'état initial.
+
+        :return: Ensemble des états accessibles
+        :rtype: FrozenSet[str]
+        """
+        if self._reachable is None:
+            successors = self.successors
+            seen = {self._initial_state}
+            stack: List[str] = [self._initial_state]
+            while stack:
+                for target in successors.get(stack.pop(), ()):
+                    if target not in seen:
+                        seen.add(target)
+                        stack.append(target)
+            self._reachable = frozenset(seen)
+        return self._reachable
+
+    @property
+    def coreachable(self) -> FrozenSet[str]:
+        """
+        États co-accessibles (depuis lesquels un état final est atteignable).
+
+        :return: Ensemble des états co-accessibles
+        :rtype: FrozenSet[str]
+        """
+        if self._coreachable is None:
+            index = self.reverse_index
+            seen = set(self._final_states)
+            stack = list(seen)
+            while stack:
+                for sources in index.get(stack.pop(), {}).values():
+                    for source in sources:
+                        if source not in seen:
+                            seen.add(source)
+                            stack.append(source)
+            self._coreachable = frozenset(seen)
+        return self._coreachable
+
+    @property
+    def useful(self) -> FrozenSet[str]:
+        """
+        États utiles (accessibles et co-accessibles).
+
+        :return: Ensemble des états utiles
+        :rtype: FrozenSet[str]
+        """
+        if self._useful is None:
+            self._useful = self.reachable & self.coreachable
+        return self._useful
+
+    @property
+    def dead_states(self) -> FrozenSet[str]:
+        """
+        États puits : aucun état final n'est atteignable depuis eux.
+
+        :return: Ensemble des états puits
+        :rtype: FrozenSet[str]
+        """
+        if self._dead_states is None:
+            self._dead_states = self._states - self.coreachable
+        return self._dead_states
+
+    @property
+    def universal_states(self) -> FrozenSet[str]:
+        """
+        États universellement acceptants : toute suite de symboles de
+        l'alphabet lue depuis eux est acceptée.
+
+        Un état est retenu s'il est final, possède une transition pour chaque
+        symbole et ne mène qu'à des états retenus (plus grand point fixe).
+        Pour un automate non déterministe, c'est une condition suffisante.
+
+        :return: Ensemble des états universellement acceptants
+        :rtype: FrozenSet[str]
+        """
+        if self._universal_states is None:
+            symbols = [
+                symbol for symbol in self._symbols if symbol != self._epsilon_symbol
+            ]
+            transitions = self._transitions
+            targets_of: Dict[str, Set[str]] = {}
+            for state in self._final_states:
+                targets: Set[str] = set()
+                for symbol in symbols:
+                    target = transitions.get((state, symbol))
+                    if not target:
+                        break
+                    targets.update((target,) if isinstance(target, str) else target)
+                else:
+                    targets_of[state] = targets
+
+            # Retrait itératif des états menant hors de l'ensemble candidat
+            candidates = set(targets_of)
+            changed = True
+            while changed:
+                changed = False
+                for state in list(candidates):
+                    if not targets_of[state] <= candidates:
+                        candidates.discard(state)
+                        changed = True
+            self._universal_states = frozenset(candidates)
+        return self._universal_states
+
+    @property
+    def is_deterministic(self) -> bool:
+        """
+        Indique si l'automate est déterministe (ni epsilon, ni choix multiple).
+
+        :return: True si l'automate est déterministe
+        :rtype: bool
+        """
+        if self._deterministic is None:
+            self._deterministic = all(
+                isinstance(targets, str)
+                or (len(targets) <= 1 and symbol != self._epsilon_symbol)
+                for (_, symbol), targets in self._transitions.items()
+                if targets
+            )
+        return self._deterministic
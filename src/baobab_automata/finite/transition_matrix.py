@@ -0,0 +1,504 @@
+"""
+Vue matricielle (NumPy) des transitions d'un automate fini.
+
+Ce module contient la classe TransitionMatrix, qui stocke l'adjacence d'un
+automate au format CSR (indptr, indices, data) construit avec NumPy seul.
+Les analyses (accessibilité, co-accessibilité, dénombrement des mots,
+finitude du langage) sont des produits creux vectorisés ; seules les
+frontières étroites (longues chaînes) sont parcourues en Python, où le coût
+fixe des appels NumPy dominerait. Elles passent à l'échelle de 10^5 états.
+Les automates non déterministes sont confiés à WordEnumeration, qui les
+déterminise : un mot reconnu par plusieurs chemins n'y compte qu'une fois.
+"""
+
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from .indexed_automaton import EPSILON
+
+# Au-delà de cette borne, les comptes passent en entiers Python
+_INT64_LIMIT = 2**62
+
+# Taille maximale pour l'exponentiation rapide sur matrice dense
+_DENSE_LIMIT = 512
+
+# En deçà de cette taille, une frontière est traitée sans NumPy
+_NARROW_FRONTIER = 64
+
+
+class TransitionMatrix:
+    """
+    Adjacence creuse (CSR) d'un automate fini.
+
+    Les états sont numérotés dans l'ordre trié de leurs noms et les symboles
+    dans l'ordre trié de l'alphabet. La matrice combinée A compte, pour
+    chaque couple (i, j), le nombre de symboles menant de i à j ; les
+    symboles de chaque arc restent disponibles pour les vues par symbole.
+
+    :param states: Noms des états, par indice
+    :type states: List[str]
+    :param symbols: Symboles, par indice
+    :type symbols: List[str]
+    :param sources: Indices des états sources des arcs
+    :type sources: np.ndarray
+    :param labels: Indices des symboles des arcs
+    :type labels: np.ndarray
+    :param targets: Indices des états cibles des arcs
+    :type targets: np.ndarray
+    :param initial: Indice de l'état initial
+    :type initial: int
+    :param finals: Masque des états finaux
+    :type finals: np.ndarray
+    :param automaton: Automate source (à défaut, reconstruit depuis les arcs)
+    :type automaton: Optional[Any]
+    """
+
+    def __init__(
+        self,
+        states: List[str],
+        symbols: List[str],
+        sources: np.ndarray,
+        labels: np.ndarray,
+        targets: np.ndarray,
+        initial: int,
+        finals: np.ndarray,
+        automaton: Optional[Any] = None,
+    ) -> None:
+        """
+        Construit la matrice CSR à partir des arcs étiquetés.
+
+        :param states: Noms des états, par indice
+        :type states: List[str]
+        :param symbols: Symboles, par indice
+        :type symbols: List[str]
+        :param sources: Indices des états sources des arcs
+        :type sources: np.ndarray
+        :param labels: Indices des symboles des arcs
+        :type labels: np.ndarray
+        :param targets: Indices des états cibles des arcs
+        :type targets: np.ndarray
+        :param initial: Indice de l'état initial
+        :type initial: int
+        :param finals: Masque des états finaux
+        :type finals: np.ndarray
+        :param automaton: Automate source (à défaut, reconstruit depuis les arcs)
+        :type automaton: Optional[Any]
+        """
+        self._states = states
+        self._symbols = symbols
+        self._initial = initial
+        self._finals = finals
+        self._automaton = automaton
+        size = len(states)
+
+        order = np.lexsort((labels, targets, sources))
+        self._edge_sources = sources[order]
+        self._edge_labels = labels[order]
+        self._edge_targets = targets[order]
+
+        # Fusion des arcs parallèles : data = nombre de symboles par couple
+        keys = self._edge_sources * max(size, 1) + self._edge_targets
+        keys, counts = np.unique(keys, return_counts=True)
+        rows = keys // max(size, 1)
+        self._indices = keys % max(size, 1)
+        self._data = counts.astype(np.int64)
+        self._indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=size), out=self._indptr[1:])
+        self._rows = rows
+        self._transpose: Optional["TransitionMatrix"] = None
+        self._adjacency: Optional[Tuple[List[int], List[int]]] = None
+
+    @classmethod
+    def from_automaton(cls, automaton: Any) -> "TransitionMatrix":
+        """
+        Construit la vue matricielle d'un DFA ou d'un NFA.
+
+        Les transitions d'un NFA (ensembles de cibles) donnent un arc par
+        cible ; le symbole epsilon éventuel, absent de l'alphabet, reçoit son
+        propre indice.
+
+        :param automaton: Automate fini (DFA ou NFA)
+        :type automaton: Any
+        :return: Vue matricielle
+        :rtype: TransitionMatrix
+        """
+        states = sorted(automaton.states)
+        index = {state: number for number, state in enumerate(states)}
+        symbols = sorted(
+            set(automaton.alphabet) | {symbol for _, symbol in automaton.transitions}
+        )
+        symbol_index = {symbol: number for number, symbol in enumerate(symbols)}
+
+        sources: List[int] = []
+        labels: List[int] = []
+        targets: List[int] = []
+        for (source, symbol), target in automaton.transitions.items():
+            for destination in (target,) if isinstance(target, str) else target:
+                sources.append(index[source])
+                labels.append(symbol_index[symbol])
+                targets.append(index[destination])
+
+        finals = np.zeros(len(states), dtype=bool)
+        finals[[index[state] for state in automaton.final_states]] = True
+        return cls(
+            states,
+            symbols,
+            np.asarray(sources, dtype=np.int64),
+            np.asarray(labels, dtype=np.int64),
+            np.asarray(targets, dtype=np.int64),
+            index[automaton.initial_state],
+            finals,
+            automaton,
+        )
+
+    # ==================== PROPRIÉTÉS ====================
+
+    @property
+    def states(self) -> List[str]:
+        """
+        Noms des états, dans l'ordre des lignes.
+
+        :return: Noms des états
+        :rtype: List[str]
+        """
+        return self._states
+
+    @property
+    def symbols(self) -> List[str]:
+        """
+        Symboles, dans l'ordre de leurs indices.
+
+        :return: Symboles
+        :rtype: List[str]
+        """
+        return self._symbols
+
+    @property
+    def size(self) -> int:
+        """
+        Nombre d'états.
+
+        :return: Nombre d'états
+        :rtype: int
+        """
+        return len(self._states)
+
+    @property
+    def indptr(self) -> np.ndarray:
+        """
+        Pointeurs de début de ligne (CSR).
+
+        :return: Tableau de taille n+1
+        :rtype: np.ndarray
+        """
+        return self._indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        Indices de colonnes (CSR).
+
+        :return: Colonnes des coefficients non nuls
+        :rtype: np.ndarray
+        """
+        return self._indices
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        Coefficients non nuls (nombre de symboles par couple d'états).
+
+        :return: Coefficients
+        :rtype: np.ndarray
+        """
+        return self._data
+
+    @property
+    def initial(self) -> int:
+        """
+        Indice de l'état initial.
+
+        :return: Indice de l'état initial
+        :rtype: int
+        """
+        return self._initial
+
+    @property
+    def finals(self) -> np.ndarray:
+        """
+        Masque des états finaux.
+
+        :return: Tableau booléen
+        :rtype: np.ndarray
+        """
+        return self._finals
+
+    # ==================== VUES ====================
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Matrice combinée dense (n x n) ; à réserver aux petits automates.
+
+        :return: Nombre de symboles menant de i à j
+        :rtype: np.ndarray
+        """
+        dense = np.zeros((self.size, self.size), dtype=np.int64)
+        dense[self._rows, self._indices] = self._data
+        return dense
+
+    def symbol_matrices(self) -> Dict[str, np.ndarray]:
+        """
+        Matrices d'adjacence booléennes denses, une par symbole.
+
+        :return: Symbole -> matrice (n x n)
+        :rtype: Dict[str, np.ndarray]
+        """
+        matrices = {}
+        for number, symbol in enumerate(self._symbols):
+            mask = self._edge_labels == number
+            matrix = np.zeros((self.size, self.size), dtype=bool)
+            matrix[self._edge_sources[mask], self._edge_targets[mask]] = True
+            matrices[symbol] = matrix
+        return matrices
+
+    def transpose(self) -> "TransitionMatrix":
+        """
+        Matrice transposée (arcs inversés), calculée une seule fois.
+
+        :return: Vue matricielle de l'automate miroir (même état initial)
+        :rtype: TransitionMatrix
+        """
+        if self._transpose is None:
+            self._transpose = TransitionMatrix(
+                self._states,
+                self._symbols,
+                self._edge_targets,
+                self._edge_labels,
+                self._edge_sources,
+                self._initial,
+                self._finals,
+            )
+            self._transpose._transpose = self
+        return self._transpose
+
+    def matvec(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Produit creux y = A x.
+
+        :param vector: Vecteur x (entiers NumPy ou objets Python)
+        :type vector: np.ndarray
+        :return: Vecteur y, de même type que x
+        :rtype: np.ndarray
+        """
+        products = self._data.astype(vector.dtype) * vector[self._indices]
+        sums = np.zeros(len(products) + 1, dtype=vector.dtype)
+        np.cumsum(products, out=sums[1:])
+        return sums[self._indptr[1:]] - sums[self._indptr[:-1]]
+
+    # ==================== ANALYSES ====================
+
+    def reachable(self, start: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        États accessibles, par parcours en largeur vectorisé.
+
+        :param start: Masque des états de départ (par défaut, l'état initial)
+        :type start: Optional[np.ndarray]
+        :return: Masque des états accessibles
+        :rtype: np.ndarray
+        """
+        if start is None:
+            start = np.zeros(self.size, dtype=bool)
+            start[self._initial] = True
+        visited = start.copy()
+        frontier = np.flatnonzero(visited)
+        while frontier.size:
+            if frontier.size < _NARROW_FRONTIER:
+                indptr, indices = self._lists()
+                level = []
+                for row in frontier.tolist():
+                    for target in indices[indptr[row] : indptr[row + 1]]:
+                        if not visited[target]:
+                            visited[target] = True
+                            level.append(target)
+                frontier = np.asarray(level, dtype=np.int64)
+                continue
+            successors = np.unique(self._gather(frontier))
+            frontier = successors[~visited[successors]]
+            visited[frontier] = True
+        return visited
+
+    def coreachable(self) -> np.ndarray:
+        """
+        États co-accessibles (depuis lesquels un état final est atteignable).
+
+        :return: Masque des états co-accessibles
+        :rtype: np.ndarray
+        """
+        return self.transpose().reachable(self._finals)
+
+    def useful(self) -> np.ndarray:
+        """
+        États utiles (accessibles et co-accessibles).
+
+        :return: Masque des états utiles
+        :rtype: np.ndarray
+        """
+        return self.reachable() & self.coreachable()
+
+    def names(self, mask: np.ndarray) -> FrozenSet[str]:
+        """
+        Noms des états sélectionnés par un masque.
+
+        :param mask: Masque booléen des états
+        :type mask: np.ndarray
+        :return: Ensemble des noms
+        :rtype: FrozenSet[str]
+        """
+        states = self._states
+        return frozenset(states[index] for index in np.flatnonzero(mask).tolist())
+
+    def is_finite(self) -> bool:
+        """
+        Indique si le langage est fini (aucun cycle entre états utiles).
+
+        Les états utiles de degré entrant nul sont retirés par vagues
+        (tri topologique vectorisé) ; il reste un cycle si certains ne
+        peuvent jamais l'être. Un cycle de transitions epsilon ne lisant
+        aucune lettre, les automates qui en portent sont déterminisés.
+
+        :return: True si le langage est fini
+        :rtype: bool
+        """
+        if self._has_epsilon():
+            # Import local pour éviter les dépendances circulaires
+            from ..algorithms.finite.word_enumeration import WordEnumeration
+
+            return WordEnumeration.is_finite(self._source())
+
+        useful = self.useful()
+        edges = useful[self._rows] & useful[self._indices]
+        in_degree = np.bincount(self._indices[edges], minlength=self.size)
+        remaining = int(useful.sum())
+        frontier = np.flatnonzero(useful & (in_degree == 0))
+        while frontier.size:
+            remaining -= frontier.size
+            if frontier.size < _NARROW_FRONTIER:
+                indptr, indices = self._lists()
+                level = []
+                for row in frontier.tolist():
+                    for target in indices[indptr[row] : indptr[row + 1]]:
+                        if useful[target]:
+                            in_degree[target] -= 1
+                            if not in_degree[target]:
+                                level.append(target)
+                frontier = np.asarray(level, dtype=np.int64)
+                continue
+            successors = self._gather(frontier)
+            successors = successors[useful[successors]]
+            in_degree -= np.bincount(successors, minlength=self.size)
+            touched = np.unique(successors)
+            frontier = touched[in_degree[touched] == 0]
+        return remaining == 0
+
+    def count_words(self, length: int) -> int:
+        """
+        Nombre de mots acceptés de longueur donnée.
+
+        Pour un automate déterministe, chaque mot suit un seul chemin : le
+        calcul e_init · A^n · f se fait par exponentiation rapide sur matrice
+        dense pour les petits automates, par n produits creux sinon ; les
+        entiers 64 bits sont remplacés par des entiers Python avant tout
+        dépassement. Un automate non déterministe est confié à
+        WordEnumeration, afin qu'un mot reconnu par plusieurs chemins ne
+        soit compté qu'une fois.
+
+        :param length: Longueur des mots
+        :type length: int
+        :return: Nombre de mots acceptés
+        :rtype: int
+        """
+        if not self._is_deterministic():
+            # Import local pour éviter les dépendances circulaires
+            from ..algorithms.finite.word_enumeration import WordEnumeration
+
+            return WordEnumeration.count_by_length(self._source(), length)[length]
+
+        vector = self._finals.astype(np.int64)
+        if self.size <= _DENSE_LIMIT:
+            power = self.to_dense()
+            while length:
+                if length & 1:
+                    power, vector = _widen(power, vector, self.size)
+                    vector = power @ vector
+                length >>= 1
+                if length:
+                    power, _ = _widen(power, power, self.size)
+                    power = power @ power
+        else:
+            for _ in range(length):
+                _, vector = _widen(self._data, vector, self.size)
+                vector = self.matvec(vector)
+        return int(vector[self._initial])
+
+    def _has_epsilon(self) -> bool:
+        """Indique si un arc porte le symbole epsilon."""
+        if EPSILON not in self._symbols:
+            return False
+        return bool(np.any(self._edge_labels == self._symbols.index(EPSILON)))
+
+    def _is_deterministic(self) -> bool:
+        """Indique si chaque couple (état, symbole) a au plus une cible."""
+        if self._has_epsilon():
+            return False
+        pairs = self._edge_sources * max(len(self._symbols), 1) + self._edge_labels
+        return len(np.unique(pairs)) == len(pairs)
+
+    def _source(self) -> Any:
+        """Retourne l'automate source, reconstruit en NFA s'il est absent."""
+        if self._automaton is None:
+            # Import local pour éviter les dépendances circulaires
+            from .nfa import NFA
+
+            transitions: Dict[Tuple[str, str], set] = {}
+            for source, label, target in zip(
+                self._edge_sources.tolist(),
+                self._edge_labels.tolist(),
+                self._edge_targets.tolist(),
+            ):
+                key = (self._states[source], self._symbols[label])
+                transitions.setdefault(key, set()).add(self._states[target])
+            self._automaton = NFA(
+                states=set(self._states),
+                alphabet=set(self._symbols) - {EPSILON},
+                transitions=transitions,
+                initial_state=self._states[self._initial],
+                final_states=set(self.names(self._finals)),
+            )
+        return self._automaton
+
+    def _lists(self) -> Tuple[List[int], List[int]]:
+        """Retourne (une seule fois convertis) indptr et indices en listes Python."""
+        if self._adjacency is None:
+            self._adjacency = (self._indptr.tolist(), self._indices.tolist())
+        return self._adjacency
+
+    def _gather(self, rows: np.ndarray) -> np.ndarray:
+        """Concatène (sans boucle Python) les colonnes des lignes données."""
+        starts = self._indptr[rows]
+        lengths = self._indptr[rows + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            return np.empty(0, dtype=np.int64)
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return self._indices[offsets + np.arange(total)]
+
+
+def _widen(left: np.ndarray, right: np.ndarray, size: int):
+    """Convertit deux opérandes en entiers Python si leur produit peut déborder."""
+    if left.dtype == object and right.dtype == object:
+        return left, right
+    bound = int(np.max(left, initial=0)) * int(np.max(right, initial=0)) * max(size, 1)
+    if bound >= _INT64_LIMIT or left.dtype == object or right.dtype == object:
+        return left.astype(object), right.astype(object)
+    return left, right
@@ -6,6 +6,9 @@ déterministes (DPDA) et non-déterministes (NPDA).
 """
 
 from .abstract_pushdown_automaton import AbstractPushdownAutomaton
+from .input_cursor import InputCursor
+from .pushdown_stack import PushdownStack
+from .saturation_recognizer import SaturationRecognizer
 from .pda import PDA
 from .pda.pda_configuration import PDAConfiguration
 from .pda.pda_operations import PDAOperations
@@ -16,6 +19,9 @@ from .grammar import GrammarParser
 
 __all__ = [
     "AbstractPushdownAutomaton",
+    "InputCursor",
+    "PushdownStack",
+    "SaturationRecognizer",
     "PDA",
     "PDAConfiguration",
     "PDAOperations",
@@ -1,11 +1,14 @@
 """Module pour les automates à pile déterministes (DPDA)."""
 
+from .compiled_dpda import CompiledDPDA, DPDAStream
 from .dpda import DPDA
 from .dpda_configuration import DPDAConfiguration
 from .dpda_exceptions import DPDAError, InvalidDPDAError
 
 __all__ = [
+    "CompiledDPDA",
     "DPDA",
+    "DPDAStream",
     "DPDAConfiguration",
     "DPDAError",
     "InvalidDPDAError",
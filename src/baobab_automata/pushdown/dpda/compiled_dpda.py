@@ -0,0 +1,315 @@
+"""
+Tables de transition compilées et reconnaissance en flux pour les DPDA.
+
+Ce module définit la classe CompiledDPDA, produite par DPDA.compile(), et
+la classe DPDAStream, qui reconnaît un mot fourni par morceaux :
+
+- états, symboles d'entrée et symboles de pile sont numérotés ; la
+  fonction de transition devient une table dense indexée par
+  (état, entrée, sommet), l'entrée 0 désignant ε ;
+- la pile est une liste d'entiers, sommet en fin de liste ;
+- les boucles de transitions ε sont détectées à la compilation : une
+  configuration qui ne lirait plus jamais de symbole est rejetée au lieu
+  de boucler, et la fin de mot est résolue par des résumés précalculés.
+
+Chaque symbole coûte un temps constant amorti : une lecture, puis les
+transitions ε, dont les dépilements sont payés par les empilements
+antérieurs.
+"""
+
+from typing import Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+from .dpda_exceptions import DPDAError
+
+# Absence de transition dans la table dense
+_NONE = -1
+
+# Issues d'une suite de transitions ε : blocage, acceptation en fin de mot
+# et boucle infinie ; une issue positive est l'état atteint après dépilement
+_HALT = -1
+_ACCEPT = -2
+_LOOP = -3
+
+
+class CompiledDPDA:
+    """Fonction de transition d'un DPDA compilée en tables d'entiers.
+
+    Les transitions dont le symbole d'entrée ou le sommet de pile compte
+    plusieurs caractères ne s'appliquent jamais lors de la simulation et
+    sont ignorées.
+
+    Attributes:
+        states: États, dans l'ordre de leur numéro
+        input_symbols: Symboles d'entrée, le numéro 0 étant réservé à ε
+        stack_symbols: Symboles de pile, dans l'ordre de leur numéro
+        epsilon_loops: Couples (état, sommet) à partir desquels les
+            transitions ε bouclent sans fin avant la fin du mot
+    """
+
+    def __init__(
+        self,
+        states: FrozenSet[str],
+        input_alphabet: FrozenSet[str],
+        stack_alphabet: FrozenSet[str],
+        transitions: Mapping[Tuple[str, str, str], Tuple[str, str]],
+        initial_state: str,
+        initial_stack_symbol: str,
+        final_states: FrozenSet[str],
+    ) -> None:
+        """Compile les tables d'un DPDA.
+
+        :param states: États de l'automate
+        :param input_alphabet: Alphabet d'entrée
+        :param stack_alphabet: Alphabet de pile
+        :param transitions: Fonction de transition déterministe
+        :param initial_state: État initial
+        :param initial_stack_symbol: Symbole initial de pile
+        :param final_states: États finaux
+        """
+        inputs: Set[str] = {symbol for symbol in input_alphabet if len(symbol) == 1}
+        stack: Set[str] = set(initial_stack_symbol)
+        stack.update(symbol for symbol in stack_alphabet if len(symbol) == 1)
+        for (_, symbol, top), (_, pushed) in transitions.items():
+            if len(symbol) == 1:
+                inputs.add(symbol)
+            if len(top) == 1:
+                stack.add(top)
+            stack.update(pushed)
+
+        self.states: Tuple[str, ...] = tuple(sorted(states))
+        self.input_symbols: Tuple[str, ...] = ("",) + tuple(sorted(inputs))
+        self.stack_symbols: Tuple[str, ...] = tuple(sorted(stack))
+        state_codes = {state: code for code, state in enumerate(self.states)}
+        self._input_codes: Dict[str, int] = {
+            symbol: code for code, symbol in enumerate(self.input_symbols) if code
+        }
+        stack_codes = {symbol: code for code, symbol in enumerate(self.stack_symbols)}
+        self._stack_width = len(self.stack_symbols)
+        self._row_width = len(self.input_symbols) * self._stack_width
+
+        # Table dense : numéro d'action, ou _NONE
+        self._table: List[int] = [_NONE] * (len(self.states) * self._row_width)
+        # Actions : état d'arrivée et symboles empilés, sommet en dernier
+        self._targets: List[int] = []
+        self._pushes: List[Tuple[int, ...]] = []
+        for (state, symbol, top), (target, pushed) in transitions.items():
+            if len(symbol) > 1 or len(top) != 1:
+                continue
+            index = self._index(
+                state_codes[state],
+                self._input_codes[symbol] if symbol else 0,
+                stack_codes[top],
+            )
+            self._table[index] = len(self._targets)
+            self._targets.append(state_codes[target])
+            self._pushes.append(tuple(stack_codes[item] for item in reversed(pushed)))
+
+        self._finals: List[bool] = [state in final_states for state in self.states]
+        self._initial_state = state_codes[initial_state]
+        self._initial_stack: Tuple[int, ...] = tuple(
+            stack_codes[symbol] for symbol in reversed(initial_stack_symbol)
+        )
+
+        # Détection des boucles ε : avant la fin du mot, les transitions ε
+        # d'une boucle sont retirées de la table ; en fin de mot, chaque
+        # couple (état, sommet) reçoit l'issue de ses transitions ε
+        loops: List[Tuple[int, int]] = []
+        summaries: Dict[Tuple[int, int], int] = {}
+        end_summaries: Dict[Tuple[int, int], int] = {}
+        for state in range(len(self.states)):
+            for top in range(self._stack_width):
+                outcome = self._epsilon_outcome(state, top, False, summaries)
+                if outcome == _LOOP:
+                    loops.append((state, top))
+                self._epsilon_outcome(state, top, True, end_summaries)
+        for state, top in loops:
+            self._table[self._index(state, 0, top)] = _NONE
+        self._end: List[int] = [
+            _HALT if outcome == _LOOP else outcome
+            for _, outcome in sorted(end_summaries.items())
+        ]
+        self.epsilon_loops: FrozenSet[Tuple[str, str]] = frozenset(
+            (self.states[state], self.stack_symbols[top]) for state, top in loops
+        )
+
+    def stream(self) -> "DPDAStream":
+        """Démarre une reconnaissance en flux.
+
+        :return: Reconnaisseur dans la configuration initiale
+        """
+        return DPDAStream(self)
+
+    def accepts(self, word: str) -> bool:
+        """Vérifie si un mot est accepté.
+
+        :param word: Mot à tester
+        :return: True si le mot est accepté, False sinon
+        """
+        stream = DPDAStream(self)
+        stream.feed(word)
+        return stream.finish()
+
+    def _index(self, state: int, symbol: int, top: int) -> int:
+        """Indice d'une transition dans la table dense."""
+        return state * self._row_width + symbol * self._stack_width + top
+
+    def _epsilon_outcome(
+        self,
+        state: int,
+        top: int,
+        at_end: bool,
+        summaries: Dict[Tuple[int, int], int],
+    ) -> int:
+        """Issue des transitions ε depuis (état, sommet), jusqu'au dépilement.
+
+        Chaque couple dont l'issue dépend de celles des symboles qu'il
+        empile reçoit un cadre sur une pile explicite : la longueur des
+        suites de transitions ε n'est pas bornée par la limite de récursion.
+        """
+        # Cadres : couple, symboles empilés, nombre restant à dépiler, état
+        frames: List[List] = []
+        active: Set[Tuple[int, int]] = set()
+        key = (state, top)
+        while True:
+            # Appel sur key : issue immédiate, ou nouveau cadre
+            outcome: Optional[int] = None
+            if key in summaries:
+                outcome = summaries[key]
+            elif at_end and self._finals[key[0]]:
+                outcome = summaries[key] = _ACCEPT
+            else:
+                action = self._table[self._index(key[0], 0, key[1])]
+                if action == _NONE:
+                    outcome = summaries[key] = _HALT
+                elif key in active:
+                    # Le même couple revient au-dessus de lui-même : boucle
+                    outcome = _LOOP
+                else:
+                    active.add(key)
+                    pushes = self._pushes[action]
+                    frames.append([key, pushes, len(pushes), self._targets[action]])
+
+            # Retours : l'issue obtenue devient l'état courant du cadre appelant
+            while True:
+                frame = frames[-1] if frames else None
+                if outcome is not None:
+                    if frame is None:
+                        return outcome
+                    frame[3] = outcome
+                    outcome = None
+                frame_key, pushes, remaining, current = frame
+                if current >= 0 and remaining:
+                    # Symbole suivant, sommet d'abord
+                    frame[2] = remaining - 1
+                    key = (current, pushes[remaining - 1])
+                    break
+                frames.pop()
+                active.discard(frame_key)
+                summaries[frame_key] = outcome = current
+
+
+class DPDAStream:
+    """Reconnaissance incrémentale d'un mot par un DPDA compilé.
+
+    Le mot est fourni par morceaux avec feed, puis finish résout la fin de
+    mot. Dès qu'aucune transition ne s'applique, le flux est rejeté et les
+    morceaux suivants sont ignorés.
+
+    Attributes:
+        position: Nombre de symboles lus
+    """
+
+    def __init__(self, compiled: CompiledDPDA) -> None:
+        """Initialise un flux dans la configuration initiale.
+
+        :param compiled: Tables compilées du DPDA
+        """
+        self._compiled = compiled
+        self._state = compiled._initial_state
+        self._stack: List[int] = list(compiled._initial_stack)
+        self._rejected = False
+        self._result: Optional[bool] = None
+        self.position = 0
+
+    @property
+    def rejected(self) -> bool:
+        """Indique si le flux est déjà rejeté, quelle que soit la suite.
+
+        :return: True si aucune suite du mot ne peut être acceptée
+        """
+        return self._rejected
+
+    def feed(self, chunk: str) -> None:
+        """Lit un morceau du mot.
+
+        :param chunk: Symboles suivants du mot
+        :raises DPDAError: Si le flux est déjà terminé par finish
+        """
+        if self._result is not None:
+            raise DPDAError("Le flux est terminé, aucun symbole ne peut être lu")
+        if self._rejected:
+            return
+
+        compiled = self._compiled
+        codes = compiled._input_codes
+        table = compiled._table
+        targets = compiled._targets
+        pushes = compiled._pushes
+        row_width = compiled._row_width
+        stack_width = compiled._stack_width
+        stack = self._stack
+        state = self._state
+
+        for symbol in chunk:
+            code = codes.get(symbol)
+            if code is None:
+                self._rejected = True
+                break
+            offset = code * stack_width
+            while stack:
+                row = state * row_width
+                top = stack[-1]
+                action = table[row + offset + top]
+                if action >= 0:
+                    stack.pop()
+                    stack.extend(pushes[action])
+                    state = targets[action]
+                    break
+                # Transition ε, hors boucles détectées à la compilation
+                action = table[row + top]
+                if action < 0:
+                    self._rejected = True
+                    break
+                stack.pop()
+                stack.extend(pushes[action])
+                state = targets[action]
+            else:
+                self._rejected = True
+            if self._rejected:
+                break
+            self.position += 1
+
+        self._state = state
+
+    def finish(self) -> bool:
+        """Termine le mot et décide de son acceptation.
+
+        :return: True si le mot lu est accepté, False sinon
+        """
+        if self._result is None:
+            self._result = not self._rejected and self._resolve_end()
+        return self._result
+
+    def _resolve_end(self) -> bool:
+        """Applique les résumés ε de fin de mot, un dépilement à la fois."""
+        compiled = self._compiled
+        state = self._state
+        stack = self._stack
+        while not compiled._finals[state]:
+            if not stack:
+                return False
+            outcome = compiled._end[state * compiled._stack_width + stack.pop()]
+            if outcome < 0:
+                return outcome == _ACCEPT
+            state = outcome
+        return True
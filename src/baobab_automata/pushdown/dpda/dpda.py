@@ -5,11 +5,12 @@ Ce module implémente la classe DPDA pour la reconnaissance des langages
 hors-contexte déterministes avec des algorithmes optimisés.
 """
 
-from typing import Any, Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
 from collections import defaultdict
 
 from ..abstract_pushdown_automaton import AbstractPushdownAutomaton
-from .dpda_configuration import DPDAConfiguration
+from .compiled_dpda import CompiledDPDA
 from .dpda_exceptions import DPDAError, InvalidDPDAError
 
 
@@ -54,13 +55,13 @@ class DPDA(AbstractPushdownAutomaton):
         :param name: Nom optionnel de l'automate
         :raises InvalidDPDAError: Si l'automate n'est pas valide ou non-déterministe
         """
-        self._states = states
-        self._input_alphabet = input_alphabet
-        self._stack_alphabet = stack_alphabet
+        self._states = frozenset(states)
+        self._input_alphabet = frozenset(input_alphabet)
+        self._stack_alphabet = frozenset(stack_alphabet)
         self._transitions = transitions
         self._initial_state = initial_state
         self._initial_stack_symbol = initial_stack_symbol
-        self._final_states = final_states
+        self._final_states = frozenset(final_states)
         self._name = name
 
         # Cache pour les optimisations
@@ -70,12 +71,13 @@ class DPDA(AbstractPushdownAutomaton):
         self._transition_cache: Dict[
             Tuple[str, str, str], Optional[Tuple[str, str]]
         ] = {}
+        self._compiled: Optional[CompiledDPDA] = None
 
         # Validation de l'automate
         self.validate()
 
     @property
-    def states(self) -> Set[str]:
+    def states(self) -> FrozenSet[str]:
         """Retourne l'ensemble des états de l'automate.
 
         :return: Ensemble des états
@@ -83,7 +85,7 @@ class DPDA(AbstractPushdownAutomaton):
         return self._states
 
     @property
-    def input_alphabet(self) -> Set[str]:
+    def input_alphabet(self) -> FrozenSet[str]:
         """Retourne l'alphabet d'entrée de l'automate.
 
         :return: Alphabet d'entrée
@@ -91,7 +93,7 @@ class DPDA(AbstractPushdownAutomaton):
         return self._input_alphabet
 
     @property
-    def stack_alphabet(self) -> Set[str]:
+    def stack_alphabet(self) -> FrozenSet[str]:
         """Retourne l'alphabet de pile de l'automate.
 
         :return: Alphabet de pile
@@ -115,13 +117,21 @@ class DPDA(AbstractPushdownAutomaton):
         return self._initial_stack_symbol
 
     @property
-    def final_states(self) -> Set[str]:
+    def final_states(self) -> FrozenSet[str]:
         """Retourne l'ensemble des états finaux.
 
         :return: États finaux
         """
         return self._final_states
 
+    @property
+    def transitions(self) -> Mapping[Tuple[str, str, str], Tuple[str, str]]:
+        """Retourne la fonction de transition en lecture seule.
+
+        :return: Vue (état, symbole d'entrée, symbole de pile) -> destinations
+        """
+        return MappingProxyType(self._transitions)
+
     @property
     def name(self) -> Optional[str]:
         """Retourne le nom de l'automate.
@@ -138,71 +148,37 @@ class DPDA(AbstractPushdownAutomaton):
         :raises DPDAError: En cas d'erreur de traitement
         """
         try:
-            return self._simulate_word_deterministic(word)
+            return self.compile().accepts(word)
         except Exception as e:
             raise DPDAError(
                 f"Erreur lors de la reconnaissance du mot '{word}': {e}"
             ) from e
 
-    def _simulate_word_deterministic(self, word: str) -> bool:
-        """Simule la reconnaissance d'un mot de manière déterministe.
-
-        :param word: Mot à simuler
-        :return: True si le mot est accepté, False sinon
-        """
-        # Configuration initiale
-        current_config = DPDAConfiguration(
-            state=self._initial_state,
-            remaining_input=word,
-            stack=self._initial_stack_symbol,
-        )
+    def compile(self) -> CompiledDPDA:
+        """Compile la fonction de transition en tables d'entiers.
 
-        # Simulation déterministe
-        while True:
-            # Vérification de l'acceptation
-            if current_config.is_accepting and self.is_final_state(
-                current_config.state
-            ):
-                return True
-
-            # Récupération de la transition unique
-            input_symbol = (
-                current_config.remaining_input[0]
-                if current_config.remaining_input
-                else ""
-            )
-            stack_symbol = current_config.stack_top
+        Les tables sont construites au premier appel puis réutilisées par
+        accepts. Elles permettent aussi de reconnaître un mot fourni par
+        morceaux :
 
-            if stack_symbol is None:
-                return False
+            stream = dpda.compile().stream()
+            for chunk in chunks:
+                stream.feed(chunk)
+            accepted = stream.finish()
 
-            # Recherche de transition avec symbole d'entrée
-            transition = self.get_transition(
-                current_config.state, input_symbol, stack_symbol
+        :return: Automate compilé
+        """
+        if self._compiled is None:
+            self._compiled = CompiledDPDA(
+                self._states,
+                self._input_alphabet,
+                self._stack_alphabet,
+                self._transitions,
+                self._initial_state,
+                self._initial_stack_symbol,
+                self._final_states,
             )
-
-            # Si pas de transition avec symbole d'entrée, chercher transition epsilon
-            if transition is None:
-                transition = self.get_transition(current_config.state, "", stack_symbol)
-
-            if transition is None:
-                return False
-
-            # Application de la transition
-            new_state, stack_operation = transition
-
-            # Mise à jour de la configuration
-            if input_symbol and input_symbol != "":
-                current_config = current_config.consume_input(1)
-            current_config = current_config.change_state(new_state)
-
-            # Gestion de la pile
-            if stack_operation == "":
-                # Dépilage
-                current_config = current_config.pop_symbols(1)
-            else:
-                # Remplacement du sommet
-                current_config = current_config.replace_stack_top(stack_operation)
+        return self._compiled
 
     def get_transition(
         self, state: str, input_symbol: str, stack_symbol: str
@@ -513,10 +489,10 @@ class DPDA(AbstractPushdownAutomaton):
         return (
             f"DPDA("
             f"states={len(self._states)}, "
-            f"input_alphabet={self._input_alphabet}, "
-            f"stack_alphabet={self._stack_alphabet}, "
+            f"input_alphabet={set(self._input_alphabet)}, "
+            f"stack_alphabet={set(self._stack_alphabet)}, "
             f"initial_state='{self._initial_state}', "
-            f"final_states={self._final_states})"
+            f"final_states={set(self._final_states)})"
         )
 
     def __repr__(self) -> str:
@@ -526,12 +502,12 @@ class DPDA(AbstractPushdownAutomaton):
         """
         return (
             f"DPDA("
-            f"states={self._states}, "
-            f"input_alphabet={self._input_alphabet}, "
-            f"stack_alphabet={self._stack_alphabet}, "
+            f"states={set(self._states)}, "
+            f"input_alphabet={set(self._input_alphabet)}, "
+            f"stack_alphabet={set(self._stack_alphabet)}, "
             f"transitions=..., "
             f"initial_state='{self._initial_state}', "
             f"initial_stack_symbol='{self._initial_stack_symbol}', "
-            f"final_states={self._final_states}, "
+            f"final_states={set(self._final_states)}, "
             f"name='{self._name}')"
         )
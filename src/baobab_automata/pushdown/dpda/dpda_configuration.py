@@ -8,6 +8,9 @@ les configurations d'un DPDA lors de la simulation.
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from ..input_cursor import InputCursor
+from ..pushdown_stack import PushdownStack
+
 
 @dataclass(frozen=True)
 class DPDAConfiguration:
@@ -18,13 +21,15 @@ class DPDAConfiguration:
     restant et l'état de la pile.
 
     :param state: État courant de l'automate
-    :param remaining_input: Mot d'entrée restant à traiter
-    :param stack: État de la pile (chaîne avec le sommet à gauche)
+    :param remaining_input: Mot restant, curseur sur le mot d'entrée
+        partagé ou chaîne
+    :param stack: État de la pile (sommet à gauche), pile partagée ou
+        chaîne
     """
 
     state: str
-    remaining_input: str
-    stack: str
+    remaining_input: InputCursor
+    stack: PushdownStack
 
     def __post_init__(self) -> None:
         """Valide la configuration après initialisation.
@@ -34,10 +39,18 @@ class DPDAConfiguration:
         if not isinstance(self.state, str) or not self.state:
             raise ValueError("L'état doit être une chaîne non vide")
 
-        if not isinstance(self.remaining_input, str):
+        if isinstance(self.remaining_input, str):
+            # Configuration figée : le mot est normalisé sans __setattr__
+            object.__setattr__(
+                self, "remaining_input", InputCursor.of(self.remaining_input)
+            )
+        elif not isinstance(self.remaining_input, InputCursor):
             raise ValueError("Le mot restant doit être une chaîne")
 
-        if not isinstance(self.stack, str):
+        if isinstance(self.stack, str):
+            # Configuration figée : la pile est normalisée sans __setattr__
+            object.__setattr__(self, "stack", PushdownStack.of(self.stack))
+        elif not isinstance(self.stack, PushdownStack):
             raise ValueError("La pile doit être une chaîne")
 
     @property
@@ -49,7 +62,15 @@ class DPDAConfiguration:
 
         :return: True si la configuration est acceptante, False sinon
         """
-        return self.remaining_input == ""
+        return not self.remaining_input
+
+    @property
+    def position(self) -> int:
+        """Retourne la position du prochain symbole dans le mot d'entrée.
+
+        :return: Nombre de symboles déjà consommés
+        """
+        return self.remaining_input.position
 
     @property
     def stack_top(self) -> Optional[str]:
@@ -57,7 +78,7 @@ class DPDAConfiguration:
 
         :return: Symbole au sommet de la pile ou None si la pile est vide
         """
-        return self.stack[0] if self.stack else None
+        return self.stack.top if self.stack else None
 
     @property
     def stack_bottom(self) -> Optional[str]:
@@ -81,7 +102,7 @@ class DPDAConfiguration:
 
         :return: True si la pile est vide, False sinon
         """
-        return self.stack == ""
+        return not self.stack
 
     def push_symbols(self, symbols: str) -> "DPDAConfiguration":
         """Crée une nouvelle configuration avec des symboles ajoutés à la pile.
@@ -93,7 +114,7 @@ class DPDAConfiguration:
         if not isinstance(symbols, str):
             raise ValueError("Les symboles doivent être une chaîne")
 
-        new_stack = symbols + self.stack
+        new_stack = self.stack.push(symbols)
         return DPDAConfiguration(
             state=self.state, remaining_input=self.remaining_input, stack=new_stack
         )
@@ -114,7 +135,7 @@ class DPDAConfiguration:
                 "Tentative de retirer plus de symboles qu'il n'y en a dans la pile"
             )
 
-        new_stack = self.stack[count:]
+        new_stack = self.stack.pop(count)
         return DPDAConfiguration(
             state=self.state, remaining_input=self.remaining_input, stack=new_stack
         )
@@ -133,7 +154,7 @@ class DPDAConfiguration:
         if not self.stack:
             raise IndexError("Impossible de remplacer le sommet d'une pile vide")
 
-        new_stack = new_symbols + self.stack[1:]
+        new_stack = self.stack.replace_top(new_symbols)
         return DPDAConfiguration(
             state=self.state, remaining_input=self.remaining_input, stack=new_stack
         )
@@ -154,7 +175,7 @@ class DPDAConfiguration:
                 "Tentative de consommer plus de symboles qu'il n'y en a dans le mot"
             )
 
-        new_input = self.remaining_input[count:]
+        new_input = self.remaining_input.advance(count)
         return DPDAConfiguration(
             state=self.state, remaining_input=new_input, stack=self.stack
         )
@@ -180,8 +201,8 @@ class DPDAConfiguration:
         """
         return {
             "state": self.state,
-            "remaining_input": self.remaining_input,
-            "stack": self.stack,
+            "remaining_input": str(self.remaining_input),
+            "stack": str(self.stack),
             "stack_height": self.stack_height,
             "is_accepting": self.is_accepting,
         }
@@ -1,11 +1,19 @@
 """Module pour le parsing et la manipulation des grammaires hors-contexte."""
 
+from .grammar_analysis import END_MARKER, GrammarAnalysis, LL1Conflict, LL1Table
 from .grammar_parser import GrammarParser
+from .grammar_tokens import Tokenizer, grammar_fingerprint
 from .grammar_types import Production, ContextFreeGrammar, GrammarType
 from .grammar_exceptions import GrammarError, GrammarParseError, GrammarValidationError
 
 __all__ = [
+    "END_MARKER",
+    "GrammarAnalysis",
+    "LL1Conflict",
+    "LL1Table",
     "GrammarParser",
+    "Tokenizer",
+    "grammar_fingerprint",
     "Production",
     "ContextFreeGrammar",
     "GrammarType",
@@ -0,0 +1,337 @@
+"""
+Analyses FIRST/FOLLOW et tables LL(1) des grammaires hors-contexte.
+
+Ce module calcule une fois par grammaire les variables annulables et les
+ensembles FIRST et FOLLOW, représentés par des entiers utilisés comme
+ensembles de bits (un bit par terminal, le bit 0 étant la marque de fin),
+puis construit la table LL(1) et son analyseur prédictif.
+
+Les analyses sont mises en cache sur la grammaire elle-même (voir
+ContextFreeGrammar.get_analysis) afin que les conversions et les
+analyseurs les partagent.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+from .grammar_tokens import Tokenizer
+from .grammar_types import ContextFreeGrammar, Production
+
+# Marque de fin d'entrée, terminal de code 0
+END_MARKER = "\x00end"
+
+
+@dataclass(frozen=True)
+class LL1Conflict:
+    """Case de la table LL(1) revendiquée par plusieurs productions.
+
+    Attributes:
+        variable: Variable au sommet de la pile
+        terminal: Terminal de prévision (END_MARKER pour la fin de l'entrée)
+        productions: Productions en concurrence, la première étant retenue
+        kind: "FIRST/FIRST" si le terminal commence plusieurs parties
+            droites, "FIRST/FOLLOW" s'il suit une partie droite annulable
+    """
+
+    variable: str
+    terminal: str
+    productions: Tuple[Production, ...]
+    kind: str
+
+    def __str__(self) -> str:
+        """Représentation textuelle du conflit."""
+        terminal = "fin" if self.terminal == END_MARKER else repr(self.terminal)
+        rules = " / ".join(str(production) for production in self.productions)
+        return f"Conflit {self.kind} sur ({self.variable}, {terminal}) : {rules}"
+
+
+class GrammarAnalysis:
+    """Annulables, FIRST et FOLLOW d'une grammaire, en ensembles de bits.
+
+    Les terminaux sont numérotés dans l'ordre de l'attribut terminals : la
+    marque de fin d'abord, puis les terminaux triés. Un ensemble de
+    terminaux est un entier dont le bit i représente terminals[i].
+
+    Attributes:
+        start_symbol: Symbole de départ
+        variables: Variables, triées
+        terminals: Terminaux, marque de fin en tête
+        productions: Productions, triées
+        nullable: Variables dérivant le mot vide
+        first_bits: FIRST de chaque variable
+        follow_bits: FOLLOW de chaque variable
+    """
+
+    def __init__(self, grammar: ContextFreeGrammar) -> None:
+        """Calcule les analyses d'une grammaire.
+
+        :param grammar: Grammaire à analyser
+        """
+        self.start_symbol = grammar.start_symbol
+        self.variables: Tuple[str, ...] = tuple(
+            sorted(set(grammar.variables) | {p.left_side for p in grammar.productions})
+        )
+        variables = set(self.variables)
+        self.terminals: Tuple[str, ...] = (END_MARKER,) + tuple(
+            sorted(
+                set(grammar.terminals)
+                | {
+                    symbol
+                    for production in grammar.productions
+                    for symbol in production.right_side
+                    if symbol not in variables
+                }
+            )
+        )
+        self._codes = {terminal: code for code, terminal in enumerate(self.terminals)}
+        self.productions: Tuple[Production, ...] = tuple(
+            sorted(grammar.productions, key=lambda p: (p.left_side, p.right_side))
+        )
+        self.nullable = self._nullable_variables()
+        self.first_bits = self._first_sets()
+        self.follow_bits = self._follow_sets()
+        self._ll1_table: Optional[LL1Table] = None
+
+    @staticmethod
+    def of(grammar: ContextFreeGrammar) -> "GrammarAnalysis":
+        """Analyse d'une grammaire, mise en cache sur la grammaire.
+
+        Le cache est invalidé si l'axiome ou les productions ont changé.
+
+        :param grammar: Grammaire à analyser
+        :return: Analyse partagée de la grammaire
+        """
+        key = (grammar.start_symbol, frozenset(grammar.productions))
+        cached = grammar.__dict__.get("_analysis")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        analysis = GrammarAnalysis(grammar)
+        # La grammaire est figée : le cache est posé sans passer par __setattr__
+        object.__setattr__(grammar, "_analysis", (key, analysis))
+        return analysis
+
+    def terminal_set(self, bits: int) -> FrozenSet[str]:
+        """Convertit un ensemble de bits en ensemble de terminaux.
+
+        :param bits: Ensemble de bits
+        :return: Terminaux correspondants
+        """
+        terminals = []
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            terminals.append(self.terminals[low.bit_length() - 1])
+        return frozenset(terminals)
+
+    def first(self, symbol: str) -> FrozenSet[str]:
+        """Obtient l'ensemble FIRST d'un symbole (sans ε).
+
+        :param symbol: Variable ou terminal
+        :return: Terminaux pouvant commencer une dérivation du symbole
+        """
+        return self.terminal_set(self.sequence_first((symbol,))[0])
+
+    def follow(self, variable: str) -> FrozenSet[str]:
+        """Obtient l'ensemble FOLLOW d'une variable.
+
+        :param variable: Variable de la grammaire
+        :return: Terminaux pouvant suivre la variable, END_MARKER compris
+        """
+        return self.terminal_set(self.follow_bits.get(variable, 0))
+
+    def sequence_first(self, symbols: Sequence[str]) -> Tuple[int, bool]:
+        """Calcule FIRST d'une suite de symboles.
+
+        :param symbols: Suite de variables et de terminaux
+        :return: Ensemble de bits FIRST et indicateur d'annulabilité
+        """
+        bits = 0
+        for symbol in symbols:
+            if symbol not in self.first_bits:
+                return bits | 1 << self._codes[symbol], False
+            bits |= self.first_bits[symbol]
+            if symbol not in self.nullable:
+                return bits, False
+        return bits, True
+
+    def ll1_table(self) -> "LL1Table":
+        """Obtient la table LL(1), construite au premier appel.
+
+        :return: Table LL(1) de la grammaire
+        """
+        if self._ll1_table is None:
+            self._ll1_table = LL1Table(self)
+        return self._ll1_table
+
+    def _nullable_variables(self) -> FrozenSet[str]:
+        """Variables dérivant le mot vide, par propagation de compteurs."""
+        remaining = [len(production.right_side) for production in self.productions]
+        occurrences: Dict[str, List[int]] = {}
+        for number, production in enumerate(self.productions):
+            for symbol in set(production.right_side):
+                occurrences.setdefault(symbol, []).append(number)
+
+        nullable = set()
+        queue = [p.left_side for p in self.productions if not p.right_side]
+        while queue:
+            variable = queue.pop()
+            if variable in nullable:
+                continue
+            nullable.add(variable)
+            for number in occurrences.get(variable, ()):
+                remaining[number] -= self.productions[number].right_side.count(variable)
+                if remaining[number] == 0:
+                    queue.append(self.productions[number].left_side)
+        return frozenset(nullable)
+
+    def _first_sets(self) -> Dict[str, int]:
+        """FIRST des variables, par point fixe sur les ensembles de bits."""
+        first = {variable: 0 for variable in self.variables}
+        self.first_bits = first
+        changed = True
+        while changed:
+            changed = False
+            for production in self.productions:
+                bits = self.sequence_first(production.right_side)[0]
+                if bits & ~first[production.left_side]:
+                    first[production.left_side] |= bits
+                    changed = True
+        return first
+
+    def _follow_sets(self) -> Dict[str, int]:
+        """FOLLOW des variables, par propagation le long des inclusions."""
+        follow = {variable: 0 for variable in self.variables}
+        follow[self.start_symbol] = 1
+        # FOLLOW(A) ⊆ FOLLOW(B) lorsque B termine une partie droite de A
+        includes: Dict[str, set] = {variable: set() for variable in self.variables}
+        for production in self.productions:
+            right = production.right_side
+            for position, symbol in enumerate(right):
+                if symbol not in follow:
+                    continue
+                bits, empty = self.sequence_first(right[position + 1 :])
+                follow[symbol] |= bits
+                if empty and symbol != production.left_side:
+                    includes[production.left_side].add(symbol)
+
+        queue = list(self.variables)
+        while queue:
+            variable = queue.pop()
+            for target in includes[variable]:
+                if follow[variable] & ~follow[target]:
+                    follow[target] |= follow[variable]
+                    queue.append(target)
+        return follow
+
+
+class LL1Table:
+    """Table d'analyse prédictive LL(1) et son reconnaisseur.
+
+    Chaque case (variable, terminal) retient au plus une production ; les
+    cases disputées sont rapportées dans conflicts et la table garde la
+    première production dans l'ordre de GrammarAnalysis.productions.
+
+    Attributes:
+        analysis: Analyse de la grammaire
+        entries: Production retenue par case (variable, terminal)
+        conflicts: Conflits rencontrés lors de la construction
+    """
+
+    def __init__(self, analysis: GrammarAnalysis) -> None:
+        """Construit la table à partir des ensembles FIRST et FOLLOW.
+
+        :param analysis: Analyse de la grammaire
+        """
+        self.analysis = analysis
+        self.entries: Dict[Tuple[str, str], Production] = {}
+        self.conflicts: List[LL1Conflict] = []
+        claims: Dict[Tuple[str, str], List[Tuple[Production, bool]]] = {}
+        for production in analysis.productions:
+            bits, empty = analysis.sequence_first(production.right_side)
+            for terminal in analysis.terminal_set(bits):
+                claims.setdefault((production.left_side, terminal), []).append(
+                    (production, True)
+                )
+            if empty:
+                follow = analysis.follow_bits[production.left_side] & ~bits
+                for terminal in analysis.terminal_set(follow):
+                    claims.setdefault((production.left_side, terminal), []).append(
+                        (production, False)
+                    )
+
+        for (variable, terminal), claimants in sorted(claims.items()):
+            self.entries[(variable, terminal)] = claimants[0][0]
+            if len(claimants) > 1:
+                from_first = sum(1 for _, first in claimants if first)
+                self.conflicts.append(
+                    LL1Conflict(
+                        variable,
+                        terminal,
+                        tuple(production for production, _ in claimants),
+                        "FIRST/FIRST" if from_first > 1 else "FIRST/FOLLOW",
+                    )
+                )
+        self._tokenizer = Tokenizer(analysis.terminals[1:])
+
+    @property
+    def is_ll1(self) -> bool:
+        """Indique si la grammaire est LL(1) (aucun conflit)."""
+        return not self.conflicts
+
+    def get(self, variable: str, terminal: str) -> Optional[Production]:
+        """Obtient la production prédite pour une case.
+
+        :param variable: Variable au sommet de la pile
+        :param terminal: Terminal de prévision (END_MARKER en fin d'entrée)
+        :return: Production prédite ou None
+        """
+        return self.entries.get((variable, terminal))
+
+    def tokenize(self, text: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+        """Découpe une entrée en jetons.
+
+        Une chaîne est découpée en caractères si tous les terminaux sont des
+        caractères, en mots séparés par des blancs sinon.
+
+        :param text: Chaîne ou séquence de jetons
+        :return: Jetons
+        """
+        return self._tokenizer.tokenize(text)
+
+    def recognize(self, tokens: Sequence[str]) -> bool:
+        """Reconnaît une entrée par analyse prédictive.
+
+        La réponse est exacte lorsque la table n'a aucun conflit.
+
+        :param tokens: Jetons de l'entrée
+        :return: True si l'entrée est acceptée
+        """
+        return self.failure_position(tokens) is None
+
+    def failure_position(self, tokens: Sequence[str]) -> Optional[int]:
+        """Position du jeton sur lequel l'analyse prédictive échoue.
+
+        :param tokens: Jetons de l'entrée
+        :return: Indice du jeton fautif (len(tokens) pour une fin
+            prématurée), ou None si l'entrée est acceptée
+        """
+        tokens = list(tokens) + [END_MARKER]
+        entries = self.entries
+        variables = self.analysis.first_bits
+        stack = [END_MARKER, self.analysis.start_symbol]
+        position = 0
+        while stack:
+            top = stack.pop()
+            token = tokens[position]
+            if top in variables:
+                production = entries.get((top, token))
+                if production is None:
+                    return position
+                stack.extend(reversed(production.right_side))
+            elif top == token:
+                position += 1
+            else:
+                return position
+        return None
@@ -20,6 +20,7 @@ from .grammar_exceptions import (
     GrammarParseError,
     GrammarValidationError,
 )
+from .grammar_analysis import END_MARKER, LL1Table
 from .grammar_types import ContextFreeGrammar, GrammarType, Production
 
 
@@ -671,42 +672,121 @@ class GrammarParser:
             )
 
     def grammar_to_dpda(self, grammar: ContextFreeGrammar) -> "DPDA":
-        """Convertit une grammaire en DPDA si possible.
+        """Convertit une grammaire LL(1) en DPDA prédictif.
+
+        L'automate lit un terminal, puis développe la variable au sommet de
+        la pile selon la table LL(1) mise en cache sur la grammaire jusqu'à
+        dépiler ce terminal. Chaque symbole de pile indique en plus si tout
+        ce qui se trouve sous lui s'efface en fin d'entrée, ce qui permet
+        d'accepter par état final sans transition ε dans les états de lecture.
 
         :param grammar: Grammaire à convertir
         :return: DPDA équivalent
-        :raises GrammarConversionError: Si la conversion n'est pas possible
+        :raises GrammarConversionError: Si la grammaire n'est pas LL(1) ou si
+            un terminal n'est pas un caractère
         """
         try:
             from ..dpda import DPDA
 
-            # Conversion via PDA
-            pda = self.grammar_to_pda(grammar)
-
-            # Vérification du déterminisme
-            if not self._is_deterministic_pda(pda):
+            table = grammar.get_analysis().ll1_table()
+            if not table.is_ll1:
+                raise GrammarConversionError(
+                    "La grammaire ne peut pas être convertie en DPDA "
+                    "(non-déterministe)",
+                    "grammar_to_dpda",
+                    "; ".join(str(conflict) for conflict in table.conflicts),
+                )
+            if any(len(terminal) != 1 for terminal in grammar.terminals):
                 raise GrammarConversionError(
-                    "La grammaire ne peut pas être convertie en DPDA (non-déterministe)"
+                    "Les terminaux d'un DPDA doivent être des caractères",
+                    "grammar_to_dpda",
                 )
 
-            # Création du DPDA
-            dpda = DPDA(
-                states=pda.states,
-                input_alphabet=pda.input_alphabet,
-                stack_alphabet=pda.stack_alphabet,
-                transitions=self._convert_to_dpda_transitions(pda._transitions),
-                initial_state=pda.initial_state,
-                initial_stack_symbol=pda.initial_stack_symbol,
-                final_states=pda.final_states,
+            transitions, stack_alphabet = self._ll1_dpda_transitions(grammar, table)
+            return DPDA(
+                states={state for state, _, _ in transitions}
+                | {"q0", "q1", "q2", "q3"},
+                input_alphabet=grammar.terminals,
+                stack_alphabet=stack_alphabet,
+                transitions=transitions,
+                initial_state="q0",
+                initial_stack_symbol="Z",
+                final_states={"q2"},
             )
 
-            return dpda
-
+        except GrammarConversionError:
+            raise
         except Exception as e:
             raise GrammarConversionError(
                 f"Erreur lors de la conversion grammaire → DPDA : {e}"
             )
 
+    def _ll1_dpda_transitions(
+        self, grammar: ContextFreeGrammar, table: LL1Table
+    ) -> Tuple[Dict, Set[str]]:
+        """Construit les transitions du DPDA prédictif d'une table LL(1).
+
+        États : q0 (initial), q1 et q2 (lecture, q2 final), q3 (choix de
+        l'état de lecture après un dépilement) et q1_a (prévision a).
+        Un symbole de pile code un couple (symbole, tout le dessous
+        s'efface), sous forme d'un caractère de la zone d'usage privé.
+
+        :param grammar: Grammaire LL(1)
+        :param table: Table LL(1) sans conflit
+        :return: Transitions et alphabet de pile
+        """
+        symbols = sorted(set(table.analysis.variables) | set(grammar.terminals))
+        codes = {
+            (symbol, erasable): chr(0xE000 + 2 * index + erasable)
+            for index, symbol in enumerate(symbols)
+            for erasable in (False, True)
+        }
+
+        # Variables qui s'effacent lorsque la prévision est la fin de l'entrée
+        erasable: Set[str] = set()
+        changed = True
+        while changed:
+            changed = False
+            for variable in table.analysis.variables:
+                production = table.get(variable, END_MARKER)
+                if (
+                    variable not in erasable
+                    and production is not None
+                    and all(symbol in erasable for symbol in production.right_side)
+                ):
+                    erasable.add(variable)
+                    changed = True
+
+        transitions: Dict[Tuple[str, str, str], Tuple[str, str]] = {
+            ("q0", "", "Z"): ("q3", codes[(grammar.start_symbol, True)] + "Z"),
+            ("q3", "", "Z"): ("q2", "Z"),
+        }
+        for (symbol, below), code in codes.items():
+            accepting = below and symbol in erasable
+            transitions[("q3", "", code)] = ("q2" if accepting else "q1", code)
+
+        for terminal in grammar.terminals:
+            lookahead = f"q1_{terminal}"
+            for code in list(codes.values()) + ["Z"]:
+                transitions[("q1", terminal, code)] = (lookahead, code)
+                transitions[("q2", terminal, code)] = (lookahead, code)
+            for below in (False, True):
+                transitions[(lookahead, "", codes[(terminal, below)])] = ("q3", "")
+                for variable in table.analysis.variables:
+                    production = table.get(variable, terminal)
+                    if production is None:
+                        continue
+                    pushed = []
+                    flag = below
+                    for symbol in reversed(production.right_side):
+                        pushed.append(codes[(symbol, flag)])
+                        flag = flag and symbol in erasable
+                    transitions[(lookahead, "", codes[(variable, below)])] = (
+                        lookahead,
+                        "".join(reversed(pushed)),
+                    )
+        return transitions, set(codes.values()) | {"Z"}
+
     def grammar_to_npda(self, grammar: ContextFreeGrammar) -> "NPDA":
         """Convertit une grammaire en NPDA.
 
@@ -1097,22 +1177,7 @@ class GrammarParser:
         :param grammar: Grammaire à analyser
         :return: Ensemble des variables nullables
         """
-        nullable = set()
-        changed = True
-
-        while changed:
-            changed = False
-            for production in grammar.productions:
-                if production.is_empty():
-                    if production.left_side not in nullable:
-                        nullable.add(production.left_side)
-                        changed = True
-                elif all(symbol in nullable for symbol in production.right_side):
-                    if production.left_side not in nullable:
-                        nullable.add(production.left_side)
-                        changed = True
-
-        return nullable
+        return set(grammar.get_analysis().nullable)
 
     def _generate_combinations(
         self, symbols: Tuple[str, ...], nullable_variables: Set[str]
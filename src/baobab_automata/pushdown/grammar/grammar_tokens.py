@@ -0,0 +1,54 @@
+"""
+Découpage des entrées en jetons et empreinte des grammaires.
+
+Ce module regroupe ce que partagent les analyseurs de grammaires
+hors-contexte (Earley, CYK, LR, GLR et LL(1)) : la classe Tokenizer, qui
+découpe une chaîne selon la forme des terminaux, et grammar_fingerprint,
+qui identifie une grammaire dans les caches de compilation.
+"""
+
+from typing import Hashable, Iterable, Sequence, Tuple, Union
+
+from .grammar_types import ContextFreeGrammar
+
+
+class Tokenizer:
+    """Découpage d'une entrée en jetons.
+
+    Une chaîne est découpée en caractères si tous les terminaux sont des
+    caractères, en mots séparés par des blancs sinon ; une séquence est
+    prise telle quelle.
+
+    Attributes:
+        char_tokens: Indique si les jetons sont des caractères
+    """
+
+    def __init__(self, terminals: Iterable[str]) -> None:
+        """Choisit le découpage d'après les terminaux.
+
+        :param terminals: Terminaux de la grammaire
+        """
+        self.char_tokens = all(len(terminal) == 1 for terminal in terminals)
+
+    def tokenize(self, text: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+        """Découpe une entrée en jetons.
+
+        :param text: Chaîne ou séquence de jetons
+        :return: Jetons
+        """
+        if isinstance(text, str):
+            return tuple(text) if self.char_tokens else tuple(text.split())
+        return tuple(text)
+
+
+def grammar_fingerprint(grammar: ContextFreeGrammar) -> Hashable:
+    """Clé identifiant une grammaire, pour les caches de compilation.
+
+    :param grammar: Grammaire hors-contexte
+    :return: Clé hachable (axiome, terminaux, productions)
+    """
+    return (
+        grammar.start_symbol,
+        frozenset(grammar.terminals),
+        frozenset(grammar.productions),
+    )
@@ -171,6 +171,18 @@ class ContextFreeGrammar:
 
         return {p for p in self.productions if p.left_side == variable}
 
+    def get_analysis(self) -> "GrammarAnalysis":
+        """Obtient les analyses FIRST/FOLLOW de la grammaire.
+
+        Le résultat est calculé au premier appel puis mis en cache sur la
+        grammaire, pour être partagé par les conversions et les analyseurs.
+
+        :return: Annulables, FIRST, FOLLOW et table LL(1)
+        """
+        from .grammar_analysis import GrammarAnalysis
+
+        return GrammarAnalysis.of(self)
+
     def get_empty_productions(self) -> Set[Production]:
         """Obtient toutes les productions vides.
 
@@ -0,0 +1,123 @@
+"""
+Curseurs d'entrée partagés des automates à pile.
+
+Ce module définit la classe InputCursor, qui désigne le mot restant d'une
+configuration par une position dans le mot d'entrée au lieu d'en garder
+une copie. Consommer un symbole ne fait qu'avancer la position : toutes
+les configurations d'une simulation partagent le même mot, si bien que
+la reconnaissance d'un mot de longueur n coûte O(n) au lieu de O(n²) en
+temps et en mémoire.
+"""
+
+from functools import total_ordering
+from itertools import islice
+from typing import Iterator, Union
+
+
+@total_ordering
+class InputCursor:
+    """Position dans un mot d'entrée partagé.
+
+    Le curseur se lit comme le mot restant : len, l'indexation,
+    l'itération, startswith, str et la comparaison avec une chaîne donnent
+    les mêmes résultats que sur la chaîne word[position:], reconstruite
+    seulement lorsque str est appelé. Comme pour PushdownStack, l'empreinte
+    n'est cohérente qu'entre curseurs.
+
+    Attributes:
+        buffer: Mot d'entrée complet, partagé entre les configurations
+        position: Nombre de symboles déjà consommés
+    """
+
+    __slots__ = ("buffer", "position")
+
+    def __init__(self, buffer: str, position: int = 0) -> None:
+        """Initialise un curseur.
+
+        :param buffer: Mot d'entrée complet
+        :param position: Position du premier symbole restant
+        """
+        self.buffer = buffer
+        self.position = position
+
+    @classmethod
+    def of(cls, text: Union[str, "InputCursor"]) -> "InputCursor":
+        """Obtient un curseur au début d'un mot.
+
+        :param text: Mot restant, ou curseur déjà construit
+        :return: Curseur correspondant
+        """
+        if isinstance(text, InputCursor):
+            return text
+        return cls(text)
+
+    def advance(self, count: int = 1) -> "InputCursor":
+        """Avance le curseur sans recopier le mot.
+
+        :param count: Nombre de symboles consommés
+        :return: Nouveau curseur sur le même mot
+        :raises IndexError: Si le mot restant compte moins de count symboles
+        """
+        if count > len(self):
+            raise IndexError("Impossible d'avancer au-delà de la fin du mot")
+        return InputCursor(self.buffer, self.position + count)
+
+    def startswith(self, prefix: str) -> bool:
+        """Indique si le mot restant commence par un préfixe.
+
+        :param prefix: Préfixe recherché
+        :return: True si le mot restant commence par le préfixe
+        """
+        return self.buffer.startswith(prefix, self.position)
+
+    def __len__(self) -> int:
+        """Retourne le nombre de symboles restants."""
+        return len(self.buffer) - self.position
+
+    def __bool__(self) -> bool:
+        """Indique s'il reste au moins un symbole."""
+        return self.position < len(self.buffer)
+
+    def __iter__(self) -> Iterator[str]:
+        """Parcourt les symboles restants."""
+        return islice(self.buffer, self.position, None)
+
+    def __getitem__(self, index: Union[int, slice]) -> str:
+        """Accède aux symboles comme dans le mot restant.
+
+        :param index: Indice ou tranche, 0 désignant le prochain symbole
+        :return: Symbole ou chaîne de symboles
+        """
+        if isinstance(index, int) and 0 <= index < len(self):
+            return self.buffer[self.position + index]
+        return str(self)[index]
+
+    def __hash__(self) -> int:
+        """Retourne une empreinte en temps constant, fondée sur la longueur."""
+        # Les curseurs d'une même simulation partagent le mot : la longueur
+        # restante les distingue exactement
+        return hash(len(self))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare à un autre curseur ou à une chaîne, sans recopie."""
+        if isinstance(other, InputCursor):
+            if self.buffer is other.buffer:
+                return self.position == other.position
+            other = str(other)
+        if isinstance(other, str):
+            return len(self) == len(other) and self.startswith(other)
+        return NotImplemented
+
+    def __lt__(self, other: object) -> bool:
+        """Ordre des mots restants."""
+        if isinstance(other, (InputCursor, str)):
+            return str(self) < str(other)
+        return NotImplemented
+
+    def __str__(self) -> str:
+        """Reconstruit le mot restant."""
+        return self.buffer[self.position :]
+
+    def __repr__(self) -> str:
+        """Retourne la représentation détaillée du curseur."""
+        return f"InputCursor({self.buffer!r}, {self.position})"
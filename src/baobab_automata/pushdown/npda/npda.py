@@ -7,12 +7,16 @@ capacités avancées pour la simulation parallèle et l'optimisation des calculs
 
 import heapq
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
 
 from ..abstract_pushdown_automaton import AbstractPushdownAutomaton
+from ..saturation_recognizer import RECOGNITION_STRATEGIES, SaturationRecognizer
 from .npda_configuration import NPDAConfiguration
+from .npda_parallel import ParallelExplorer
 from .npda_exceptions import (
     InvalidNPDAError,
+    NPDAConfigurationError,
     NPDAMemoryError,
     NPDAError,
     NPDATimeoutError,
@@ -38,6 +42,7 @@ class NPDA(AbstractPushdownAutomaton):
         final_states: Set[str],
         name: Optional[str] = None,
         max_parallel_branches: int = 1000,
+        recognition_strategy: str = "search",
     ) -> None:
         """Initialise un automate à pile non-déterministe.
 
@@ -50,21 +55,27 @@ class NPDA(AbstractPushdownAutomaton):
         :param final_states: États finaux
         :param name: Nom optionnel de l'automate
         :param max_parallel_branches: Nombre maximum de branches parallèles
+        :param recognition_strategy: Stratégie de reconnaissance, parmi
+            "search", "saturation" et "auto" (voir set_recognition_strategy)
         :raises InvalidNPDAError: Si l'automate n'est pas valide
+        :raises NPDAConfigurationError: Si la stratégie est inconnue
         """
-        self._states = states
-        self._input_alphabet = input_alphabet
-        self._stack_alphabet = stack_alphabet
+        self._states = frozenset(states)
+        self._input_alphabet = frozenset(input_alphabet)
+        self._stack_alphabet = frozenset(stack_alphabet)
         self._transitions = transitions
         self._initial_state = initial_state
         self._initial_stack_symbol = initial_stack_symbol
-        self._final_states = final_states
+        self._final_states = frozenset(final_states)
         self._name = name
         self._max_parallel_branches = max_parallel_branches
+        self.set_recognition_strategy(recognition_strategy)
 
         # Configuration des capacités parallèles
         self._timeout = 10.0
         self._memory_limit = 100 * 1024 * 1024  # 100MB
+        self._workers = 1
+        self._explorer: Optional[ParallelExplorer] = None
 
         # Cache pour les optimisations
         self._epsilon_closure_cache: Dict[Tuple[str, str], Set[NPDAConfiguration]] = {}
@@ -79,6 +90,7 @@ class NPDA(AbstractPushdownAutomaton):
             "cache_misses": 0,
             "timeout_count": 0,
             "memory_limit_count": 0,
+            "saturation_runs": 0,
         }
 
         # Validation de l'automate
@@ -86,7 +98,7 @@ class NPDA(AbstractPushdownAutomaton):
             raise InvalidNPDAError("L'automate NPDA n'est pas valide")
 
     @property
-    def states(self) -> Set[str]:
+    def states(self) -> FrozenSet[str]:
         """Retourne l'ensemble des états de l'automate.
 
         :return: Ensemble des états
@@ -94,7 +106,7 @@ class NPDA(AbstractPushdownAutomaton):
         return self._states
 
     @property
-    def input_alphabet(self) -> Set[str]:
+    def input_alphabet(self) -> FrozenSet[str]:
         """Retourne l'alphabet d'entrée de l'automate.
 
         :return: Alphabet d'entrée
@@ -102,7 +114,7 @@ class NPDA(AbstractPushdownAutomaton):
         return self._input_alphabet
 
     @property
-    def stack_alphabet(self) -> Set[str]:
+    def stack_alphabet(self) -> FrozenSet[str]:
         """Retourne l'alphabet de pile de l'automate.
 
         :return: Alphabet de pile
@@ -126,13 +138,21 @@ class NPDA(AbstractPushdownAutomaton):
         return self._initial_stack_symbol
 
     @property
-    def final_states(self) -> Set[str]:
+    def final_states(self) -> FrozenSet[str]:
         """Retourne l'ensemble des états finaux.
 
         :return: États finaux
         """
         return self._final_states
 
+    @property
+    def transitions(self) -> Mapping[Tuple[str, str, str], Set[Tuple[str, str]]]:
+        """Retourne la fonction de transition en lecture seule.
+
+        :return: Vue (état, symbole d'entrée, symbole de pile) -> destinations
+        """
+        return MappingProxyType(self._transitions)
+
     @property
     def name(self) -> Optional[str]:
         """Retourne le nom de l'automate.
@@ -149,17 +169,58 @@ class NPDA(AbstractPushdownAutomaton):
         """
         return self._max_parallel_branches
 
+    @property
+    def parallel_workers(self) -> int:
+        """Retourne le nombre de processus explorant les branches.
+
+        :return: Nombre de processus, 1 pour une exploration séquentielle
+        """
+        return self._workers
+
+    @property
+    def recognition_strategy(self) -> str:
+        """Retourne la stratégie de reconnaissance.
+
+        :return: "search", "saturation" ou "auto"
+        """
+        return self._recognition_strategy
+
+    def set_recognition_strategy(self, strategy: str) -> None:
+        """Choisit la stratégie de reconnaissance utilisée par accepts.
+
+        - "search" : exploration des configurations par file de priorité,
+          bornée par max_parallel_branches et le timeout (les dépassements
+          lèvent NPDAMemoryError ou NPDATimeoutError) ;
+        - "saturation" : décision exacte et polynomiale par saturation des
+          résumés de dépilement (voir SaturationRecognizer) ;
+        - "auto" : exploration, puis saturation si le budget de branches ou
+          de temps est épuisé.
+
+        :param strategy: Nom de la stratégie
+        :raises NPDAConfigurationError: Si la stratégie est inconnue
+        """
+        if strategy not in RECOGNITION_STRATEGIES:
+            raise NPDAConfigurationError(
+                f"Stratégie de reconnaissance inconnue : '{strategy}'",
+                [f"Stratégies disponibles : {', '.join(RECOGNITION_STRATEGIES)}"],
+            )
+        self._recognition_strategy = strategy
+
     def configure_parallel_execution(
         self,
         max_branches: int = 1000,
         timeout: float = 10.0,
         memory_limit: int = 100 * 1024 * 1024,  # 100MB
+        workers: int = 1,
     ) -> None:
         """Configure les paramètres d'exécution parallèle.
 
         :param max_branches: Nombre maximum de branches parallèles
         :param timeout: Timeout en secondes
         :param memory_limit: Limite de mémoire en octets
+        :param workers: Nombre de processus explorant les branches ; au-delà
+            de 1, la recherche est répartie entre des processus (voir
+            accepts_many pour réutiliser les processus d'un mot à l'autre)
         :raises NPDAError: Si la configuration est invalide
         """
         if max_branches <= 0:
@@ -168,10 +229,13 @@ class NPDA(AbstractPushdownAutomaton):
             raise NPDAError("Le timeout doit être positif")
         if memory_limit <= 0:
             raise NPDAError("La limite de mémoire doit être positive")
+        if workers < 1:
+            raise NPDAError("Le nombre de processus doit être au moins 1")
 
         self._max_parallel_branches = max_branches
         self._timeout = timeout
         self._memory_limit = memory_limit
+        self._workers = workers
 
     def accepts(self, word: str) -> bool:
         """Vérifie si un mot est accepté par l'automate.
@@ -179,8 +243,10 @@ class NPDA(AbstractPushdownAutomaton):
         :param word: Mot à tester
         :return: True si le mot est accepté, False sinon
         :raises NPDAError: En cas d'erreur de traitement
-        :raises NPDATimeoutError: Si le calcul dépasse le timeout
+        :raises NPDATimeoutError: Si le calcul dépasse le timeout (stratégie
+            "search")
         :raises NPDAMemoryError: Si le calcul dépasse la limite mémoire
+            (stratégie "search")
         """
         if not isinstance(word, str):
             raise NPDAError("Le mot doit être une chaîne de caractères")
@@ -194,15 +260,68 @@ class NPDA(AbstractPushdownAutomaton):
         self._performance_stats["total_computations"] += 1
 
         try:
-            result = self._simulate_word_parallel(word)
-            self._recognition_cache[word] = result
-            return result
-        except NPDATimeoutError:
-            self._performance_stats["timeout_count"] += 1
-            raise
-        except NPDAMemoryError:
-            self._performance_stats["memory_limit_count"] += 1
-            raise
+            if self._recognition_strategy == "saturation":
+                result = self._recognize_by_saturation(word)
+            elif self._workers > 1:
+                result = self._simulate_word_on_workers(word)
+            else:
+                result = self._simulate_word_parallel(word)
+        except (NPDATimeoutError, NPDAMemoryError) as error:
+            if isinstance(error, NPDATimeoutError):
+                self._performance_stats["timeout_count"] += 1
+            else:
+                self._performance_stats["memory_limit_count"] += 1
+            if self._recognition_strategy != "auto":
+                raise
+            # Budget épuisé : décision exacte par saturation
+            result = self._recognize_by_saturation(word)
+
+        self._recognition_cache[word] = result
+        return result
+
+    def accepts_many(self, words: Iterable[str]) -> List[bool]:
+        """Vérifie l'acceptation de plusieurs mots.
+
+        Avec plusieurs processus (voir configure_parallel_execution), un seul
+        groupe de processus est démarré pour tous les mots au lieu d'un par
+        appel à accepts. Sous les méthodes de démarrage « spawn » et
+        « forkserver », le script appelant doit protéger son point d'entrée
+        par ``if __name__ == "__main__":``.
+
+        :param words: Mots à tester
+        :return: Décisions, dans l'ordre des mots
+        :raises NPDAError: En cas d'erreur de traitement
+        :raises NPDATimeoutError: Si un calcul dépasse le timeout (stratégie
+            "search")
+        :raises NPDAMemoryError: Si un calcul dépasse la limite mémoire
+            (stratégie "search")
+        """
+        words = list(words)
+        if self._workers == 1 or self._recognition_strategy == "saturation":
+            return [self.accepts(word) for word in words]
+
+        self._explorer = self._parallel_explorer()
+        self._explorer.start(self._workers)
+        try:
+            return [self.accepts(word) for word in words]
+        finally:
+            self._explorer.close()
+            self._explorer = None
+
+    def _recognize_by_saturation(self, word: str) -> bool:
+        """Décide l'appartenance d'un mot par saturation des résumés.
+
+        :param word: Mot à tester
+        :return: True si le mot est accepté, False sinon
+        """
+        self._performance_stats["saturation_runs"] += 1
+        recognizer = SaturationRecognizer(
+            self._transitions,
+            self._initial_state,
+            self._initial_stack_symbol,
+            self._final_states,
+        )
+        return recognizer.recognize(word)
 
     def get_transitions(
         self, state: str, input_symbol: str, stack_symbol: str
@@ -357,8 +476,10 @@ class NPDA(AbstractPushdownAutomaton):
             depth=0,
         )
 
-        # File de priorité pour gérer les configurations
-        config_queue = [(-initial_config.priority, initial_config)]
+        # File de priorité pour gérer les configurations ; à priorité égale,
+        # l'ordre d'insertion départage sans comparer les piles
+        config_queue = [(-initial_config.priority, 0, initial_config)]
+        insertions = 1
         visited_configs = set()
         branch_counter = 0
 
@@ -378,12 +499,14 @@ class NPDA(AbstractPushdownAutomaton):
                 )
 
             # Récupération de la configuration avec la plus haute priorité
-            _, current_config = heapq.heappop(config_queue)
+            _, _, current_config = heapq.heappop(config_queue)
 
             # Vérification si la configuration a déjà été visitée
+            # Position dans le mot partagé et pile partagée : empreinte en
+            # temps constant, sans recopie du mot ni de la pile
             config_key = (
                 current_config.state,
-                current_config.remaining_input,
+                current_config.position,
                 current_config.stack,
             )
             if config_key in visited_configs:
@@ -406,10 +529,40 @@ class NPDA(AbstractPushdownAutomaton):
 
             # Ajout des nouvelles configurations à la file de priorité
             for config in new_configs:
-                heapq.heappush(config_queue, (-config.priority, config))
+                heapq.heappush(config_queue, (-config.priority, insertions, config))
+                insertions += 1
 
         return False
 
+    def _simulate_word_on_workers(self, word: str) -> bool:
+        """Simule la reconnaissance d'un mot sur plusieurs processus.
+
+        :param word: Mot à simuler
+        :return: True si le mot est accepté, False sinon
+        :raises NPDATimeoutError: Si le calcul dépasse le timeout
+        :raises NPDAMemoryError: Si trop de branches sont en attente
+        """
+        explorer = self._explorer or self._parallel_explorer()
+        accepted, branches = explorer.explore(
+            word, self._workers, self._max_parallel_branches, self._timeout
+        )
+        self._performance_stats["parallel_branches_created"] += branches
+        return accepted
+
+    def _parallel_explorer(self) -> ParallelExplorer:
+        """Compile les transitions pour l'exploration sur plusieurs processus.
+
+        :return: Explorateur, sans groupe de processus démarré
+        """
+        return ParallelExplorer(
+            self._transitions,
+            self._states,
+            self._stack_alphabet,
+            self._initial_state,
+            self._initial_stack_symbol,
+            self._final_states,
+        )
+
     def _generate_next_configurations(
         self, config: NPDAConfiguration, branch_counter: int
     ) -> List[NPDAConfiguration]:
@@ -642,6 +795,7 @@ class NPDA(AbstractPushdownAutomaton):
                 final_states=self._final_states,
                 name=f"Optimized_{self._name or 'NPDA'}",
                 max_parallel_branches=self._max_parallel_branches,
+                recognition_strategy=self._recognition_strategy,
             )
 
             # Optimisations appliquées
@@ -769,6 +923,7 @@ class NPDA(AbstractPushdownAutomaton):
             "cache_misses": 0,
             "timeout_count": 0,
             "memory_limit_count": 0,
+            "saturation_runs": 0,
         }
 
     def union(self, other: "NPDA") -> "NPDA":
@@ -846,6 +1001,7 @@ class NPDA(AbstractPushdownAutomaton):
             max_parallel_branches=max(
                 self._max_parallel_branches, other._max_parallel_branches
             ),
+            recognition_strategy=self._recognition_strategy,
         )
 
     def concatenation(self, other: "NPDA") -> "NPDA":
@@ -927,6 +1083,7 @@ class NPDA(AbstractPushdownAutomaton):
             max_parallel_branches=max(
                 self._max_parallel_branches, other._max_parallel_branches
             ),
+            recognition_strategy=self._recognition_strategy,
         )
 
     def kleene_star(self) -> "NPDA":
@@ -995,6 +1152,7 @@ class NPDA(AbstractPushdownAutomaton):
             final_states=new_final_states,
             name=f"Kleene({self._name or 'NPDA'})",
             max_parallel_branches=self._max_parallel_branches,
+            recognition_strategy=self._recognition_strategy,
         )
 
     @classmethod
@@ -1182,6 +1340,8 @@ class NPDA(AbstractPushdownAutomaton):
             "max_parallel_branches": self._max_parallel_branches,
             "timeout": self._timeout,
             "memory_limit": self._memory_limit,
+            "workers": self._workers,
+            "recognition_strategy": self._recognition_strategy,
         }
 
     @classmethod
@@ -1212,6 +1372,7 @@ class NPDA(AbstractPushdownAutomaton):
                 final_states=set(data["final_states"]),
                 name=data.get("name"),
                 max_parallel_branches=data.get("max_parallel_branches", 1000),
+                recognition_strategy=data.get("recognition_strategy", "search"),
             )
         except (KeyError, ValueError) as e:
             raise InvalidNPDAError(f"Données de NPDA invalides : {e}")
@@ -1235,12 +1396,12 @@ class NPDA(AbstractPushdownAutomaton):
         :return: Représentation technique pour le débogage
         """
         return (
-            f"NPDA(states={self._states}, "
-            f"input_alphabet={self._input_alphabet}, "
-            f"stack_alphabet={self._stack_alphabet}, "
+            f"NPDA(states={set(self._states)}, "
+            f"input_alphabet={set(self._input_alphabet)}, "
+            f"stack_alphabet={set(self._stack_alphabet)}, "
             f"transitions=..., "
             f"initial_state='{self._initial_state}', "
             f"initial_stack_symbol='{self._initial_stack_symbol}', "
-            f"final_states={self._final_states}, "
+            f"final_states={set(self._final_states)}, "
             f"max_parallel_branches={self._max_parallel_branches})"
         )
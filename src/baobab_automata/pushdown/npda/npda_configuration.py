@@ -8,6 +8,9 @@ les configurations d'un NPDA avec support des capacités parallèles.
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from ..input_cursor import InputCursor
+from ..pushdown_stack import PushdownStack
+
 
 @dataclass(frozen=True, order=True)
 class NPDAConfiguration:
@@ -19,8 +22,10 @@ class NPDAConfiguration:
 
     Attributes:
         state: État actuel de l'automate
-        remaining_input: Mot restant à traiter
-        stack: Représentation de la pile comme une chaîne (sommet à gauche)
+        remaining_input: Mot restant, curseur sur le mot d'entrée partagé
+            (une chaîne étant acceptée à la construction)
+        stack: Pile partagée (sommet à gauche), une chaîne étant acceptée
+            à la construction
         priority: Priorité pour l'ordre de traitement (plus élevé = plus prioritaire)
         branch_id: Identifiant unique de la branche de calcul
         depth: Profondeur de la configuration dans l'arbre de calcul
@@ -28,8 +33,8 @@ class NPDAConfiguration:
     """
 
     state: str
-    remaining_input: str
-    stack: str  # Représentation de la pile comme une chaîne
+    remaining_input: InputCursor  # Curseur, construit depuis une chaîne
+    stack: PushdownStack  # Pile partagée, construite depuis une chaîne
     priority: int = 0  # Priorité pour l'ordre de traitement
     branch_id: int = 0  # Identifiant de la branche
     depth: int = 0  # Profondeur dans l'arbre de calcul
@@ -42,9 +47,17 @@ class NPDAConfiguration:
         """
         if not self.state:
             raise ValueError("L'état ne peut pas être vide")
-        if not isinstance(self.remaining_input, str):
+        if isinstance(self.remaining_input, str):
+            # Configuration figée : le mot est normalisé sans __setattr__
+            object.__setattr__(
+                self, "remaining_input", InputCursor.of(self.remaining_input)
+            )
+        elif not isinstance(self.remaining_input, InputCursor):
             raise ValueError("Le mot restant doit être une chaîne")
-        if not isinstance(self.stack, str):
+        if isinstance(self.stack, str):
+            # Configuration figée : la pile est normalisée sans __setattr__
+            object.__setattr__(self, "stack", PushdownStack.of(self.stack))
+        elif not isinstance(self.stack, PushdownStack):
             raise ValueError("La pile doit être une chaîne")
         if self.priority < 0:
             raise ValueError("La priorité ne peut pas être négative")
@@ -62,7 +75,7 @@ class NPDAConfiguration:
 
         :return: True si la configuration est acceptante, False sinon
         """
-        return self.remaining_input == ""
+        return not self.remaining_input
 
     @property
     def is_final(self) -> bool:
@@ -72,7 +85,7 @@ class NPDAConfiguration:
 
         :return: True si la configuration est finale, False sinon
         """
-        return self.remaining_input == ""
+        return not self.remaining_input
 
     @property
     def stack_top(self) -> str:
@@ -80,7 +93,7 @@ class NPDAConfiguration:
 
         :return: Symbole au sommet de la pile ou chaîne vide si la pile est vide
         """
-        return self.stack[0] if self.stack else ""
+        return self.stack.top
 
     @property
     def stack_bottom(self) -> str:
@@ -106,6 +119,14 @@ class NPDAConfiguration:
         """
         return len(self.remaining_input)
 
+    @property
+    def position(self) -> int:
+        """Retourne la position du prochain symbole dans le mot d'entrée.
+
+        :return: Nombre de symboles déjà consommés
+        """
+        return self.remaining_input.position
+
     def push_symbol(self, symbol: str) -> "NPDAConfiguration":
         """Crée une nouvelle configuration avec un symbole empilé.
 
@@ -119,7 +140,7 @@ class NPDAConfiguration:
         return NPDAConfiguration(
             state=self.state,
             remaining_input=self.remaining_input,
-            stack=symbol + self.stack,  # Empilage au début (sommet à gauche)
+            stack=self.stack.push(symbol),  # Empilage au sommet (à gauche)
             priority=self.priority,
             branch_id=self.branch_id,
             depth=self.depth + 1,
@@ -139,7 +160,7 @@ class NPDAConfiguration:
         return NPDAConfiguration(
             state=self.state,
             remaining_input=self.remaining_input,
-            stack=symbols + self.stack,  # Empilage au début (sommet à gauche)
+            stack=self.stack.push(symbols),  # Empilage au sommet (à gauche)
             priority=self.priority,
             branch_id=self.branch_id,
             depth=self.depth + 1,
@@ -158,7 +179,7 @@ class NPDAConfiguration:
         return NPDAConfiguration(
             state=self.state,
             remaining_input=self.remaining_input,
-            stack=self.stack[1:],  # Dépilage du premier caractère
+            stack=self.stack.pop(),  # Dépilage du sommet
             priority=self.priority,
             branch_id=self.branch_id,
             depth=self.depth + 1,
@@ -181,7 +202,7 @@ class NPDAConfiguration:
 
         return NPDAConfiguration(
             state=self.state,
-            remaining_input=self.remaining_input[length:],
+            remaining_input=self.remaining_input.advance(length),
             stack=self.stack,
             priority=self.priority,
             branch_id=self.branch_id,
@@ -256,8 +277,8 @@ class NPDAConfiguration:
         """
         return {
             "state": self.state,
-            "remaining_input": self.remaining_input,
-            "stack": self.stack,
+            "remaining_input": str(self.remaining_input),
+            "stack": str(self.stack),
             "priority": self.priority,
             "branch_id": self.branch_id,
             "depth": self.depth,
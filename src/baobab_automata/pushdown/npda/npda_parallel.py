@@ -0,0 +1,451 @@
+"""
+Exploration des configurations d'un NPDA sur un groupe de processus.
+
+Ce module contient la classe ParallelExplorer, qui répartit la frontière
+de la recherche d'un NPDA entre plusieurs processus :
+
+- l'ensemble des configurations visitées est partagé en fragments : chaque
+  configuration appartient au processus désigné par l'empreinte CRC32 de
+  son encodage, qui seul la déduplique ;
+- chaque processus développe sa file locale et envoie les successeurs
+  aux propriétaires par lots ; un processus inactif vole la moitié de la
+  file du processus le plus chargé ;
+- un compteur partagé des configurations en attente détecte la fin de
+  l'exploration, et un événement partagé interrompt tous les processus
+  dès qu'une configuration acceptante est trouvée.
+
+Les configurations circulent sous forme binaire : état, position et
+hauteur de pile sur un en-tête fixe, puis les codes des symboles de pile,
+sommet en tête. Les lots sont des concaténations de configurations.
+
+Le groupe de processus peut rester démarré entre deux mots (start, puis
+close) : chaque mot est un travail numéroté, et les messages d'un travail
+terminé sont ignorés. Démarrer un groupe coûte plusieurs dizaines de
+millisecondes.
+
+Avec les méthodes de démarrage « spawn » et « forkserver » (par défaut
+sous Windows et macOS, et sous Linux à partir de Python 3.14), chaque
+processus réimporte le module principal : le script appelant doit placer
+son point d'entrée sous ``if __name__ == "__main__":``.
+"""
+
+import multiprocessing
+import struct
+import time
+import zlib
+from collections import deque
+from queue import Empty
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from .npda_exceptions import NPDAMemoryError, NPDATimeoutError
+
+# En-tête d'une configuration : état, position dans le mot, octets de pile
+_HEADER = struct.Struct("<III")
+
+# Nombre de configurations développées entre deux lectures de la boîte
+_ROUND = 256
+
+# Transitions codées : (état, entrée, sommet) -> ((état, octets empilés), ...)
+_Moves = Dict[Tuple[int, str, bytes], Tuple[Tuple[int, bytes], ...]]
+
+# Tables compilées : états finaux et transitions codées
+_Tables = Tuple[frozenset, _Moves]
+
+
+class ParallelExplorer:
+    """
+    Recherche d'une configuration acceptante répartie sur des processus.
+
+    Les états et les symboles de pile sont numérotés ; un symbole de pile
+    occupe un octet, ou deux au-delà de 256 symboles.
+    """
+
+    def __init__(
+        self,
+        transitions: Dict[Tuple[str, str, str], Iterable[Tuple[str, str]]],
+        states: Iterable[str],
+        stack_alphabet: Iterable[str],
+        initial_state: str,
+        initial_stack_symbol: str,
+        final_states: Iterable[str],
+    ) -> None:
+        """
+        Compile les transitions dans un codage entier.
+
+        :param transitions: Transitions (état, entrée, sommet) vers des
+            couples (état, symboles empilés)
+        :type transitions: Dict[Tuple[str, str, str], Iterable[Tuple[str, str]]]
+        :param states: États de l'automate
+        :type states: Iterable[str]
+        :param stack_alphabet: Alphabet de pile
+        :type stack_alphabet: Iterable[str]
+        :param initial_state: État initial
+        :type initial_state: str
+        :param initial_stack_symbol: Symbole initial de pile
+        :type initial_stack_symbol: str
+        :param final_states: États finaux
+        :type final_states: Iterable[str]
+        """
+        self._states = {state: code for code, state in enumerate(sorted(states))}
+        symbols = set(stack_alphabet) | set(initial_stack_symbol)
+        for (_, _, top), targets in transitions.items():
+            symbols.update(top)
+            for _, pushed in targets:
+                symbols.update(pushed)
+        self._width = 1 if len(symbols) <= 256 else 2
+        self._symbols = {symbol: code for code, symbol in enumerate(sorted(symbols))}
+
+        moves: _Moves = {}
+        for (state, symbol, top), targets in transitions.items():
+            # Transitions que la simulation séquentielle peut appliquer
+            if len(symbol) > 1 or len(top) != 1:
+                continue
+            moves[(self._states[state], symbol, self._encode_stack(top))] = tuple(
+                (self._states[target], self._encode_stack(pushed))
+                for target, pushed in targets
+            )
+        finals = frozenset(self._states[state] for state in final_states)
+        self._tables: _Tables = (finals, moves)
+        self._initial = _encode(
+            self._states[initial_state], 0, self._encode_stack(initial_stack_symbol)
+        )
+        self._pool: Optional[_Pool] = None
+
+    @property
+    def running(self) -> bool:
+        """
+        Indique si un groupe de processus est démarré.
+
+        :return: True entre start et close
+        :rtype: bool
+        """
+        return self._pool is not None
+
+    def start(self, workers: int) -> None:
+        """
+        Démarre un groupe de processus, réutilisé par explore jusqu'à close.
+
+        :param workers: Nombre de processus
+        :type workers: int
+        """
+        self.close()
+        self._pool = _Pool(self._tables, self._width, workers)
+
+    def close(self) -> None:
+        """
+        Arrête le groupe de processus démarré par start, s'il existe.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelExplorer":
+        """Retourne l'explorateur, dont le groupe est arrêté en sortie."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Arrête le groupe de processus."""
+        self.close()
+
+    def explore(
+        self,
+        word: str,
+        workers: int,
+        max_pending: int,
+        timeout: float,
+    ) -> Tuple[bool, int]:
+        """
+        Cherche une configuration acceptante pour un mot.
+
+        Le groupe démarré par start est utilisé s'il compte le nombre de
+        processus demandé ; sinon, un groupe est démarré pour ce seul mot.
+
+        :param word: Mot à reconnaître
+        :type word: str
+        :param workers: Nombre de processus
+        :type workers: int
+        :param max_pending: Nombre maximal de configurations en attente
+        :type max_pending: int
+        :param timeout: Durée maximale en secondes
+        :type timeout: float
+        :return: Décision et nombre de branches créées
+        :rtype: Tuple[bool, int]
+        :raises NPDATimeoutError: Si la durée maximale est dépassée
+        :raises NPDAMemoryError: Si trop de configurations sont en attente
+        """
+        if self._pool is not None and self._pool.workers == workers:
+            return self._pool.run(self._initial, word, max_pending, timeout)
+        pool = _Pool(self._tables, self._width, workers)
+        try:
+            return pool.run(self._initial, word, max_pending, timeout)
+        finally:
+            pool.close()
+
+    def _encode_stack(self, symbols: str) -> bytes:
+        """Codes des symboles de pile, sommet en tête."""
+        return b"".join(
+            self._symbols[symbol].to_bytes(self._width, "big") for symbol in symbols
+        )
+
+
+def _encode(state: int, position: int, stack: bytes) -> bytes:
+    """Encodage binaire d'une configuration."""
+    return _HEADER.pack(state, position, len(stack)) + stack
+
+
+def _decode(batch: bytes) -> List[bytes]:
+    """Découpe un lot en configurations encodées."""
+    configs = []
+    offset = 0
+    while offset < len(batch):
+        end = offset + _HEADER.size + _HEADER.unpack_from(batch, offset)[2]
+        configs.append(batch[offset:end])
+        offset = end
+    return configs
+
+
+def _owner(config: bytes, workers: int) -> int:
+    """Processus propriétaire d'une configuration, stable entre processus."""
+    return zlib.crc32(config) % workers
+
+
+def _add(counter, amount: int) -> None:
+    """Ajoute une quantité à un compteur partagé."""
+    if amount:
+        with counter.get_lock():
+            counter.value += amount
+
+
+class _Pool:
+    """Groupe de processus et objets partagés, réutilisés d'un mot à l'autre."""
+
+    def __init__(self, tables: _Tables, width: int, workers: int) -> None:
+        """Démarre les processus ; les tables ne sont transmises qu'une fois."""
+        context = multiprocessing.get_context()
+        self.workers = workers
+        self.inboxes = [context.Queue() for _ in range(workers)]
+        self.pending = context.Value("q", 0)
+        self.branches = context.Value("q", 0)
+        self.loads = context.Array("q", workers)
+        # Dernier travail acquitté par chaque processus
+        self.acks = context.Array("q", workers)
+        # Numéro du travail en cours, 0 entre deux mots
+        self.active = context.Value("q", 0, lock=False)
+        self.found = context.Event()
+        self.shutdown = context.Event()
+        self._job = 0
+        self.processes = [
+            context.Process(
+                target=_explore_shard,
+                args=(
+                    index,
+                    tables,
+                    width,
+                    self.inboxes,
+                    self.pending,
+                    self.branches,
+                    self.loads,
+                    self.acks,
+                    self.active,
+                    self.found,
+                    self.shutdown,
+                ),
+                daemon=True,
+            )
+            for index in range(workers)
+        ]
+        for process in self.processes:
+            process.start()
+
+    def run(
+        self, initial: bytes, word: str, max_pending: int, timeout: float
+    ) -> Tuple[bool, int]:
+        """Explore un mot sur le groupe (voir ParallelExplorer.explore)."""
+        self._job += 1
+        job = self._job
+        self.found.clear()
+        self.pending.value = 1
+        self.branches.value = 0
+        for index in range(self.workers):
+            self.loads[index] = 0
+        self.active.value = job
+        for inbox in self.inboxes:
+            inbox.put(("job", job, word))
+        self.inboxes[_owner(initial, self.workers)].put(("configs", job, initial))
+
+        start_time = time.time()
+        try:
+            while not self.found.wait(0.002):
+                if self.pending.value == 0:
+                    break
+                if time.time() - start_time > timeout:
+                    raise NPDATimeoutError(
+                        f"Timeout de calcul dépassé ({timeout}s)", timeout, word
+                    )
+                if self.pending.value > max_pending:
+                    raise NPDAMemoryError(
+                        f"Limite de branches parallèles dépassée ({max_pending})",
+                        max_pending,
+                        self.pending.value,
+                    )
+            return self.found.is_set(), self.branches.value
+        finally:
+            # Les processus abandonnent le mot ; les compteurs ne sont remis à
+            # zéro pour le mot suivant qu'une fois la fin acquittée par tous
+            self.active.value = 0
+            while any(ack < job for ack in self.acks[:]):
+                if not all(process.is_alive() for process in self.processes):
+                    break
+                time.sleep(0.001)
+
+    def close(self) -> None:
+        """Arrête les processus et libère les files."""
+        self.shutdown.set()
+        for process in self.processes:
+            process.join(0.5)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        for inbox in self.inboxes:
+            inbox.cancel_join_thread()
+            inbox.close()
+
+
+def _explore_shard(
+    index: int,
+    tables: _Tables,
+    width: int,
+    inboxes: list,
+    pending,
+    branches,
+    loads,
+    acks,
+    active,
+    found,
+    shutdown,
+) -> None:
+    """Boucle d'un processus : déduplication, développement et vol de travail.
+
+    Chaque message porte le numéro du travail (du mot) auquel il appartient :
+    les messages d'un travail terminé sont ignorés, ceux d'un travail pas
+    encore annoncé sont différés jusqu'à son annonce.
+    """
+    finals, moves = tables
+    workers = len(inboxes)
+    inbox = inboxes[index]
+    job = latest = 0
+    word = ""
+    visited: Set[bytes] = set()
+    local: Deque[bytes] = deque()
+    deferred: List[tuple] = []
+    stealing = False
+
+    try:
+        while not shutdown.is_set():
+            if job and active.value != job:
+                # Travail terminé : état local effacé, fin acquittée
+                visited = set()
+                local.clear()
+                stealing = False
+                loads[index] = 0
+                acks[index] = job
+                job = 0
+
+            # Boîte de réception : annonces, lots à dédupliquer, travail volé,
+            # demandes de vol
+            replay: List[tuple] = []
+            while True:
+                if replay:
+                    kind, number, payload = replay.pop(0)
+                else:
+                    try:
+                        kind, number, payload = (
+                            inbox.get_nowait() if local else inbox.get(timeout=0.005)
+                        )
+                    except Empty:
+                        break
+                if kind == "job":
+                    latest = number
+                    if active.value != number:
+                        acks[index] = number
+                        continue
+                    job, word = number, payload
+                    # Messages arrivés avant l'annonce du travail
+                    replay = [message for message in deferred if message[1] == number]
+                    deferred = [message for message in deferred if message[1] > number]
+                elif number > latest:
+                    deferred.append((kind, number, payload))
+                elif number != job:
+                    continue
+                elif kind == "configs":
+                    configs = _decode(payload)
+                    fresh = [config for config in configs if config not in visited]
+                    visited.update(fresh)
+                    local.extend(fresh)
+                    _add(pending, len(fresh) - len(configs))
+                elif kind == "stolen":
+                    local.extend(_decode(payload))
+                    stealing = False
+                elif kind == "steal":
+                    share = [local.pop() for _ in range(len(local) // 2)]
+                    inboxes[payload].put(("stolen", job, b"".join(share)))
+
+            if not job:
+                continue
+            if not local:
+                # Vol de travail : la moitié de la file la plus chargée
+                if not stealing:
+                    victim = max(range(workers), key=lambda other: loads[other])
+                    if victim != index and loads[victim] > 1:
+                        inboxes[victim].put(("steal", job, index))
+                        stealing = True
+                continue
+
+            length = len(word)
+            outgoing: List[List[bytes]] = [[] for _ in range(workers)]
+            processed = created = 0
+            while local and processed < _ROUND:
+                config = local.popleft()
+                processed += 1
+                state, position, height = _HEADER.unpack_from(config)
+                if position == length and state in finals:
+                    found.set()
+                    local.clear()
+                    break
+                if not height:
+                    continue
+                stack = config[_HEADER.size :]
+                top, below = stack[:width], stack[width:]
+                successors = [
+                    (target, position, pushed)
+                    for target, pushed in moves.get((state, "", top), ())
+                ]
+                if position < length:
+                    symbol = word[position]
+                    successors.extend(
+                        (target, position + 1, pushed)
+                        for target, pushed in moves.get((state, symbol, top), ())
+                    )
+                created += len(successors)
+                for target, after, pushed in successors:
+                    successor = _encode(target, after, pushed + below)
+                    outgoing[_owner(successor, workers)].append(successor)
+
+            # Les successeurs sont comptés avant d'être envoyés et les
+            # configurations développées décomptées ensuite : le compteur ne
+            # s'annule que lorsqu'aucune configuration ne reste à traiter
+            own = [config for config in outgoing[index] if config not in visited]
+            visited.update(own)
+            local.extend(own)
+            outgoing[index] = []
+            _add(pending, len(own) + sum(map(len, outgoing)))
+            for other, batch in enumerate(outgoing):
+                if batch:
+                    inboxes[other].put(("configs", job, b"".join(batch)))
+            _add(branches, created)
+            _add(pending, -processed)
+            loads[index] = len(local)
+    finally:
+        # Les messages restés dans les files ne doivent pas bloquer la sortie
+        for queue in inboxes:
+            queue.cancel_join_thread()
@@ -7,9 +7,11 @@ des langages plus complexes comme a^n b^n ou les palindromes.
 """
 
 from collections import deque
-from typing import Any, Dict, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Set, Tuple
 
 from ..abstract_pushdown_automaton import AbstractPushdownAutomaton
+from ..saturation_recognizer import RECOGNITION_STRATEGIES, SaturationRecognizer
 from .pda_configuration import PDAConfiguration
 from .pda_exceptions import (
     InvalidPDAError,
@@ -44,6 +46,7 @@ class PDA(AbstractPushdownAutomaton):
         initial_stack_symbol: str,
         final_states: Set[str],
         name: Optional[str] = None,
+        recognition_strategy: str = "search",
     ) -> None:
         """Initialise un automate à pile non-déterministe.
 
@@ -55,6 +58,8 @@ class PDA(AbstractPushdownAutomaton):
         :param initial_stack_symbol: Symbole initial de pile
         :param final_states: États finaux
         :param name: Nom optionnel de l'automate
+        :param recognition_strategy: Stratégie de reconnaissance, parmi
+            "search", "saturation" et "auto" (voir set_recognition_strategy)
         :raises InvalidPDAError: Si l'automate n'est pas valide
         """
         self._states = frozenset(states)
@@ -65,6 +70,7 @@ class PDA(AbstractPushdownAutomaton):
         self._initial_stack_symbol = initial_stack_symbol
         self._final_states = frozenset(final_states)
         self._name = name
+        self.set_recognition_strategy(recognition_strategy)
 
         # Cache pour les optimisations
         self._epsilon_closure_cache: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
@@ -75,28 +81,28 @@ class PDA(AbstractPushdownAutomaton):
             raise InvalidPDAError("L'automate à pile n'est pas valide")
 
     @property
-    def states(self) -> Set[str]:
+    def states(self) -> FrozenSet[str]:
         """Retourne l'ensemble des états de l'automate.
 
         :return: Ensemble des états
         """
-        return set(self._states)
+        return self._states
 
     @property
-    def input_alphabet(self) -> Set[str]:
+    def input_alphabet(self) -> FrozenSet[str]:
         """Retourne l'alphabet d'entrée de l'automate.
 
         :return: Alphabet d'entrée
         """
-        return set(self._input_alphabet)
+        return self._input_alphabet
 
     @property
-    def stack_alphabet(self) -> Set[str]:
+    def stack_alphabet(self) -> FrozenSet[str]:
         """Retourne l'alphabet de pile de l'automate.
 
         :return: Alphabet de pile
         """
-        return set(self._stack_alphabet)
+        return self._stack_alphabet
 
     @property
     def initial_state(self) -> str:
@@ -115,12 +121,20 @@ class PDA(AbstractPushdownAutomaton):
         return self._initial_stack_symbol
 
     @property
-    def final_states(self) -> Set[str]:
+    def final_states(self) -> FrozenSet[str]:
         """Retourne l'ensemble des états finaux.
 
         :return: États finaux
         """
-        return set(self._final_states)
+        return self._final_states
+
+    @property
+    def transitions(self) -> Mapping[Tuple[str, str, str], Set[Tuple[str, str]]]:
+        """Retourne la fonction de transition en lecture seule.
+
+        :return: Vue (état, symbole d'entrée, symbole de pile) -> destinations
+        """
+        return MappingProxyType(self._transitions)
 
     @property
     def name(self) -> Optional[str]:
@@ -130,6 +144,34 @@ class PDA(AbstractPushdownAutomaton):
         """
         return self._name
 
+    @property
+    def recognition_strategy(self) -> str:
+        """Retourne la stratégie de reconnaissance.
+
+        :return: "search", "saturation" ou "auto"
+        """
+        return self._recognition_strategy
+
+    def set_recognition_strategy(self, strategy: str) -> None:
+        """Choisit la stratégie de reconnaissance utilisée par accepts.
+
+        - "search" : exploration en largeur des configurations, bornée en
+          nombre d'itérations (un mot est rejeté si la borne est atteinte) ;
+        - "saturation" : décision exacte et polynomiale par saturation des
+          résumés de dépilement (voir SaturationRecognizer) ;
+        - "auto" : exploration, puis saturation si la borne est atteinte
+          avant la fin de l'exploration.
+
+        :param strategy: Nom de la stratégie
+        :raises PDAError: Si la stratégie est inconnue
+        """
+        if strategy not in RECOGNITION_STRATEGIES:
+            raise PDAError(
+                f"Stratégie de reconnaissance inconnue: '{strategy}' "
+                f"(disponibles: {', '.join(RECOGNITION_STRATEGIES)})"
+            )
+        self._recognition_strategy = strategy
+
     def accepts(self, word: str) -> bool:
         """Vérifie si un mot est accepté par l'automate.
 
@@ -141,6 +183,8 @@ class PDA(AbstractPushdownAutomaton):
             raise PDAError(f"Le mot doit être une chaîne, reçu: {type(word)}")
 
         try:
+            if self._recognition_strategy == "saturation":
+                return self._recognize_by_saturation(word)
             return self._simulate_word(word)
         except Exception as e:
             raise PDAError(f"Erreur lors de la simulation du mot '{word}': {e}")
@@ -352,6 +396,7 @@ class PDA(AbstractPushdownAutomaton):
             "initial_stack_symbol": self._initial_stack_symbol,
             "final_states": list(self._final_states),
             "name": self._name,
+            "recognition_strategy": self._recognition_strategy,
         }
 
     @classmethod
@@ -384,6 +429,7 @@ class PDA(AbstractPushdownAutomaton):
                 initial_stack_symbol=data["initial_stack_symbol"],
                 final_states=set(data["final_states"]),
                 name=data.get("name"),
+                recognition_strategy=data.get("recognition_strategy", "search"),
             )
 
         except KeyError as e:
@@ -419,15 +465,17 @@ class PDA(AbstractPushdownAutomaton):
             current_config = config_queue.popleft()
 
             # Vérification de l'acceptation
-            if current_config.remaining_input == "" and self.is_final_state(
+            if not current_config.remaining_input and self.is_final_state(
                 current_config.state
             ):
                 return True
 
             # Éviter les configurations déjà visitées
+            # Position dans le mot partagé et pile partagée : empreinte en
+            # temps constant, sans recopie du mot ni de la pile
             config_key = (
                 current_config.state,
-                current_config.remaining_input,
+                current_config.position,
                 current_config.stack,
             )
             if config_key in visited_configs:
@@ -463,8 +511,26 @@ class PDA(AbstractPushdownAutomaton):
                 if new_config is not None:
                     config_queue.append(new_config)
 
+        # Borne d'itérations atteinte avant la fin de l'exploration
+        if config_queue and self._recognition_strategy == "auto":
+            return self._recognize_by_saturation(word)
         return False
 
+    def _recognize_by_saturation(self, word: str) -> bool:
+        """Décide l'appartenance d'un mot par saturation des résumés.
+
+        :param word: Mot à tester
+        :return: True si le mot est accepté, False sinon
+        """
+        recognizer = SaturationRecognizer(
+            self._transitions,
+            self._initial_state,
+            self._initial_stack_symbol,
+            self._final_states,
+            empty_stack_moves=True,
+        )
+        return recognizer.recognize(word)
+
     def _apply_transition(
         self, config: PDAConfiguration, next_state: str, stack_symbols: str
     ) -> Optional[PDAConfiguration]:
@@ -8,6 +8,9 @@ l'état d'un PDA à un moment donné de la simulation.
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from ..input_cursor import InputCursor
+from ..pushdown_stack import PushdownStack
+
 
 @dataclass(frozen=True)
 class PDAConfiguration:
@@ -16,7 +19,7 @@ class PDAConfiguration:
     Une configuration représente l'état complet d'un PDA à un moment donné :
     - L'état actuel de l'automate
     - Le mot d'entrée restant à traiter
-    - L'état de la pile (représenté comme une chaîne de caractères)
+    - L'état de la pile (pile partagée, construite depuis une chaîne)
 
     La classe est immuable (frozen=True) pour garantir la cohérence
     et permettre l'utilisation dans des structures de données comme les sets.
@@ -25,11 +28,11 @@ class PDAConfiguration:
     state: str
     """État actuel de l'automate."""
 
-    remaining_input: str
-    """Mot d'entrée restant à traiter."""
+    remaining_input: InputCursor
+    """Mot restant, curseur sur le mot d'entrée partagé (chaîne acceptée)."""
 
-    stack: str
-    """État de la pile (chaîne de caractères avec le sommet à droite)."""
+    stack: PushdownStack
+    """État de la pile (sommet à gauche), une chaîne étant acceptée."""
 
     def __post_init__(self) -> None:
         """Valide la configuration après initialisation.
@@ -39,10 +42,18 @@ class PDAConfiguration:
         if not isinstance(self.state, str) or not self.state:
             raise ValueError("L'état doit être une chaîne non vide")
 
-        if not isinstance(self.remaining_input, str):
+        if isinstance(self.remaining_input, str):
+            # Configuration figée : le mot est normalisé sans __setattr__
+            object.__setattr__(
+                self, "remaining_input", InputCursor.of(self.remaining_input)
+            )
+        elif not isinstance(self.remaining_input, InputCursor):
             raise ValueError("Le mot restant doit être une chaîne")
 
-        if not isinstance(self.stack, str):
+        if isinstance(self.stack, str):
+            # Configuration figée : la pile est normalisée sans __setattr__
+            object.__setattr__(self, "stack", PushdownStack.of(self.stack))
+        elif not isinstance(self.stack, PushdownStack):
             raise ValueError("La pile doit être une chaîne")
 
     @property
@@ -61,7 +72,15 @@ class PDAConfiguration:
         """
         if self.is_empty_stack:
             return None
-        return self.stack[0]  # Le sommet est à gauche, pas à droite
+        return self.stack.top
+
+    @property
+    def position(self) -> int:
+        """Retourne la position du prochain symbole dans le mot d'entrée.
+
+        :return: Nombre de symboles déjà consommés
+        """
+        return self.remaining_input.position
 
     def push_symbols(self, symbols: str) -> "PDAConfiguration":
         """Crée une nouvelle configuration avec des symboles ajoutés à la pile.
@@ -76,7 +95,7 @@ class PDAConfiguration:
         return PDAConfiguration(
             state=self.state,
             remaining_input=self.remaining_input,
-            stack=symbols + self.stack,  # Ajouter au début (sommet)
+            stack=self.stack.push(symbols),  # Ajouter au sommet
         )
 
     def pop_symbol(self) -> "PDAConfiguration":
@@ -91,7 +110,7 @@ class PDAConfiguration:
         return PDAConfiguration(
             state=self.state,
             remaining_input=self.remaining_input,
-            stack=self.stack[1:],  # Retirer le premier caractère (sommet)
+            stack=self.stack.pop(),  # Retirer le sommet
         )
 
     def replace_stack_top(self, new_symbols: str) -> "PDAConfiguration":
@@ -110,7 +129,7 @@ class PDAConfiguration:
         return PDAConfiguration(
             state=self.state,
             remaining_input=self.remaining_input,
-            stack=new_symbols + self.stack[1:],  # Remplacer le premier caractère
+            stack=self.stack.replace_top(new_symbols),
         )
 
     def consume_input(self, symbol: str) -> "PDAConfiguration":
@@ -130,7 +149,7 @@ class PDAConfiguration:
 
         return PDAConfiguration(
             state=self.state,
-            remaining_input=self.remaining_input[len(symbol) :],
+            remaining_input=self.remaining_input.advance(len(symbol)),
             stack=self.stack,
         )
 
@@ -155,8 +174,8 @@ class PDAConfiguration:
         """
         return {
             "state": self.state,
-            "remaining_input": self.remaining_input,
-            "stack": self.stack,
+            "remaining_input": str(self.remaining_input),
+            "stack": str(self.stack),
         }
 
     @classmethod
@@ -0,0 +1,177 @@
+"""
+Piles persistantes partagées des automates à pile.
+
+Ce module définit la classe PushdownStack, une liste chaînée immuable dont
+chaque cellule porte un symbole et la pile située en dessous. Empiler ou
+dépiler ne recopie jamais la pile : les configurations issues d'une même
+configuration partagent leur fond de pile, si bien qu'une recherche
+non-déterministe sur des piles profondes occupe une mémoire linéaire en
+nombre de configurations au lieu de quadratique.
+
+Les cellules sont hash-consées : deux piles de même contenu sont le même
+objet, l'égalité se réduit en pratique à une comparaison d'identité et
+l'empreinte de chaque cellule est calculée une seule fois, à sa création.
+"""
+
+from functools import total_ordering
+from typing import Iterator, Optional, Union
+from weakref import WeakValueDictionary
+
+
+@total_ordering
+class PushdownStack:
+    """Pile immuable à cellules partagées, sommet en tête.
+
+    La pile se lit comme la chaîne de ses symboles, sommet à gauche :
+    len, l'indexation, l'itération, str et la comparaison avec une chaîne
+    donnent les mêmes résultats que sur cette chaîne. L'empreinte n'est
+    cohérente qu'entre piles : une pile et une chaîne égales ne doivent pas
+    être mélangées comme clés d'un même ensemble.
+
+    Attributes:
+        top: Symbole au sommet (chaîne vide pour la pile vide)
+        below: Pile sous le sommet (None pour la pile vide)
+        height: Nombre de symboles
+    """
+
+    __slots__ = ("top", "below", "height", "_hash", "__weakref__")
+
+    # Cellules existantes, indexées par (sommet, pile en dessous)
+    _cells: "WeakValueDictionary" = WeakValueDictionary()
+    EMPTY: "PushdownStack"
+
+    def __init__(self, top: str, below: Optional["PushdownStack"]) -> None:
+        """Initialise une cellule ; passer par of, push et pop pour la partager.
+
+        :param top: Symbole au sommet
+        :param below: Pile sous le sommet, None pour la pile vide
+        """
+        self.top = top
+        self.below = below
+        self.height = below.height + 1 if below is not None else 0
+        self._hash = hash((top, below._hash if below is not None else 0))
+
+    @classmethod
+    def of(cls, symbols: Union[str, "PushdownStack"]) -> "PushdownStack":
+        """Obtient la pile partagée d'une chaîne de symboles.
+
+        :param symbols: Symboles, sommet en tête, ou pile déjà construite
+        :return: Pile correspondante
+        """
+        if isinstance(symbols, PushdownStack):
+            return symbols
+        return cls.EMPTY.push(symbols)
+
+    def push(self, symbols: str) -> "PushdownStack":
+        """Empile des symboles, le premier se retrouvant au sommet.
+
+        :param symbols: Symboles à empiler
+        :return: Nouvelle pile, partageant celle-ci comme fond
+        """
+        stack = self
+        cells = PushdownStack._cells
+        for symbol in reversed(symbols):
+            key = (symbol, stack)
+            cell = cells.get(key)
+            if cell is None:
+                cell = cells[key] = PushdownStack(symbol, stack)
+            stack = cell
+        return stack
+
+    def pop(self, count: int = 1) -> "PushdownStack":
+        """Dépile des symboles.
+
+        :param count: Nombre de symboles à retirer du sommet
+        :return: Pile située sous les symboles retirés
+        :raises IndexError: Si la pile contient moins de count symboles
+        """
+        if count > self.height:
+            raise IndexError("Impossible de dépiler : la pile est trop courte")
+        stack = self
+        for _ in range(count):
+            stack = stack.below
+        return stack
+
+    def replace_top(self, symbols: str) -> "PushdownStack":
+        """Remplace le sommet par des symboles.
+
+        :param symbols: Symboles remplaçant le sommet, le premier au sommet
+        :return: Nouvelle pile
+        :raises IndexError: Si la pile est vide
+        """
+        return self.pop().push(symbols)
+
+    def __len__(self) -> int:
+        """Retourne le nombre de symboles, en temps constant."""
+        return self.height
+
+    def __bool__(self) -> bool:
+        """Indique si la pile contient au moins un symbole."""
+        return self.height > 0
+
+    def __iter__(self) -> Iterator[str]:
+        """Parcourt les symboles du sommet vers le fond."""
+        stack = self
+        while stack.height:
+            yield stack.top
+            stack = stack.below
+
+    def __getitem__(self, index: Union[int, slice]) -> str:
+        """Accède aux symboles comme dans la chaîne de la pile.
+
+        :param index: Indice ou tranche, 0 désignant le sommet
+        :return: Symbole ou chaîne de symboles
+        """
+        if index == 0 and self.height:
+            return self.top
+        return str(self)[index]
+
+    def __hash__(self) -> int:
+        """Retourne l'empreinte précalculée."""
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        """Compare à une autre pile ou à la chaîne de ses symboles."""
+        if isinstance(other, PushdownStack):
+            if self is other:
+                return True
+            if self._hash != other._hash or self.height != other.height:
+                return False
+            return _compare(self, other) == 0
+        if isinstance(other, str):
+            return self.height == len(other) and str(self) == other
+        return NotImplemented
+
+    def __lt__(self, other: object) -> bool:
+        """Ordre de la chaîne des symboles, sommet en tête."""
+        if isinstance(other, PushdownStack):
+            return _compare(self, other) < 0
+        if isinstance(other, str):
+            return str(self) < other
+        return NotImplemented
+
+    def __str__(self) -> str:
+        """Retourne la chaîne des symboles, sommet à gauche."""
+        return "".join(self)
+
+    def __repr__(self) -> str:
+        """Retourne la représentation détaillée de la pile."""
+        return f"PushdownStack({str(self)!r})"
+
+    def __reduce__(self):
+        """Reconstruit la pile dans la table de partage du destinataire."""
+        return (PushdownStack.of, (str(self),))
+
+
+PushdownStack.EMPTY = PushdownStack("", None)
+
+
+def _compare(left: PushdownStack, right: PushdownStack) -> int:
+    """Compare deux piles symbole à symbole, jusqu'au premier fond commun."""
+    while left is not right:
+        if not left.height or not right.height:
+            return -1 if not left.height else 1
+        if left.top != right.top:
+            return -1 if left.top < right.top else 1
+        left, right = left.below, right.below
+    return 0
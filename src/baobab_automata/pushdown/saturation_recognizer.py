@@ -0,0 +1,155 @@
+"""
+Reconnaissance exacte et polynomiale pour les automates à pile.
+
+Ce module contient la classe SaturationRecognizer, qui décide si un mot
+est accepté par un automate à pile non-déterministe sans énumérer ses
+configurations. L'algorithme sature des résumés de dépilement, ce qui
+revient à calculer post* restreint aux positions du mot :
+
+- un résumé (i, p, X) → (j, q) indique que, depuis l'état p à la
+  position i avec X au sommet, l'automate peut lire w[i:j] et atteindre
+  l'état q en ayant dépilé X, sans toucher au reste de la pile ;
+- une transition qui remplace X par Y1...Yk est suivie en enchaînant les
+  résumés de Y1, puis de Y2, etc., à la manière des items d'Earley ;
+- une configuration de sommet X n'est explorée qu'une fois par couple
+  (position, état), quel que soit le contenu de la pile en dessous.
+
+Le nombre de résumés est en O(n²·|Q|²·|Γ|) pour un mot de longueur n : la
+décision est exacte et polynomiale, même lorsque les piles croissent sans
+borne ou que l'exploration des configurations dépasse son budget.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Stratégies de reconnaissance proposées par NPDA et PDA
+RECOGNITION_STRATEGIES = ("search", "saturation", "auto")
+
+# Fond de pile virtuel : sommet d'une pile vide, jamais dépilé
+_BOTTOM = "\x00bottom"
+
+# Item d'avancement : (résumé d'origine, n° de mot empilé, symboles dépilés,
+# position, état)
+_Item = Tuple[Tuple[int, str, str], int, int, int, str]
+
+
+class SaturationRecognizer:
+    """
+    Reconnaisseur d'un automate à pile par saturation de résumés.
+
+    L'acceptation se fait par état final en fin de mot, la pile pouvant
+    contenir des symboles quelconques. Chaque transition dépile le symbole
+    de sommet (un caractère) et empile sa chaîne, le premier caractère se
+    retrouvant au sommet ; une pile vide ne permet aucune transition, sauf
+    si empty_stack_moves autorise les transitions de symbole de pile vide.
+    """
+
+    def __init__(
+        self,
+        transitions: Dict[Tuple[str, str, str], Iterable[Tuple[str, str]]],
+        initial_state: str,
+        initial_stack_symbol: str,
+        final_states: Iterable[str],
+        empty_stack_moves: bool = False,
+    ) -> None:
+        """
+        Indexe les transitions de l'automate.
+
+        :param transitions: Transitions (état, entrée, sommet) vers des
+            couples (état, symboles empilés)
+        :type transitions: Dict[Tuple[str, str, str], Iterable[Tuple[str, str]]]
+        :param initial_state: État initial
+        :type initial_state: str
+        :param initial_stack_symbol: Symbole initial de pile
+        :type initial_stack_symbol: str
+        :param final_states: États finaux
+        :type final_states: Iterable[str]
+        :param empty_stack_moves: Indique si les transitions de sommet ""
+            s'appliquent à la pile vide (sémantique du PDA)
+        :type empty_stack_moves: bool
+        """
+        self.initial_state = initial_state
+        self.final_states = frozenset(final_states)
+        # Mots empilés, numérotés ; le dernier est la pile initiale
+        self._pushes: List[Tuple[str, ...]] = []
+        self._moves: Dict[Tuple[str, str, str], List[Tuple[str, int]]] = {}
+        for (state, symbol, top), targets in transitions.items():
+            # Seules les transitions applicables par la simulation comptent :
+            # entrée d'au plus un caractère, sommet d'un caractère
+            if len(symbol) > 1 or len(top) > 1:
+                continue
+            if not top and not empty_stack_moves:
+                continue
+            if not top:
+                top = _BOTTOM
+            for next_state, pushed in targets:
+                pushed = tuple(pushed) + ((_BOTTOM,) if top == _BOTTOM else ())
+                self._moves.setdefault((state, symbol, top), []).append(
+                    (next_state, len(self._pushes))
+                )
+                self._pushes.append(pushed)
+        initial = (initial_stack_symbol,) if initial_stack_symbol else ()
+        self._pushes.append(initial + ((_BOTTOM,) if empty_stack_moves else ()))
+
+    def recognize(self, word: str) -> bool:
+        """
+        Décide l'appartenance d'un mot au langage de l'automate.
+
+        :param word: Mot à reconnaître
+        :type word: str
+        :return: True si une exécution lit tout le mot et termine dans un
+            état final
+        :rtype: bool
+        """
+        n = len(word)
+        finals = self.final_states
+        pushes = self._pushes
+        moves = self._moves
+        root = (-1, "", "")
+        summaries: Dict[Tuple[int, str, str], Set[Tuple[int, str]]] = {}
+        waiting: Dict[Tuple[int, str, str], List[Tuple[Tuple, int, int]]] = {}
+        seen: Set[_Item] = set()
+        agenda: List[_Item] = [(root, len(pushes) - 1, 0, 0, self.initial_state)]
+
+        while agenda:
+            item = agenda.pop()
+            if item in seen:
+                continue
+            seen.add(item)
+            origin, push, done, position, state = item
+            symbols = pushes[push]
+
+            if done == len(symbols):
+                # Tout le mot empilé a été dépilé : nouveau résumé
+                if origin is root:
+                    if position == n and state in finals:
+                        return True
+                    continue
+                results = summaries[origin]
+                if (position, state) in results:
+                    continue
+                results.add((position, state))
+                for parent, parent_push, parent_done in waiting[origin]:
+                    agenda.append(
+                        (parent, parent_push, parent_done + 1, position, state)
+                    )
+                continue
+
+            # Configuration de sommet symbols[done] atteinte en (position, état)
+            key = (position, state, symbols[done])
+            if key not in summaries:
+                if position == n and state in finals:
+                    return True
+                summaries[key] = set()
+                waiting[key] = []
+                top = symbols[done]
+                for next_state, pushed in moves.get((state, "", top), ()):
+                    agenda.append((key, pushed, 0, position, next_state))
+                if position < n:
+                    symbol = word[position]
+                    for next_state, pushed in moves.get((state, symbol, top), ()):
+                        agenda.append((key, pushed, 0, position + 1, next_state))
+            waiting[key].append((origin, push, done))
+            for after, next_state in summaries[key]:
+                agenda.append((origin, push, done + 1, after, next_state))
+
+        return False
@@ -0,0 +1,87 @@
+"""
+Tests unitaires pour la construction incrémentale de DFA acycliques minimaux.
+
+Ce module valide les modes trié et non trié de AcyclicDFABuilder ainsi que
+le raccourci DFA.from_words.
+"""
+
+import itertools
+import random
+import unittest
+
+from baobab_automata.finite import AcyclicDFABuilder, DFA
+from baobab_automata.finite.dfa.dfa_exceptions import InvalidDFAError
+
+
+class TestAcyclicDFABuilder(unittest.TestCase):
+    """Tests unitaires pour la classe AcyclicDFABuilder."""
+
+    WORDS = ["tap", "taps", "top", "tops", "stop", "stops"]
+
+    def _assert_language(self, dfa, words, alphabet, max_length):
+        """Vérifie que le DFA reconnaît exactement les mots donnés."""
+        expected = set(words)
+        for length in range(max_length + 1):
+            for letters in itertools.product(sorted(alphabet), repeat=length):
+                word = "".join(letters)
+                self.assertEqual(dfa.accepts(word), word in expected, word)
+
+    def test_sorted_build_is_minimal(self):
+        """Test de la construction triée et de sa minimalité."""
+        dfa = DFA.from_words(sorted(self.WORDS))
+        self._assert_language(dfa, self.WORDS, "aopst", 5)
+        self.assertEqual(len(dfa.states), len(dfa.minimize().states))
+        self.assertEqual(len(dfa.states), 7)
+
+    def test_unsorted_build_matches_sorted(self):
+        """Test de l'équivalence des modes trié et non trié."""
+        rng = random.Random(7)
+        for _ in range(50):
+            words = {
+                "".join(rng.choice("abc") for _ in range(rng.randint(0, 5)))
+                for _ in range(rng.randint(1, 20))
+            }
+            shuffled = list(words) * 2
+            rng.shuffle(shuffled)
+
+            sorted_dfa = DFA.from_words(sorted(words))
+            unsorted_dfa = DFA.from_words(shuffled, sorted_input=False)
+            self._assert_language(unsorted_dfa, words, "abc", 6)
+            self.assertEqual(len(unsorted_dfa.states), len(sorted_dfa.states))
+
+    def test_generator_and_counters(self):
+        """Test de l'ajout depuis un générateur, avec doublons et mot vide."""
+        builder = AcyclicDFABuilder(alphabet={"0", "1", "2"})
+        builder.add_words(format(n, "06b") for n in range(64))
+        builder.add_word("111111")
+        self.assertEqual(builder.word_count, 64)
+
+        dfa = builder.build()
+        self.assertEqual(dfa.alphabet, {"0", "1", "2"})
+        self.assertTrue(dfa.accepts("000101"))
+        self.assertFalse(dfa.accepts("0101"))
+        self.assertEqual(len(dfa.states), 7)
+        self.assertFalse(dfa.accepts(""))
+
+        with_empty = DFA.from_words(["", "a"])
+        self.assertTrue(with_empty.accepts(""))
+        self.assertTrue(with_empty.accepts("a"))
+        self.assertTrue(with_empty.is_final_state(with_empty.initial_state))
+
+    def test_errors(self):
+        """Test des erreurs d'ordre, d'alphabet et de réutilisation."""
+        with self.assertRaises(InvalidDFAError):
+            DFA.from_words(["b", "a"])
+
+        builder = AcyclicDFABuilder(alphabet={"a"})
+        with self.assertRaises(InvalidDFAError):
+            builder.add_word("ab")
+
+        builder.add_word("a")
+        builder.build()
+        with self.assertRaises(InvalidDFAError):
+            builder.add_word("aa")
+
+
+if __name__ == "__main__":
+    unittest.main()
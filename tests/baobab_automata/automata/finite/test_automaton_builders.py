@@ -0,0 +1,143 @@
+"""
+Tests unitaires pour les constructeurs en masse DFABuilder et NFABuilder.
+
+Ce module valide l'ajout incrémental et vectorisé d'états et de transitions,
+la validation différée et la production d'automates figés.
+"""
+
+import unittest
+
+import numpy as np
+
+from baobab_automata.finite import DFABuilder, NFABuilder
+from baobab_automata.finite.dfa.dfa_exceptions import (
+    InvalidDFAError,
+    InvalidTransitionError,
+)
+from baobab_automata.finite.nfa.nfa_exceptions import (
+    InvalidNFAError,
+    InvalidTransitionError as InvalidNFATransitionError,
+)
+
+
+class TestDFABuilder(unittest.TestCase):
+    """Tests unitaires pour la classe DFABuilder."""
+
+    def test_incremental_build(self):
+        """Test de la construction état par état."""
+        builder = DFABuilder({"a", "b"}, expected_states=1, expected_transitions=1)
+        start = builder.add_state(name="start")
+        end = builder.add_state(final=True)
+        builder.set_initial(start)
+        builder.add_transition(start, "a", end)
+        builder.add_transition(end, "b", start)
+
+        dfa = builder.build()
+        self.assertEqual(dfa.states, {"start", "q1"})
+        self.assertEqual(dfa.final_states, {"q1"})
+        self.assertTrue(dfa.accepts("aba"))
+        self.assertFalse(dfa.accepts("ab"))
+        self.assertTrue(dfa.validate())
+
+    def test_bulk_numpy_build(self):
+        """Test de l'ajout vectorisé de transitions (compteur modulo n)."""
+        size = 1000
+        builder = DFABuilder({"0", "1"})
+        builder.add_states(size)
+        builder.set_initial(0)
+        builder.set_final(np.array([0]))
+        sources = np.arange(size)
+        builder.add_transitions(sources, np.zeros(size, dtype=int), sources)
+        builder.add_transitions(sources, ["1"] * size, (sources + 1) % size)
+
+        dfa = builder.build()
+        self.assertEqual(builder.transition_count, 2 * size)
+        self.assertEqual(len(dfa.states), size)
+        self.assertTrue(dfa.accepts("1" * size))
+        self.assertTrue(dfa.accepts("0101" + "1" * (size - 2)))
+        self.assertFalse(dfa.accepts("1" * (size - 1)))
+
+    def test_validation(self):
+        """Test des erreurs détectées à la validation."""
+        builder = DFABuilder({"a"})
+        builder.add_states(2)
+        with self.assertRaises(InvalidDFAError):
+            builder.build()
+
+        builder.set_initial(0)
+        builder.add_transition(0, "a", 1)
+        builder.add_transition(0, "a", 0)
+        with self.assertRaises(InvalidDFAError):
+            builder.build()
+
+        with self.assertRaises(InvalidTransitionError):
+            builder.add_transition(0, "z", 1)
+
+    def test_deferred_validation(self):
+        """Test de la validation différée."""
+        builder = DFABuilder({"a"})
+        builder.add_states(1)
+        builder.set_initial(0)
+        builder.add_transition(0, "a", 5)
+        with self.assertRaises(InvalidDFAError):
+            builder.validate()
+
+        builder = DFABuilder({"a"})
+        builder.add_states(2)
+        builder.set_initial(0)
+        builder.add_transitions([0], [0], [1])
+        dfa = builder.build(validate=False)
+        self.assertTrue(dfa.validate())
+
+    def test_negative_indices_rejected(self):
+        """Test du rejet des indices négatifs, même sans validation."""
+        builder = DFABuilder({"a", "b"})
+        builder.add_states(2)
+        with self.assertRaises(InvalidDFAError):
+            builder.set_initial(-1)
+        builder.set_initial(0)
+        with self.assertRaises(InvalidTransitionError):
+            builder.add_transition(0, "a", -1)
+        for sources, symbols, targets in (
+            ([-1], [0], [1]),
+            ([0], [-1], [1]),
+            ([0], [0], [-2]),
+        ):
+            with self.assertRaises(InvalidTransitionError):
+                builder.add_transitions(sources, symbols, targets)
+        self.assertEqual(builder.transition_count, 0)
+        self.assertEqual(builder.build(validate=False).transitions, {})
+
+
+class TestNFABuilder(unittest.TestCase):
+    """Tests unitaires pour la classe NFABuilder."""
+
+    def test_nondeterministic_build(self):
+        """Test du regroupement des transitions multiples."""
+        builder = NFABuilder({"a", "b", "epsilon"})
+        builder.add_states(3)
+        builder.set_initial(0)
+        builder.set_final(2)
+        builder.add_transitions([0, 0, 1, 0], ["a", "a", "b", "epsilon"], [0, 1, 2, 1])
+
+        nfa = builder.build()
+        self.assertEqual(nfa.get_transitions("q0", "a"), {"q0", "q1"})
+        self.assertTrue(nfa.accepts("aab"))
+        self.assertTrue(nfa.accepts("b"))
+        self.assertFalse(nfa.accepts("ba"))
+
+    def test_mismatched_arrays(self):
+        """Test du rejet de tableaux de tailles différentes."""
+        builder = NFABuilder({"a"})
+        builder.add_states(2)
+        with self.assertRaises(InvalidNFATransitionError):
+            builder.add_transitions([0, 1], [0], [1, 0])
+        builder.set_initial(0)
+        builder.add_transition(0, "a", 1)
+        builder.add_state(name="q1")
+        with self.assertRaises(InvalidNFAError):
+            builder.build()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+"""
+Tests unitaires pour la minimisation de Brzozowski et le choix d'algorithme.
+
+Ce module vérifie que la double déterminisation du miroir produit le DFA
+minimal, que la sélection de stratégie réagit à l'explosion de la
+déterminisation et que le choix est consigné dans les statistiques.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from baobab_automata.algorithms.finite import OptimizationAlgorithms
+from baobab_automata.finite.dfa import DFA
+from baobab_automata.finite.nfa import NFA, EpsilonNFA
+from baobab_automata.finite.optimization.optimization_exceptions import (
+    OptimizationError,
+)
+
+
+def _language(automaton, max_length=7):
+    """Mots sur {a, b} de longueur bornée acceptés par l'automate."""
+    return {
+        word
+        for length in range(max_length + 1)
+        for word in map("".join, itertools.product("ab", repeat=length))
+        if automaton.accepts(word)
+    }
+
+
+def _random_nfa(rng, size):
+    """NFA aléatoire sur {a, b}, avec au moins un état final."""
+    states = [f"s{i}" for i in range(size)]
+    transitions = {}
+    for state in states:
+        for symbol in "ab":
+            targets = {target for target in states if rng.random() < 0.3}
+            if targets:
+                transitions[(state, symbol)] = targets
+    finals = {state for state in states if rng.random() < 0.4} or {states[-1]}
+    return NFA(set(states), {"a", "b"}, transitions, "s0", finals)
+
+
+def _kth_from_end_nfa(k):
+    """NFA des mots dont la k-ième lettre avant la fin est un a."""
+    transitions = {("p0", "a"): {"p0", "p1"}, ("p0", "b"): {"p0"}}
+    for i in range(1, k):
+        transitions[(f"p{i}", "a")] = {f"p{i + 1}"}
+        transitions[(f"p{i}", "b")] = {f"p{i + 1}"}
+    return NFA(
+        states={f"p{i}" for i in range(k + 1)},
+        alphabet={"a", "b"},
+        transitions=transitions,
+        initial_state="p0",
+        final_states={f"p{k}"},
+    )
+
+
+class TestBrzozowskiMinimization:
+    """Tests pour minimize_brzozowski et select_minimization_strategy."""
+
+    def test_matches_hopcroft(self):
+        """Test de l'égalité des tailles avec Hopcroft sur des NFA aléatoires."""
+        rng = random.Random(3)
+        optimizer = OptimizationAlgorithms()
+        for _ in range(100):
+            nfa = _random_nfa(rng, rng.randint(1, 7))
+            minimal = optimizer.minimize_brzozowski(nfa)
+            assert isinstance(minimal, DFA)
+            assert _language(minimal) == _language(nfa)
+            if not minimal.final_states:
+                assert len(minimal.states) == 1
+                continue
+
+            hopcroft = optimizer.minimize_dfa(nfa.to_dfa())
+            useful = optimizer.remove_coaccessible_states(hopcroft)
+            assert len(minimal.states) == len(useful.states)
+
+    def test_partial_dfa_hopcroft(self):
+        """Test de Hopcroft sur un DFA partiel (puits implicite)."""
+        dfa = DFA(
+            states={"q0", "q1", "q2"},
+            alphabet={"a", "b"},
+            transitions={("q0", "a"): "q1", ("q0", "b"): "q2", ("q1", "a"): "q2"},
+            initial_state="q0",
+            final_states={"q2"},
+        )
+        minimal = OptimizationAlgorithms().minimize_dfa(dfa)
+        assert len(minimal.states) == 3
+        assert _language(minimal) == {"b", "aa"}
+
+    def test_explicit_dead_state_hopcroft(self):
+        """Test de Hopcroft sur un DFA portant un état puits explicite."""
+        dfa = DFA(
+            states={"s", "p", "q", "f", "dead"},
+            alphabet={"a", "b"},
+            transitions={
+                ("s", "a"): "p",
+                ("s", "b"): "q",
+                ("p", "b"): "f",
+                ("q", "b"): "f",
+                ("p", "a"): "dead",
+                ("f", "a"): "dead",
+                ("dead", "a"): "dead",
+                ("dead", "b"): "dead",
+            },
+            initial_state="s",
+            final_states={"f"},
+        )
+        minimal = OptimizationAlgorithms().minimize_dfa(dfa)
+        assert len(minimal.states) == 3
+        assert _language(minimal) == {"ab", "bb"}
+
+    def test_epsilon_automata(self):
+        """Test sur un ε-NFA et sur un NFA portant des transitions epsilon."""
+        enfa = EpsilonNFA(
+            states={"0", "1", "2"},
+            alphabet={"a", "b"},
+            transitions={("0", "ε"): {"1"}, ("1", "a"): {"2"}, ("0", "b"): {"2"}},
+            initial_state="0",
+            final_states={"2"},
+        )
+        optimizer = OptimizationAlgorithms()
+        assert _language(optimizer.minimize_brzozowski(enfa)) == {"a", "b"}
+
+        nfa = NFA(
+            states={"0", "1", "2"},
+            alphabet={"a", "epsilon"},
+            transitions={("0", "epsilon"): {"1"}, ("1", "a"): {"2"}},
+            initial_state="0",
+            final_states={"2"},
+        )
+        assert nfa.to_dfa().accepts("a")
+        minimal = optimizer.minimize_brzozowski(nfa)
+        assert minimal.alphabet == {"a"}
+        assert minimal.accepts("a") and not minimal.accepts("")
+
+        with pytest.raises(OptimizationError):
+            optimizer.minimize_brzozowski("not an automaton")
+
+    def test_strategy_selection(self):
+        """Test du choix de Brzozowski quand la déterminisation explose."""
+        optimizer = OptimizationAlgorithms()
+        blowup = _kth_from_end_nfa(10)
+        choice = optimizer.select_minimization_strategy(blowup)
+        assert choice["strategy"] == "brzozowski"
+        assert choice["states"] == 11
+        assert choice["forward_growth"] > choice["reverse_growth"]
+
+        # Le miroir se déterminise bien, son propre miroir explose
+        assert (
+            optimizer.select_minimization_strategy(blowup.reverse())["strategy"]
+            == "hopcroft"
+        )
+        assert (
+            optimizer.select_minimization_strategy(blowup.to_dfa())["strategy"]
+            == "hopcroft"
+        )
+
+    def test_strategy_selection_without_branching(self):
+        """Test de l'absence de sonde pour un NFA sans branchement."""
+        optimizer = OptimizationAlgorithms()
+        # Une cible par transition : le miroir seul est non déterministe
+        nfa = NFA(
+            states={"p", "q", "r"},
+            alphabet={"a", "b"},
+            transitions={
+                ("p", "a"): {"q"},
+                ("r", "a"): {"q"},
+                ("q", "b"): {"p"},
+                ("r", "b"): set(),
+            },
+            initial_state="p",
+            final_states={"q"},
+        )
+        choice = optimizer.select_minimization_strategy(nfa)
+        assert choice["strategy"] == "hopcroft"
+        assert choice["branching"] == 1.0
+        assert choice["reverse_growth"] is None
+
+        blowup = optimizer.select_minimization_strategy(_kth_from_end_nfa(4))
+        assert blowup["branching"] > 1 and blowup["reverse_growth"] is not None
+
+    def test_level_three_records_choice(self):
+        """Test de la sélection automatique au niveau d'optimisation 3."""
+        nfa = _kth_from_end_nfa(6)
+        optimizer = OptimizationAlgorithms(optimization_level=3)
+        minimal = optimizer.minimize_nfa(nfa)
+        assert len(minimal.states) == 2**6
+        assert _language(minimal) == _language(nfa)
+
+        stats = optimizer.get_optimization_stats(nfa, minimal)["optimization_stats"]
+        (choice,) = stats["strategy_choices"]
+        assert choice["operation"] == "minimize_nfa"
+        assert choice["strategy"] == "brzozowski"
+
+        default = OptimizationAlgorithms()
+        default.minimize_nfa(nfa)
+        assert (
+            "strategy_choices"
+            not in default.get_optimization_stats(nfa, nfa)["optimization_stats"]
+        )
@@ -5,6 +5,10 @@ Ce module contient tous les tests pour les algorithmes de conversion
 entre différents types d'automates finis.
 """
 
+import itertools
+import random
+import re
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -16,9 +20,12 @@ from baobab_automata.algorithms.finite.conversion_algorithms import (
     ConversionTimeoutError,
     ConversionValidationError,
 )
+from baobab_automata.algorithms.finite.state_elimination import StateElimination
 from baobab_automata.finite.dfa import DFA
 from baobab_automata.finite.epsilon_nfa import EpsilonNFA
 from baobab_automata.finite.nfa import NFA
+from baobab_automata.finite.regex.regex_ast import ASTNode, NodeType
+from baobab_automata.finite.regex.regex_parser import RegexParser
 
 
 class TestConversionStats:
@@ -491,6 +498,125 @@ class TestAutomatonToRegexConversion:
         assert isinstance(regex, str)
         assert len(regex) > 0
 
+    def test_automaton_to_regex_optimized_state_elimination(self):
+        """Test de l'élimination d'états sur un NFA non déterministe."""
+        converter = ConversionAlgorithms()
+        nfa = NFA(
+            states={"q0", "q1"},
+            alphabet={"a", "b"},
+            transitions={("q0", "a"): {"q0", "q1"}, ("q1", "b"): {"q1"}},
+            initial_state="q0",
+            final_states={"q1"},
+        )
+
+        assert converter.automaton_to_regex_optimized(nfa) == "a+b*"
+
+    def test_state_elimination_even_parity(self):
+        """Test de l'élimination d'états sur la parité de a et de b."""
+        transitions = {}
+        for state in ("ee", "eo", "oe", "oo"):
+            flip_a = ("o" if state[0] == "e" else "e") + state[1]
+            flip_b = state[0] + ("o" if state[1] == "e" else "e")
+            transitions[(state, "a")] = flip_a
+            transitions[(state, "b")] = flip_b
+        dfa = DFA(
+            states={"ee", "eo", "oe", "oo"},
+            alphabet={"a", "b"},
+            transitions=transitions,
+            initial_state="ee",
+            final_states={"ee"},
+        )
+
+        pattern = re.compile(StateElimination.to_regex(dfa))
+        for length in range(7):
+            for word in map("".join, itertools.product("ab", repeat=length)):
+                assert bool(pattern.fullmatch(word)) == dfa.accepts(word)
+
+    def test_state_elimination_simplifications(self):
+        """Test des simplifications algébriques de l'AST."""
+        a = ASTNode(NodeType.LITERAL, "a")
+        epsilon = ASTNode(NodeType.EPSILON)
+        empty = ASTNode(NodeType.EMPTY)
+        star = StateElimination.kleene_star(a)
+
+        assert StateElimination.union(empty, a) == a
+        assert StateElimination.union(a, a) == a
+        assert StateElimination.format(StateElimination.union(epsilon, a)) == "a?"
+        assert StateElimination.concatenation(epsilon, a) == a
+        assert StateElimination.concatenation(a, empty) == empty
+        assert StateElimination.format(StateElimination.concatenation(a, star)) == "a+"
+        assert StateElimination.kleene_star(star) == star
+        assert StateElimination.kleene_star(empty) == epsilon
+
+    def test_state_elimination_empty_language(self):
+        """Test de la conversion d'un automate sans état final accessible."""
+        dfa = DFA(
+            states={"q0", "q1"},
+            alphabet={"a"},
+            transitions={("q0", "a"): "q0"},
+            initial_state="q0",
+            final_states={"q1"},
+        )
+
+        assert StateElimination.to_regex(dfa) == "∅"
+
+    def test_state_elimination_parser_round_trip(self):
+        """Test de la relecture par RegexParser, ε et ∅ n'apparaissant que seuls."""
+        rng = random.Random(7)
+        parser = RegexParser(unicode=True)
+        words = [
+            "".join(word)
+            for length in range(5)
+            for word in itertools.product("ab", repeat=length)
+        ]
+        for _ in range(60):
+            states = [f"q{i}" for i in range(rng.randint(1, 4))]
+            transitions = {}
+            for state in states:
+                for symbol in "ab":
+                    targets = {target for target in states if rng.random() < 0.3}
+                    if targets:
+                        transitions[(state, symbol)] = targets
+            finals = {state for state in states if rng.random() < 0.4}
+            nfa = NFA(set(states), {"a", "b"}, transitions, "q0", finals)
+            regex = StateElimination.to_regex(nfa)
+            accepted = {word for word in words if nfa.accepts(word)}
+            if regex in ("ε", "∅"):
+                assert accepted == ({""} if regex == "ε" else set())
+                continue
+            assert "ε" not in regex and "∅" not in regex
+            reparsed = parser.parse(regex)
+            assert {word for word in words if reparsed.accepts(word)} == accepted
+
+        only_empty_word = DFA({"q0"}, {"a"}, {}, "q0", {"q0"})
+        assert StateElimination.to_regex(only_empty_word) == "ε"
+
+    def test_state_elimination_escapes_metacharacters(self):
+        """Test de l'échappement des symboles qui sont des métacaractères."""
+        dfa = DFA(
+            states={"q0", "q1", "q2", "q3"},
+            alphabet={"a", "*", "b"},
+            transitions={("q0", "a"): "q1", ("q1", "*"): "q2", ("q2", "b"): "q3"},
+            initial_state="q0",
+            final_states={"q3"},
+        )
+
+        assert StateElimination.to_regex(dfa) == "a\\*b"
+
+    def test_state_elimination_interval_round_trip(self):
+        """Test de la relecture des expressions produites pour les intervalles."""
+        parser = RegexParser(unicode=True)
+        words = ["", "a", "b", "ab", "a*b", "*", ".", "**.", "]", "-y", "[]\\"]
+        words += ["x\x05", "\u00e9y", "\\"]
+        for regex in ("[^a]", "a*b", "(\\*|\\.)+[a-c\\]]", "[^\\-x]y?", "x[\x00-\x1f]"):
+            automaton = parser.parse(regex)
+            converted = StateElimination.to_regex(automaton)
+            reparsed = parser.parse(converted)
+            for word in words:
+                assert reparsed.accepts(word) == automaton.accepts(word)
+
+        assert StateElimination.to_regex(parser.parse("[^a]")) == "[^a]"
+
 
 class TestErrorHandling:
     """Tests pour la gestion d'erreurs."""
@@ -9,6 +9,7 @@ import unittest
 from typing import Dict, Set, Tuple
 
 from baobab_automata.finite.dfa import DFA
+from baobab_automata.finite.dfa.dfa import Match
 from baobab_automata.finite.dfa.dfa_exceptions import (
     DFAError,
     InvalidDFAError,
@@ -330,6 +331,87 @@ class TestDFA(unittest.TestCase):
         self.assertIsNotNone(nfa)
         # Un DFA est toujours un NFA, donc la conversion doit fonctionner
 
+    def test_read_only_views(self):
+        """Test que les propriétés sont des vues immuables sans copie."""
+        dfa = self._create_simple_dfa()
+
+        self.assertIsInstance(dfa.states, frozenset)
+        self.assertIs(dfa.states, dfa.states)
+        self.assertIs(dfa.alphabet, dfa.alphabet)
+        self.assertIs(dfa.final_states, dfa.final_states)
+        self.assertEqual(dfa.transitions[("q0", "a")], "q1")
+        with self.assertRaises(TypeError):
+            dfa.transitions[("q2", "a")] = "q0"
+
+    def test_constructor_does_not_alias_inputs(self):
+        """Test que le constructeur public isole l'automate des entrées."""
+        states = {"q0", "q1"}
+        transitions = {("q0", "a"): "q1"}
+        dfa = DFA(states, {"a"}, transitions, "q0", {"q1"})
+
+        states.add("q9")
+        transitions[("q1", "a")] = "q0"
+
+        self.assertEqual(dfa.states, {"q0", "q1"})
+        self.assertIsNone(dfa.get_transition("q1", "a"))
+
+    def test_complement_shares_structure(self):
+        """Test que le complément partage les structures de l'original."""
+        dfa = self._create_simple_dfa()
+        complement = dfa.complement()
+
+        self.assertIs(complement.states, dfa.states)
+        self.assertIs(complement.alphabet, dfa.alphabet)
+        self.assertEqual(complement.final_states, {"q0", "q1"})
+        self.assertTrue(complement.accepts("a"))
+        self.assertFalse(complement.accepts("ab"))
+
+    def test_early_reject_on_dead_state(self):
+        """Test du rejet anticipé dans un état puits."""
+        dfa = DFA(
+            {"q0", "q1", "dead"},
+            {"a", "b"},
+            {
+                ("q0", "a"): "q1",
+                ("q0", "b"): "dead",
+                ("q1", "a"): "q1",
+                ("dead", "a"): "dead",
+                ("dead", "b"): "dead",
+            },
+            "q0",
+            {"q1"},
+        )
+
+        self.assertFalse(dfa.accepts("b" + "a" * 1000))
+        self.assertTrue(dfa.accepts("aaa"))
+        stats = dfa.get_early_exit_stats()
+        self.assertEqual(stats["early_rejects"], 1)
+        self.assertEqual(stats["skipped_symbols"], 1000)
+
+        dfa.reset_early_exit_stats()
+        self.assertEqual(dfa.get_early_exit_stats()["early_rejects"], 0)
+
+    def test_early_accept_on_universal_state(self):
+        """Test de l'acceptation anticipée dans un état universel."""
+        dfa = DFA(
+            {"q0", "ok"},
+            {"a", "b"},
+            {("q0", "a"): "ok", ("ok", "a"): "ok", ("ok", "b"): "ok"},
+            "q0",
+            {"ok"},
+        )
+
+        self.assertEqual(
+            dfa.accepts_many(["ab" * 500, "b", "a", "abc"]),
+            [True, False, True, False],
+        )
+        stats = dfa.get_early_exit_stats()
+        self.assertEqual(stats["early_accepts"], 2)
+        self.assertEqual(stats["skipped_symbols"], 999 + 2)
+
+        match = dfa.find_longest_match("xxabba!ab", 0)
+        self.assertEqual(match, Match("abba", 2, 6))
+
     def _create_simple_dfa(self) -> DFA:
         """Crée un DFA simple pour les tests."""
         states = {"q0", "q1", "q2"}
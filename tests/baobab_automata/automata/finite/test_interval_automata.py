@@ -0,0 +1,258 @@
+"""
+Tests unitaires pour les automates à transitions par intervalles.
+
+Ce module valide les classes de caractères, les DFA/NFA à intervalles et le
+mode Unicode du parser d'expressions régulières.
+"""
+
+import unittest
+
+from baobab_automata.finite.dfa import DFA
+from baobab_automata.finite.interval import (
+    MAX_CODEPOINT,
+    CharClass,
+    IntervalDFA,
+    IntervalNFA,
+    InvalidCharClassError,
+    InvalidIntervalAutomatonError,
+    NonDeterministicIntervalError,
+    split_intervals,
+)
+from baobab_automata.finite.regex.regex_exceptions import RegexSyntaxError
+from baobab_automata.finite.regex.regex_parser import RegexParser
+
+
+class TestCharClass(unittest.TestCase):
+    """Tests unitaires pour la classe CharClass."""
+
+    def test_normalization_merges_adjacent_intervals(self):
+        """Test de la fusion des intervalles chevauchants et adjacents."""
+        char_class = CharClass([(ord("d"), ord("f")), (ord("a"), ord("c")), (120, 122)])
+        self.assertEqual(char_class.intervals, ((97, 102), (120, 122)))
+        self.assertEqual(len(char_class), 9)
+
+    def test_parse_bracket_and_negation(self):
+        """Test de l'analyse des classes entre crochets."""
+        char_class = CharClass.parse("[a-c_\\d]")
+        self.assertIn("b", char_class)
+        self.assertIn("_", char_class)
+        self.assertIn("٣", char_class)
+        self.assertNotIn("d", char_class)
+        negated = CharClass.parse("[^a-c]")
+        self.assertNotIn("a", negated)
+        self.assertIn("é", negated)
+
+    def test_parse_invalid(self):
+        """Test de l'analyse de spécifications invalides."""
+        with self.assertRaises(InvalidCharClassError):
+            CharClass.parse("[z-a]")
+        with self.assertRaises(InvalidCharClassError):
+            CharClass.parse("abc")
+
+    def test_set_operations(self):
+        """Test des opérations ensemblistes."""
+        letters = CharClass.from_range("a", "z")
+        vowels = CharClass.from_chars("aeiouy")
+        consonants = letters - vowels
+        self.assertEqual(len(consonants), 20)
+        self.assertEqual(consonants | vowels, letters)
+        self.assertTrue((consonants & vowels).is_empty())
+        self.assertEqual(~CharClass.empty(), CharClass.any_char())
+        self.assertEqual(CharClass.any_char().intervals, ((0, MAX_CODEPOINT),))
+
+    def test_unicode_word_class(self):
+        """Test de la classe \\w sur des caractères non ASCII."""
+        word = CharClass.word()
+        for char in "aZ_éß漢٣":
+            self.assertIn(char, word)
+        self.assertNotIn(" ", word)
+        self.assertNotIn("!", word)
+
+    def test_split_intervals(self):
+        """Test du découpage d'intervalles chevauchants."""
+        pieces = split_intervals([(0, 10, "x"), (5, 15, "y")])
+        self.assertEqual(
+            pieces,
+            [
+                (0, 4, frozenset({"x"})),
+                (5, 10, frozenset({"x", "y"})),
+                (11, 15, frozenset({"y"})),
+            ],
+        )
+
+
+class TestIntervalDFA(unittest.TestCase):
+    """Tests unitaires pour la classe IntervalDFA."""
+
+    def setUp(self):
+        """Identifiants : une lettre puis des lettres ou chiffres."""
+        self.identifier = IntervalDFA(
+            {"start", "body"},
+            {("start", "[a-zA-Z_]"): "body", ("body", "\\w"): "body"},
+            "start",
+            {"body"},
+        )
+
+    def test_accepts(self):
+        """Test de la reconnaissance de mots."""
+        self.assertTrue(self.identifier.accepts("abc_12"))
+        self.assertTrue(self.identifier.accepts("xé٣"))
+        self.assertFalse(self.identifier.accepts("1abc"))
+        self.assertFalse(self.identifier.accepts(""))
+        self.assertFalse(self.identifier.accepts("a b"))
+
+    def test_get_transition(self):
+        """Test de la récupération de transitions par caractère."""
+        self.assertEqual(self.identifier.get_transition("start", "q"), "body")
+        self.assertIsNone(self.identifier.get_transition("start", "1"))
+        self.assertEqual(self.identifier.get_transition("body", "漢"), "body")
+
+    def test_overlapping_transitions_rejected(self):
+        """Test du rejet des intervalles ambigus."""
+        with self.assertRaises(NonDeterministicIntervalError):
+            IntervalDFA(
+                {"q0", "q1", "q2"},
+                {("q0", "[a-m]"): "q1", ("q0", "[k-z]"): "q2"},
+                "q0",
+                {"q1"},
+            )
+
+    def test_invalid_state_rejected(self):
+        """Test du rejet d'une transition vers un état inconnu."""
+        with self.assertRaises(InvalidIntervalAutomatonError):
+            IntervalDFA({"q0"}, {("q0", "a"): "q9"}, "q0", {"q0"})
+
+    def test_minimize_merges_equivalent_states(self):
+        """Test de la minimisation avec des intervalles découpés."""
+        dfa = IntervalDFA(
+            {"q0", "q1", "q2", "q3"},
+            {
+                ("q0", "[a-f]"): "q1",
+                ("q0", "[g-z]"): "q2",
+                ("q1", "[0-9]"): "q3",
+                ("q2", "[0-4]"): "q3",
+                ("q2", "[5-9]"): "q3",
+            },
+            "q0",
+            {"q3"},
+        )
+        minimal = dfa.minimize()
+        self.assertEqual(len(minimal.states), 3)
+        self.assertEqual(
+            minimal.get_intervals("q0")[0][0], CharClass.from_range("a", "z")
+        )
+        for word in ["a1", "z9", "m5", "a", "1", "a12"]:
+            self.assertEqual(minimal.accepts(word), dfa.accepts(word))
+
+    def test_product_operations(self):
+        """Test de l'intersection, de l'union et de la différence."""
+        ascii_only = IntervalDFA(
+            {"q0"}, {("q0", CharClass([(0, 127)])): "q0"}, "q0", {"q0"}
+        )
+        intersection = self.identifier.intersection(ascii_only)
+        self.assertTrue(intersection.accepts("abc1"))
+        self.assertFalse(intersection.accepts("abé"))
+        difference = self.identifier.difference(ascii_only)
+        self.assertTrue(difference.accepts("abé"))
+        self.assertFalse(difference.accepts("abc"))
+        union = self.identifier.union(ascii_only)
+        self.assertTrue(union.accepts(""))
+        self.assertTrue(union.accepts("xé"))
+
+    def test_complement(self):
+        """Test du complément sur tout Unicode."""
+        complement = self.identifier.complement()
+        self.assertTrue(complement.accepts(""))
+        self.assertTrue(complement.accepts("1abc"))
+        self.assertFalse(complement.accepts("abc"))
+        self.assertTrue(complement.accepts(chr(MAX_CODEPOINT)))
+
+    def test_dfa_round_trip(self):
+        """Test de la conversion depuis et vers un DFA classique."""
+        dfa = DFA(
+            {"p", "q"}, {"a", "b"}, {("p", "a"): "q", ("q", "b"): "p"}, "p", {"p"}
+        )
+        interval_dfa = IntervalDFA.from_dfa(dfa)
+        self.assertTrue(interval_dfa.accepts("abab"))
+        self.assertFalse(interval_dfa.accepts("aba"))
+        back = interval_dfa.to_dfa()
+        self.assertTrue(back.accepts("ab"))
+        self.assertEqual(back.alphabet, {"a", "b"})
+
+    def test_serialization(self):
+        """Test de la sérialisation en dictionnaire."""
+        restored = IntervalDFA.from_dict(self.identifier.to_dict())
+        self.assertTrue(restored.accepts("x_9"))
+        self.assertFalse(restored.accepts("9"))
+
+
+class TestIntervalNFA(unittest.TestCase):
+    """Tests unitaires pour la classe IntervalNFA."""
+
+    def test_determinization_splits_intervals(self):
+        """Test de la déterminisation avec intervalles chevauchants."""
+        nfa = IntervalNFA(
+            {"q0", "q1", "q2"},
+            {("q0", "[a-m]"): {"q1"}, ("q0", "[h-z]"): {"q2"}},
+            "q0",
+            {"q1", "q2"},
+        )
+        dfa = nfa.to_dfa()
+        self.assertEqual(len(dfa.get_intervals("q0")), 3)
+        self.assertTrue(dfa.accepts("a"))
+        self.assertTrue(dfa.accepts("j"))
+        self.assertTrue(dfa.accepts("z"))
+        self.assertEqual(len(dfa.minimize().states), 2)
+
+    def test_thompson_combinators(self):
+        """Test des combinateurs union, concaténation et étoile."""
+        letters = IntervalNFA.from_char_class("[a-z]")
+        digit = IntervalNFA.from_char_class("\\d")
+        nfa = letters.kleene_star().concatenation(digit.union(IntervalNFA.empty_word()))
+        self.assertTrue(nfa.accepts(""))
+        self.assertTrue(nfa.accepts("abc"))
+        self.assertTrue(nfa.accepts("abc٧"))
+        self.assertFalse(nfa.accepts("1a"))
+        self.assertTrue(nfa.to_dfa().minimize().accepts("zz9"))
+
+
+class TestUnicodeRegexParser(unittest.TestCase):
+    """Tests unitaires pour le mode Unicode du parser d'expressions régulières."""
+
+    def setUp(self):
+        """Initialisation du parser Unicode."""
+        self.parser = RegexParser(unicode=True)
+
+    def test_character_classes(self):
+        """Test des classes de caractères Unicode."""
+        automaton = self.parser.parse("[A-Za-zÀ-ÿ]+\\d*")
+        self.assertIsInstance(automaton, IntervalDFA)
+        self.assertTrue(automaton.accepts("Élève42"))
+        self.assertFalse(automaton.accepts("42"))
+
+    def test_dot_and_escapes(self):
+        """Test du point et des caractères échappés."""
+        automaton = self.parser.parse("\\w+\\.(.)?")
+        self.assertTrue(automaton.accepts("fichier."))
+        self.assertTrue(automaton.accepts("données.☃"))
+        self.assertFalse(automaton.accepts("fichier.\n"))
+
+    def test_default_mode_unchanged(self):
+        """Test que le mode par défaut rejette toujours les caractères inconnus."""
+        with self.assertRaises(RegexSyntaxError):
+            RegexParser().parse("a@b")
+        self.assertTrue(self.parser.parse("a@b").accepts("a@b"))
+
+    def test_unclosed_bracket(self):
+        """Test d'une classe non fermée."""
+        with self.assertRaises(RegexSyntaxError):
+            self.parser.parse("[a-z")
+
+    def test_serialization_keeps_mode(self):
+        """Test de la conservation du mode Unicode."""
+        parser = RegexParser.from_dict(self.parser.to_dict())
+        self.assertTrue(parser.unicode)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -185,6 +185,69 @@ class TestLanguageOperations(unittest.TestCase):
         self.assertIsInstance(result, NFA)
         self.assertEqual(result.alphabet, {"a", "b"})
 
+    def test_homomorphism_merges_symbols(self):
+        """Test de la fusion des cibles de symboles de même image."""
+        mapping = Mapping({"a": "x", "b": "x"})
+        result = LanguageOperations.homomorphism(self.dfa1, mapping)
+        self.assertEqual(result.alphabet, {"x"})
+        self.assertTrue(result.accepts("x"))
+        self.assertTrue(result.accepts("xxx"))
+        self.assertFalse(result.accepts("xx"))
+        self.assertEqual(result.get_transitions("q0", "x"), {"q1"})
+
+    def test_inverse_homomorphism_matches_translation(self):
+        """Test de l'équivalence avec la lecture du mot traduit."""
+        mapping = Mapping({"a": "a", "c": "a", "d": "b"})
+        result = LanguageOperations.inverse_homomorphism(self.nfa1, mapping)
+        self.assertEqual(result.alphabet, {"a", "c", "d"})
+        for word in ["cd", "ad", "cdacd", "bd", "", "cdc", "cdab"]:
+            self.assertEqual(
+                result.accepts(word),
+                LanguageOperations.accepts_mapped(self.nfa1, mapping, word),
+            )
+        self.assertTrue(LanguageOperations.accepts_mapped(self.nfa1, mapping, "cdacd"))
+        self.assertFalse(LanguageOperations.accepts_mapped(self.nfa1, mapping, "bd"))
+
+    def test_inverse_homomorphism_multi_character_images(self):
+        """Test des images de plusieurs caractères, lues comme des chemins."""
+        ab = DFA(
+            states={"q0", "q1", "q2"},
+            alphabet={"a", "b"},
+            transitions={("q0", "a"): "q1", ("q1", "b"): "q2"},
+            initial_state="q0",
+            final_states={"q2"},
+        )
+        mapping = Mapping({"x": "ab", "y": "a"})
+        result = LanguageOperations.inverse_homomorphism(ab, mapping)
+        self.assertTrue(LanguageOperations.accepts_mapped(ab, mapping, "x"))
+        self.assertTrue(result.accepts("x"))
+        for word in ["", "y", "xx", "yx", "xy"]:
+            self.assertEqual(
+                result.accepts(word),
+                LanguageOperations.accepts_mapped(ab, mapping, word),
+            )
+
+        # Les transitions epsilon sont suivies entre les caractères d'une image
+        a_then_b = NFA(
+            states={"q0", "q1", "q2", "q3"},
+            alphabet={"a", "b", "epsilon"},
+            transitions={
+                ("q0", "a"): {"q1"},
+                ("q1", "epsilon"): {"q2"},
+                ("q2", "b"): {"q3"},
+                ("q3", "epsilon"): {"q0"},
+            },
+            initial_state="q0",
+            final_states={"q3"},
+        )
+        result = LanguageOperations.inverse_homomorphism(a_then_b, mapping)
+        for word in ["", "x", "xx", "y", "xy"]:
+            self.assertEqual(
+                result.accepts(word),
+                LanguageOperations.accepts_mapped(a_then_b, mapping, word),
+            )
+        self.assertTrue(result.accepts("xx"))
+
     def test_cartesian_product_basic(self):
         """Test du produit cartésien de base."""
         result = LanguageOperations.cartesian_product(self.dfa1, self.dfa2)
@@ -414,6 +477,34 @@ class TestLanguageOperations(unittest.TestCase):
         with self.assertRaises(OperationValidationError):
             LanguageOperations.power("invalid", 2)
 
+    # ==================== TESTS DES ÉTATS INDEXÉS ====================
+
+    def test_composition_keeps_names_lazy(self):
+        """Test que les compositions successives ne construisent pas les noms."""
+        result = LanguageOperations.kleene_star(
+            LanguageOperations.concatenation(
+                LanguageOperations.union(self.dfa1, self.dfa2), self.dfa1
+            )
+        )
+        self.assertFalse(result._indexed.names.is_materialized)
+        self.assertTrue(result.accepts(""))
+        self.assertTrue(result.accepts("aba"))
+        self.assertTrue(result.accepts("abaaba"))
+        self.assertFalse(result.accepts("b"))
+        self.assertFalse(result._indexed.names.is_materialized)
+
+        # Les noms sont construits à la première demande
+        self.assertIn("kleene_initial", result.states)
+        self.assertIn("k_1_union_initial", result.states)
+        self.assertTrue(result._indexed.names.is_materialized)
+        self.assertTrue(result.validate())
+
+    def test_intersection_keeps_reachable_pairs(self):
+        """Test que le produit ne contient que les paires accessibles."""
+        result = LanguageOperations.intersection(self.dfa1, self.nfa1)
+        self.assertEqual(result.states, {"(q0,q0)", "(q1,q1)", "(q0,q2)", "(q1,q0)"})
+        self.assertEqual(result.final_states, set())
+
 
 if __name__ == "__main__":
     unittest.main()
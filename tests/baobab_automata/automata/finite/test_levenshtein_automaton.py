@@ -0,0 +1,102 @@
+"""
+Tests unitaires pour les automates de Levenshtein.
+
+Ce module valide les distances calculées par les tables paramétriques, la
+recherche approximative dans un DFA dictionnaire et la construction
+explicite du DFA de Levenshtein.
+"""
+
+import itertools
+import random
+import unittest
+
+from baobab_automata.finite import DFA, LevenshteinAutomaton
+from baobab_automata.finite.dfa.dfa_exceptions import InvalidDFAError
+
+
+def _edit_distance(first, second):
+    """Distance d'édition de référence (programmation dynamique)."""
+    row = list(range(len(second) + 1))
+    for i, left in enumerate(first, 1):
+        previous, row[0] = row[:], i
+        for j, right in enumerate(second, 1):
+            row[j] = min(
+                previous[j] + 1, row[j - 1] + 1, previous[j - 1] + (left != right)
+            )
+    return row[-1]
+
+
+class TestLevenshteinAutomaton(unittest.TestCase):
+    """Tests unitaires pour la classe LevenshteinAutomaton."""
+
+    def test_distances_match_reference(self):
+        """Test des distances pour k de 0 à 3 contre la programmation dynamique."""
+        rng = random.Random(3)
+        for max_distance in range(4):
+            for _ in range(60):
+                query = "".join(rng.choice("abc") for _ in range(rng.randint(0, 6)))
+                automaton = LevenshteinAutomaton(query, max_distance)
+                for _ in range(20):
+                    word = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 8)))
+                    expected = _edit_distance(query, word)
+                    self.assertEqual(
+                        automaton.distance(word),
+                        expected if expected <= max_distance else None,
+                        (query, word, max_distance),
+                    )
+
+    def test_fuzzy_search(self):
+        """Test de la recherche approximative dans un dictionnaire."""
+        words = ["cat", "cats", "coat", "cut", "dog", "dot", "scat"]
+        dictionary = DFA.from_words(words)
+
+        self.assertEqual(dictionary.fuzzy_search("cat", 0), [("cat", 0)])
+        self.assertEqual(
+            dictionary.fuzzy_search("cat", 1),
+            [
+                ("cat", 0),
+                ("cats", 1),
+                ("coat", 1),
+                ("cut", 1),
+                ("scat", 1),
+            ],
+        )
+        self.assertIn(("dot", 2), dictionary.fuzzy_search("cat", 3))
+        self.assertIn(("dog", 3), dictionary.fuzzy_search("cat", 3))
+
+        rng = random.Random(5)
+        words = sorted(
+            {
+                "".join(rng.choice("abcde") for _ in range(rng.randint(1, 7)))
+                for _ in range(500)
+            }
+        )
+        dictionary = DFA.from_words(words)
+        for max_distance in range(4):
+            expected = [
+                (word, _edit_distance("abcd", word))
+                for word in words
+                if _edit_distance("abcd", word) <= max_distance
+            ]
+            self.assertEqual(dictionary.fuzzy_search("abcd", max_distance), expected)
+
+    def test_to_dfa(self):
+        """Test de la construction explicite du DFA de Levenshtein."""
+        dfa = LevenshteinAutomaton("abc", 2).to_dfa({"a", "b", "c", "x"})
+        for length in range(7):
+            for letters in itertools.product("abcx", repeat=length):
+                word = "".join(letters)
+                self.assertEqual(
+                    dfa.accepts(word), _edit_distance("abc", word) <= 2, word
+                )
+
+    def test_invalid_distance(self):
+        """Test du rejet d'une distance hors des tables paramétriques."""
+        with self.assertRaises(InvalidDFAError):
+            LevenshteinAutomaton("abc", 4)
+        with self.assertRaises(InvalidDFAError):
+            DFA.from_words(["abc"]).fuzzy_search("abc", -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,9 @@ de la classe Mapping selon les spécifications détaillées.
 
 import unittest
 
-from baobab_automata.finite.language.language_operations_exceptions import InvalidMappingError
+from baobab_automata.finite.language.language_operations_exceptions import (
+    InvalidMappingError,
+)
 from baobab_automata.finite.mapping import Mapping
 
 
@@ -172,6 +174,34 @@ class TestMapping(unittest.TestCase):
         self.assertEqual(self.mapping._inverse_mapping["y"], {"b"})
         self.assertEqual(self.mapping._inverse_mapping["z"], {"c"})
 
+    def test_translate(self):
+        """Test de la traduction d'un texte par la table compilée."""
+        mapping = Mapping({"a": "x", "b": "yz"})
+        self.assertEqual(mapping.translation_table(), {ord("a"): "x", ord("b"): "yz"})
+        self.assertEqual(mapping.translate("abc"), "xyzc")
+        self.assertEqual(mapping.translate("ab", strict=True), "xyz")
+        with self.assertRaises(KeyError):
+            mapping.translate("abc", strict=True)
+
+        with self.assertRaises(InvalidMappingError):
+            Mapping({"ab": "x"}).translate("ab")
+
+    def test_translate_bytes(self):
+        """Test de la traduction octet par octet."""
+        mapping = Mapping({"a": "x", "b": "x"})
+        self.assertEqual(len(mapping.byte_table()), 256)
+        self.assertEqual(mapping.translate_bytes(b"abc"), b"xxc")
+        with self.assertRaises(KeyError):
+            mapping.translate_bytes(b"abc", strict=True)
+
+        with self.assertRaises(InvalidMappingError):
+            Mapping({"a": "xy"}).byte_table()
+
+    def test_symbol_classes(self):
+        """Test du regroupement des symboles de même image."""
+        mapping = Mapping({"a": "x", "b": "x", "c": "w"})
+        self.assertEqual(mapping.symbol_classes(), {"a": 1, "b": 1, "c": 0})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -353,6 +353,19 @@ class TestNFA:
         assert dfa is not None
         assert dfa.validate()
 
+    def test_read_only_views(self):
+        """Test que les propriétés et transitions sont immuables."""
+        nfa = self._create_simple_nfa()
+
+        assert nfa.states is nfa.states
+        assert isinstance(nfa.final_states, frozenset)
+        assert nfa.get_transitions("q0", "a") == {"q1", "q2"}
+        assert nfa.get_transitions("q2", "a") == frozenset()
+        with pytest.raises(AttributeError):
+            nfa.get_transitions("q0", "a").add("q0")
+        with pytest.raises(TypeError):
+            nfa.transitions[("q2", "b")] = {"q0"}
+
     def _create_simple_nfa(self) -> NFA:
         """Crée un NFA simple pour les tests."""
         states = {"q0", "q1", "q2"}
@@ -0,0 +1,154 @@
+"""
+Tests unitaires pour la réduction de NFA par bisimulation et simulation.
+
+Ce module vérifie que les quotients préservent exactement le langage et
+qu'ils fusionnent les états attendus, sans déterminisation.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from baobab_automata.algorithms.finite import NFAReduction, OptimizationAlgorithms
+from baobab_automata.finite.nfa import NFA, EpsilonNFA
+from baobab_automata.finite.optimization.optimization_exceptions import (
+    OptimizationError,
+)
+
+
+def _language(automaton, max_length=6):
+    """Mots sur {a, b} de longueur bornée acceptés par l'automate."""
+    return {
+        word
+        for length in range(max_length + 1)
+        for word in map("".join, itertools.product("ab", repeat=length))
+        if automaton.accepts(word)
+    }
+
+
+def _random_nfa(rng, size):
+    """NFA aléatoire sur {a, b}."""
+    states = [f"s{i}" for i in range(size)]
+    transitions = {}
+    for state in states:
+        for symbol in "ab":
+            targets = {target for target in states if rng.random() < 0.3}
+            if targets:
+                transitions[(state, symbol)] = targets
+    finals = {state for state in states if rng.random() < 0.4}
+    return NFA(set(states), {"a", "b"}, transitions, "s0", finals)
+
+
+class TestNFAReduction:
+    """Tests pour la classe NFAReduction."""
+
+    def test_forward_bisimulation_merges_twins(self):
+        """Test de la fusion de deux branches identiques."""
+        nfa = NFA(
+            states={"q0", "q1", "q2", "q3"},
+            alphabet={"a", "b"},
+            transitions={
+                ("q0", "a"): {"q1", "q2"},
+                ("q1", "b"): {"q3"},
+                ("q2", "b"): {"q3"},
+            },
+            initial_state="q0",
+            final_states={"q3"},
+        )
+        reduced = NFAReduction.bisimulation(nfa)
+        assert reduced.states == {"q0", "q1", "q3"}
+        assert reduced.get_transitions("q0", "a") == {"q1"}
+        assert _language(reduced) == {"ab"}
+
+    def test_backward_bisimulation(self):
+        """Test de la fusion d'états de même passé."""
+        nfa = NFA(
+            states={"q0", "q1", "q2", "q3", "q4"},
+            alphabet={"a", "b"},
+            transitions={
+                ("q0", "a"): {"q1", "q2"},
+                ("q1", "a"): {"q3"},
+                ("q2", "b"): {"q4"},
+            },
+            initial_state="q0",
+            final_states={"q3", "q4"},
+        )
+        assert NFAReduction.bisimulation(nfa).states == {"q0", "q1", "q2", "q3"}
+        reduced = NFAReduction.bisimulation(nfa, "backward")
+        assert reduced.states == {"q0", "q1", "q3", "q4"}
+        assert _language(reduced) == {"aa", "ab"}
+
+        with pytest.raises(ValueError):
+            NFAReduction.bisimulation(nfa, "sideways")
+
+    def test_simulation_reduction(self):
+        """Test de l'élagage des transitions vers un état simulé."""
+        nfa = NFA(
+            states={"p", "small", "big", "end"},
+            alphabet={"a", "b"},
+            transitions={
+                ("p", "a"): {"small", "big"},
+                ("small", "a"): {"end"},
+                ("big", "a"): {"end"},
+                ("big", "b"): {"end"},
+            },
+            initial_state="p",
+            final_states={"end"},
+        )
+        assert "big" in NFAReduction.simulation_preorder(nfa)["small"]
+        assert len(NFAReduction.bisimulation(nfa).states) == 4
+
+        reduced = NFAReduction.simulation(nfa)
+        assert reduced.get_transitions("p", "a") == {"big"}
+        assert _language(reduced) == {"aa", "ab"}
+
+    def test_random_languages_preserved(self):
+        """Test de la préservation du langage sur des NFA aléatoires."""
+        rng = random.Random(1)
+        for _ in range(150):
+            nfa = _random_nfa(rng, rng.randint(1, 7))
+            expected = _language(nfa)
+            for reduced in (
+                NFAReduction.bisimulation(nfa),
+                NFAReduction.bisimulation(nfa, "backward"),
+                NFAReduction.simulation(nfa),
+            ):
+                assert len(reduced.states) <= len(nfa.states)
+                assert _language(reduced) == expected
+
+    def test_epsilon_nfa(self):
+        """Test de la réduction d'un ε-NFA."""
+        enfa = EpsilonNFA(
+            states={"0", "1", "2", "3"},
+            alphabet={"a"},
+            transitions={
+                ("0", "ε"): {"1", "2"},
+                ("1", "a"): {"3"},
+                ("2", "a"): {"3"},
+            },
+            initial_state="0",
+            final_states={"3"},
+        )
+        for reduced in (NFAReduction.bisimulation(enfa), NFAReduction.simulation(enfa)):
+            assert isinstance(reduced, EpsilonNFA)
+            assert reduced.states == {"0", "1", "3"}
+            assert reduced.accepts("a") and not reduced.accepts("aa")
+
+    def test_optimizer_entry_points(self):
+        """Test des méthodes de OptimizationAlgorithms."""
+        rng = random.Random(2)
+        nfa = _random_nfa(rng, 6)
+        optimizer = OptimizationAlgorithms()
+        for reduced in (
+            optimizer.reduce_nfa_bisimulation(nfa),
+            optimizer.reduce_nfa_bisimulation(nfa, "backward"),
+            optimizer.reduce_nfa_simulation(nfa),
+            optimizer.minimize_nfa_heuristic(nfa),
+        ):
+            assert _language(reduced) == _language(nfa)
+
+        with pytest.raises(OptimizationError):
+            optimizer.reduce_nfa_bisimulation(nfa, "sideways")
+        with pytest.raises(OptimizationError):
+            optimizer.reduce_nfa_simulation(nfa.to_dfa())
@@ -0,0 +1,164 @@
+"""
+Tests unitaires pour le DFA persistant à partage structurel.
+
+Ce module vérifie que les éditions produisent de nouvelles versions sans
+altérer les anciennes, que les lots de TransitionChange sont appliqués de
+façon atomique et que la table persistante se comporte comme un dict.
+"""
+
+import random
+
+import pytest
+
+from baobab_automata.finite import DFA, PersistentDFA
+from baobab_automata.finite.dfa.dfa_exceptions import (
+    InvalidDFAError,
+    InvalidStateError,
+    InvalidTransitionError,
+)
+from baobab_automata.finite.dfa.persistent_dfa import _REMOVED, _PersistentMap
+from baobab_automata.finite.optimization import TransitionChange
+
+
+class _Colliding:
+    """Clé dont toutes les instances partagent le même hachage."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, _Colliding) and other.name == self.name
+
+
+def _ab_star_dfa():
+    """DFA des mots sur {a, b} se terminant par b."""
+    return DFA(
+        states={"q0", "q1"},
+        alphabet={"a", "b"},
+        transitions={
+            ("q0", "a"): "q0",
+            ("q0", "b"): "q1",
+            ("q1", "a"): "q0",
+            ("q1", "b"): "q1",
+        },
+        initial_state="q0",
+        final_states={"q1"},
+    )
+
+
+class TestPersistentMap:
+    """Tests pour la table de hachage persistante."""
+
+    def test_random_edits_match_dict(self):
+        """Test de l'équivalence avec un dict sur des éditions aléatoires."""
+        rng = random.Random(0)
+        versions = [(_PersistentMap(), {})]
+        for _ in range(300):
+            table, expected = versions[rng.randrange(len(versions))]
+            expected = dict(expected)
+            edits = []
+            for _ in range(rng.randint(1, 20)):
+                key = rng.randrange(500)
+                if rng.random() < 0.3:
+                    edits.append((key, _REMOVED))
+                    expected.pop(key, None)
+                else:
+                    edits.append((key, rng.random()))
+                    expected[key] = edits[-1][1]
+            versions.append((table.evolve(edits), expected))
+
+        for table, expected in versions:
+            assert len(table) == len(expected)
+            assert dict(table.items()) == expected
+            assert all(table.get(key) == value for key, value in expected.items())
+
+    def test_hash_collisions(self):
+        """Test des seaux de collision complète de hachage."""
+        keys = [_Colliding(name) for name in "abcd"]
+        table = _PersistentMap().evolve((key, key.name) for key in keys)
+        assert len(table) == 4
+        assert table.get(_Colliding("c")) == "c"
+
+        smaller = table.evolve([(_Colliding("b"), _REMOVED)])
+        assert _Colliding("b") not in smaller and _Colliding("b") in table
+        assert sorted(value for _, value in smaller.items()) == ["a", "c", "d"]
+
+
+class TestPersistentDFA:
+    """Tests pour la classe PersistentDFA."""
+
+    def test_conversion_round_trip(self):
+        """Test de la conversion depuis et vers un DFA."""
+        dfa = _ab_star_dfa()
+        persistent = dfa.to_persistent()
+        assert persistent.states == dfa.states
+        assert persistent.final_states == dfa.final_states
+        assert dict(persistent.transitions) == dict(dfa.transitions)
+        assert persistent.accepts("aab") and not persistent.accepts("ba")
+        assert persistent.to_dfa().accepts("ab")
+        assert PersistentDFA.from_dict(dfa.to_dict()).accepts("b")
+
+        with pytest.raises(InvalidDFAError):
+            PersistentDFA({"q0"}, {"a"}, {("q0", "a"): "q9"}, "q0", set())
+
+    def test_edits_keep_old_versions(self):
+        """Test de la validité des anciennes versions après édition."""
+        original = _ab_star_dfa().to_persistent()
+        edited = original.add_state("q2", final=True).set_transition("q1", "a", "q2")
+        assert edited.accepts("ba") and not original.accepts("ba")
+        assert edited.states == {"q0", "q1", "q2"}
+        assert original.states == {"q0", "q1"}
+
+        removed = edited.remove_transition("q0", "b")
+        assert not removed.accepts("b") and edited.accepts("b")
+        assert removed.remove_transition("q0", "b") is removed
+        assert not removed.set_final("q1", False).accepts("aab")
+        assert removed.get_reachable_states() == {"q0"}
+
+        with pytest.raises(InvalidStateError):
+            original.set_transition("q0", "a", "q9")
+        with pytest.raises(InvalidTransitionError):
+            original.set_transition("q0", "c", "q1")
+        with pytest.raises(InvalidStateError):
+            original.add_state("q0")
+
+    def test_apply_changes(self):
+        """Test de l'application d'un lot de TransitionChange."""
+        original = _ab_star_dfa().to_persistent()
+        changes = [
+            TransitionChange("q1", "b", "q1", None),
+            TransitionChange("q1", "b", None, "q0"),
+            TransitionChange("q0", "a", "q0", "q1"),
+        ]
+        edited = original.apply_changes(changes)
+        assert edited.get_transition("q1", "b") == "q0"
+        assert edited.get_transition("q0", "a") == "q1"
+        assert original.get_transition("q0", "a") == "q0"
+        assert original.apply_changes([]) is original
+
+        # old_target est vérifié contre l'état courant du lot
+        with pytest.raises(InvalidTransitionError):
+            original.apply_change(TransitionChange("q0", "a", "q1", "q0"))
+        with pytest.raises(InvalidTransitionError):
+            original.apply_change(TransitionChange("q0", "a", None, "q1"))
+
+    def test_large_automaton_edits(self):
+        """Test d'éditions successives sur un automate de 20 000 états."""
+        size = 20_000
+        dfa = DFA(
+            states={f"s{i}" for i in range(size)},
+            alphabet={"a"},
+            transitions={(f"s{i}", "a"): f"s{i + 1}" for i in range(size - 1)},
+            initial_state="s0",
+            final_states={f"s{size - 1}"},
+        )
+        versions = [dfa.to_persistent()]
+        for i in range(200):
+            versions.append(versions[-1].set_transition(f"s{i}", "a", f"s{size - 1}"))
+        assert versions[1].accepts("a")
+        assert not versions[0].accepts("a")
+        assert versions[0].accepts("a" * (size - 1))
+        assert versions[-1].get_transition("s199", "a") == f"s{size - 1}"
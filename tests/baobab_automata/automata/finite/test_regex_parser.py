@@ -309,12 +309,16 @@ class TestRegexParser:
         with pytest.raises(RegexParseError):
             self.parser.parse("(a|b")
 
-    def test_automaton_to_regex_placeholder(self):
-        """Test la conversion automate vers regex (placeholder)."""
-        # Pour l'instant, cette méthode retourne un placeholder
-        automaton = self.parser.parse("a|b")
-        regex = self.parser.automaton_to_regex(automaton)
-        assert regex == "a*"  # Placeholder actuel
+    def test_automaton_to_regex(self):
+        """Test la conversion automate vers regex par élimination d'états."""
+        automaton = DFA(
+            {"q0", "q1"},
+            {"a", "b"},
+            {("q0", "a"): "q1", ("q1", "b"): "q1"},
+            "q0",
+            {"q1"},
+        )
+        assert self.parser.automaton_to_regex(automaton) == "ab*"
 
     def test_build_automaton_literal(self):
         """Test la construction d'automate pour un littéral."""
@@ -0,0 +1,106 @@
+"""
+Tests unitaires pour les analyses structurelles mises en cache.
+
+Ce module valide l'index inverse, l'accessibilité, la co-accessibilité,
+les états puits, le déterminisme, le miroir et l'invalidation du cache.
+"""
+
+import unittest
+
+from baobab_automata.finite.dfa import DFA
+from baobab_automata.finite.nfa import NFA, EpsilonNFA
+from baobab_automata.finite.structural_analysis import StructuralAnalysis
+
+
+class TestStructuralAnalysis(unittest.TestCase):
+    """Tests unitaires pour la classe StructuralAnalysis."""
+
+    def setUp(self):
+        """DFA avec un état inaccessible et un état puits."""
+        self.dfa = DFA(
+            {"q0", "q1", "q2", "dead", "lost"},
+            {"a", "b"},
+            {
+                ("q0", "a"): "q1",
+                ("q1", "b"): "q2",
+                ("q0", "b"): "dead",
+                ("dead", "a"): "dead",
+                ("lost", "a"): "q2",
+            },
+            "q0",
+            {"q2"},
+        )
+
+    def test_analyses_are_cached(self):
+        """Test que les analyses sont calculées une seule fois."""
+        analysis = StructuralAnalysis.of(self.dfa)
+        self.assertIs(StructuralAnalysis.of(self.dfa), analysis)
+        self.assertIs(self.dfa.get_reachable_states(), self.dfa.get_reachable_states())
+        self.assertEqual(self.dfa.get_reachable_states(), {"q0", "q1", "q2", "dead"})
+        self.assertEqual(analysis.coreachable, {"q0", "q1", "q2", "lost"})
+        self.assertEqual(self.dfa.get_dead_states(), {"dead"})
+
+    def test_reverse_index(self):
+        """Test de l'index inverse des transitions."""
+        index = StructuralAnalysis.of(self.dfa).reverse_index
+        self.assertEqual(index["q2"], {"b": {"q1"}, "a": {"lost"}})
+        self.assertEqual(index["dead"]["a"], {"dead"})
+        predecessors = StructuralAnalysis.of(self.dfa).predecessors({"q1", "q2"}, "a")
+        self.assertEqual(predecessors, {"q0", "lost"})
+
+    def test_nfa_analyses(self):
+        """Test des analyses sur un NFA et un ε-NFA."""
+        nfa = NFA(
+            {"q0", "q1", "q2"},
+            {"a"},
+            {("q0", "a"): {"q0", "q1"}},
+            "q0",
+            {"q1"},
+        )
+        self.assertEqual(nfa.get_useful_states(), {"q0", "q1"})
+        self.assertFalse(nfa.is_deterministic())
+        self.assertTrue(self.dfa.to_nfa().is_deterministic())
+
+        epsilon_nfa = EpsilonNFA(
+            {"q0", "q1", "q2"},
+            {"a"},
+            {("q0", "ε"): {"q1"}, ("q1", "a"): {"q2"}},
+            "q0",
+            {"q2"},
+        )
+        self.assertEqual(epsilon_nfa.get_coaccessible_states(), {"q0", "q1", "q2"})
+
+    def test_cache_dropped_when_structures_replaced(self):
+        """Test que le cache est reconstruit si les structures changent."""
+        nfa = NFA({"q0", "q1"}, {"a"}, {("q0", "a"): {"q1"}}, "q0", {"q1"})
+        self.assertEqual(nfa.get_accessible_states(), {"q0", "q1"})
+
+        nfa._transitions = {}
+        self.assertEqual(nfa.get_accessible_states(), {"q0"})
+
+        StructuralAnalysis.drop(nfa)
+        self.assertNotIn("_structural_analysis", nfa.__dict__)
+
+    def test_reverse(self):
+        """Test de l'automate miroir."""
+        mirror = self.dfa.reverse()
+        self.assertTrue(mirror.accepts("ba"))
+        self.assertFalse(mirror.accepts("ab"))
+        self.assertFalse(mirror.accepts("a"))
+
+        two_finals = DFA(
+            {"p0", "p1", "p2"},
+            {"a", "b"},
+            {("p0", "a"): "p1", ("p1", "b"): "p2"},
+            "p0",
+            {"p1", "p2"},
+        )
+        mirror = two_finals.reverse()
+        self.assertTrue(mirror.accepts("a"))
+        self.assertTrue(mirror.accepts("ba"))
+        self.assertFalse(mirror.accepts("b"))
+        self.assertTrue(mirror.reverse().accepts("ab"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+Tests unitaires pour la vue matricielle des automates finis.
+
+Ce module valide les exports to_matrix() et to_csr() des DFA et NFA ainsi
+que les analyses vectorisées de TransitionMatrix.
+"""
+
+import unittest
+
+import numpy as np
+
+from baobab_automata.finite import DFA, DFABuilder, NFA, TransitionMatrix
+
+
+def _even_a_dfa():
+    """DFA des mots sur {a, b} ayant un nombre pair de a, plus un état isolé."""
+    return DFA(
+        states={"even", "odd", "lost"},
+        alphabet={"a", "b"},
+        transitions={
+            ("even", "a"): "odd",
+            ("odd", "a"): "even",
+            ("even", "b"): "even",
+            ("odd", "b"): "odd",
+            ("lost", "a"): "even",
+        },
+        initial_state="even",
+        final_states={"even"},
+    )
+
+
+class TestTransitionMatrix(unittest.TestCase):
+    """Tests unitaires pour la classe TransitionMatrix."""
+
+    def test_exports(self):
+        """Test des matrices par symbole et de l'adjacence CSR."""
+        dfa = _even_a_dfa()
+        matrix = dfa.to_csr()
+        self.assertIsInstance(matrix, TransitionMatrix)
+        self.assertEqual(matrix.states, ["even", "lost", "odd"])
+        self.assertEqual(matrix.indptr.tolist(), [0, 2, 3, 5])
+        self.assertEqual(matrix.indices.tolist(), [0, 2, 0, 0, 2])
+        self.assertEqual(matrix.data.tolist(), [1, 1, 1, 1, 1])
+
+        per_symbol = dfa.to_matrix()
+        self.assertEqual(per_symbol["a"].dtype, bool)
+        self.assertEqual(
+            per_symbol["a"].astype(int).tolist(), [[0, 0, 1], [1, 0, 0], [1, 0, 0]]
+        )
+        combined = sum(m.astype(np.int64) for m in per_symbol.values())
+        self.assertTrue((combined == matrix.to_dense()).all())
+
+        nfa = NFA(
+            states={"p", "q"},
+            alphabet={"a"},
+            transitions={("p", "a"): {"p", "q"}},
+            initial_state="p",
+            final_states={"q"},
+        )
+        self.assertEqual(nfa.to_csr().to_dense().tolist(), [[1, 1], [0, 0]])
+
+    def test_analyses(self):
+        """Test de l'accessibilité, du dénombrement et de la finitude."""
+        matrix = _even_a_dfa().to_csr()
+        self.assertEqual(matrix.names(matrix.reachable()), {"even", "odd"})
+        self.assertEqual(matrix.names(matrix.coreachable()), {"even", "odd", "lost"})
+        self.assertEqual(matrix.names(matrix.useful()), {"even", "odd"})
+        self.assertFalse(matrix.is_finite())
+        self.assertEqual([matrix.count_words(n) for n in range(6)], [1, 1, 2, 4, 8, 16])
+        self.assertEqual(matrix.count_words(200), 2**199)
+
+        finite = DFA.from_words(["a", "ab", "abc", "b"]).to_csr()
+        self.assertTrue(finite.is_finite())
+        self.assertEqual([finite.count_words(n) for n in range(5)], [0, 2, 1, 1, 0])
+
+    def test_nfa_counts_words_not_paths(self):
+        """Test du dénombrement des mots d'un NFA avec chemins et cycles epsilon."""
+        nfa = NFA(
+            states={"p", "q", "r", "s"},
+            alphabet={"a", "epsilon"},
+            transitions={
+                ("p", "a"): {"q", "r"},
+                ("q", "epsilon"): {"s"},
+                ("s", "epsilon"): {"q"},
+            },
+            initial_state="p",
+            final_states={"q", "r"},
+        )
+        matrix = nfa.to_csr()
+        self.assertEqual([matrix.count_words(n) for n in range(3)], [0, 1, 0])
+        self.assertTrue(matrix.is_finite())
+
+        forked = NFA(
+            states={"p", "q", "r"},
+            alphabet={"a"},
+            transitions={("p", "a"): {"q", "r"}},
+            initial_state="p",
+            final_states={"q", "r"},
+        )
+        self.assertEqual(forked.to_csr().count_words(1), 1)
+
+    def test_matrices_without_source(self):
+        """Test des analyses sur une transposée et une matrice construite."""
+        # Miroir du DFA : deux cibles pour (even, a), mêmes comptes de mots
+        mirror = _even_a_dfa().to_csr().transpose()
+        self.assertEqual([mirror.count_words(n) for n in range(5)], [1, 1, 2, 4, 8])
+        self.assertFalse(mirror.is_finite())
+
+        built = TransitionMatrix(
+            ["p", "q"],
+            ["a", "b"],
+            np.array([0, 0, 1]),
+            np.array([0, 1, 0]),
+            np.array([1, 1, 1]),
+            0,
+            np.array([False, True]),
+        )
+        self.assertEqual([built.count_words(n) for n in range(4)], [0, 2, 2, 2])
+        self.assertFalse(built.is_finite())
+
+    def test_epsilon_operators(self):
+        """Test des exports et analyses sur l'union, la concaténation et l'étoile."""
+        word_a = NFA({"0", "1"}, {"a"}, {("0", "a"): {"1"}}, "0", {"1"})
+        word_b = NFA({"0", "1"}, {"b"}, {("0", "b"): {"1"}}, "0", {"1"})
+        for automaton, counts, finite in (
+            (word_a.union(word_b), [0, 2, 0, 0], True),
+            (word_a.concatenation(word_b), [0, 0, 1, 0], True),
+            (word_a.kleene_star(), [1, 1, 1, 1], False),
+        ):
+            per_symbol = automaton.to_matrix()
+            self.assertIn("epsilon", per_symbol)
+            self.assertTrue(per_symbol["epsilon"].any())
+            matrix = automaton.to_csr()
+            self.assertEqual(matrix.symbols[-1], "epsilon")
+            self.assertEqual([matrix.count_words(n) for n in range(4)], counts)
+            self.assertEqual(matrix.is_finite(), finite)
+
+    def test_large_automaton(self):
+        """Test des analyses sur une chaîne et un graphe de 10^5 états."""
+        size = 100_000
+        builder = DFABuilder({"0", "1"})
+        builder.add_states(size)
+        builder.set_initial(0)
+        builder.set_final([size - 1])
+        states = np.arange(size)
+        builder.add_transitions(states[:-1], np.zeros(size - 1, dtype=int), states[1:])
+        chain = builder.build().to_csr()
+        self.assertTrue(chain.reachable().all())
+        self.assertTrue(chain.coreachable().all())
+        self.assertTrue(chain.is_finite())
+        self.assertEqual(chain.count_words(10), 0)
+
+        builder.add_transitions([size - 1], [1], [0])
+        cycle = builder.build().to_csr()
+        self.assertFalse(cycle.is_finite())
+        self.assertEqual(cycle.count_words(50), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Tests unitaires pour l'énumération et le dénombrement des mots.
+
+Ce module valide l'ordre militaire de l'énumération, les comptes par
+longueur (y compris au-delà des entiers 64 bits) et l'uniformité du tirage.
+"""
+
+import collections
+import itertools
+import random
+
+from baobab_automata.algorithms.finite import OptimizationAlgorithms, WordEnumeration
+from baobab_automata.finite.dfa import DFA
+from baobab_automata.finite.nfa import NFA
+
+
+def _even_a_dfa():
+    """DFA des mots sur {a, b} contenant un nombre pair de a."""
+    return DFA(
+        states={"even", "odd"},
+        alphabet={"a", "b"},
+        transitions={
+            ("even", "a"): "odd",
+            ("odd", "a"): "even",
+            ("even", "b"): "even",
+            ("odd", "b"): "odd",
+        },
+        initial_state="even",
+        final_states={"even"},
+    )
+
+
+class TestWordEnumeration:
+    """Tests pour la classe WordEnumeration."""
+
+    def test_shortlex_order(self):
+        """Test de l'ordre militaire sur un langage infini."""
+        words = itertools.islice(WordEnumeration.shortlex(_even_a_dfa()), 30)
+        expected = [
+            word
+            for length in range(10)
+            for word in map("".join, itertools.product("ab", repeat=length))
+            if word.count("a") % 2 == 0
+        ][:30]
+        assert list(words) == expected
+
+    def test_shortlex_finite_language(self):
+        """Test de l'énumération complète d'un langage fini et d'un NFA."""
+        dfa = DFA.from_words(["b", "ab", "a", "abc"], sorted_input=False)
+        assert list(WordEnumeration.shortlex(dfa)) == ["a", "b", "ab", "abc"]
+        assert list(WordEnumeration.shortlex(dfa, max_length=1)) == ["a", "b"]
+        assert WordEnumeration.count_words(dfa) == 4
+        assert WordEnumeration.count_words(_even_a_dfa()) is None
+        assert WordEnumeration.is_finite(dfa)
+        assert not WordEnumeration.is_finite(_even_a_dfa())
+
+        nfa = NFA(
+            states={"p", "q"},
+            alphabet={"a"},
+            transitions={("p", "a"): {"p", "q"}, ("q", "a"): {"q"}},
+            initial_state="p",
+            final_states={"q"},
+        )
+        assert list(WordEnumeration.shortlex(nfa, 3)) == ["a", "aa", "aaa"]
+        assert WordEnumeration.count_by_length(nfa, 3) == [0, 1, 1, 1]
+
+    def test_count_by_length_big_integers(self):
+        """Test des comptes au-delà des entiers 64 bits."""
+        counts = WordEnumeration.count_by_length(_even_a_dfa(), 150)
+        assert counts[:5] == [1, 1, 2, 4, 8]
+        assert counts[150] == 2**149
+
+    def test_uniform_sampling(self):
+        """Test du tirage uniforme parmi les mots d'une longueur."""
+        rng = random.Random(0)
+        draws = collections.Counter(
+            WordEnumeration.sample(_even_a_dfa(), 4, rng) for _ in range(4000)
+        )
+        assert len(draws) == 8
+        assert min(draws.values()) > 350
+
+        words = WordEnumeration.sample_words(_even_a_dfa(), 20, 6, rng)
+        assert len(words) == 20
+        assert all(word.count("a") % 2 == 0 and len(word) <= 6 for word in words)
+        assert WordEnumeration.sample(DFA.from_words(["ab"]), 3) is None
+
+    def test_generated_test_words_follow_alphabet(self):
+        """Test des mots de validation générés sur l'alphabet réel."""
+        dfa = DFA.from_words(["xy", "xyz"])
+        words = OptimizationAlgorithms()._generate_test_words(dfa, 40)
+        assert len(words) == 40
+        assert words[:2] == ["xy", "xyz"]
+        assert all(set(word) <= {"x", "y", "z"} for word in words)
+
+    def test_generated_test_words_without_determinization(self):
+        """Test des mots de validation d'un NFA, obtenus sans déterminiser."""
+        # 17e lettre avant la fin égale à a : 2^17 états une fois déterminisé
+        transitions = {("p0", "a"): {"p0", "p1"}, ("p0", "b"): {"p0"}}
+        for i in range(1, 17):
+            transitions[(f"p{i}", "a")] = {f"p{i + 1}"}
+            transitions[(f"p{i}", "b")] = {f"p{i + 1}"}
+        nfa = NFA({f"p{i}" for i in range(18)}, {"a", "b"}, transitions, "p0", {"p17"})
+        optimizer = OptimizationAlgorithms()
+        assert optimizer.validate_optimization(nfa, nfa)
+
+        small = NFA(
+            states={"p0", "p1"},
+            alphabet={"a", "b"},
+            transitions={("p0", "a"): {"p0", "p1"}, ("p0", "b"): {"p0"}},
+            initial_state="p0",
+            final_states={"p1"},
+        )
+        words = optimizer._generate_test_words(small, 40)
+        assert len(words) == 40
+        assert words[:3] == ["a", "aa", "ba"]
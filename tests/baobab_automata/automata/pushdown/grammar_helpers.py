@@ -0,0 +1,26 @@
+"""
+Fabriques partagées par les tests des grammaires et des automates à pile.
+
+Ce module regroupe la construction de grammaires hors-contexte à partir de
+règles écrites en couples et les longueurs utilisées pour tirer au hasard
+parties droites et mots empilés.
+"""
+
+from baobab_automata.pushdown.grammar.grammar_types import (
+    ContextFreeGrammar,
+    Production,
+)
+
+# Longueurs des parties droites (ou mots empilés) tirées au hasard
+# (ε et unitaires fréquents)
+LENGTHS = (0, 1, 1, 2, 2, 3)
+
+
+def build_grammar(rules, start="S", terminals=("a", "b")):
+    """Grammaire construite à partir de couples (variable, partie droite)."""
+    return ContextFreeGrammar(
+        variables={left for left, _ in rules},
+        terminals=set(terminals),
+        productions={Production(left, tuple(right)) for left, right in rules},
+        start_symbol=start,
+    )
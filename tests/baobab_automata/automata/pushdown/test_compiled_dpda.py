@@ -0,0 +1,144 @@
+"""
+Tests unitaires pour les DPDA compilés et la reconnaissance en flux.
+
+Ce module vérifie que la reconnaissance par morceaux donne les mêmes
+décisions que accepts, que les boucles ε sont détectées à la compilation
+et que le flux se termine proprement.
+"""
+
+import itertools
+import sys
+
+import pytest
+
+from baobab_automata.pushdown.dpda import DPDA, DPDAError
+
+
+def _brackets_dpda():
+    """DPDA des mots bien parenthésés sur ( ) [ ]."""
+    transitions = {
+        ("q0", "(", "Z"): ("q1", "(Z"),
+        ("q0", "[", "Z"): ("q1", "[Z"),
+        ("q1", ")", "("): ("q2", ""),
+        ("q1", "]", "["): ("q2", ""),
+    }
+    for top in "([":
+        transitions[("q1", "(", top)] = ("q1", "(" + top)
+        transitions[("q1", "[", top)] = ("q1", "[" + top)
+        # Après une fermeture, q2 regarde le sommet par une transition ε
+        transitions[("q2", "", top)] = ("q1", top)
+    transitions[("q2", "", "Z")] = ("q0", "Z")
+    return DPDA(
+        states={"q0", "q1", "q2"},
+        input_alphabet={"(", ")", "[", "]"},
+        stack_alphabet={"Z", "(", "["},
+        transitions=transitions,
+        initial_state="q0",
+        initial_stack_symbol="Z",
+        final_states={"q0"},
+    )
+
+
+class TestCompiledDPDA:
+    """Tests pour les classes CompiledDPDA et DPDAStream."""
+
+    def test_stream_matches_accepts(self):
+        """Test de la lecture par morceaux contre accepts."""
+        dpda = _brackets_dpda()
+        compiled = dpda.compile()
+        assert compiled is dpda.compile() and not compiled.epsilon_loops
+
+        nested = "([" * 20000 + "])" * 20000
+        stream = compiled.stream()
+        for start in range(0, len(nested), 777):
+            stream.feed(nested[start : start + 777])
+        assert stream.position == len(nested) and not stream.rejected
+        assert stream.finish() == dpda.accepts(nested)
+
+        for length in range(5):
+            for word in map("".join, itertools.product("()[]", repeat=length)):
+                stream = compiled.stream()
+                for symbol in word:
+                    stream.feed(symbol)
+                assert stream.finish() == dpda.accepts(word)
+
+    def test_epsilon_loops_detected_at_compile_time(self):
+        """Test du rejet des boucles ε au lieu d'une simulation sans fin."""
+        dpda = DPDA(
+            states={"q0", "q1", "q2", "q3"},
+            input_alphabet={"a", "b"},
+            stack_alphabet={"Z", "A"},
+            transitions={
+                # q1 empile sans fin
+                ("q0", "a", "Z"): ("q1", "Z"),
+                ("q1", "", "Z"): ("q1", "AZ"),
+                ("q1", "", "A"): ("q1", "AA"),
+                # q2 et q3 alternent, en passant par l'état final q3
+                ("q0", "b", "Z"): ("q2", "AZ"),
+                ("q2", "", "A"): ("q3", "A"),
+                ("q3", "", "A"): ("q2", "A"),
+            },
+            initial_state="q0",
+            initial_stack_symbol="Z",
+            final_states={"q0", "q3"},
+        )
+        assert dpda.compile().epsilon_loops == {
+            ("q1", "Z"),
+            ("q1", "A"),
+            ("q2", "A"),
+            ("q3", "A"),
+        }
+        assert dpda.accepts("") and not dpda.accepts("a")
+        assert not dpda.accepts("aa")
+        # En fin de mot, la boucle atteint un état final avant de se répéter
+        assert dpda.accepts("b") and not dpda.accepts("ba")
+
+    def test_stream_lifecycle(self):
+        """Test du rejet anticipé et de la fin du flux."""
+        stream = _brackets_dpda().compile().stream()
+        stream.feed("(]")
+        assert stream.rejected and stream.position == 1
+        stream.feed("()")
+        assert stream.position == 1 and not stream.finish()
+
+        stream = _brackets_dpda().compile().stream()
+        stream.feed("x")
+        assert stream.rejected and not stream.finish()
+        assert not stream.finish()
+        with pytest.raises(DPDAError):
+            stream.feed("(")
+
+    def test_epsilon_chain_longer_than_recursion_limit(self):
+        """Test d'une suite de transitions ε plus longue que la récursion."""
+        length = sys.getrecursionlimit() + 1000
+        chain = [chr(0x100 + index) for index in range(length)]
+        transitions = {("q0", "a", "Z"): ("q1", chain[0] + "Z")}
+        for symbol, following in zip(chain, chain[1:]):
+            # Chaque symbole empile le suivant au-dessus de lui
+            transitions[("q1", "", symbol)] = ("q1", following + symbol)
+        transitions[("q1", "", chain[-1])] = ("q2", chain[-1])
+        dpda = DPDA(
+            states={"q0", "q1", "q2"},
+            input_alphabet={"a"},
+            stack_alphabet={"Z", *chain},
+            transitions=transitions,
+            initial_state="q0",
+            initial_stack_symbol="Z",
+            final_states={"q2"},
+        )
+        assert not dpda.compile().epsilon_loops
+        assert dpda.accepts("a") and not dpda.accepts("aa")
+
+        # Refermée sur elle-même, la suite devient une boucle ε
+        transitions[("q1", "", chain[-1])] = ("q1", chain[0] + chain[-1])
+        looping = DPDA(
+            states={"q0", "q1", "q2"},
+            input_alphabet={"a"},
+            stack_alphabet={"Z", *chain},
+            transitions=transitions,
+            initial_state="q0",
+            initial_stack_symbol="Z",
+            final_states={"q2"},
+        )
+        assert len(looping.compile().epsilon_loops) == length
+        assert not looping.accepts("a")
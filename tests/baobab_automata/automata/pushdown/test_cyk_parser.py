@@ -0,0 +1,166 @@
+"""
+Tests unitaires pour l'analyseur CYK vectorisé.
+
+Ce module vérifie la normalisation en forme de Chomsky stricte, la
+reconnaissance contre un point fixe naïf, l'extraction d'arbres par
+pointeurs arrière et le cache de SpecializedAlgorithms.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from baobab_automata.algorithms.pushdown import CYKParser, EarleyParser
+from baobab_automata.algorithms.pushdown.specialized_algorithms import (
+    ParseTree,
+    SpecializedAlgorithms,
+)
+from baobab_automata.pushdown.grammar.grammar_types import Production
+from baobab_automata.pushdown.specialized.specialized_exceptions import (
+    CYKError,
+    NormalizationError,
+)
+
+from .grammar_helpers import build_grammar
+
+
+def _derives(grammar, word):
+    """Appartenance par point fixe sur les triplets (variable, début, fin)."""
+    length = len(word)
+    derived = set()
+
+    def sequence(right, start, end):
+        reached = {start}
+        for symbol in right:
+            reached = {
+                middle
+                for position in reached
+                for middle in range(position, end + 1)
+                if (symbol, position, middle) in derived
+                or (middle == position + 1 and word[position:middle] == symbol)
+            }
+        return end in reached
+
+    changed = True
+    while changed:
+        changed = False
+        for production in grammar.productions:
+            for start in range(length + 1):
+                for end in range(start, length + 1):
+                    key = (production.left_side, start, end)
+                    if key in derived:
+                        continue
+                    if sequence(production.right_side, start, end):
+                        derived.add(key)
+                        changed = True
+    return (grammar.start_symbol, 0, length) in derived
+
+
+def _leaves(tree):
+    """Mot porté par les feuilles d'un arbre."""
+    if not tree.children:
+        return tree.symbol if tree.end > tree.start else ""
+    return "".join(_leaves(child) for child in tree.children)
+
+
+def _expressions():
+    """Grammaire des expressions arithmétiques."""
+    return build_grammar(
+        [
+            ("E", ("E", "+", "T")),
+            ("E", ("T",)),
+            ("T", ("T", "*", "F")),
+            ("T", ("F",)),
+            ("F", ("(", "E", ")")),
+            ("F", ("a",)),
+        ],
+        "E",
+        "a+*()",
+    )
+
+
+class TestCYKParser:
+    """Tests pour la classe CYKParser."""
+
+    def test_random_grammars_match_fixpoint(self):
+        """Test de la normalisation et de la reconnaissance, grammaires aléatoires."""
+        rng = random.Random(7)
+        algorithms = SpecializedAlgorithms()
+        for _ in range(60):
+            variables = ["S", "A", "B", "C"][: rng.randint(1, 4)]
+            symbols = variables * 2 + ["a", "b"]
+            rules = [
+                (variable, [rng.choice(symbols) for _ in range(rng.randint(0, 4))])
+                for variable in variables
+                for _ in range(rng.randint(1, 4))
+            ]
+            grammar = build_grammar(rules)
+            normalized = CYKParser.normalize(grammar)
+            if normalized is not None:
+                assert algorithms._is_chomsky_normal_form(normalized)
+            parser = CYKParser(normalized) if normalized is not None else None
+            for length in range(5):
+                for word in map("".join, itertools.product("ab", repeat=length)):
+                    expected = _derives(grammar, word)
+                    assert (parser is not None and parser.recognize(word)) == expected
+                    if expected and word:
+                        assert _leaves(parser.derivation(word, ParseTree)) == word
+
+    def test_long_expression_and_tree(self):
+        """Test d'une longue expression, comparée à Earley."""
+        grammar = _expressions()
+        parser = CYKParser(CYKParser.normalize(grammar))
+        word = "+".join(["(a*a+a)*a"] * 30)
+        assert parser.recognize(word)
+        assert EarleyParser(grammar).recognize(word)
+        assert not parser.recognize(word + "+")
+        assert not parser.recognize(word.replace(")", "", 1))
+
+        tree = parser.derivation("a*(a+a)", ParseTree)
+        assert _leaves(tree) == "a*(a+a)"
+        assert (tree.symbol, tree.start, tree.end) == ("E", 0, 7)
+        assert parser.derivation("a*(", ParseTree) is None
+
+    def test_empty_word_and_rules(self):
+        """Test de l'axiome annulable et du rejet des règles hors forme normale."""
+        grammar = build_grammar([("S", ("a", "S", "b")), ("S", ())])
+        normalized = CYKParser.normalize(grammar)
+        assert Production(normalized.start_symbol, ()) in normalized.productions
+        parser = CYKParser(normalized)
+        assert [w for w in ("", "ab", "aabb", "abab") if parser.recognize(w)] == [
+            "",
+            "ab",
+            "aabb",
+        ]
+        assert str(parser.derivation("", ParseTree)) == normalized.start_symbol
+
+        assert CYKParser.normalize(build_grammar([("S", ("a", "S"))])) is None
+        with pytest.raises(ValueError):
+            CYKParser(build_grammar([("S", ("a", "S"))]))
+
+    def test_specialized_algorithms_entry_points(self):
+        """Test des méthodes CYK et du cache par empreinte de grammaire."""
+        algorithms = SpecializedAlgorithms()
+        chomsky = build_grammar([("S", ("A", "B")), ("A", ("a",)), ("B", ("b",))])
+        swapped = build_grammar([("S", ("B", "A")), ("A", ("a",)), ("B", ("b",))])
+        assert algorithms.cyk_parse(chomsky, "ab")
+        assert not algorithms.cyk_parse(swapped, "ab")
+        assert algorithms.cyk_parse(chomsky, "ab")
+        assert algorithms.get_cache_stats()["hits"] == 1
+
+        tree = algorithms.cyk_parse_with_tree(chomsky, "ab")
+        assert str(tree) == "(S (A a) (B b))"
+
+        with pytest.raises(CYKError):
+            algorithms.cyk_parse(_expressions(), "a")
+        assert algorithms.cyk_parse_optimized(_expressions(), "a+a*(a)")
+        assert not algorithms.cyk_parse_optimized(_expressions(), "a+")
+        assert not algorithms.cyk_parse_optimized(
+            build_grammar([("S", ("a", "S"))]), "a"
+        )
+
+        normalized = algorithms.to_chomsky_normal_form(_expressions())
+        assert algorithms._is_chomsky_normal_form(normalized)
+        with pytest.raises(NormalizationError):
+            algorithms.to_chomsky_normal_form(build_grammar([("S", ("a", "S"))]))
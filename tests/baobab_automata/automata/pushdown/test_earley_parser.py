@@ -0,0 +1,170 @@
+"""
+Tests unitaires pour l'analyseur d'Earley et sa forêt partagée.
+
+Ce module vérifie la reconnaissance contre un point fixe naïf sur des
+grammaires aléatoires, la taille polynomiale de la forêt d'une grammaire
+ambiguë, la linéarité apportée par les items de Leo et l'intégration dans
+SpecializedAlgorithms.
+"""
+
+import itertools
+import random
+
+from baobab_automata.algorithms.pushdown import EarleyParser
+from baobab_automata.algorithms.pushdown.specialized_algorithms import (
+    ParseTree,
+    SpecializedAlgorithms,
+)
+from baobab_automata.pushdown.grammar.grammar_types import Production
+
+from .grammar_helpers import LENGTHS, build_grammar
+
+
+def _derives(grammar, word):
+    """Appartenance par point fixe sur les triplets (variable, début, fin)."""
+    length = len(word)
+    derived = set()
+
+    def sequence(right, start, end):
+        reached = {start}
+        for symbol in right:
+            reached = {
+                middle
+                for position in reached
+                for middle in range(position, end + 1)
+                if (symbol, position, middle) in derived
+                or (middle == position + 1 and word[position:middle] == symbol)
+            }
+        return end in reached
+
+    changed = True
+    while changed:
+        changed = False
+        for production in grammar.productions:
+            for start in range(length + 1):
+                for end in range(start, length + 1):
+                    key = (production.left_side, start, end)
+                    if key in derived:
+                        continue
+                    if sequence(production.right_side, start, end):
+                        derived.add(key)
+                        changed = True
+    return (grammar.start_symbol, 0, length) in derived
+
+
+def _check_tree(grammar, tree):
+    """Vérifie que chaque nœud interne applique une production de la grammaire."""
+    leaves = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node.symbol in grammar.variables:
+            right = tuple(child.symbol for child in node.children)
+            assert Production(node.symbol, right) in grammar.productions
+            stack.extend(reversed(node.children))
+        else:
+            leaves.append(node.symbol)
+    return "".join(leaves)
+
+
+class TestEarleyParser:
+    """Tests pour la classe EarleyParser."""
+
+    def test_random_grammars_match_fixpoint(self):
+        """Test de la reconnaissance et des arbres sur des grammaires aléatoires."""
+        rng = random.Random(5)
+        for _ in range(120):
+            variables = ["S", "A", "B", "C"][: rng.randint(1, 4)]
+            symbols = variables * 2 + ["a", "b"]
+            rules = [
+                (variable, [rng.choice(symbols) for _ in range(rng.choice(LENGTHS))])
+                for variable in variables
+                for _ in range(rng.randint(1, 4))
+            ]
+            grammar = build_grammar(rules)
+            parser = EarleyParser(grammar)
+            for length in range(5):
+                for word in map("".join, itertools.product("ab", repeat=length)):
+                    expected = _derives(grammar, word)
+                    assert parser.recognize(word) == expected
+                    forest = parser.parse(word)
+                    assert (forest is not None) == expected
+                    if forest is not None:
+                        assert _check_tree(grammar, forest.extract(ParseTree)) == word
+
+    def test_ambiguous_grammar_shares_forest(self):
+        """Test d'une forêt polynomiale pour un nombre catalan d'arbres."""
+        grammar = build_grammar([("E", ("E", "+", "E")), ("E", ("a",))], "E", "a+")
+        parser = EarleyParser(grammar)
+        forest = parser.parse("+".join("a" * 12))
+        assert forest.count_trees() == 58786
+        assert forest.is_ambiguous
+        assert len(forest.iter_nodes()) < 400
+        assert parser.parse("a+") is None
+
+    def test_nullable_and_cyclic_grammars(self):
+        """Test des variables annulables et des dérivations cycliques."""
+        grammar = build_grammar(
+            [("S", ("A", "S", "B")), ("S", ()), ("A", ("a",)), ("A", ()), ("B", ("b",))]
+        )
+        parser = EarleyParser(grammar)
+        assert parser.nullable == {"S", "A"}
+        assert [w for w in ("", "b", "ab", "ba", "abbb") if parser.recognize(w)] == [
+            "",
+            "b",
+            "ab",
+            "abbb",
+        ]
+
+        # Chaînes de Leo à travers un cycle unitaire et à travers l'axiome
+        unit_cycle = build_grammar(
+            [("S", ("B",)), ("B", ("S",)), ("B", ("A",)), ("A", ("b",)), ("A", ())]
+        )
+        assert EarleyParser(unit_cycle).recognize("b")
+        through_start = build_grammar(
+            [("S", ("A",)), ("A", ("B", "B")), ("B", ("b",)), ("B", ()), ("B", ("S",))]
+        )
+        assert EarleyParser(through_start).recognize("b")
+
+        cyclic = EarleyParser(build_grammar([("S", ("S",)), ("S", ("a",))]))
+        forest = cyclic.parse("a")
+        assert forest.count_trees() is None
+        assert str(forest.extract(ParseTree)) == "(S a)"
+
+    def test_leo_items_keep_right_recursion_linear(self):
+        """Test du nombre d'items linéaire sur une grammaire récursive à droite."""
+        parser = EarleyParser(build_grammar([("S", ("a", "S")), ("S", ("a",))]))
+        word = "a" * 1000
+        with_leo = parser.chart(word)
+        without_leo = parser.chart(word, leo=False)
+        assert with_leo.accepted and without_leo.accepted
+        assert with_leo.item_count < 6 * len(word)
+        assert without_leo.item_count > 100 * len(word)
+
+        chart = parser.chart("aab")
+        assert not chart.accepted and chart.failed_at == 2
+
+    def test_token_sequences(self):
+        """Test des terminaux de plusieurs caractères."""
+        grammar = build_grammar(
+            [("S", ("id",)), ("S", ("S", "plus", "id"))], terminals=("id", "plus")
+        )
+        parser = EarleyParser(grammar)
+        assert parser.tokenize("id plus id") == ("id", "plus", "id")
+        assert parser.recognize(parser.tokenize("id plus id"))
+        assert not parser.recognize(["id", "plus"])
+
+    def test_specialized_algorithms_entry_points(self):
+        """Test des méthodes Earley de SpecializedAlgorithms."""
+        grammar = build_grammar([("S", ("a", "A")), ("A", ("b",)), ("A", ("A", "b"))])
+        algorithms = SpecializedAlgorithms()
+        assert algorithms.earley_parse(grammar, "abbb")
+        assert not algorithms.earley_parse(grammar, "a")
+
+        tree = algorithms.earley_parse_with_tree(grammar, "abb")
+        assert str(tree) == "(S a (A (A b) b))"
+        assert (tree.start, tree.end) == (0, 3)
+
+        assert algorithms.earley_parse_optimized(grammar, "ab")
+        assert algorithms.earley_parse_optimized(grammar, "ab")
+        assert algorithms.get_cache_stats()["hits"] == 1
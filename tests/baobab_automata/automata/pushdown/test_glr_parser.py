@@ -0,0 +1,112 @@
+"""
+Tests unitaires pour l'analyseur GLR sur graphe des piles.
+
+Ce module vérifie la reconnaissance et le nombre d'arbres contre Earley
+sur des grammaires aléatoires conflictuelles, la forêt partagée d'une
+grammaire ambiguë et la largeur bornée du graphe sur une grammaire
+presque déterministe.
+"""
+
+import itertools
+import random
+import time
+
+from baobab_automata.algorithms.pushdown import EarleyParser, GLRParser, LRTables
+from baobab_automata.algorithms.pushdown.specialized_algorithms import ParseTree
+
+from .grammar_helpers import LENGTHS, build_grammar
+
+
+class TestGLRParser:
+    """Tests pour la classe GLRParser."""
+
+    def test_random_grammars_match_earley(self):
+        """Test de la reconnaissance et du nombre d'arbres, grammaires aléatoires."""
+        rng = random.Random(3)
+        for _ in range(100):
+            variables = ["S", "A", "B", "C"][: rng.randint(1, 4)]
+            symbols = variables * 2 + ["a", "b"]
+            rules = [
+                (variable, [rng.choice(symbols) for _ in range(rng.choice(LENGTHS))])
+                for variable in variables
+                for _ in range(rng.randint(1, 4))
+            ]
+            grammar = build_grammar(rules)
+            earley = EarleyParser(grammar)
+            parser = GLRParser.from_grammar(grammar)
+            for length in range(5):
+                for word in map("".join, itertools.product("ab", repeat=length)):
+                    forest = parser.parse(word)
+                    expected = earley.parse(word)
+                    assert (forest is None) == (expected is None)
+                    if forest is not None:
+                        assert forest.count_trees() == expected.count_trees()
+
+    def test_ambiguous_grammar_shares_forest(self):
+        """Test d'une forêt polynomiale pour un nombre catalan d'arbres."""
+        grammar = build_grammar([("E", ("E", "+", "E")), ("E", ("a",))], "E", "a+")
+        parser = GLRParser.from_grammar(grammar)
+        assert not parser.tables.is_deterministic
+        forest = parser.parse("+".join("a" * 12))
+        assert forest.count_trees() == 58786
+        assert forest.is_ambiguous
+        assert len(forest.iter_nodes()) < 200
+        assert str(forest.extract(ParseTree)).count("(E a)") == 12
+
+        run = parser.run("a++a")
+        assert not run.accepted and run.failed_at == 2
+        assert parser.run("a+c").failed_at == 2
+
+    def test_hidden_left_recursion(self):
+        """Test des réductions refaites quand une arête rejoint un nœud traité."""
+        grammar = build_grammar(
+            [("S", ("A", "S", "b")), ("S", ("a",)), ("A", ())], terminals="ab"
+        )
+        parser = GLRParser.from_grammar(grammar)
+        assert [w for w in ("a", "ab", "abb", "b", "aab") if parser.recognize(w)] == [
+            "a",
+            "ab",
+            "abb",
+        ]
+        assert parser.parse("abb").count_trees() == 1
+
+    def test_nearly_deterministic_grammar_stays_narrow(self):
+        """Test d'une largeur bornée et d'une taille linéaire du graphe."""
+        # LR(2) : après « a », seul le « c » ou le « d » qui suit « b »
+        # départage X et Y
+        grammar = build_grammar(
+            [
+                ("S", ("S", "I")),
+                ("S", ("I",)),
+                ("I", ("X", "b", "c")),
+                ("I", ("Y", "b", "d")),
+                ("X", ("a",)),
+                ("Y", ("a",)),
+            ],
+            terminals="abcd",
+        )
+        tables = LRTables.from_grammar(grammar)
+        assert {conflict.kind for conflict in tables.conflicts} == {"reduce/reduce"}
+        parser = GLRParser(tables)
+        word = "abcabd" * 2000
+        run = parser.run(word)
+        assert run.accepted
+        assert run.max_width <= 6
+        assert run.node_count < 4 * len(word)
+        assert run.forest.count_trees() == 1
+        assert not parser.recognize(word + "ab")
+
+    def test_right_recursion_is_linear(self):
+        """Test d'une durée linéaire sur une grammaire récursive à droite."""
+        grammar = build_grammar([("S", ("a", "S")), ("S", ("a",))], terminals="a")
+        parser = GLRParser.from_grammar(grammar)
+        assert not LRTables.from_grammar(grammar).conflicts
+        durations = []
+        for length in (2000, 16000):
+            start = time.perf_counter()
+            run = parser.run("a" * length)
+            durations.append(time.perf_counter() - start)
+            assert run.accepted and run.forest.count_trees() == 1
+        # Huit fois plus de jetons : une durée quadratique serait 64 fois
+        # plus longue
+        assert durations[1] < 24 * durations[0] + 0.05
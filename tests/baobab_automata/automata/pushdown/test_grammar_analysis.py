@@ -0,0 +1,128 @@
+"""
+Tests unitaires pour les analyses FIRST/FOLLOW et les tables LL(1).
+
+Ce module vérifie les ensembles d'une grammaire classique, les
+diagnostics de conflits, le cache porté par la grammaire et le DPDA
+prédictif produit par GrammarParser.grammar_to_dpda.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from baobab_automata.algorithms.pushdown import EarleyParser
+from baobab_automata.pushdown.grammar import END_MARKER
+from baobab_automata.pushdown.grammar.grammar_exceptions import GrammarConversionError
+from baobab_automata.pushdown.grammar.grammar_parser import GrammarParser
+from baobab_automata.pushdown.grammar.grammar_types import Production
+
+from .grammar_helpers import build_grammar
+
+
+def _expressions():
+    """Grammaire des expressions sans récursivité gauche."""
+    return build_grammar(
+        [
+            ("E", ("T", "E'")),
+            ("E'", ("+", "T", "E'")),
+            ("E'", ()),
+            ("T", ("F", "T'")),
+            ("T'", ("*", "F", "T'")),
+            ("T'", ()),
+            ("F", ("(", "E", ")")),
+            ("F", ("a",)),
+        ],
+        "E",
+        "a+*()",
+    )
+
+
+class TestGrammarAnalysis:
+    """Tests pour les classes GrammarAnalysis et LL1Table."""
+
+    def test_first_and_follow_sets(self):
+        """Test des ensembles de la grammaire des expressions."""
+        analysis = _expressions().get_analysis()
+        assert analysis.nullable == {"E'", "T'"}
+        assert analysis.first("E") == analysis.first("F") == {"(", "a"}
+        assert analysis.first("E'") == {"+"}
+        assert analysis.first("a") == {"a"}
+        assert analysis.follow("E") == analysis.follow("E'") == {")", END_MARKER}
+        assert analysis.follow("T") == {"+", ")", END_MARKER}
+        assert analysis.follow("F") == {"*", "+", ")", END_MARKER}
+
+        table = analysis.ll1_table()
+        assert table.is_ll1
+        assert table.get("E'", ")") == Production("E'", ())
+        assert table.get("F", "(") == Production("F", ("(", "E", ")"))
+        assert table.recognize("a*(a+a)+a")
+        assert table.failure_position("a+*a") == 2
+        assert table.failure_position("(a") == 2
+
+    def test_conflict_diagnostics(self):
+        """Test des conflits FIRST/FIRST et FIRST/FOLLOW."""
+        left_recursive = build_grammar([("S", ("S", "a")), ("S", ("b",))])
+        (conflict,) = left_recursive.get_analysis().ll1_table().conflicts
+        assert (conflict.variable, conflict.terminal) == ("S", "b")
+        assert conflict.kind == "FIRST/FIRST"
+
+        optional = build_grammar([("S", ("A", "a")), ("A", ("a",)), ("A", ())])
+        table = optional.get_analysis().ll1_table()
+        (conflict,) = table.conflicts
+        assert (conflict.variable, conflict.terminal, conflict.kind) == (
+            "A",
+            "a",
+            "FIRST/FOLLOW",
+        )
+        assert str(conflict).endswith("A -> ε / A -> a")
+        assert not table.is_ll1
+
+    def test_analysis_is_cached_on_grammar(self):
+        """Test du partage de l'analyse entre la grammaire et les analyseurs."""
+        grammar = build_grammar([("S", ("a", "S")), ("S", ())])
+        analysis = grammar.get_analysis()
+        assert grammar.get_analysis() is analysis
+        assert analysis.ll1_table() is analysis.ll1_table()
+        assert EarleyParser(grammar).nullable is analysis.nullable
+        assert GrammarParser()._get_nullable_variables(grammar) == {"S"}
+
+        grammar.productions.add(Production("S", ("b",)))
+        assert grammar.get_analysis() is not analysis
+        assert grammar.get_analysis().first("S") == {"a", "b"}
+
+    def test_random_ll1_grammars_and_dpda(self):
+        """Test du reconnaisseur et du DPDA prédictif contre Earley."""
+        rng = random.Random(1)
+        parser = GrammarParser()
+        checked = 0
+        while checked < 60:
+            variables = ["S", "A", "B"][: rng.randint(1, 3)]
+            symbols = variables + ["a", "b", "c"]
+            rules = [
+                (variable, [rng.choice(symbols) for _ in range(rng.randint(0, 3))])
+                for variable in variables
+                for _ in range(rng.randint(1, 3))
+            ]
+            grammar = build_grammar(rules, terminals="abc")
+            table = grammar.get_analysis().ll1_table()
+            if not table.is_ll1:
+                continue
+            checked += 1
+            earley = EarleyParser(grammar)
+            dpda = parser.grammar_to_dpda(grammar)
+            for length in range(5):
+                for word in map("".join, itertools.product("abc", repeat=length)):
+                    expected = earley.recognize(word)
+                    assert table.recognize(word) == expected
+                    assert dpda.accepts(word) == expected
+
+    def test_grammar_to_dpda_rejects_non_ll1(self):
+        """Test du refus des grammaires non LL(1) avec le détail des conflits."""
+        parser = GrammarParser()
+        dpda = parser.grammar_to_dpda(_expressions())
+        assert dpda.accepts("a*(a+a)") and not dpda.accepts("a*(a+a")
+
+        with pytest.raises(GrammarConversionError) as error:
+            parser.grammar_to_dpda(build_grammar([("S", ("S", "a")), ("S", ("b",))]))
+        assert "FIRST/FIRST" in str(error.value)
@@ -0,0 +1,69 @@
+"""
+Tests unitaires pour le découpage en jetons partagé par les analyseurs.
+
+Ce module vérifie les deux modes de découpage de Tokenizer, leur usage
+commun par les analyseurs Earley, CYK, LR, GLR et LL(1), et l'empreinte
+des grammaires utilisée par les caches de compilation.
+"""
+
+from baobab_automata.algorithms.pushdown import EarleyParser
+from baobab_automata.algorithms.pushdown.cyk_parser import CYKParser
+from baobab_automata.algorithms.pushdown.glr_parser import GLRParser
+from baobab_automata.algorithms.pushdown.lr_parser import LRParser
+from baobab_automata.pushdown.grammar import Tokenizer, grammar_fingerprint
+from baobab_automata.pushdown.grammar.grammar_types import (
+    ContextFreeGrammar,
+    Production,
+)
+
+
+def _sum_grammar(terminals=("id", "plus")):
+    """Grammaire S -> id S' ; S' -> plus id S' | ε, LL(1) et LALR(1)."""
+    name, plus = terminals
+    return ContextFreeGrammar(
+        variables={"S", "T"},
+        terminals=set(terminals),
+        productions={
+            Production("S", (name, "T")),
+            Production("T", (plus, name, "T")),
+            Production("T", ()),
+        },
+        start_symbol="S",
+    )
+
+
+class TestGrammarTokens:
+    """Tests pour Tokenizer et grammar_fingerprint."""
+
+    def test_tokenizer_modes(self):
+        """Test du découpage en caractères et en mots."""
+        assert Tokenizer({"a", "b"}).char_tokens
+        assert Tokenizer({"a", "b"}).tokenize("ab a") == ("a", "b", " ", "a")
+        assert not Tokenizer({"id", "+"}).char_tokens
+        assert Tokenizer({"id", "+"}).tokenize(" id +  id ") == ("id", "+", "id")
+        assert Tokenizer({"id"}).tokenize(["id", "id"]) == ("id", "id")
+
+    def test_parsers_share_tokenizer(self):
+        """Test du même découpage par chaque analyseur."""
+        for terminals, text in ((("id", "plus"), "id plus id"), (("i", "+"), "i+i")):
+            grammar = _sum_grammar(terminals)
+            expected = Tokenizer(terminals).tokenize(text)
+            parsers = [
+                EarleyParser(grammar),
+                CYKParser(CYKParser.normalize(grammar)),
+                LRParser.from_grammar(grammar),
+                GLRParser.from_grammar(grammar),
+                grammar.get_analysis().ll1_table(),
+            ]
+            for parser in parsers:
+                assert parser.tokenize(text) == expected
+                assert parser.recognize(expected)
+
+    def test_grammar_fingerprint(self):
+        """Test de l'empreinte : égale pour des grammaires égales."""
+        assert grammar_fingerprint(_sum_grammar()) == grammar_fingerprint(
+            _sum_grammar()
+        )
+        assert grammar_fingerprint(_sum_grammar()) != grammar_fingerprint(
+            _sum_grammar(("i", "+"))
+        )
@@ -0,0 +1,76 @@
+"""
+Tests unitaires pour les curseurs d'entrée partagés.
+
+Ce module vérifie que les configurations avancent dans le mot d'entrée
+sans le recopier, que le mot restant se reconstruit à la demande et que
+la reconnaissance déterministe reste linéaire sur de longs mots.
+"""
+
+import pytest
+
+from baobab_automata.pushdown import InputCursor
+from baobab_automata.pushdown.dpda import DPDA
+from baobab_automata.pushdown.dpda.dpda_configuration import DPDAConfiguration
+from baobab_automata.pushdown.npda.npda_configuration import NPDAConfiguration
+from baobab_automata.pushdown.pda.pda_configuration import PDAConfiguration
+
+
+class TestInputCursor:
+    """Tests pour la classe InputCursor."""
+
+    def test_cursor_reads_like_remaining_input(self):
+        """Test de la lecture du curseur comme le mot restant."""
+        word = "abcab"
+        for position in range(len(word) + 1):
+            cursor = InputCursor(word, position)
+            rest = word[position:]
+            assert cursor == rest and str(cursor) == rest and len(cursor) == len(rest)
+            assert bool(cursor) == bool(rest) and list(cursor) == list(rest)
+            assert cursor[1:] == rest[1:] and cursor.startswith(rest[:2])
+            assert cursor == InputCursor(rest)
+            assert hash(cursor) == hash(InputCursor(rest))
+            if rest:
+                assert cursor[0] == rest[0] and cursor[-1] == rest[-1]
+        assert InputCursor(word, 1) < InputCursor(word, 2)
+        with pytest.raises(IndexError):
+            InputCursor(word, 4).advance(2)
+
+    def test_configurations_share_the_word(self):
+        """Test de la consommation par avancée de position."""
+        config = NPDAConfiguration(state="q0", remaining_input="abc", stack="Z")
+        child = config.consume_input(2)
+        assert child.position == 2 and child.remaining_input == "c"
+        assert child.remaining_input.buffer is config.remaining_input.buffer
+        assert child.to_dict()["remaining_input"] == "c"
+
+        pda = PDAConfiguration("q0", "abc", "Z").consume_input("ab")
+        assert pda.position == 2 and str(pda) == "(q0, c, Z)"
+        with pytest.raises(ValueError):
+            pda.consume_input("a")
+
+        dpda = DPDAConfiguration("q0", "ab", "Z").consume_input(2)
+        assert dpda.is_accepting and dpda.position == 2
+        assert repr(dpda) == (
+            "DPDAConfiguration(state='q0', remaining_input='', stack='Z')"
+        )
+
+    def test_long_word_deterministic_recognition(self):
+        """Test d'un DPDA sur un mot de plus de 100 000 symboles."""
+        dpda = DPDA(
+            states={"q0", "q1", "q2"},
+            input_alphabet={"a", "b", "c"},
+            stack_alphabet={"Z", "A"},
+            transitions={
+                ("q0", "a", "Z"): ("q0", "AZ"),
+                ("q0", "a", "A"): ("q0", "AA"),
+                ("q0", "b", "A"): ("q1", ""),
+                ("q1", "b", "A"): ("q1", ""),
+                ("q1", "c", "Z"): ("q2", "Z"),
+            },
+            initial_state="q0",
+            initial_stack_symbol="Z",
+            final_states={"q2"},
+        )
+        n = 50000
+        assert dpda.accepts("a" * n + "b" * n + "c")
+        assert not dpda.accepts("a" * n + "b" * (n - 1) + "c")
@@ -0,0 +1,146 @@
+"""
+Tests unitaires pour les tables LR(1)/LALR(1) et l'analyseur associé.
+
+Ce module vérifie la taille des collections d'états sur des grammaires
+classiques, le rapport des conflits, la reconnaissance contre Earley sur
+des grammaires aléatoires sans conflit et la sérialisation des tables.
+"""
+
+import itertools
+import json
+import random
+
+from baobab_automata.algorithms.pushdown import EarleyParser, LRParser, LRTables
+from baobab_automata.algorithms.pushdown.specialized_algorithms import ParseTree
+
+from .grammar_helpers import LENGTHS, build_grammar
+
+
+def _expressions():
+    """Grammaire des expressions arithmétiques."""
+    return build_grammar(
+        [
+            ("E", ("E", "+", "T")),
+            ("E", ("T",)),
+            ("T", ("T", "*", "F")),
+            ("T", ("F",)),
+            ("F", ("(", "E", ")")),
+            ("F", ("a",)),
+        ],
+        "E",
+        "a+*()",
+    )
+
+
+class TestLRParser:
+    """Tests pour les classes LRTables et LRParser."""
+
+    def test_expression_grammar(self):
+        """Test des tables et de l'analyse de la grammaire des expressions."""
+        lalr = LRTables.from_grammar(_expressions())
+        canonical = LRTables.from_grammar(_expressions(), lalr=False)
+        assert (lalr.state_count, canonical.state_count) == (12, 22)
+        assert lalr.is_deterministic and canonical.is_deterministic
+
+        parser = LRParser(lalr)
+        word = "+".join(["(a*a+a)*a"] * 300)
+        assert parser.recognize(word)
+        assert LRParser(canonical).recognize(word)
+        assert parser.failure_position("a+*a") == 2
+        assert parser.failure_position("(a") == 2
+        assert parser.failure_position("a-a") == 1
+
+        tree = parser.derivation("a*(a+a)", ParseTree)
+        assert str(tree) == "(E (T (T (F a)) * (F ( (E (E (T (F a))) + (T (F a))) ))))"
+        assert (tree.start, tree.end) == (0, 7)
+        assert parser.derivation("a*(", ParseTree) is None
+
+    def test_conflict_reports(self):
+        """Test des conflits décalage/réduction et réduction/réduction."""
+        ambiguous = LRTables.from_grammar(
+            build_grammar([("E", ("E", "+", "E")), ("E", ("a",))], "E", "a+")
+        )
+        (conflict,) = ambiguous.conflicts
+        assert (conflict.kind, conflict.symbol) == ("shift/reduce", "+")
+        assert "réduction E -> E + E" in conflict.description
+        terminal = ambiguous.terminals.index("+")
+        assert ambiguous.actions(conflict.state, terminal) == conflict.actions
+        # Le décalage est retenu : l'analyse reste possible
+        assert LRParser(ambiguous).recognize("a+a+a")
+
+        # Grammaire LR(1) mais pas LALR(1) : la fusion des noyaux crée
+        # des conflits réduction/réduction
+        rules = [
+            ("S", ("a", "A", "d")),
+            ("S", ("b", "B", "d")),
+            ("S", ("a", "B", "e")),
+            ("S", ("b", "A", "e")),
+            ("A", ("c",)),
+            ("B", ("c",)),
+        ]
+        grammar = build_grammar(rules, terminals="abcde")
+        lalr = LRTables.from_grammar(grammar)
+        canonical = LRTables.from_grammar(grammar, lalr=False)
+        assert {(c.kind, c.symbol) for c in lalr.conflicts} == {
+            ("reduce/reduce", "d"),
+            ("reduce/reduce", "e"),
+        }
+        assert canonical.is_deterministic
+        assert canonical.state_count == lalr.state_count + 1
+        parser = LRParser(canonical)
+        assert [w for w in ("acd", "ace", "bcd", "bce") if parser.recognize(w)] == [
+            "acd",
+            "ace",
+            "bcd",
+            "bce",
+        ]
+
+    def test_random_grammars_match_earley(self):
+        """Test de la reconnaissance sur des grammaires aléatoires sans conflit."""
+        rng = random.Random(11)
+        deterministic = 0
+        for _ in range(300):
+            variables = ["S", "A", "B"][: rng.randint(1, 3)]
+            symbols = variables + ["a", "b", "a", "b"]
+            rules = [
+                (variable, [rng.choice(symbols) for _ in range(rng.choice(LENGTHS))])
+                for variable in variables
+                for _ in range(rng.randint(1, 3))
+            ]
+            grammar = build_grammar(rules)
+            lalr = LRTables.from_grammar(grammar)
+            canonical = LRTables.from_grammar(grammar, lalr=False)
+            assert lalr.state_count <= canonical.state_count
+            if lalr.is_deterministic:
+                assert canonical.is_deterministic
+            if not canonical.is_deterministic:
+                continue
+            deterministic += 1
+            earley = EarleyParser(grammar)
+            parsers = [LRParser(canonical)]
+            if lalr.is_deterministic:
+                parsers.append(LRParser(lalr))
+            for length in range(6):
+                for word in map("".join, itertools.product("ab", repeat=length)):
+                    expected = earley.recognize(word)
+                    for parser in parsers:
+                        assert parser.recognize(word) == expected
+        assert deterministic > 50
+
+    def test_serialization_round_trip(self):
+        """Test du rechargement des tables depuis leur forme JSON."""
+        tables = LRTables.from_grammar(
+            build_grammar([("E", ("E", "+", "E")), ("E", ("a",))], "E", "a+")
+        )
+        restored = LRTables.from_dict(json.loads(json.dumps(tables.to_dict())))
+        assert restored.to_dict() == tables.to_dict()
+        assert restored.conflicts == tables.conflicts
+        assert LRParser(restored).recognize("a+a")
+        assert not LRParser(restored).recognize("a+")
+
+        tokens = build_grammar(
+            [("S", ("id",)), ("S", ("S", "plus", "id"))], terminals=("id", "plus")
+        )
+        parser = LRParser(LRTables.from_dict(LRTables.from_grammar(tokens).to_dict()))
+        assert parser.recognize(parser.tokenize("id plus id"))
+        assert parser.failure_position(["id", "plus"]) == 2
@@ -0,0 +1,137 @@
+"""
+Tests unitaires pour l'exploration des branches d'un NPDA sur des processus.
+
+Ce module compare l'exploration répartie à l'exploration séquentielle,
+puis vérifie le codage binaire des configurations et le respect des
+budgets de branches et de temps.
+"""
+
+import itertools
+
+import pytest
+
+from baobab_automata.pushdown.npda import NPDA, NPDAError
+from baobab_automata.pushdown.npda.npda_exceptions import (
+    NPDAMemoryError,
+    NPDATimeoutError,
+)
+from baobab_automata.pushdown.npda.npda_parallel import (
+    _HEADER,
+    ParallelExplorer,
+    _decode,
+    _encode,
+)
+
+
+def _palindromes_transitions():
+    """Transitions des palindromes pairs sur {a, b}, avec devinette du milieu."""
+    transitions = {
+        ("q0", symbol, top): {("q0", symbol.upper() + top)}
+        for symbol in "ab"
+        for top in "ZAB"
+    }
+    for top in "ZAB":
+        transitions[("q0", "", top)] = {("q1", top)}
+    for symbol in "ab":
+        transitions[("q1", symbol, symbol.upper())] = {("q1", "")}
+    transitions[("q1", "", "Z")] = {("q2", "Z")}
+    return transitions
+
+
+def _palindromes_npda(**kwargs):
+    """NPDA des palindromes pairs sur {a, b}."""
+    return NPDA(
+        states={"q0", "q1", "q2"},
+        input_alphabet={"a", "b"},
+        stack_alphabet={"Z", "A", "B"},
+        transitions=_palindromes_transitions(),
+        initial_state="q0",
+        initial_stack_symbol="Z",
+        final_states={"q2"},
+        **kwargs,
+    )
+
+
+class TestNPDAParallel:
+    """Tests pour l'exploration répartie des branches."""
+
+    def test_workers_match_sequential_search(self):
+        """Test de l'exploration répartie contre l'exploration séquentielle."""
+        sequential = _palindromes_npda()
+        parallel = _palindromes_npda()
+        parallel.configure_parallel_execution(workers=2)
+        assert parallel.parallel_workers == 2
+        words = ["", "ab" * 20 + "ba" * 20, "ab" * 20 + "ba" * 19 + "a"]
+        for length in range(1, 7):
+            words.extend(map("".join, itertools.product("ab", repeat=length)))
+        for word in words:
+            assert parallel.accepts(word) == sequential.accepts(word)
+        assert parallel.get_performance_stats()["parallel_branches_created"] > 0
+        assert parallel.to_dict()["workers"] == 2
+
+    def test_pool_reused_across_words(self):
+        """Test d'un même groupe de processus pour plusieurs mots."""
+        words = ["ab" * 10 + "ba" * 10, "abba", "abab", "", "b" * 12, "aab"]
+        sequential = _palindromes_npda()
+        parallel = _palindromes_npda()
+        parallel.configure_parallel_execution(workers=2)
+        expected = [sequential.accepts(word) for word in words]
+        assert parallel.accepts_many(words) == expected
+
+        explorer = ParallelExplorer(
+            _palindromes_transitions(),
+            {"q0", "q1", "q2"},
+            {"Z", "A", "B"},
+            "q0",
+            "Z",
+            {"q2"},
+        )
+        with explorer:
+            explorer.start(2)
+            processes = list(explorer._pool.processes)
+            for word, accepted in zip(words * 2, expected * 2):
+                assert explorer.explore(word, 2, 10**6, 10.0)[0] == accepted
+            # Après un dépassement, le groupe reste utilisable
+            with pytest.raises(NPDAMemoryError):
+                explorer.explore(words[0], 2, 1, 10.0)
+            assert explorer.explore(words[0], 2, 10**6, 10.0)[0]
+            assert explorer._pool.processes == processes
+            assert all(process.is_alive() for process in processes)
+        assert not explorer.running
+        assert not any(process.is_alive() for process in processes)
+
+    def test_binary_configurations(self):
+        """Test du codage des configurations et des lots."""
+        first = _encode(3, 7, b"\x01\x02")
+        second = _encode(0, 0, b"")
+        assert len(first) == _HEADER.size + 2
+        assert _decode(first + second + first) == [first, second, first]
+        with pytest.raises(NPDAError):
+            _palindromes_npda().configure_parallel_execution(workers=0)
+
+    def test_budgets_are_enforced(self):
+        """Test des limites de branches et de temps sur plusieurs processus."""
+        # Les transitions ε empilent des piles distinctes, sans borne
+        growing = NPDA(
+            states={"q0"},
+            input_alphabet={"a"},
+            stack_alphabet={"Z", "A"},
+            transitions={
+                ("q0", "", top): {("q0", "Z" + top), ("q0", "A" + top)} for top in "ZA"
+            },
+            initial_state="q0",
+            initial_stack_symbol="Z",
+            final_states=set(),
+        )
+        growing.configure_parallel_execution(max_branches=50, workers=2)
+        with pytest.raises(NPDAMemoryError):
+            growing.accepts("a")
+        growing.configure_parallel_execution(
+            max_branches=10**9, timeout=0.2, workers=2
+        )
+        with pytest.raises(NPDATimeoutError):
+            growing.accepts("a")
+
+        growing.set_recognition_strategy("auto")
+        assert not growing.accepts("a")
+        assert growing.get_performance_stats()["saturation_runs"] == 1
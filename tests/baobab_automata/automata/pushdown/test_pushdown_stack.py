@@ -0,0 +1,82 @@
+"""
+Tests unitaires pour les piles persistantes partagées.
+
+Ce module vérifie le partage des cellules entre piles, la compatibilité
+avec la représentation en chaîne utilisée par les configurations et la
+simulation d'un NPDA dont les piles deviennent profondes.
+"""
+
+import pickle
+import random
+
+import pytest
+
+from baobab_automata.pushdown import PushdownStack
+from baobab_automata.pushdown.dpda.dpda_configuration import DPDAConfiguration
+from baobab_automata.pushdown.npda import NPDA
+from baobab_automata.pushdown.npda.npda_configuration import NPDAConfiguration
+
+
+class TestPushdownStack:
+    """Tests pour la classe PushdownStack."""
+
+    def test_cells_are_shared(self):
+        """Test du partage des fonds de pile et de l'unicité des cellules."""
+        base = PushdownStack.of("AZ")
+        assert base is PushdownStack.of("Z").push("A")
+        pushed = base.push("BC")
+        assert pushed.pop(2) is base
+        assert pushed.replace_top("D").below is pushed.below
+        assert pushed.pop(4) is PushdownStack.EMPTY
+        with pytest.raises(IndexError):
+            base.pop(3)
+
+        config = NPDAConfiguration(state="q0", remaining_input="a", stack="AZ")
+        child = config.push_symbols("BB").pop_symbol()
+        assert child.stack.below is config.stack
+        assert hash(child.stack) == hash(PushdownStack.of("BAZ"))
+
+    def test_string_compatibility(self):
+        """Test de la lecture de la pile comme la chaîne de ses symboles."""
+        rng = random.Random(5)
+        words = ["".join(rng.choice("ABZ") for _ in range(rng.randint(0, 6)))]
+        words += ["".join(rng.choice("ABZ") for _ in range(6)) for _ in range(40)]
+        words += ["", "A", "AB"]
+        for word in words:
+            stack = PushdownStack.of(word)
+            assert stack == word and str(stack) == word and len(stack) == len(word)
+            assert list(stack) == list(word) and stack[1:] == word[1:]
+            assert pickle.loads(pickle.dumps(stack)) is stack
+            for other in words:
+                assert (stack < PushdownStack.of(other)) == (word < other)
+
+        config = DPDAConfiguration("q0", "ab", "AZ")
+        assert config.to_dict()["stack"] == "AZ"
+        assert repr(config) == (
+            "DPDAConfiguration(state='q0', remaining_input='ab', stack='AZ')"
+        )
+        assert config.replace_stack_top("BB") == DPDAConfiguration("q0", "ab", "BBZ")
+
+    def test_deep_stack_npda(self):
+        """Test d'un NPDA des palindromes pairs sur des piles profondes."""
+        transitions = {}
+        for symbol in "ab":
+            for top in "abZ":
+                transitions[("q0", symbol, top)] = {("q0", symbol + top)}
+            transitions[("q1", symbol, symbol)] = {("q1", "")}
+        for top in "abZ":
+            transitions[("q0", "", top)] = {("q1", top)}
+        transitions[("q1", "", "Z")] = {("q2", "Z")}
+        npda = NPDA(
+            states={"q0", "q1", "q2"},
+            input_alphabet={"a", "b"},
+            stack_alphabet={"a", "b", "Z"},
+            transitions=transitions,
+            initial_state="q0",
+            initial_stack_symbol="Z",
+            final_states={"q2"},
+            max_parallel_branches=10000,
+        )
+        half = "".join(random.Random(2).choice("ab") for _ in range(200))
+        assert npda.accepts(half + half[::-1])
+        assert not npda.accepts(half + "a" + half[::-1] + "b")
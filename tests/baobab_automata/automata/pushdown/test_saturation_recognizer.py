@@ -0,0 +1,123 @@
+"""
+Tests unitaires pour la reconnaissance par saturation des résumés.
+
+Ce module compare la saturation à l'exploration des configurations sur
+des automates aléatoires, puis vérifie le repli automatique lorsque le
+budget de branches ou de temps est épuisé.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from baobab_automata.pushdown.npda import NPDA
+from baobab_automata.pushdown.npda.npda_exceptions import (
+    NPDAConfigurationError,
+    NPDAError,
+    NPDAMemoryError,
+    NPDATimeoutError,
+)
+from baobab_automata.pushdown.pda import PDA
+from baobab_automata.pushdown.pda.pda_exceptions import PDAError
+
+from .grammar_helpers import LENGTHS
+
+
+def _random_transitions(rng, empty_tops):
+    """Transitions aléatoires sur trois états et trois symboles de pile."""
+    tops = ["Z", "A", "B"] + ([""] if empty_tops else [])
+    transitions = {}
+    for _ in range(rng.randint(2, 7)):
+        symbol = rng.choice(("", "a", "b", "a", "b"))
+        key = (rng.choice("pqr"), symbol, rng.choice(tops))
+        pushed = "".join(rng.choice("ZAB") for _ in range(rng.choice(LENGTHS)))
+        transitions.setdefault(key, set()).add((rng.choice("pqr"), pushed))
+    return transitions
+
+
+class TestSaturationRecognizer:
+    """Tests pour la classe SaturationRecognizer et les stratégies."""
+
+    def test_random_automata_match_search(self):
+        """Test de la saturation contre l'exploration, automates aléatoires."""
+        rng = random.Random(7)
+        for trial in range(120):
+            transitions = _random_transitions(rng, trial % 2)
+            finals = set(rng.sample("pqr", rng.randint(1, 2)))
+            alphabets = ({"p", "q", "r"}, {"a", "b"}, {"Z", "A", "B"})
+            automata = [PDA(*alphabets, transitions, "p", "Z", finals)]
+            if not trial % 2:
+                npda = NPDA(*alphabets, transitions, "p", "Z", finals)
+                npda.configure_parallel_execution(max_branches=20000, timeout=5.0)
+                automata.append(npda)
+            for automaton in automata:
+                for length in range(1, 5):
+                    for word in map("".join, itertools.product("ab", repeat=length)):
+                        automaton.set_recognition_strategy("search")
+                        try:
+                            expected = automaton.accepts(word)
+                        except (NPDAError, PDAError):
+                            continue
+                        automaton.set_recognition_strategy("saturation")
+                        if isinstance(automaton, NPDA):
+                            automaton.clear_cache()
+                        assert automaton.accepts(word) == expected
+
+    def test_fallback_when_budget_is_exhausted(self):
+        """Test du repli automatique sur la saturation."""
+        # Les transitions ε font croître la pile sans borne
+        growing = NPDA(
+            states={"q0", "q1", "q2"},
+            input_alphabet={"a"},
+            stack_alphabet={"Z", "A"},
+            transitions={
+                ("q0", "a", "Z"): {("q0", "ZZ")},
+                ("q0", "", "Z"): {("q1", "AZ")},
+                ("q1", "", "A"): {("q0", "Z"), ("q2", "")},
+            },
+            initial_state="q0",
+            initial_stack_symbol="Z",
+            final_states={"q2"},
+            max_parallel_branches=10,
+        )
+        growing.configure_parallel_execution(max_branches=10, timeout=0.001)
+        with pytest.raises((NPDATimeoutError, NPDAMemoryError)):
+            growing.accepts("ab")
+
+        growing.set_recognition_strategy("auto")
+        assert growing.accepts("aa") and not growing.accepts("ab")
+        assert growing.get_performance_stats()["saturation_runs"] == 1
+
+        branching = NPDA(
+            states={"q0", "q1"},
+            input_alphabet={"a"},
+            stack_alphabet={"Z"},
+            transitions={
+                ("q0", "a", "Z"): {("q0", "Z"), ("q1", "Z")},
+                ("q1", "a", "Z"): {("q0", "Z"), ("q1", "Z")},
+            },
+            initial_state="q0",
+            initial_stack_symbol="Z",
+            final_states={"q1"},
+            max_parallel_branches=5,
+            recognition_strategy="auto",
+        )
+        assert branching.accepts("a" * 40) and not branching.accepts("")
+        restored = NPDA.from_dict(branching.to_dict())
+        assert restored.recognition_strategy == "auto"
+
+        # Sur le mot vide, la borne d'itérations du PDA est nulle
+        pda = PDA({"q0"}, {"a"}, {"Z"}, {}, "q0", "Z", {"q0"})
+        assert not pda.accepts("")
+        pda.set_recognition_strategy("auto")
+        assert pda.accepts("")
+
+    def test_strategy_validation(self):
+        """Test du refus des stratégies inconnues."""
+        with pytest.raises(NPDAConfigurationError):
+            NPDA({"q0"}, {"a"}, {"Z"}, {}, "q0", "Z", set(), recognition_strategy="x")
+        pda = PDA({"q0"}, {"a"}, {"Z"}, {}, "q0", "Z", set())
+        with pytest.raises(PDAError):
+            pda.set_recognition_strategy("x")
+        assert pda.recognition_strategy == "search"